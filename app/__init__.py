@@ -10,11 +10,24 @@ from app.logindialog import LoginDialog
 from app.mainwindow import MainWindow
 from app.parser.outputparser import ParserManager
 from app.sender import QtSenderWorker
+from app.sender.persistentqueue import PersistentRequestQueue
+from app.sender.spool import Spool
+from app.settings import Settings
 
 
 class Application:
     logger = logging.getLogger('Main')
 
+    CONFIG_QUEUE_FILE_KEY = 'sender/queueFile'
+    QUEUE_FILENAME = 'queue.db'
+    """Database storing the requests that were not sent yet (in the data
+    directory unless set in the settings)"""
+
+    CONFIG_SPOOL_DIRECTORY_KEY = 'sender/spoolDirectory'
+    SPOOL_DIRECTORY = 'spool'
+    """Directory storing the requests added during long outages (in the data
+    directory unless set in the settings)"""
+
     def __init__(self):
         set_up_logging()
         self.logger.info('Starting up the app')
@@ -42,13 +55,24 @@ class Application:
 
     def _init_app(self, token):
         self.api.set_token(token)
-        self.sender_worker = QtSenderWorker(self.api, self.q_app)
+        settings = Settings()
+        queue_path = settings.get_data_path(self.CONFIG_QUEUE_FILE_KEY,
+                                            self.QUEUE_FILENAME)
+        spool_path = settings.get_data_path(self.CONFIG_SPOOL_DIRECTORY_KEY,
+                                            self.SPOOL_DIRECTORY)
+        self.logger.info('Storing the request queue in %s and %s',
+                         queue_path, spool_path)
+        self.sender_worker = QtSenderWorker(
+            self.api, self.q_app,
+            queue=PersistentRequestQueue(queue_path),
+            spool=Spool(spool_path))
         sender = self.sender_worker.sender
         self.analyzer_worker = QtAnalyzerWorker(sender, self.q_app)
         self.parser_manager = ParserManager(self.q_app, sender,
                                             self.analyzer_worker)
         self._init_main_window(sender, self.parser_manager,
                                self.analyzer_worker)
+        sender.announce_queued_requests()
 
         self.sender_worker.start()
         self.analyzer_worker.start()
@@ -105,7 +105,9 @@ class AnalyzerWorker(Collector):
         try:
             data = Calculator.perform_calculations(self)
             if data and self.sender is not None:
-                self.sender.add_request('Analyzer', '/planetarydata/', data)
+                # Only the latest results are worth sending
+                self.sender.add_request('Analyzer', '/planetarydata/', data,
+                                        supersede_key='planetarydata')
         except Exception as e:
             # We don't really want to crash the app because some error occurred
             # during the calculations
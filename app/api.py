@@ -1,5 +1,8 @@
+import json
 import logging
 import urllib.parse
+import zlib
+from datetime import datetime
 
 import dateutil.parser
 import requests
@@ -9,6 +12,18 @@ from requests.auth import AuthBase
 
 from app.timeutils import TimeOffset
 
+ENCODING_FORM = 'form'
+ENCODING_JSON = 'json'
+ENCODING_JSON_GZIP = 'json+gzip'
+ENCODINGS = [ENCODING_FORM, ENCODING_JSON, ENCODING_JSON_GZIP]
+"""Encodings of the request bodies"""
+
+# Encoding to try if the server does not support given one
+_FALLBACK_ENCODINGS = {
+    ENCODING_JSON_GZIP: ENCODING_JSON,
+    ENCODING_JSON: ENCODING_FORM,
+}
+
 
 class APIWorker(QThread):
     """
@@ -78,11 +93,32 @@ class TokenAuth(AuthBase):
 
 
 class API:
+    """
+    Client of the API server
+
+    The resources can be created using form-encoded (the default) or JSON
+    request bodies, the latter optionally compressed with gzip (see
+    :py:meth:`set_encoding`). If the server responds with 415 Unsupported
+    Media Type, the next simpler encoding is used for the endpoint from then
+    on (gzip -> JSON -> form; bulk requests are always sent as JSON).
+    """
+
     logger = logging.getLogger('API')
 
+    gzip_min_size = 1024
+    """Minimum size of the request body in bytes to compress it"""
+
+    gzip_level = 6
+    """Compression level (1-9) used for gzip request bodies"""
+
     def __init__(self):
         self.server_url = None  # Address of the API server
         self.auth = None  # Authentication class to use
+        # Encoding of the request bodies used for the URLs not listed in
+        # "encodings"
+        self.default_encoding = ENCODING_FORM
+        # Relative URL -> encoding of the request bodies
+        self.encodings = {}
 
     def obtain_token(self, username, password):
         """Obtain authentication token for provided user
@@ -112,6 +148,24 @@ class API:
         """
         self.auth = TokenAuth(token)
 
+    def set_encoding(self, url, encoding):
+        """Set the encoding of the request bodies sent to given endpoint
+
+        :param str url: relative URL
+        :param str encoding: one of :py:data:`ENCODINGS`
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError('Unknown encoding: {}'.format(encoding))
+        self.encodings[url] = encoding
+
+    def get_encoding(self, url):
+        """Return the encoding of the request bodies sent to given endpoint
+
+        :param str url: relative URL
+        :rtype: str
+        """
+        return self.encodings.get(url, self.default_encoding)
+
     def get_gsinfo(self):
         """Obtain the latest Ground Station info
 
@@ -169,15 +223,74 @@ class API:
             self.__unknown_response(response)
 
     def create(self, url, data, files=None, requests_object=requests):
-        response, json = self._request(url, data, files=files,
-                                       requests_object=requests_object)
+        """Create a resource
+
+        :param str url: relative URL
+        :param dict data: data of the resource
+        :param dict|None files: files to send (always form-encoded)
+        :param requests_object: see :py:meth:`_request`
+        :return: response of the server
+        :rtype: requests.Response
+        :raise APIError: if the server did not respond with 201 status code
+        """
+        response = self._create(url, data, files, requests_object)
         if response.status_code != requests.codes.created:
             raise APIError('201 status code was expected when creating '
                            'resource; got {}'.format(response.status_code),
                            response)
+        return response
+
+    def create_bulk(self, url, data_list, requests_object=requests):
+        """Create multiple resources with a single request
+
+        The data is sent as a JSON array; the server is expected to create
+        either all of the resources or none of them.
+
+        :param str url: relative URL
+        :param list[dict] data_list: data of the resources to create
+        :param requests_object: see :py:meth:`_request`
+        :return: response of the server
+        :rtype: requests.Response
+        :raise APIError: if the server did not respond with 201 status code
+        """
+        response = self._create(url, data_list, None, requests_object,
+                                bulk=True)
+        if response.status_code != requests.codes.created:
+            raise APIError('201 status code was expected when creating '
+                           'resources; got {}'.format(response.status_code),
+                           response)
+        return response
+
+    def _create(self, url, data, files, requests_object, bulk=False):
+        """Send the data of the resource(s) with the encoding negotiated for
+        given URL
+
+        :return: response of the server
+        :rtype: requests.Response
+        """
+        while True:
+            encoding = ENCODING_FORM if files else self.get_encoding(url)
+            if bulk and encoding == ENCODING_FORM:
+                encoding = ENCODING_JSON
+            if encoding == ENCODING_FORM:
+                response, json = self._request(
+                    url, data, files=files, requests_object=requests_object)
+            else:
+                response, json = self._request(
+                    url, json_data=data, requests_object=requests_object,
+                    compress=encoding == ENCODING_JSON_GZIP)
+
+            fallback = _FALLBACK_ENCODINGS.get(encoding)
+            if (response.status_code !=
+                    requests.codes.unsupported_media_type or
+                    fallback is None or (bulk and fallback == ENCODING_FORM)):
+                return response
+            self.logger.info('%s does not support %s request bodies; using '
+                             '%s instead', url, encoding, fallback)
+            self.encodings[url] = fallback
 
     def _request(self, url, data={}, files=None, method='post',
-                 requests_object=requests):
+                 requests_object=requests, json_data=None, compress=False):
         """Make a request to given URL with provided data
 
         :param str url: relative URL
@@ -187,13 +300,28 @@ class API:
         :param requests_object: requests object to make the request with. Uses
             ``requests`` module by default; ``requests.Session`` instance
             can be used instead.
+        :param json_data: data to send as JSON instead of ``data``
+        :param bool compress: whether or not to compress ``json_data`` with
+            gzip (if it's at least :py:attr:`gzip_min_size` bytes)
         :return: :py:class:`requests.Response` object and json contents (or
             ``None`` in case of errors)
         :rtype: tuple[requests.Response, dict]|tuple[requests.Response, None]
         """
         url = urllib.parse.urljoin(self.server_url, url)
-        response = requests_object.request(method, url, data=data, files=files,
-                                           auth=self.auth)
+        if json_data is not None:
+            body = encode_json(json_data)
+            headers = {'Content-Type': 'application/json'}
+            if compress and len(body) >= self.gzip_min_size:
+                compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED,
+                                              16 + zlib.MAX_WBITS)
+                body = compressor.compress(body) + compressor.flush()
+                headers['Content-Encoding'] = 'gzip'
+            response = requests_object.request(method, url, data=body,
+                                               headers=headers,
+                                               auth=self.auth)
+        else:
+            response = requests_object.request(method, url, data=data,
+                                               files=files, auth=self.auth)
         if response.status_code in (requests.codes.ok, requests.codes.created):
             try:
                 return response, response.json()
@@ -225,6 +353,9 @@ def _parse_datetime(s):
     return dateutil.parser.parse(s).astimezone(tz=None)
 
 
+_isoformat = datetime.isoformat
+
+
 def encode_datetime(dt):
     """Converts provided datetime object into ISO 8601/RFC3339-compliant string
 
@@ -232,10 +363,31 @@ def encode_datetime(dt):
     :return: string representation of dt
     :rtype: str
     """
-    s = dt.isoformat()
-    if s.endswith('+00:00'):
-        s = s[:-6] + 'Z'
     if dt.tzinfo is None:
-        # Treat datetimes with no tzinfo as UTC
-        s += 'Z'
-    return s
+        # Treat datetimes with no tzinfo as UTC (the common case, so it's
+        # checked first)
+        return _isoformat(dt) + 'Z'
+    s = _isoformat(dt)
+    return s[:-6] + 'Z' if s.endswith('+00:00') else s
+
+
+def _encode_json_default(obj):
+    if isinstance(obj, datetime):
+        return encode_datetime(obj)
+    raise TypeError('{!r} is not JSON serializable'.format(obj))
+
+
+_json_encoder = json.JSONEncoder(separators=(',', ':'),
+                                 default=_encode_json_default)
+
+
+def encode_json(data):
+    """Encode given data as compact JSON
+
+    Datetime objects are encoded with :py:func:`encode_datetime`.
+
+    :param data: data to encode
+    :return: UTF-8 encoded JSON
+    :rtype: bytes
+    """
+    return _json_encoder.encode(data).encode()
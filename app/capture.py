@@ -0,0 +1,219 @@
+"""
+Binary capture format for the raw probe output.
+
+The capture file starts with :py:data:`MAGIC` and the wall clock time the
+capture was started at (nanoseconds since the epoch). It is followed by
+frames, each consisting of a header (monotonic receive time in nanoseconds
+and length of the data) and the raw bytes received (usually a single line,
+including its terminator). The data is not decoded in any way, so nothing is
+lost even if it's not valid UTF-8.
+
+All the integers are little-endian. A frame truncated by a crash at the end
+of the file is ignored by :py:class:`CaptureReader`.
+"""
+import logging
+import os
+import struct
+import time
+
+MAGIC = b'KSCAP\x00\x01\n'
+"""First bytes of every capture file (the last but one byte is the format
+version)"""
+
+HEADER = struct.Struct('<q')
+"""File header: wall clock time of the capture start in ns"""
+
+FRAME_HEADER = struct.Struct('<qI')
+"""Frame header: monotonic receive time in ns, length of the data"""
+
+FSYNC_NEVER = 'never'
+FSYNC_INTERVAL = 'interval'
+FSYNC_ALWAYS = 'always'
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_INTERVAL, FSYNC_ALWAYS)
+
+logger = logging.getLogger('Capture')
+
+
+def monotonic_ns():
+    """Return the value of the monotonic clock in nanoseconds
+
+    :rtype: int
+    """
+    return int(time.monotonic() * 1e9)
+
+
+def is_capture(path):
+    """Check if given file is a capture file
+
+    :param str path: path to the file
+    :rtype: bool
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CaptureWriter:
+    """
+    Writes the frames to a capture file
+
+    The frames are collected in memory and written in batches, either when
+    ``batch_size`` bytes are collected or ``flush_interval`` seconds passed
+    since the last write. Whether the data is also synced to the disk depends
+    on the fsync policy:
+
+    * :py:data:`FSYNC_NEVER` - leave it to the operating system
+    * :py:data:`FSYNC_INTERVAL` - sync at most every ``fsync_interval``
+      seconds (when the batch is written)
+    * :py:data:`FSYNC_ALWAYS` - sync every time a batch is written
+    """
+
+    def __init__(self, path, fsync=FSYNC_INTERVAL, batch_size=1 << 16,
+                 flush_interval=0.5, fsync_interval=5):
+        """Constructor
+
+        If the file already exists and is a capture file, the frames are
+        appended to it.
+
+        :param str path: path to the capture file
+        :param str fsync: fsync policy (one of :py:data:`FSYNC_POLICIES`)
+        :param int batch_size: number of bytes to collect before writing
+        :param float flush_interval: maximum time in seconds the frames are
+            kept in memory
+        :param float fsync_interval: minimum time between syncs in seconds
+            when using :py:data:`FSYNC_INTERVAL` policy
+        :raise ValueError: if the fsync policy is invalid or the file exists
+            and is not a capture file
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError('Invalid fsync policy: {}'.format(fsync))
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(MAGIC + HEADER.pack(int(time.time() * 1e9)))
+            self.file.flush()
+        elif not is_capture(path):
+            self.file.close()
+            raise ValueError('{} is not a capture file'.format(path))
+
+        self._buffer = bytearray()
+        self._last_flush = self._last_fsync = time.monotonic()
+
+    def write_frame(self, data, timestamp=None):
+        """Add a frame to the capture
+
+        :param bytes data: raw data received
+        :param int|None timestamp: monotonic receive time in ns; current time
+            is used by default
+        """
+        if timestamp is None:
+            timestamp = monotonic_ns()
+        self._buffer += FRAME_HEADER.pack(timestamp, len(data))
+        self._buffer += data
+        if (len(self._buffer) >= self.batch_size or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write the collected frames (and sync them if the policy says so)"""
+        now = time.monotonic()
+        if self._buffer:
+            self.file.write(self._buffer)
+            self._buffer = bytearray()
+            self.file.flush()
+            if (self.fsync == FSYNC_ALWAYS or
+                    (self.fsync == FSYNC_INTERVAL and
+                     now - self._last_fsync >= self.fsync_interval)):
+                os.fsync(self.file.fileno())
+                self._last_fsync = now
+        self._last_flush = now
+
+    def close(self):
+        """Write all the collected frames and close the file"""
+        if self.file.closed:
+            return
+        self.flush()
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self.file.fileno())
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CaptureReader:
+    """
+    Reads the frames from a capture file
+    """
+
+    def __init__(self, path):
+        """Constructor
+
+        :param str path: path to the capture file
+        :raise ValueError: if the file is not a capture file
+        """
+        self.file = open(path, 'rb')
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError('{} is not a capture file'.format(path))
+        header = self.file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self.file.close()
+            raise ValueError('{} is truncated'.format(path))
+        self.start_time_ns, = HEADER.unpack(header)
+
+    def __iter__(self):
+        """Iterate over the frames
+
+        :return: iterator of ``(timestamp, data)`` tuples, where the
+            timestamp is the monotonic receive time in ns
+        """
+        read = self.file.read
+        while True:
+            header = read(FRAME_HEADER.size)
+            if not header:
+                return
+            if len(header) == FRAME_HEADER.size:
+                timestamp, length = FRAME_HEADER.unpack(header)
+                data = read(length)
+                if len(data) == length:
+                    yield timestamp, data
+                    continue
+            logger.warning('Ignoring truncated frame at the end of %s',
+                           self.file.name)
+            return
+
+    def replay(self, speed=1.0):
+        """Iterate over the frames keeping their original inter-arrival times
+
+        :param float|None speed: real-time multiplier or ``None`` to return
+            the frames as fast as possible
+        :return: iterator of ``(timestamp, data)`` tuples (see
+            :py:meth:`__iter__`)
+        """
+        first_timestamp = start = None
+        for timestamp, data in self:
+            if speed is not None:
+                now = time.monotonic()
+                if first_timestamp is None:
+                    first_timestamp, start = timestamp, now
+                delay = ((timestamp - first_timestamp) / 1e9 / speed -
+                         (now - start))
+                if delay > 0:
+                    time.sleep(delay)
+            yield timestamp, data
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
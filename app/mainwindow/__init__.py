@@ -15,6 +15,7 @@ from app.mainwindow.parser import QtParser
 from app.mainwindow.queue import QueueDock
 from app.mainwindow.statistics import StatisticsDock
 from app.probestartdialog import ProbeStartDialog
+from app.serialportdialog import SerialPortDialog
 from app.sender.sendererrorcatcher import QtSenderErrorCatcher
 from app.settings import Settings
 from app.ui.ui_main import Ui_MainWindow
@@ -172,10 +173,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         logging.getLogger('Analyzer').info(
             'Processing %s', 'suspended' if suspended else 'resumed')
 
-    def choose_parser_file(self):
+    def _prepare_parser_start(self):
+        """Make sure the parser can be started
+
+        Asks for the probe start time if it's not set and whether to
+        terminate the parser if it's running.
+
+        :return: ``True`` if the parser can be started; ``False`` if user
+            cancelled it
+        :rtype: bool
+        """
         if (self._parser_manager.probe_start_time is None and
                 not self.show_set_probe_start_time()):
-            return
+            return False
 
         if self._parser_manager.is_running():
             msg_box = QMessageBox(
@@ -187,8 +197,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             msg_box.exec()
             if msg_box.clickedButton() == terminate_btn:
                 self._parser_manager.terminate()
+                self._parser_manager.wait()
             else:
-                return
+                return False
+        return True
+
+    def choose_parser_file(self):
+        if not self._prepare_parser_start():
+            return
 
         settings = Settings()
         file_dialog = QFileDialog(self)
@@ -217,6 +233,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         settings[self.CONFIG_FILE_DIALOG_GEOMETRY_KEY] = \
             file_dialog.saveGeometry()
 
+    def choose_serial_port(self):
+        if not self._prepare_parser_start():
+            return
+        SerialPortDialog(self._parser_manager, self).exec()
+
     def terminate_sender(self):
         """Terminate sender, asking the user for permission if still running
 
@@ -227,11 +248,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if len(self._sender):
             msg_box = QMessageBox(QMessageBox.Warning, 'Sender is running',
                                   None, QMessageBox.Cancel)
-            msg_box.setInformativeText(
-                'If you terminate the application now, the data will be '
-                'lost. Are you sure you want to quit?')
-            terminate_btn = msg_box.addButton('Terminate without sending',
-                                              QMessageBox.DestructiveRole)
+            if self._sender.queue.persistent:
+                msg_box.setInformativeText(
+                    'If you terminate the application now, the data will be '
+                    'sent the next time it is started. Are you sure you '
+                    'want to quit?')
+                terminate_btn = msg_box.addButton('Quit',
+                                                  QMessageBox.ActionRole)
+            else:
+                msg_box.setInformativeText(
+                    'If you terminate the application now, the data will be '
+                    'lost. Are you sure you want to quit?')
+                terminate_btn = msg_box.addButton('Terminate without sending',
+                                                  QMessageBox.DestructiveRole)
 
             if self._sender.paused:
                 msg_box.setText('Request queue is paused, but there are still '
@@ -62,12 +62,20 @@ class QueueDock(QDockWidget, Ui_QueueDock):
         def update_text():
             """Update "Processing ... requests" label text on status bar"""
             count = queue_model.rowCount()
-            queue_status_label.setText("Processing {} requests"
-                                       .format(count))
+            unlisted = queue_model.unlisted_count
+            if unlisted:
+                queue_status_label.setText(
+                    "Processing {} requests ({} not listed)".format(
+                        count + unlisted, unlisted))
+            else:
+                queue_status_label.setText("Processing {} requests"
+                                           .format(count))
 
         update_text()
         queue_model.rowsInserted.connect(update_text)
         queue_model.rowsRemoved.connect(update_text)
+        queue_model.modelReset.connect(update_text)
+        queue_model.unlisted_count_changed.connect(update_text)
         return queue_status_label
 
     def on_paused(self, paused):
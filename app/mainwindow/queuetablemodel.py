@@ -1,8 +1,10 @@
 import logging
-from collections import deque, namedtuple
+from collections import OrderedDict, namedtuple
 from enum import IntEnum
 
-from PyQt5.QtCore import QAbstractTableModel, Qt, QModelIndex
+from PyQt5.QtCore import (
+    QAbstractTableModel, Qt, QModelIndex, QTimer, pyqtSignal
+)
 
 from app.colors import ERROR_BRUSH
 
@@ -11,13 +13,15 @@ class Status(IntEnum):
     waiting = 0
     processing = 1
     error = 2
+    retrying = 3
 
     @staticmethod
     def as_string(status_id):
         status_to_string = {
             Status.waiting: 'Waiting',
             Status.processing: 'Processing',
-            Status.error: 'Error'
+            Status.error: 'Error',
+            Status.retrying: 'Retrying'
         }
         return status_to_string[status_id]
 
@@ -33,22 +37,72 @@ class QueueTableModel(QAbstractTableModel):
 
     The class keeps its own lightweight copy of queue to avoid expensive
     thread-safe queue retrieval.
+
+    The changes reported by the sender are collected and applied to the
+    model at most every ``update_interval`` milliseconds, so that the views
+    are updated once for a burst of requests. Since the requests are mostly
+    processed in the order they were added, the rows are found by their
+    request IDs in constant time (see :py:meth:`_remove_rows`).
+
+    The requests restored from the persistent queue the sender didn't
+    announce (see :py:meth:`app.sender.Sender.announce_queued_requests`) are
+    not listed; only their number is kept in :py:attr:`unlisted_count`.
     """
 
+    unlisted_count_changed = pyqtSignal(int)
+
     logger = logging.getLogger('MainWindow')
 
-    def __init__(self, sender, parent=None):
+    max_removed_ranges = 16
+    """Maximum number of ranges of rows removed separately at once; the model
+    is reset if there are more"""
+
+    def __init__(self, sender, parent=None, update_interval=100):
         """Constructor
 
         :param app.sender.QtSender sender: sender instance
         :param QObject parent: parent of the model
+        :param int update_interval: maximum time in milliseconds the changes
+            wait to be applied
         """
         super().__init__(parent)
-        self.queue = deque()
+        self.queue = []
+        # Request ID -> position of the row plus the number of rows removed
+        # from the beginning of the queue (the offset)
+        self._positions = {}
+        self._offset = 0
+        # Changes not applied yet: rows to insert (by request ID), statuses
+        # of the rows in the queue and IDs of the rows to remove
+        self._pending_added = OrderedDict()
+        self._pending_statuses = {}
+        self._pending_removed = set()
+        # Number and range of IDs of the requests not listed
+        self.unlisted_count = 0
+        self._unlisted_ids = range(0)
+        self._pending_unlisted_removed = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(update_interval)
+        self._timer.timeout.connect(self.apply_pending)
+
         sender.request_added.connect(self.add_request)
         sender.request_processing.connect(self.set_request_status)
         sender.error_occurred.connect(self.on_error)
+        sender.request_retrying.connect(self.on_retrying)
         sender.request_processed.connect(self.remove_request)
+        sender.requests_not_announced.connect(self.set_not_announced)
+
+    def set_not_announced(self, count, first_id, last_id):
+        """Set the number of requests queued, but not listed
+
+        :param int count: number of the requests
+        :param int first_id: lowest possible ID of the requests
+        :param int last_id: highest possible ID of the requests
+        """
+        self.unlisted_count = count
+        self._unlisted_ids = range(first_id, last_id + 1)
+        self._pending_unlisted_removed = 0
+        self.unlisted_count_changed.emit(count)
 
     def add_request(self, request_data):
         """Add given request to the queue.
@@ -56,16 +110,16 @@ class QueueTableModel(QAbstractTableModel):
         :param app.sender.RequestData request_data: request data of the new
             request
         """
-        count = len(self.queue)
-        self.beginInsertRows(QModelIndex(), count, count)
-        self.queue.append(LightRequestData(request_data.id,
-                                           request_data.module,
-                                           Status.waiting))
-        self.endInsertRows()
+        self._pending_added[request_data.id] = LightRequestData(
+            request_data.id, request_data.module, Status.waiting)
+        self._schedule_update()
 
     def on_error(self, request_data, exception, traceback_exception):
         self.set_request_status(request_data, Status.error)
 
+    def on_retrying(self, request_data, exception, attempt, delay):
+        self.set_request_status(request_data, Status.retrying)
+
     def set_request_status(self, request_data, status_id=Status.processing):
         """Set status of given request
 
@@ -76,15 +130,18 @@ class QueueTableModel(QAbstractTableModel):
             to change status of
         :param int status_id: status ID to set
         """
-        for index, item in enumerate(self.queue):
-            if request_data.id == item.id:
-                self.queue[index] = item._replace(status=status_id)
-                model_index = self.index(index, 2)
-                self.dataChanged.emit(model_index, model_index)
-                return
-        self.logger.warning(
-            'QueueTableModel was requested to set status on invalid '
-            'RequestData object: %s', request_data)
+        item = self._pending_added.get(request_data.id)
+        if item is not None:
+            self._pending_added[request_data.id] = item._replace(
+                status=status_id)
+        elif (request_data.id in self._positions and
+              request_data.id not in self._pending_removed):
+            self._pending_statuses[request_data.id] = status_id
+            self._schedule_update()
+        elif request_data.id not in self._unlisted_ids:
+            self.logger.warning(
+                'QueueTableModel was requested to set status on invalid '
+                'RequestData object: %s', request_data)
 
     def remove_request(self, request_data):
         """Remove provided request from the queue
@@ -95,15 +152,99 @@ class QueueTableModel(QAbstractTableModel):
         :param app.sender.RequestData request_data: request data of the request
             to remove
         """
-        for index, item in enumerate(self.queue):
-            if request_data.id == item.id:
-                self.beginRemoveRows(QModelIndex(), index, index)
-                del self.queue[index]
-                self.endRemoveRows()
-                return
-        self.logger.warning(
-            'QueueTableModel was requested to remove invalid RequestData '
-            'object: %s', request_data)
+        if self._pending_added.pop(request_data.id, None) is not None:
+            return
+        if (request_data.id in self._positions and
+                request_data.id not in self._pending_removed):
+            self._pending_statuses.pop(request_data.id, None)
+            self._pending_removed.add(request_data.id)
+            self._schedule_update()
+        elif request_data.id in self._unlisted_ids:
+            self._pending_unlisted_removed += 1
+            self._schedule_update()
+        else:
+            self.logger.warning(
+                'QueueTableModel was requested to remove invalid RequestData '
+                'object: %s', request_data)
+
+    def _schedule_update(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def apply_pending(self):
+        """Apply the changes collected since the last update to the model"""
+        self._timer.stop()
+        if self._pending_unlisted_removed:
+            self.unlisted_count = max(
+                0, self.unlisted_count - self._pending_unlisted_removed)
+            self._pending_unlisted_removed = 0
+            self.unlisted_count_changed.emit(self.unlisted_count)
+
+        if self._pending_removed:
+            self._remove_rows(self._pending_removed)
+            self._pending_removed = set()
+
+        if self._pending_statuses:
+            first = last = None
+            for request_id, status_id in self._pending_statuses.items():
+                row = self._positions[request_id] - self._offset
+                self.queue[row] = self.queue[row]._replace(status=status_id)
+                first = row if first is None else min(first, row)
+                last = row if last is None else max(last, row)
+            self._pending_statuses = {}
+            self.dataChanged.emit(self.index(first, 2), self.index(last, 2))
+
+        if self._pending_added:
+            count = len(self.queue)
+            self.beginInsertRows(QModelIndex(), count,
+                                 count + len(self._pending_added) - 1)
+            for request_id, item in self._pending_added.items():
+                self._positions[request_id] = len(self.queue) + self._offset
+                self.queue.append(item)
+            self._pending_added = OrderedDict()
+            self.endInsertRows()
+
+    def _remove_rows(self, request_ids):
+        """Remove the rows of given requests
+
+        The rows following the removed ones are moved by increasing the
+        offset; only the positions of the rows preceding any of the removed
+        ones have to be updated. Since the oldest requests are usually
+        processed first, there are few or no such rows.
+
+        :param set[int] request_ids: IDs of the requests to remove
+        """
+        rows = sorted(self._positions.pop(request_id) - self._offset
+                      for request_id in request_ids)
+        count = len(rows)
+        removed_before = 0
+        for row in range(rows[-1]):
+            if row == rows[removed_before]:
+                removed_before += 1
+            else:
+                self._positions[self.queue[row].id] += count - removed_before
+        self._offset += count
+
+        # Ranges of consecutive rows, starting from the last one
+        ranges = []
+        end = len(rows) - 1
+        for i in range(len(rows) - 1, -1, -1):
+            if i == 0 or rows[i - 1] != rows[i] - 1:
+                ranges.append((rows[i], rows[end]))
+                end = i - 1
+        if len(ranges) > self.max_removed_ranges:
+            # Removing every range separately is slow for the views (and the
+            # proxy models)
+            self.beginResetModel()
+            removed = set(rows)
+            self.queue = [item for row, item in enumerate(self.queue)
+                          if row not in removed]
+            self.endResetModel()
+            return
+        for first, last in ranges:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.queue[first:last + 1]
+            self.endRemoveRows()
 
     def columnCount(self, parent=None, *args, **kwargs):
         return 3
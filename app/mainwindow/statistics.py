@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import QDockWidget
+from PyQt5.QtWidgets import QDockWidget, QTableWidgetItem
 
 from app import humanize
 from app.statistics import QtStatistics
@@ -31,6 +31,11 @@ class StatisticsDock(QDockWidget, Ui_StatisticsDock):
                 self.update_requests_sent)
         self.statistics.total_data_received_changed.connect(
                 self.update_total_data_received)
+        self.statistics.sender_metrics_changed.connect(
+                self.update_sender_metrics)
+        self.statistics.backpressure_changed.connect(
+                self.update_backpressure)
+        self._backpressure = parser_manager.backpressure
 
     def update_time_since_start(self, timedelta):
         self.timeSinceStartLabel.setText(natural_timedelta(timedelta))
@@ -50,3 +55,80 @@ class StatisticsDock(QDockWidget, Ui_StatisticsDock):
     def update_total_data_received(self, total_data_received):
         self.totalDataReceivedLabel.setText(
             humanize.format_size(total_data_received))
+
+    def update_sender_metrics(self, snapshot, previous):
+        """Show the metrics of the requests to every URL
+
+        The rates are calculated since the previous snapshot.
+
+        :param app.sender.metrics.MetricsSnapshot snapshot: current metrics
+        :param app.sender.metrics.MetricsSnapshot|None previous: previous
+            metrics
+        """
+        self.queueLengthLabel.setText(str(snapshot.queue_depth[-1][1]))
+        table = self.endpointsTable
+        table.setRowCount(len(snapshot.endpoints))
+        for row, url in enumerate(sorted(snapshot.endpoints)):
+            endpoint = snapshot.endpoints[url]
+            last = (previous.endpoints.get(url)
+                    if previous is not None else None)
+            elapsed = (snapshot.time - previous.time
+                       if previous is not None else 0)
+            requests_rate = _get_rate(endpoint.requests, last and
+                                      last.requests, elapsed)
+            bytes_rate = _get_rate(endpoint.bytes_sent, last and
+                                   last.bytes_sent, elapsed)
+            cells = [
+                url,
+                '-' if requests_rate is None else
+                '{:.1f}'.format(requests_rate),
+                '-' if bytes_rate is None else
+                humanize.format_size(round(bytes_rate)) + '/s',
+                str(endpoint.retries),
+                _format_latency(endpoint.queue_wait),
+                _format_latency(endpoint.response_time),
+                _format_latency(endpoint.total_time),
+            ]
+            for column, text in enumerate(cells):
+                item = table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    table.setItem(row, column, item)
+                item.setText(text)
+
+    def update_backpressure(self, snapshot):
+        """Show the mode and the counters of the backpressure policy
+
+        :param dict snapshot: see
+            :py:meth:`app.parser.backpressure.BackpressurePolicy.snapshot`
+        """
+        if snapshot['mode'] == self._backpressure.DOWNSAMPLING:
+            self.backpressureModeLabel.setText('Downsampled ({} by {})'.format(
+                self._backpressure.method, self._backpressure.factor))
+        else:
+            self.backpressureModeLabel.setText('All')
+        self.backpressureCountersLabel.setText(
+            '{downsampled} records'.format(**snapshot))
+        self.backpressureCountersLabel.setToolTip(
+            '{forwarded} records sent unchanged, {aggregates} aggregates '
+            'sent, {transitions} mode changes; queue growing by '
+            '{growth_rate:.1f} requests/s'.format(**snapshot))
+
+
+def _get_rate(value, last_value, elapsed):
+    """Return the rate of change of given counter (``None`` if unknown)"""
+    if elapsed <= 0:
+        return None
+    return (value - (last_value or 0)) / elapsed
+
+
+def _format_latency(summary):
+    """Format the percentiles of given latency summary in milliseconds
+
+    :param app.sender.metrics.LatencySummary summary: latencies to format
+    :rtype: str
+    """
+    if not summary.count:
+        return '-'
+    return '{:.0f} / {:.0f} / {:.0f}'.format(
+        summary.p50 * 1000, summary.p95 * 1000, summary.p99 * 1000)
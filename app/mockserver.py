@@ -0,0 +1,377 @@
+"""
+Local stand-in for the API server.
+
+Implements the endpoints used by :py:class:`app.api.API` closely enough to run
+the receiver (and benchmark :py:class:`app.sender.Sender`) without the web
+application:
+
+* ``POST /token-auth/`` returns a token (200),
+* ``POST`` to the resource endpoints (``/telemetry/``, ``/gps/``, ``/kundt/``,
+  ``/planetarydata/``, ``/status/``, ``/gsinfo/``, ``/video/``) creates the
+  resources (201); lists of resources are accepted for ``bulk_urls``,
+* ``GET /status/?latest=1`` and ``GET /gsinfo/?latest=1`` return the latest
+  resource (200) or nothing (204).
+
+The request bodies may be form-encoded, multipart or JSON (optionally
+compressed with gzip). Every request can be delayed, fail at random with 503
+Service Unavailable or be throttled with 429 Too Many Requests, so that slow
+and unreliable links can be simulated::
+
+    ./mockserver.py --port 8000 --latency 0.05 --error-rate 0.01
+
+Then use ``http://127.0.0.1:8000/`` as the server URL (any username and
+password are accepted unless ``--username`` and ``--password`` are given).
+"""
+import argparse
+import gzip
+import json
+import math
+import random
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from app.api import encode_datetime
+
+RESOURCE_URLS = ('/telemetry/', '/gps/', '/kundt/', '/planetarydata/',
+                 '/status/', '/gsinfo/', '/video/')
+"""Endpoints creating the resources"""
+
+LATEST_URLS = ('/status/', '/gsinfo/')
+"""Endpoints returning the latest resource on ``GET ?latest=1``"""
+
+BULK_URLS = ('/telemetry/', '/gps/')
+"""Endpoints accepting lists of resources by default"""
+
+DEFAULTS = {
+    '/status/': {'phase': '', 'mission_time': None, 'cansat_online': False},
+    '/gsinfo/': {'timezone': 0},
+}
+"""Values of the fields missing in the created resources"""
+
+
+def _parse_bool(value):
+    return value.lower() in ('true', '1', 'on')
+
+
+FORM_FIELD_TYPES = {
+    'cansat_online': _parse_bool,
+    'mission_time': float,
+    'latitude': float,
+    'longitude': float,
+    'timezone': int,
+}
+"""Functions converting the values of the fields sent in a form (which are
+strings) to the types the API server returns"""
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body are written separately; without this, every
+    # response on a kept-alive connection waits for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        path = urllib.parse.urlsplit(self.path).path
+        status = self.server.admit()
+        if status is not None:
+            return self.respond(status)
+
+        if path != '/token-auth/' and path not in RESOURCE_URLS:
+            return self.respond(404, {'detail': 'Not found.'})
+        try:
+            data = self.parse_body(body)
+        except (ValueError, OSError) as e:
+            return self.respond(400, {'detail': str(e)})
+        if path == '/token-auth/':
+            return self.respond(*self.server.authenticate(data))
+        if not self.server.authorized(self.headers.get('Authorization')):
+            return self.respond(401, {
+                'detail': 'Authentication credentials were not provided.'})
+        if data is None:
+            return self.respond(415, {'detail': 'Unsupported media type.'})
+        if isinstance(data, list) and path not in self.server.bulk_urls:
+            return self.respond(400, {'detail': 'Expected an object.'})
+        self.server.delay()
+        self.respond(201, self.server.create(path, data))
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        status = self.server.admit()
+        if status is not None:
+            return self.respond(status)
+        if url.path not in LATEST_URLS:
+            return self.respond(404, {'detail': 'Not found.'})
+        if not self.server.authorized(self.headers.get('Authorization')):
+            return self.respond(401, {
+                'detail': 'Authentication credentials were not provided.'})
+        self.server.delay()
+        latest = self.server.get_latest(url.path)
+        if latest is None:
+            return self.respond(204)
+        self.respond(200, latest)
+
+    def parse_body(self, body):
+        """Decode the request body
+
+        :param bytes body: request body
+        :return: decoded data or ``None`` if the content type is not supported
+        :rtype: dict|list|None
+        :raise ValueError: if the body is invalid
+        """
+        content_type = (self.headers.get('Content-Type') or '').partition(
+            ';')[0].strip()
+        content_encoding = self.headers.get('Content-Encoding')
+        if content_encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif content_encoding is not None:
+            return None
+        if content_type == 'application/json':
+            return json.loads(body.decode())
+        if content_type == 'application/x-www-form-urlencoded':
+            data = {key: value[0] for key, value in
+                    urllib.parse.parse_qs(body.decode()).items()}
+            for key in FORM_FIELD_TYPES.keys() & data.keys():
+                data[key] = FORM_FIELD_TYPES[key](data[key])
+            return data
+        if content_type == 'multipart/form-data':
+            # The fields and files are not needed, only the size is recorded
+            return {'size': len(body)}
+        return None
+
+    def respond(self, status, data=None):
+        self.server.record_response(status)
+        body = b'' if status == 204 else json.dumps(
+            data if data is not None else {}).encode()
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', str(self.server.retry_after))
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            super().log_message(*args)
+
+
+class MockAPIServer(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server implementing the endpoints of the API server
+
+    Every request is handled in a separate thread. The created resources are
+    only counted (and the latest one of every endpoint is kept), unless
+    ``keep_records`` is set.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), latency=0, jitter=0,
+                 error_rate=0, rate_limit=None, burst=None,
+                 bulk_urls=BULK_URLS, username=None, password=None,
+                 token='mock-token', keep_records=False, seed=None,
+                 verbose=False):
+        """Constructor
+
+        :param tuple[str, int] address: address to listen on; port 0 selects
+            a free one (see ``server_port``)
+        :param float latency: time in seconds every request takes
+        :param float jitter: maximum random time in seconds added to
+            ``latency``
+        :param float error_rate: probability of responding with 503 Service
+            Unavailable
+        :param float|None rate_limit: maximum number of requests per second
+            (the others get 429 Too Many Requests); ``None`` for no limit
+        :param int|None burst: maximum number of requests above the rate
+            limit accepted at once (at least 1); ``rate_limit`` (but at least
+            1) by default
+        :param iterable[str] bulk_urls: endpoints accepting lists of resources
+        :param str|None username: username required to obtain the token; any
+            username is accepted if ``None``
+        :param str|None password: password required to obtain the token
+        :param str token: token returned by ``/token-auth/`` and required
+            by the other endpoints
+        :param bool keep_records: whether or not to keep all created
+            resources in ``records``
+        :param int|None seed: seed of the random errors and jitter
+        :param bool verbose: whether or not to log every request
+        :raise ValueError: if ``burst`` is less than 1
+        """
+        if burst is None:
+            burst = max(1, rate_limit) if rate_limit is not None else None
+        elif burst < 1:
+            raise ValueError('Burst must be at least 1 request')
+        super().__init__(address, MockAPIHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.bulk_urls = frozenset(bulk_urls)
+        self.username = username
+        self.password = password
+        self.token = token
+        self.keep_records = keep_records
+        self.verbose = verbose
+
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        # Token bucket of the rate limit
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        # URL -> number of resources created
+        self.created = Counter()
+        # Status code -> number of responses
+        self.responses = Counter()
+        # URL -> latest resource / list of all resources
+        self.latest = {}
+        self.records = {}
+
+    @property
+    def retry_after(self):
+        """Value of the ``Retry-After`` header sent with 429 responses (whole
+        seconds, as required by HTTP)"""
+        return max(1, math.ceil(1 / self.rate_limit)) if self.rate_limit else 1
+
+    def admit(self):
+        """Decide whether or not to handle the request
+
+        :return: status code to respond with instead of handling the request
+            (429 or 503) or ``None``
+        :rtype: int|None
+        """
+        with self.lock:
+            if self.rate_limit is not None:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (
+                    now - self._refilled_at) * self.rate_limit)
+                self._refilled_at = now
+                if self._tokens < 1:
+                    return 429
+                self._tokens -= 1
+            if self.error_rate and self.random.random() < self.error_rate:
+                return 503
+        return None
+
+    def delay(self):
+        """Wait for the configured latency"""
+        delay = self.latency
+        if self.jitter:
+            with self.lock:
+                delay += self.random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def authenticate(self, data):
+        """Return the response to ``/token-auth/`` request
+
+        :param dict|None data: request data
+        :return: status code and response data
+        :rtype: tuple[int, dict]
+        """
+        data = data if isinstance(data, dict) else {}
+        if (not data.get('username') or not data.get('password') or
+                (self.username is not None and
+                 data['username'] != self.username) or
+                (self.password is not None and
+                 data['password'] != self.password)):
+            return 400, {'non_field_errors': [
+                'Unable to log in with provided credentials.']}
+        return 200, {'token': self.token}
+
+    def authorized(self, authorization):
+        """Check the ``Authorization`` header
+
+        :param str|None authorization: value of the header
+        :rtype: bool
+        """
+        return authorization == 'Token {}'.format(self.token)
+
+    def create(self, url, data):
+        """Create resources from given data
+
+        :param str url: endpoint URL
+        :param dict|list[dict] data: resource or list of resources
+        :return: created resource(s)
+        :rtype: dict|list[dict]
+        """
+        items = data if isinstance(data, list) else [data]
+        created = []
+        now = encode_datetime(datetime.utcnow())
+        with self.lock:
+            for item in items:
+                resource = dict(DEFAULTS.get(url, ()))
+                resource['timestamp'] = now
+                resource.update(item)
+                self.created[url] += 1
+                resource['id'] = self.created[url]
+                created.append(resource)
+            self.latest[url] = created[-1]
+            if self.keep_records:
+                self.records.setdefault(url, []).extend(created)
+        return created if isinstance(data, list) else created[0]
+
+    def get_latest(self, url):
+        """Return the latest resource created at given endpoint
+
+        :param str url: endpoint URL
+        :rtype: dict|None
+        """
+        with self.lock:
+            return self.latest.get(url)
+
+    def record_response(self, status):
+        with self.lock:
+            self.responses[status] += 1
+
+
+def main(args=None):
+    arg_parser = argparse.ArgumentParser(
+        description='Run a local stand-in for the API server.')
+    arg_parser.add_argument('--host', default='127.0.0.1',
+                            help='address to listen on (default: %(default)s)')
+    arg_parser.add_argument('--port', type=int, default=8000,
+                            help='port to listen on (default: %(default)s)')
+    arg_parser.add_argument(
+        '--latency', type=float, default=0, metavar='SECONDS',
+        help='time every request takes (default: 0)')
+    arg_parser.add_argument(
+        '--jitter', type=float, default=0, metavar='SECONDS',
+        help='maximum random time added to the latency (default: 0)')
+    arg_parser.add_argument(
+        '--error-rate', type=float, default=0, metavar='P',
+        help='probability of responding with 503 (default: 0)')
+    arg_parser.add_argument(
+        '--rate-limit', type=float, default=None, metavar='REQUESTS',
+        help='maximum number of requests per second; the others get 429 '
+             '(default: no limit)')
+    arg_parser.add_argument(
+        '--burst', type=int, default=None, metavar='REQUESTS',
+        help='number of requests above the rate limit accepted at once '
+             '(default: the rate limit)')
+    arg_parser.add_argument('--username', help='username to accept')
+    arg_parser.add_argument('--password', help='password to accept')
+    arg_parser.add_argument('--verbose', action='store_true',
+                            help='log every request')
+    args = arg_parser.parse_args(args)
+
+    server = MockAPIServer(
+        (args.host, args.port), args.latency, args.jitter, args.error_rate,
+        args.rate_limit, args.burst, username=args.username,
+        password=args.password, verbose=args.verbose)
+    print('Serving on http://{}:{}/'.format(*server.server_address))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print('Created: {}'.format(', '.join(
+            '{} {}'.format(url, count)
+            for url, count in sorted(server.created.items())) or 'nothing'))
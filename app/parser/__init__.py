@@ -1,6 +1,3 @@
-import collections
-
-
 class OutputLine:
     __slots__ = ['id', 'parse_timestamp', 'last_timestamp', 'content']
 
@@ -42,24 +39,37 @@ class Parser:
         else:
             self.serializer = self.serializer()
 
+    def get_message_ids(self):
+        """Return the message IDs this parser handles
+
+        :return: tuple of message IDs
+        :rtype: tuple[str]
+        """
+        if self.id is None:
+            return ()
+        elif isinstance(self.id, str):
+            return self.id,
+        return tuple(self.id)
+
     def can_parse(self, line):
         """Check if given file can be parsed by current Parser
 
         Default implementation iterates over the IDs specified in `self.id`
         and returns one if found at the beginning of provided line.
 
+        Note that :py:class:`Dispatcher` does not call this method for parsers
+        that don't override it; it looks up the message ID (i.e. the part of
+        the line before the first comma) in its own table instead. Subclasses
+        handling messages without an ID should override this method.
+
         :param str line: line to be parsed
         :return: message ID if given line can be parsed by current Parser;
             `False` otherwise
         :rtype: str|bool
         """
-        if isinstance(self.id, collections.Iterable):
-            for msg_id in self.id:
-                if line.startswith(msg_id):
-                    return msg_id
-        elif isinstance(self.id, str):
-            if line.startswith(self.id):
-                return self.id
+        for msg_id in self.get_message_ids():
+            if line.startswith(msg_id):
+                return msg_id
         return False
 
     def parse(self, line, probe_start_time, collector=None):
@@ -100,6 +110,79 @@ class Parser:
 
         return data_dict
 
+    def get_state(self):
+        """Return the state carried by the parser from one line to another
+
+        The state is used when the output is split into parts parsed
+        independently (see :py:mod:`app.parser.sharding`). Default
+        implementation returns ``None``, meaning that the parser is stateless.
+
+        :return: picklable state of the parser
+        """
+        return None
+
+    def set_state(self, state):
+        """Restore the state returned by :py:meth:`get_state`
+
+        :param state: state to restore
+        """
+        pass
+
+    @staticmethod
+    def merge_states(state, later_state):
+        """Combine the states of two consecutive parts of the output
+
+        :param state: state after parsing the first part
+        :param later_state: state after parsing the second part, starting with
+            an empty state
+        :return: state after parsing both parts
+        """
+        return later_state
+
+
+class Dispatcher:
+    """
+    Finds the parser for given line of output
+
+    The message IDs of all parsers are put in a dictionary once, so the lookup
+    does not depend on the number of parsers registered. Parsers that override
+    :py:meth:`Parser.can_parse` (e.g. the ones handling messages without an
+    ID) are only asked if the message ID is not found in the dictionary.
+    """
+
+    def __init__(self, parsers):
+        """Constructor
+
+        :param list[Parser] parsers: parsers to dispatch the lines to. If more
+            than one parser handles the same message ID, the first one is
+            used.
+        """
+        self.table = {}
+        self.fallback_parsers = []
+        for parser in parsers:
+            if type(parser).can_parse is not Parser.can_parse:
+                self.fallback_parsers.append(parser)
+                continue
+            for msg_id in parser.get_message_ids():
+                self.table.setdefault(msg_id, (parser, msg_id))
+
+    def classify(self, line):
+        """Return the parser for given line and the message ID of the line
+
+        :param str line: line of output
+        :return: parser and the message ID or ``(None, None)`` if the line
+            can't be parsed by any parser
+        :rtype: tuple[Parser, str]|tuple[None, None]
+        """
+        entry = self.table.get(line.partition(',')[0])
+        if entry is not None:
+            return entry
+        for parser in self.fallback_parsers:
+            msg_id = parser.can_parse(line)
+            if msg_id:
+                return parser, msg_id
+        return None, None
+
 
 class ParseError(Exception):
     def __init__(self, message, parser_name=None):
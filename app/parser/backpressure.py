@@ -0,0 +1,247 @@
+"""
+Backpressure between the parser and the sender.
+
+If the server can't keep up with the data (or can't be reached at all), the
+request queue of :py:class:`app.sender.Sender` grows without limit.
+:py:class:`BackpressurePolicy` watches the length of the queue and its growth
+rate and, when the link degrades, switches the selected endpoints (telemetry
+by default) into a downsampling mode: only every ``factor``-th record is sent
+(:py:attr:`BackpressurePolicy.DECIMATE`) or the records are combined into
+a single one per window of ``factor`` records
+(:py:attr:`BackpressurePolicy.AGGREGATE`, see :py:func:`aggregate`).
+
+The policy only decides what is sent to the server; the analyzer (collector)
+still receives every sample, since it is fed by the parsers themselves.
+"""
+import logging
+import numbers
+import time
+
+
+def aggregate(records):
+    """Combine given records into a single one
+
+    Numeric values are replaced with their mean; other values (e.g. the
+    timestamp) are taken from the last record. The minimum and maximum of
+    every numeric value are added with ``_min`` and ``_max`` suffixes, and the
+    number of records combined as ``sample_count`` (the record stays flat, so
+    it can be sent with any encoding)::
+
+        {..., 'temperature': 21.5, 'temperature_min': 21.0,
+         'temperature_max': 22.0, 'sample_count': 10}
+
+    :param list[dict] records: records to combine (at least one)
+    :rtype: dict
+    """
+    last = records[-1]
+    result = dict(last)
+    for key, value in last.items():
+        if not isinstance(value, numbers.Real) or isinstance(value, bool):
+            continue
+        values = [record[key] for record in records
+                  if record.get(key) is not None]
+        result[key] = sum(values) / len(values)
+        result[key + '_min'] = min(values)
+        result[key + '_max'] = max(values)
+    result['sample_count'] = len(records)
+    return result
+
+
+class BackpressurePolicy:
+    """
+    Downsampling of the data sent when the request queue grows
+
+    The policy is in the :py:attr:`NORMAL` mode until the queue length
+    reaches ``high_watermark`` or, if ``growth_threshold`` is set, until the
+    queue is longer than ``low_watermark`` and grows faster than
+    ``growth_threshold`` requests per second. It then downsamples the data
+    until the queue is drained to ``low_watermark``.
+
+    The queue is checked at most every ``check_interval`` seconds, when the
+    data is passed to :py:meth:`filter`. Every transition is logged and
+    reported with :py:meth:`on_mode_changed`; :py:meth:`snapshot` returns the
+    current state and counters.
+
+    The class is not thread-safe; it's supposed to be used by a single parser.
+    """
+
+    NORMAL = 'normal'
+    DOWNSAMPLING = 'downsampling'
+
+    DECIMATE = 'decimate'
+    """Downsampling method sending only every ``factor``-th record"""
+    AGGREGATE = 'aggregate'
+    """Downsampling method sending an aggregate of every ``factor`` records"""
+    METHODS = (DECIMATE, AGGREGATE)
+
+    logger = logging.getLogger('Parser')
+
+    def __init__(self, sender, high_watermark=1000, low_watermark=100,
+                 growth_threshold=20, method=DECIMATE, factor=10,
+                 urls=('/telemetry/',), check_interval=0.1,
+                 clock=time.monotonic):
+        """Constructor
+
+        :param app.sender.Sender sender: Sender whose queue is watched
+        :param int high_watermark: queue length starting the downsampling
+        :param int low_watermark: queue length ending the downsampling
+        :param float|None growth_threshold: queue growth rate (in requests per
+            second) starting the downsampling when the queue is longer than
+            ``low_watermark``; ``None`` to only look at the length
+        :param str method: :py:attr:`DECIMATE` or :py:attr:`AGGREGATE`
+        :param int factor: number of records per record sent when
+            downsampling
+        :param iterable[str] urls: URLs of the endpoints whose data may be
+            downsampled
+        :param float check_interval: minimum time in seconds between the
+            checks of the queue
+        :param function clock: function returning the current time in seconds
+        :raise ValueError: if the parameters are invalid
+        """
+        if method not in self.METHODS:
+            raise ValueError('Unknown downsampling method: {}'.format(method))
+        if factor < 1:
+            raise ValueError('Downsampling factor must be positive')
+        if low_watermark > high_watermark:
+            raise ValueError('Low watermark must not be greater than the '
+                             'high watermark')
+        self.sender = sender
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.growth_threshold = growth_threshold
+        self.method = method
+        self.factor = factor
+        self.urls = frozenset(urls)
+        self.check_interval = check_interval
+        self.clock = clock
+
+        self.mode = self.NORMAL
+        # Last measured queue length and growth rate
+        self.depth = 0
+        self.growth_rate = 0.0
+        self._checked_at = None
+        # Metrics
+        self.transitions = 0
+        self.forwarded = 0
+        self.downsampled = 0
+        self.aggregates = 0
+        # URL -> number of records seen since the downsampling started
+        self._counters = {}
+        # URL -> records waiting to be aggregated
+        self._windows = {}
+
+    def filter(self, url, data):
+        """Decide what to send instead of given record
+
+        :param str url: URL of the endpoint the record is sent to
+        :param dict data: record to send
+        :return: record to send (``data`` itself or an aggregate) or ``None``
+            if nothing should be sent now
+        :rtype: dict|None
+        """
+        now = self.clock()
+        if (self._checked_at is None or
+                now - self._checked_at >= self.check_interval):
+            self.check(now)
+        if url not in self.urls:
+            return data
+
+        if self.mode == self.NORMAL:
+            window = self._windows.pop(url, None)
+            if window is None:
+                self.forwarded += 1
+                return data
+            # Finish the last window, so no record is lost
+            window.append(data)
+            return self._aggregate(window)
+
+        if self.method == self.DECIMATE:
+            count = self._counters.get(url, 0)
+            self._counters[url] = count + 1
+            if count % self.factor == 0:
+                self.forwarded += 1
+                return data
+            self.downsampled += 1
+            return None
+
+        window = self._windows.setdefault(url, [])
+        window.append(data)
+        if len(window) < self.factor:
+            return None
+        del self._windows[url]
+        return self._aggregate(window)
+
+    def check(self, now=None):
+        """Measure the queue and switch the mode if necessary
+
+        :param float|None now: current time; taken from the clock by default
+        """
+        if now is None:
+            now = self.clock()
+        depth = len(self.sender)
+        if self._checked_at is not None and now > self._checked_at:
+            self.growth_rate = (depth - self.depth) / (now - self._checked_at)
+        self.depth = depth
+        self._checked_at = now
+
+        if self.mode == self.NORMAL:
+            if depth >= self.high_watermark:
+                self._set_mode(self.DOWNSAMPLING, 'queue length reached {}'
+                               .format(self.high_watermark))
+            elif (self.growth_threshold is not None and
+                  depth > self.low_watermark and
+                  self.growth_rate >= self.growth_threshold):
+                self._set_mode(self.DOWNSAMPLING, 'queue growing by {:.1f} '
+                               'requests/s'.format(self.growth_rate))
+        elif depth <= self.low_watermark:
+            self._set_mode(self.NORMAL, 'queue drained to {}'.format(
+                self.low_watermark))
+
+    def snapshot(self):
+        """Return the current state of the policy
+
+        :return: dictionary with ``mode``, ``depth`` (queue length),
+            ``growth_rate`` (requests per second), ``transitions`` (number of
+            mode changes), ``forwarded`` (records sent unchanged),
+            ``downsampled`` (records not sent separately) and ``aggregates``
+            (aggregated records sent)
+        :rtype: dict
+        """
+        return {
+            'mode': self.mode,
+            'depth': self.depth,
+            'growth_rate': self.growth_rate,
+            'transitions': self.transitions,
+            'forwarded': self.forwarded,
+            'downsampled': self.downsampled,
+            'aggregates': self.aggregates,
+        }
+
+    def _aggregate(self, window):
+        self.downsampled += len(window)
+        self.aggregates += 1
+        return aggregate(window)
+
+    def _set_mode(self, mode, reason):
+        self.mode = mode
+        self.transitions += 1
+        self._counters.clear()
+        if mode == self.DOWNSAMPLING:
+            self.logger.warning(
+                'Downsampling the data by %d (%s): %s (%d requests queued)',
+                self.factor, self.method, reason, self.depth)
+        else:
+            self.logger.info('Sending all data again: %s', reason)
+        self.on_mode_changed(mode, self.depth, self.growth_rate)
+
+    def on_mode_changed(self, mode, depth, growth_rate):
+        """Called when the mode of the policy changes.
+
+        The method is supposed to be overridden by subclasses.
+
+        :param str mode: new mode (:py:attr:`NORMAL` or
+            :py:attr:`DOWNSAMPLING`)
+        :param int depth: queue length
+        :param float growth_rate: queue growth rate in requests per second
+        """
+        pass
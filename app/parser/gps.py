@@ -124,6 +124,19 @@ class GPSParser(Parser):
         if line.id == '$GPRMC':
             return self.data.copy()
 
+    def get_state(self):
+        # Values from the latest $GPGGA are sent along with the next $GPRMC
+        return self.data.copy()
+
+    def set_state(self, state):
+        self.data = state.copy()
+
+    @staticmethod
+    def merge_states(state, later_state):
+        merged = state.copy()
+        merged.update(later_state)
+        return merged
+
 
 class ExtendedGPSParser(GPSParser):
     """Subclass of GPSParser that parses a few more GPS messages
@@ -0,0 +1,308 @@
+"""
+Index of archived output files for seeking by the probe timestamp.
+
+The index is an array with an entry for every complete line of the file: its
+byte offset and the probe timestamp (milliseconds since the start of the probe
+software) in effect at that line, i.e. the timestamp of the line itself or of
+the latest line before that had one (the same value
+:py:class:`app.parser.outputparser.BaseOutputParser` uses as
+``last_timestamp``). Lines before the first timestamp get
+:py:data:`NO_TIMESTAMP`.
+
+The array is stored next to the file (with :py:data:`INDEX_SUFFIX` appended to
+the name) in NumPy ``.npy`` format. An extra entry at the end contains the
+offset after the last indexed line, so when the file grows, only the new part
+has to be indexed.
+
+The timestamps are taken from the ``timestamp`` fields of the serializers
+without parsing the other fields, so a line is assumed to have a timestamp
+even if some of its other values are invalid.
+"""
+import mmap
+import os
+
+import numpy
+
+from app.parser.outputparser import PARSERS
+from app.parser.reader import DEFAULT_BLOCK_SIZE, BlockLineReader
+from app.parser.serializer import BaseSerializer
+from app.parser.serializer.compiler import get_defining_class
+from app.parser.serializer.fields import TimestampField, ValidationError
+
+INDEX_SUFFIX = '.idx'
+"""Suffix appended to the name of the indexed file to get the index path"""
+
+INDEX_DTYPE = numpy.dtype([('offset', '<i8'), ('timestamp', '<i8')])
+"""Type of the index entries"""
+
+NO_TIMESTAMP = -1
+"""Timestamp of the lines before the first line with a timestamp"""
+
+
+def get_timestamp_fields(parser_classes=PARSERS):
+    """Find the positions of the timestamps in the messages
+
+    Only the serializers using the default ``get_data`` and having
+    a :py:class:`app.parser.serializer.fields.TimestampField` named
+    ``timestamp`` are taken into account.
+
+    :param list parser_classes: classes of the parsers to use
+    :return: message ID (as bytes) -> ``(separator, position, field,
+        min_count, max_count)`` tuple, where ``position`` is the index of the
+        timestamp when the line is split by the separator and the counts are
+        the allowed numbers of values in the line
+    :rtype: dict
+    """
+    result = {}
+    for parser_cls in parser_classes:
+        parser = parser_cls()
+        if isinstance(parser_cls.serializer, dict):
+            serializers = parser_cls.serializer
+        else:
+            serializers = dict.fromkeys(parser.get_message_ids(),
+                                        parser_cls.serializer)
+        for msg_id, serializer_cls in serializers.items():
+            field = serializer_cls.fields.get('timestamp')
+            if (not isinstance(field, TimestampField) or
+                    get_defining_class(serializer_cls, 'get_data') is not
+                    BaseSerializer):
+                continue
+            field_count = len(serializer_cls.fields)
+            result[msg_id.encode()] = (
+                serializer_cls.separator.encode(),
+                list(serializer_cls.fields).index('timestamp') + 1, field,
+                field_count - serializer_cls.optional_count + 1,
+                field_count + 1)
+    return result
+
+
+def index_lines(data, start, timestamp_fields, last_timestamp=NO_TIMESTAMP):
+    """Create the index entries for the complete lines in given data
+
+    :param data: data of the file (e.g. :py:class:`mmap.mmap`)
+    :param int start: offset of the first line to index
+    :param dict timestamp_fields: see :py:func:`get_timestamp_fields`
+    :param int last_timestamp: timestamp in effect before the first line
+    :return: index entries and the offset after the last complete line
+    :rtype: tuple[numpy.ndarray, int]
+    """
+    buffer = numpy.frombuffer(data, numpy.uint8)
+    ends = numpy.flatnonzero(buffer[start:] == ord('\n')) + start
+    if not len(ends):
+        return numpy.empty(0, INDEX_DTYPE), start
+    starts = numpy.concatenate(([start], ends[:-1] + 1))
+
+    timestamps = []
+    for line_start, line_end in zip(starts.tolist(), ends.tolist()):
+        line = data[line_start:line_end]
+        entry = timestamp_fields.get(line.partition(b',')[0])
+        if entry is not None:
+            separator, position, field, min_count, max_count = entry
+            values = line.split(separator)
+            if min_count <= len(values) <= max_count:
+                try:
+                    timestamp = field.get_value(
+                        values[position].decode('ascii').rstrip('\r'))
+                except (ValidationError, ValueError, UnicodeDecodeError):
+                    timestamp = None
+                if timestamp is not None:
+                    last_timestamp = timestamp
+        timestamps.append(last_timestamp)
+
+    entries = numpy.empty(len(starts), INDEX_DTYPE)
+    entries['offset'] = starts
+    entries['timestamp'] = timestamps
+    return entries, int(ends[-1]) + 1
+
+
+class CaptureIndex:
+    """
+    Memory-mapped archived output file together with its index
+
+    Use :py:meth:`open_range` to get the lines from a time range without
+    reading the rest of the file.
+    """
+
+    def __init__(self, path, parser_classes=PARSERS):
+        """Constructor
+
+        Loads the index of the file, creating or updating it if needed.
+
+        :param str path: path to the output file
+        :param list parser_classes: classes of the parsers to use to find the
+            timestamps
+        """
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.file = open(path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        self.data = (mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+                     if size else b'')
+
+        index = self._load_index()
+        if index is None or index[-1]['offset'] > size:
+            index = numpy.array([(0, NO_TIMESTAMP)], INDEX_DTYPE)
+        end = int(index[-1]['offset'])
+        if end != size:
+            entries, end = index_lines(
+                self.data, end, get_timestamp_fields(parser_classes),
+                int(index[-1]['timestamp']))
+            if len(entries):
+                sentinel = numpy.array([(end, entries[-1]['timestamp'])],
+                                       INDEX_DTYPE)
+                index = numpy.concatenate((index[:-1], entries, sentinel))
+                self._save_index(index)
+        self.index = index
+        self.entries = index[:-1]
+        self.sorted = bool(numpy.all(numpy.diff(self.entries['timestamp'])
+                                     >= 0))
+
+    def _load_index(self):
+        try:
+            index = numpy.load(self.index_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        if index.dtype != INDEX_DTYPE or index.ndim != 1 or not len(index):
+            return None
+        return index
+
+    def _save_index(self, index):
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            numpy.save(f, index)
+        os.replace(temp_path, self.index_path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_line_ranges(self, t0=None, t1=None):
+        """Return the indices of the lines with timestamps in given range
+
+        :param float|None t0: start of the range (inclusive) in seconds since
+            the start of the probe software; ``None`` for no lower bound
+        :param float|None t1: end of the range (exclusive) in seconds since
+            the start of the probe software; ``None`` for no upper bound
+        :return: list of ``(first, last)`` ranges of consecutive line indices
+            (``last`` excluded)
+        :rtype: list[tuple[int, int]]
+        """
+        timestamps = self.entries['timestamp']
+        low = NO_TIMESTAMP if t0 is None else t0 * 1000
+        high = None if t1 is None else t1 * 1000
+        if self.sorted:
+            first = (0 if t0 is None else
+                     int(numpy.searchsorted(timestamps, low, 'left')))
+            last = (len(timestamps) if t1 is None else
+                    int(numpy.searchsorted(timestamps, high, 'left')))
+            return [(first, last)] if first < last else []
+
+        mask = timestamps >= low
+        if high is not None:
+            mask &= timestamps < high
+        edges = numpy.flatnonzero(numpy.diff(numpy.concatenate(
+            ([False], mask, [False])).astype(numpy.int8)))
+        return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+    def get_byte_ranges(self, t0=None, t1=None):
+        """Return the byte ranges of the lines with timestamps in given range
+
+        :param float|None t0: see :py:meth:`get_line_ranges`
+        :param float|None t1: see :py:meth:`get_line_ranges`
+        :return: list of ``(start, end)`` byte offsets; every range consists
+            of complete lines (including the terminators)
+        :rtype: list[tuple[int, int]]
+        """
+        offsets = self.index['offset']
+        return [(int(offsets[first]), int(offsets[last]))
+                for first, last in self.get_line_ranges(t0, t1)]
+
+    def open_range(self, t0=None, t1=None):
+        """Iterate over the lines with timestamps in given range
+
+        The lines are returned as :py:class:`memoryview` slices of the
+        memory-mapped file, so they are not copied (use ``bytes(line)`` or
+        ``str(line, encoding)`` to get a copy). The slices must be released
+        before :py:meth:`close` is called.
+
+        :param float|None t0: see :py:meth:`get_line_ranges`
+        :param float|None t1: see :py:meth:`get_line_ranges`
+        :return: iterator of lines without line terminators
+        """
+        view = memoryview(self.data)
+        offsets = self.index['offset'].tolist()
+        try:
+            for first, last in self.get_line_ranges(t0, t1):
+                for i in range(first, last):
+                    end = offsets[i + 1] - 1
+                    if end > offsets[i] and view[end - 1] == ord('\r'):
+                        end -= 1
+                    yield view[offsets[i]:end]
+        finally:
+            view.release()
+
+    def get_timestamp(self, line):
+        """Return the timestamp in effect at given line
+
+        :param int line: index of the line
+        :return: milliseconds since the start of the probe software or
+            :py:data:`NO_TIMESTAMP`
+        :rtype: int
+        """
+        return int(self.entries[line]['timestamp'])
+
+    def create_reader(self, t0=None, t1=None, block_size=DEFAULT_BLOCK_SIZE,
+                      encoding='utf-8'):
+        """Create a line reader returning the lines in given range
+
+        The reader can be used in place of the ones in
+        :py:mod:`app.parser.reader`.
+
+        :param float|None t0: see :py:meth:`get_line_ranges`
+        :param float|None t1: see :py:meth:`get_line_ranges`
+        :param int block_size: maximum number of bytes to return at once
+        :param str encoding: encoding of the file
+        :rtype: RangeLineReader
+        """
+        return RangeLineReader(self.data, self.get_byte_ranges(t0, t1),
+                               block_size, encoding)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RangeLineReader(BlockLineReader):
+    """
+    Reader that returns the lines from given byte ranges of the data (see
+    :py:meth:`CaptureIndex.create_reader`)
+    """
+
+    def __init__(self, data, ranges, block_size=DEFAULT_BLOCK_SIZE,
+                 encoding='utf-8'):
+        """Constructor
+
+        :param data: data of the file (e.g. :py:class:`mmap.mmap`)
+        :param list[tuple[int, int]] ranges: byte ranges to read, consisting
+            of complete lines
+        :param int block_size: maximum number of bytes to return at once
+        :param str encoding: encoding of the file
+        """
+        super().__init__(None, block_size, encoding)
+        self.data = data
+        self.ranges = list(reversed(ranges))
+
+    def read_block(self):
+        if not self.ranges:
+            return None
+        start, end = self.ranges.pop()
+        if end - start > self.block_size:
+            self.ranges.append((start + self.block_size, end))
+            end = start + self.block_size
+        return self.data[start:end]
@@ -2,14 +2,16 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from time import sleep
+from threading import Lock
 
 from PyQt5.QtCore import QThread, pyqtSignal, QObject
 
-from app.parser import OutputLine, ParseError
+from app.parser import Dispatcher, OutputLine, ParseError, reader, waiter
+from app.parser.backpressure import BackpressurePolicy
 from app.parser.kundt import KundtParser
 from app.parser.telemetry import TelemetryParser
 from app.parser.gps import GPSParser
+from app.settings import Settings
 
 PARSERS = [GPSParser, TelemetryParser, KundtParser]
 
@@ -21,7 +23,12 @@ class BaseOutputParser:
 
     logger = logging.getLogger('Parser')
 
-    def __init__(self, parsers, sender, analyzer_worker):
+    waiter_factory = staticmethod(waiter.create_input_waiter)
+    """Function creating :py:class:`app.parser.waiter.InputWaiter` used to
+    wait for new data; takes file descriptor and path as arguments"""
+
+    def __init__(self, parsers, sender, analyzer_worker, block_size=None,
+                 backpressure=None):
         """Constructor
 
         :param list parsers: list of parsers to use
@@ -29,13 +36,26 @@ class BaseOutputParser:
             the parsed data
         :param app.analyzer.AnalyzerWorker analyzer_worker: AnalyzerWorker
             instance to pass the parsed data to
+        :param int|None block_size: if set, the file is read in blocks of
+            given size (see :py:class:`app.parser.reader.BlockLineReader`);
+            otherwise it's read line by line
+        :param app.parser.backpressure.BackpressurePolicy|None backpressure:
+            policy deciding which of the parsed records are sent when the
+            request queue grows; if ``None``, all records are sent
         """
         self._parsers = parsers
+        self._dispatcher = Dispatcher(parsers)
+        self.block_size = block_size
         self.sender = sender
         self.analyzer_worker = analyzer_worker
+        self.backpressure = backpressure
         self.is_terminated = False
         self.probe_start_time = None
         self.last_timestamp = None
+        # InputWaiter used by parse_file; guarded by _waiter_lock, so
+        # mark_terminated can safely wake it up from another thread
+        self._waiter = None
+        self._waiter_lock = Lock()
 
     def parse_file(self, filename):
         """Opens given file and parses the lines inside it indefinitely
@@ -45,34 +65,87 @@ class BaseOutputParser:
         :param str filename: path to the file to parse
         """
         fd = os.open(filename, os.O_RDONLY | os.O_NONBLOCK)
-        with open(fd) as f:
+        try:
+            input_waiter = self.waiter_factory(fd, filename)
+            with self._waiter_lock:
+                self._waiter = input_waiter
+                if self.is_terminated:
+                    input_waiter.wake_up()
+            try:
+                line_reader = self.create_reader(fd)
+                while not self.is_terminated:
+                    lines = line_reader.read_lines()
+                    if lines is None:
+                        input_waiter.wait()
+                        continue
+                    self.parse_lines(lines)
+            finally:
+                with self._waiter_lock:
+                    self._waiter = None
+                input_waiter.close()
+        finally:
+            os.close(fd)
+
+    def parse_serial(self, port, baudrate, archive_path=None):
+        """Parse the lines read directly from a serial port until terminated
+
+        The function catches ParseErrors and passes them to the logger.
+
+        :param str port: serial port to read from
+        :param int baudrate: baud rate of the port
+        :param str|None archive_path: path to the file to append the raw data
+            to (see :py:class:`app.parser.reader.SerialLineReader`)
+        """
+        line_reader = reader.SerialLineReader(
+            port, baudrate, archive_path,
+            block_size=self.block_size or reader.DEFAULT_BLOCK_SIZE)
+        try:
             while not self.is_terminated:
-                line = f.readline()
-                if line == '':
-                    # We are not able to differentiate between EOF and blocking
-                    # IO, so we just wait a while assuming we'll get some data
-                    # later
-                    sleep(0.05)
-                    continue
-                line = line.rstrip('\r\n')
-                if line == '':
-                    self.logger.warning('Empty line received')
-                    continue
-
-                try:
-                    self.parse_line(line)
-                except ParseError as e:
-                    logger = (logging.getLogger(e.parser_name) if e.parser_name
-                              else self.logger)
-                    logger.exception('Could not parse line: %s (%s)', line,
-                                     str(e))
+                lines = line_reader.read_lines()
+                if lines:
+                    self.parse_lines(lines)
+        finally:
+            line_reader.close()
+
+    def create_reader(self, fd):
+        """Create line reader for given file descriptor
+
+        :param int fd: descriptor of the file to read
+        :return: :py:class:`app.parser.reader.BlockLineReader` if
+            ``block_size`` is set; :py:class:`app.parser.reader.TextLineReader`
+            otherwise
+        """
+        if self.block_size:
+            return reader.BlockLineReader(fd, self.block_size)
+        return reader.TextLineReader(fd)
+
+    def parse_lines(self, lines):
+        """Parse a batch of lines of output
+
+        Unlike :py:meth:`parse_line`, the function catches ParseErrors and
+        passes them to the logger.
+
+        :param list[str] lines: lines to parse, without line terminators
+        """
+        for line in lines:
+            if line == '':
+                self.logger.warning('Empty line received')
+                continue
+
+            try:
+                self.parse_line(line)
+            except ParseError as e:
+                logger = (logging.getLogger(e.parser_name) if e.parser_name
+                          else self.logger)
+                logger.exception('Could not parse line: %s (%s)', line,
+                                 str(e))
 
     def parse_line(self, line):
         """Parse single line of output
 
-        The function iterates over the available parsers and tries to use the
-        first one which has registered message ID that is present at the
-        beginning of the provided line
+        The function looks up the parser which has registered message ID
+        that is present at the beginning of the provided line (see
+        :py:class:`app.parser.Dispatcher`)
 
         :param str line: line to parse
         :raise ParseError: if line was not parsed by any registered parser, or
@@ -80,34 +153,35 @@ class BaseOutputParser:
             (a subclass called :py:class:`ValidationError` is usually raised
             in that case)
         """
-        for parser in self._parsers:
-            msg_id = parser.can_parse(line)
-            if msg_id:
-                parser_name = parser.__class__.__name__
-                output_line = OutputLine(msg_id, datetime.now(),
-                                         self.last_timestamp, line)
-                try:
-                    data = parser.parse(output_line, self.probe_start_time,
-                                        self.analyzer_worker)
-                    self.on_line_parsed(output_line)
-                except ParseError as e:
-                    self.on_line_parse_failed(output_line)
-                    # Add parser_name info
-                    e.parser_name = parser_name
-                    raise
-                if data:
-                    if 'timestamp' in data:
-                        # Save timestamp for future messages (which may not
-                        # contain timestamp data)
-                        self.last_timestamp = data['timestamp']
-                    else:
-                        # Use saved timestamp if necessary
-                        data['timestamp'] = self.last_timestamp
-                    self.sender.add_request(
-                        parser_name, parser.url, data, append_timestamp=False)
-                return
-
-        raise ParseError('Line was not parsed by any parser')
+        parser, msg_id = self._dispatcher.classify(line)
+        if parser is None:
+            raise ParseError('Line was not parsed by any parser')
+
+        output_line = OutputLine(msg_id, datetime.now(), self.last_timestamp,
+                                 line)
+        try:
+            data = parser.parse(output_line, self.probe_start_time,
+                                self.analyzer_worker)
+            self.on_line_parsed(output_line)
+        except ParseError as e:
+            self.on_line_parse_failed(output_line)
+            # Add parser_name info
+            e.parser_name = parser.__class__.__name__
+            raise
+        if data:
+            if 'timestamp' in data:
+                # Save timestamp for future messages (which may not
+                # contain timestamp data)
+                self.last_timestamp = data['timestamp']
+            else:
+                # Use saved timestamp if necessary
+                data['timestamp'] = self.last_timestamp
+            if self.backpressure is not None:
+                data = self.backpressure.filter(parser.url, data)
+                if data is None:
+                    return
+            self.sender.add_request(parser.__class__.__name__, parser.url,
+                                    data, append_timestamp=False)
 
     def set_probe_start_time(self, start_time):
         """Set probe start time
@@ -134,9 +208,13 @@ class BaseOutputParser:
 
         The effect of calling this function is return from parse_file at the
         next loop iteration (so, in practice, after parsing currently parsed
-        line or after waiting at most 50ms).
+        line). If the parser is waiting for new data, it is woken up
+        immediately.
         """
-        self.is_terminated = True
+        with self._waiter_lock:
+            self.is_terminated = True
+            if self._waiter is not None:
+                self._waiter.wake_up()
 
     def on_line_parsed(self, output_line):
         """Called when a line of output was parsed properly
@@ -163,9 +241,11 @@ class OutputParser(BaseOutputParser):
     Subclass of :py:class:`BaseOutputParser` that uses all available parsers
     """
 
-    def __init__(self, sender, analyzer_worker):
+    def __init__(self, sender, analyzer_worker, block_size=None,
+                 backpressure=None):
         parsers = [Parser() for Parser in PARSERS]
-        super().__init__(parsers, sender, analyzer_worker)
+        super().__init__(parsers, sender, analyzer_worker, block_size,
+                         backpressure)
 
 
 class QtOutputParserWorker(QThread, OutputParser):
@@ -175,7 +255,8 @@ class QtOutputParserWorker(QThread, OutputParser):
     line_parsed = pyqtSignal(OutputLine)
     line_parse_failed = pyqtSignal(OutputLine)
 
-    def __init__(self, path, sender, analyzer_worker, parent=None):
+    def __init__(self, path, sender, analyzer_worker, parent=None,
+                 block_size=None, backpressure=None):
         """Constructor
 
         :param str path: path to file to parse
@@ -184,9 +265,13 @@ class QtOutputParserWorker(QThread, OutputParser):
         :param app.analyzer.AnalyzerWorker analyzer_worker: AnalyzerWorker
             instance to pass the parsed data to
         :param QObject parent: QObject parent of the thread
+        :param int|None block_size: see :py:class:`BaseOutputParser`
+        :param app.parser.backpressure.BackpressurePolicy|None backpressure:
+            see :py:class:`BaseOutputParser`
         """
         super(QtOutputParserWorker, self).__init__(
-            parent, sender=sender, analyzer_worker=analyzer_worker)
+            parent, sender=sender, analyzer_worker=analyzer_worker,
+            block_size=block_size, backpressure=backpressure)
         self.path = path
 
     def on_line_parsed(self, output_line):
@@ -202,6 +287,55 @@ class QtOutputParserWorker(QThread, OutputParser):
             self.logger.exception('Could not parse file (%s)', str(e))
 
 
+class QtSerialParserWorker(QtOutputParserWorker):
+    """
+    :py:class:`QtOutputParserWorker` that reads the data directly from
+    a serial port instead of a file.
+    """
+
+    def __init__(self, port, baudrate, archive_path, sender, analyzer_worker,
+                 parent=None, block_size=None, backpressure=None):
+        """Constructor
+
+        :param str port: serial port to read from
+        :param int baudrate: baud rate of the port
+        :param str|None archive_path: path to the file to append the raw data
+            to
+        :param app.sender.Sender sender: Sender instance to use to send
+            the parsed data
+        :param app.analyzer.AnalyzerWorker analyzer_worker: AnalyzerWorker
+            instance to pass the parsed data to
+        :param QObject parent: QObject parent of the thread
+        :param int|None block_size: see :py:class:`BaseOutputParser`
+        :param app.parser.backpressure.BackpressurePolicy|None backpressure:
+            see :py:class:`BaseOutputParser`
+        """
+        super().__init__(port, sender, analyzer_worker, parent, block_size,
+                         backpressure)
+        self.baudrate = baudrate
+        self.archive_path = archive_path
+
+    def run(self):
+        try:
+            self.parse_serial(self.path, self.baudrate, self.archive_path)
+        except (OSError, ValueError) as e:
+            # pyserial raises SerialException (subclass of OSError) or
+            # ValueError on invalid settings
+            self.logger.exception('Could not read serial port (%s)', str(e))
+
+
+class QtBackpressurePolicy(QObject, BackpressurePolicy):
+    """
+    Subclass of :py:class:`app.parser.backpressure.BackpressurePolicy` that
+    uses Qt signal to notify about the mode changes.
+    """
+
+    mode_changed = pyqtSignal(str, int, float)
+
+    def on_mode_changed(self, mode, depth, growth_rate):
+        self.mode_changed.emit(mode, depth, growth_rate)
+
+
 class ParserManager(QObject):
     """
     Manages QtOutputParserWorker instance and allows to run the parser easily.
@@ -212,6 +346,16 @@ class ParserManager(QObject):
     line_parsed = pyqtSignal(OutputLine)
     line_parse_failed = pyqtSignal(OutputLine)
 
+    block_size = reader.DEFAULT_BLOCK_SIZE
+    """Block size to read the file with (see :py:class:`BaseOutputParser`);
+    ``None`` to read the file line by line"""
+
+    CONFIG_BACKPRESSURE_HIGH_KEY = 'parser/backpressure/highWatermark'
+    CONFIG_BACKPRESSURE_LOW_KEY = 'parser/backpressure/lowWatermark'
+    CONFIG_BACKPRESSURE_GROWTH_KEY = 'parser/backpressure/growthThreshold'
+    """Queue growth rate starting the downsampling; 0 to only look at the
+    queue length"""
+
     def __init__(self, parent, sender, analyzer_worker):
         """Constructor
 
@@ -224,6 +368,8 @@ class ParserManager(QObject):
         super(ParserManager, self).__init__(parent)
         self.sender = sender
         self.analyzer_worker = analyzer_worker
+        # Shared by the workers, so the mode survives restarts of the parser
+        self.backpressure = self._create_backpressure_policy(sender)
         self._processing_suspended = False
         self.worker = None
         self.path = None
@@ -231,6 +377,29 @@ class ParserManager(QObject):
         self.terminated_by_user = False
         self._probe_start_time = None
 
+    def _create_backpressure_policy(self, sender):
+        """Create the backpressure policy with the thresholds from settings
+
+        :param app.sender.Sender sender: Sender whose queue is watched
+        :rtype: QtBackpressurePolicy
+        """
+        settings = Settings()
+        high_watermark = settings.value(self.CONFIG_BACKPRESSURE_HIGH_KEY,
+                                        1000, type=int)
+        low_watermark = settings.value(self.CONFIG_BACKPRESSURE_LOW_KEY,
+                                       100, type=int)
+        growth_threshold = settings.value(self.CONFIG_BACKPRESSURE_GROWTH_KEY,
+                                          20, type=float)
+        try:
+            return QtBackpressurePolicy(
+                sender=sender, high_watermark=high_watermark,
+                low_watermark=low_watermark,
+                growth_threshold=growth_threshold or None)
+        except ValueError as e:
+            self.logger.error('Invalid backpressure settings (%s); using the '
+                              'defaults', str(e))
+            return QtBackpressurePolicy(sender=sender)
+
     def is_running(self):
         """Return ``True`` if the worker is currently running
 
@@ -328,9 +497,35 @@ class ParserManager(QObject):
             return
         self.logger.info('Starting parser: {}'.format(self.path))
 
-        self.worker = QtOutputParserWorker(self.path, self.sender,
-                                           self._get_current_analyzer(),
-                                           self.parent)
+        self._start_worker(QtOutputParserWorker(
+            self.path, self.sender, self._get_current_analyzer(), self.parent,
+            self.block_size, self.backpressure))
+
+    def parse_serial(self, port, baudrate, archive_path=None):
+        """Starts the worker set to read the data directly from serial port
+
+        :param str port: serial port to read from (e.g. ``/dev/ttyUSB0``)
+        :param int baudrate: baud rate of the port
+        :param str|None archive_path: path to the file to append the raw data
+            to, or ``None`` to not archive the data
+        :raise RuntimeError: if the worker is currently running
+        """
+        if self.is_running():
+            raise RuntimeError('The worker is already running')
+        if self._probe_start_time is None:
+            raise RuntimeError('Probe start time must be set in order to run '
+                               'Parser')
+
+        self.path = port
+        self.logger.info('Starting parser: {} ({} baud)'
+                         .format(port, baudrate))
+        self._start_worker(QtSerialParserWorker(
+            port, baudrate, archive_path, self.sender,
+            self._get_current_analyzer(), self.parent, self.block_size,
+            self.backpressure))
+
+    def _start_worker(self, worker):
+        self.worker = worker
         self.worker.started.connect(self.parser_started)
         self.worker.finished.connect(self._on_parser_terminated)
         self.worker.finished.connect(self.parser_terminated)
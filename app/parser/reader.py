@@ -0,0 +1,191 @@
+"""
+Line readers used by :py:class:`app.parser.outputparser.BaseOutputParser` to
+get lines of output from the parsed file.
+
+Both readers expose the same interface: ``read_lines()`` returns a list of
+complete lines (without line terminators) or ``None`` if there was no data
+available at the moment (i.e. caller should wait for new data). Once the end
+of the file is reached for good, ``read_remaining()`` returns the last line if
+it's not terminated.
+"""
+import logging
+import os
+import time
+
+DEFAULT_BLOCK_SIZE = 1 << 16
+"""Default number of bytes read at once by :py:class:`BlockLineReader`"""
+
+
+class TextLineReader:
+    """
+    Reader that reads the file line by line using text-mode file object
+    """
+
+    def __init__(self, fd, encoding='utf-8'):
+        """Constructor
+
+        :param int fd: descriptor of the file to read; it's not closed by the
+            reader
+        :param str encoding: encoding of the file
+        """
+        self.file = open(fd, encoding=encoding, closefd=False)
+
+    def read_lines(self):
+        line = self.file.readline()
+        if line == '':
+            return None
+        return [line.rstrip('\r\n')]
+
+    def read_remaining(self):
+        # The file object returns the unterminated last line by itself
+        return []
+
+
+class BlockLineReader:
+    """
+    Reader that reads the file in large blocks of bytes and splits them into
+    lines itself
+
+    This is much faster than reading the file line by line when there is a lot
+    of data available at once (e.g. when parsing archived output files). Lines
+    split between blocks are carried over to the next ``read_lines()`` call.
+    """
+
+    logger = logging.getLogger('Parser')
+
+    def __init__(self, fd, block_size=DEFAULT_BLOCK_SIZE, encoding='utf-8'):
+        """Constructor
+
+        :param int fd: descriptor of the file to read; it's not closed by the
+            reader
+        :param int block_size: maximum number of bytes to read at once
+        :param str encoding: encoding of the file
+        """
+        self.fd = fd
+        self.block_size = block_size
+        self.encoding = encoding
+        # Incomplete line from the end of the previous block
+        self._partial = b''
+
+    def read_block(self):
+        """Read next block of data
+
+        :return: data read or ``None`` if there is no data available
+        :rtype: bytes|None
+        """
+        try:
+            return os.read(self.fd, self.block_size) or None
+        except BlockingIOError:
+            return None
+
+    def read_lines(self):
+        block = self.read_block()
+        if block is None:
+            return None
+
+        last_newline = block.rfind(b'\n')
+        if last_newline == -1:
+            self._partial += block
+            return []
+        data = self._partial + block[:last_newline]
+        self._partial = block[last_newline + 1:]
+        return self.decode_lines(data)
+
+    def read_remaining(self):
+        """Return the incomplete line carried over from the last block
+
+        To be called at the end of the file, when no more data is expected.
+
+        :return: list containing the last line or an empty list if the file
+            ends with a line terminator
+        :rtype: list[str]
+        """
+        data = self._partial
+        self._partial = b''
+        if not data:
+            return []
+        return self.decode_lines(data)
+
+    def decode_lines(self, data):
+        """Decode given data and split it into lines
+
+        Lines that can't be decoded are logged and skipped.
+
+        :param bytes data: data to decode, without trailing newline
+        :return: list of lines without line terminators
+        :rtype: list[str]
+        """
+        try:
+            lines = data.decode(self.encoding).split('\n')
+        except UnicodeDecodeError:
+            lines = []
+            for raw_line in data.split(b'\n'):
+                try:
+                    lines.append(raw_line.decode(self.encoding))
+                except UnicodeDecodeError:
+                    self.logger.warning('Could not decode line: %r', raw_line)
+        if b'\r' in data:
+            lines = [line.rstrip('\r') for line in lines]
+        return lines
+
+
+class SerialLineReader(BlockLineReader):
+    """
+    Reader that reads the lines straight from a serial port, optionally
+    copying all the received bytes to an archive file
+
+    The archive is written through a buffered file object, so it does not
+    cost a system call for every line; the buffer is flushed every
+    ``flush_interval`` seconds and whenever the port is idle.
+    """
+
+    flush_interval = 1
+
+    def __init__(self, port, baudrate, archive_path=None, timeout=0.1,
+                 block_size=DEFAULT_BLOCK_SIZE, encoding='utf-8'):
+        """Constructor
+
+        :param str port: serial port to read from (e.g. ``/dev/ttyUSB0``)
+        :param int baudrate: baud rate of the port
+        :param str|None archive_path: path to the file to append the raw
+            data to, or ``None`` to not archive the data
+        :param float timeout: maximum time to wait for data in a single
+            ``read_lines()`` call in seconds
+        :param int block_size: maximum number of bytes to read at once
+        :param str encoding: encoding of the data
+        """
+        # Imported here, so pyserial is only required when actually used
+        import serial
+
+        super().__init__(None, block_size, encoding)
+        self.serial = serial.Serial(port, baudrate, timeout=timeout)
+        self.archive = None
+        self._last_flush = time.monotonic()
+        if archive_path is not None:
+            try:
+                self.archive = open(archive_path, 'ab')
+            except OSError:
+                self.serial.close()
+                raise
+
+    def read_block(self):
+        # Wait for the data (up to the timeout), then take all that arrived
+        block = self.serial.read(1)
+        if block:
+            waiting = self.serial.in_waiting
+            if waiting:
+                block += self.serial.read(min(waiting, self.block_size - 1))
+        if self.archive is not None:
+            now = time.monotonic()
+            if block:
+                self.archive.write(block)
+            if not block or now - self._last_flush >= self.flush_interval:
+                self.archive.flush()
+                self._last_flush = now
+        return block or None
+
+    def close(self):
+        """Close the serial port and the archive file"""
+        self.serial.close()
+        if self.archive is not None:
+            self.archive.close()
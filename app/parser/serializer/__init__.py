@@ -1,6 +1,10 @@
 import datetime
 from collections import OrderedDict
 
+from app.parser.serializer import batch
+from app.parser.serializer.compiler import (
+    compile_data_class, compile_parse_fields, field_count_error
+)
 from app.parser.serializer.fields import Field, ValidationError, TimestampField
 
 
@@ -12,35 +16,36 @@ class InvalidSerializer(Exception):
 class SerializerData:
     """
     Class containing the results of calling ``Serializer.parse()``
+
+    The values are stored in slots named after the fields. Subclasses
+    generated by :py:class:`SerializerMetaclass` (see
+    :py:func:`app.parser.serializer.compiler.compile_data_class`) have
+    specialized ``__init__`` and ``as_dict`` methods.
     """
 
+    __slots__ = ()
+
     _field_names = ()
+    _field_index = {}
+    _dict_included = ()
     _ignored_fields = ()
 
     def __init__(self, values):
         """Constructor
 
         :param list values: list of values in the same order as
-            ``_field_names``
+            ``_field_names``. Optional fields at the end may be omitted.
         """
-        self.__dict__['_lookup_dict'] = dict(zip(self._field_names, values))
-
-    def __getattr__(self, item):
-        try:
-            return self._lookup_dict[item]
-        except KeyError:
-            raise AttributeError("This SerializerData object has no "
-                                 "field '{}'".format(item))
-
-    def __setattr__(self, key, value):
-        # Only allow to set predefined fields
-        if key not in self._field_names:
-            raise AttributeError("This SerializerData object has no "
-                                 "field '{}'".format(key))
-        self._lookup_dict[key] = value
+        for name, value in zip(self._field_names, values):
+            setattr(self, name, value)
 
     def __contains__(self, item):
-        return item in self._field_names
+        return item in self._field_index
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(name, getattr(self, name))
+            for name in self._field_names if hasattr(self, name)))
 
     def as_dict(self, fields=None, include_none=False):
         """Return data stored in this object as field name -> value dictionary
@@ -54,17 +59,16 @@ class SerializerData:
         :rtype: dict
         """
         result = {}
-        if fields is None:
-            fields = self._dict_included
+        fields = set(self._dict_included if fields is None else fields)
 
         for field in self._field_names:
             if field not in fields:
                 continue
             try:
-                value = self._lookup_dict[field]
+                value = getattr(self, field)
                 if value is not None or include_none:
                     result[field] = value
-            except KeyError:
+            except AttributeError:
                 # Optional field, do nothing
                 pass
         return result
@@ -77,12 +81,15 @@ class SerializerMetaclass(type):
     a separate dictionary, creates list of fields to be included in dictionary
     generated by ``SerializerData.as_dict()`` as well as creates a subclass
     of :py:class:`SerializerData` itself).
+
+    The metaclass also compiles the fields into a specialized ``parse_fields``
+    function (see :py:mod:`app.parser.serializer.compiler`), unless the class
+    defines ``parse_fields`` itself.
     """
 
     @staticmethod
     def __new__(mcs, name, bases, attrs):
         fields = OrderedDict()
-        dict_included = []
         optional_count = 0
 
         # Move declared fields to 'fields' attribute
@@ -99,14 +106,13 @@ class SerializerMetaclass(type):
                                             'after one or more optional '
                                             'fields: {}'.format(key))
 
-                if attr.dict_included:
-                    dict_included.append(key)
-
         attrs['fields'] = fields
         attrs['optional_count'] = optional_count
-        attrs['data_cls'] = type(name + 'Data', (SerializerData,),
-                                 {'_field_names': list(fields.keys()),
-                                  '_dict_included': dict_included})
+        attrs['data_cls'] = compile_data_class(
+            name + 'Data', SerializerData, fields, optional_count)
+        if 'parse_fields' not in attrs:
+            attrs['parse_fields'] = staticmethod(
+                compile_parse_fields(name, fields, optional_count))
 
         new_cls = super().__new__(mcs, name, bases, attrs)
         return new_cls
@@ -136,20 +142,49 @@ class BaseSerializer:
             start; used to create values in TimestampFields
         :return: parsed data
         """
-        data = self.get_data(line_content)
+        data = self.data_cls(self.parse_fields(self.get_data(line_content),
+                                               probe_start_time))
+        self.post_parse_data(data)
+        return data
+
+    def parse_batch(self, lines, probe_start_time):
+        """Parse many lines of output at once using NumPy
+
+        Useful when reprocessing large amounts of archived output. The values
+        are the same as the ones returned by ``parse_data``, but stored as
+        columns; lines that could not be parsed are reported instead of
+        raising an exception. See
+        :py:func:`app.parser.serializer.batch.parse_batch` for details.
+
+        :param list[str] lines: lines of output as strings
+        :param datetime.datetime probe_start_time: datetime of probe software
+            start; used to create values in TimestampFields
+        :rtype: app.parser.serializer.batch.BatchResult
+        :raise TypeError: if the serializer does not support batch parsing
+        """
+        return batch.parse_batch(self, lines, probe_start_time)
+
+    def parse_fields(self, data, probe_start_time):
+        """Convert the values of individual fields
+
+        This is the generic implementation; subclasses created with
+        :py:class:`SerializerMetaclass` use the specialized version compiled
+        for their fields.
+
+        :param list data: list of fields' values as strings
+        :param datetime.datetime probe_start_time: datetime of probe software
+            start; used to create values in TimestampFields
+        :return: list of parsed values
+        :rtype: list
+        :raise ValidationError: if any of the values is invalid
+        """
         vals = []
 
         # Check the number of fields
         if (len(data) < len(self.fields) - self.optional_count or
                 len(data) > len(self.fields)):
-            field_count = len(self.fields)
-            if self.optional_count != 0:
-                field_count = ('between {} and {}'
-                               .format(field_count - self.optional_count,
-                                       field_count))
-            raise ValidationError('Number of fields parsed ({}) is not equal '
-                                  'to the number of fields declared ({})'
-                                  .format(len(data), field_count))
+            raise field_count_error(len(data), len(self.fields),
+                                    self.optional_count)
 
         # Parse data
         id = 1
@@ -168,10 +203,7 @@ class BaseSerializer:
                 e.field_id = id
                 raise
             id += 1
-
-        data = self.data_cls(vals)
-        self.post_parse_data(data)
-        return data
+        return vals
 
     def get_data(self, line_content):
         """Split data from line_content as list of separate fields
@@ -0,0 +1,223 @@
+"""
+Vectorized parsing of many lines of output at once.
+
+Used by :py:meth:`app.parser.serializer.BaseSerializer.parse_batch` when
+reprocessing archived output. All lines are decoded together with NumPy:
+the hex tokens are located and converted for the whole batch in a few array
+operations and then each field converts its column with
+``HexIntegerField.to_numpy``.
+
+Rows that could not be decoded this way (wrong number of fields, characters
+that are not hex digits, values out of range etc.) are passed to the regular
+``parse_fields``, so the results (and errors) are exactly the same as when
+parsing the lines one by one.
+"""
+from collections import OrderedDict, namedtuple
+
+import numpy
+
+from app.parser.serializer.compiler import get_defining_class
+from app.parser.serializer.fields import (
+    HexIntegerField, TimestampField, ValidationError
+)
+
+BatchResult = namedtuple('BatchResult', 'columns, indices, errors')
+"""Result of :py:func:`parse_batch`
+
+* ``columns`` - OrderedDict of field name -> array of parsed values (one item
+  per successfully parsed line)
+* ``indices`` - array of indices of the successfully parsed lines (in the
+  same order as values in the columns)
+* ``errors`` - list of ``(index, exception)`` tuples for the lines that
+  could not be parsed (the exception is usually a ``ValidationError``)
+"""
+
+MAX_DIGITS = 15
+"""Maximum length of hex values decoded in the vectorized way (so they fit in
+int64); longer values are left for the regular parser"""
+
+MAX_TIMESTAMP = 1 << 40
+"""Timestamps greater than this (in ms, about 35 years) are left for the
+regular parser, so they can't overflow ``datetime64``"""
+
+_HEX_DIGITS = numpy.full(256, -1, dtype=numpy.int64)
+for _i, _c in enumerate('0123456789abcdef'):
+    _HEX_DIGITS[ord(_c)] = _HEX_DIGITS[ord(_c.upper())] = _i
+_HEX_DIGITS[ord(',')] = _HEX_DIGITS[ord('\n')] = 0
+
+
+def _is_vectorizable(field):
+    return (isinstance(field, HexIntegerField) and not field.empty and
+            field.choices is None and
+            get_defining_class(type(field), 'to_python') is
+            get_defining_class(type(field), 'to_numpy'))
+
+
+def supports_batch(serializer):
+    """Check if given serializer can parse the lines in the vectorized way
+
+    This is the case if all its fields are non-empty, non-optional hex
+    integer fields implementing ``to_numpy`` and the serializer does not
+    override ``get_data`` (so the first value in each line is message ID).
+
+    :param BaseSerializer serializer: serializer to check
+    :rtype: bool
+    """
+    from app.parser.serializer import BaseSerializer
+
+    return (serializer.optional_count == 0 and
+            serializer.separator == ',' and
+            get_defining_class(type(serializer), 'get_data') is
+            BaseSerializer and
+            all(_is_vectorizable(field)
+                for field in serializer.fields.values()))
+
+
+def decode_hex_rows(lines, token_count, skip=0):
+    """Split lines into comma separated hex values and decode them
+
+    :param list[str] lines: lines to decode
+    :param int token_count: expected number of values in each line
+    :param int skip: number of values at the beginning of each line that are
+        not decoded (e.g. message ID)
+    :return: tuple of (row_count, token_count - skip) int64 array of decoded
+        values and array of indices of lines that were decoded; other lines
+        either have wrong number of values or values that aren't valid hex
+        numbers
+    :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+    text = '\n'.join(lines)
+    if text.count('\n') != len(lines) - 1:
+        # Newlines inside the lines would break the row boundaries
+        text = '\n'.join('' if '\n' in line else line for line in lines)
+    # Non-ASCII characters become '?' (invalid digit), one byte per character
+    chars = numpy.frombuffer(text.encode('ascii', 'replace') + b'\n',
+                             dtype=numpy.uint8)
+
+    is_newline = chars == ord('\n')
+    separators = numpy.flatnonzero(is_newline | (chars == ord(',')))
+    starts = numpy.empty_like(separators)
+    starts[0] = 0
+    starts[1:] = separators[:-1] + 1
+    lengths = separators - starts
+    # Line number of each token
+    token_lines = numpy.zeros(len(separators), dtype=numpy.int64)
+    numpy.cumsum(is_newline[separators[:-1]], out=token_lines[1:])
+    # Position of each token in its line
+    line_starts = numpy.concatenate(
+        ([0], numpy.flatnonzero(is_newline[separators[:-1]]) + 1))
+    token_positions = (numpy.arange(len(separators)) -
+                       line_starts[token_lines])
+    decoded_tokens = token_positions >= skip
+
+    digits = _HEX_DIGITS.take(chars)
+    invalid_tokens = (lengths == 0) | (lengths > MAX_DIGITS)
+    # Characters that are not hex digits are rare, so find their tokens
+    # instead of checking every token
+    invalid_chars = numpy.flatnonzero(digits < 0)
+    invalid_tokens[numpy.searchsorted(separators, invalid_chars)] = True
+    invalid_tokens &= decoded_tokens
+
+    # Value of each digit multiplied by its weight (16 ** position counted
+    # from the end of the token); the tokens are summed up afterwards
+    positions = numpy.repeat(separators, lengths + 1)
+    positions -= numpy.arange(1, len(chars) + 1, dtype=positions.dtype)
+    numpy.clip(positions, 0, MAX_DIGITS - 1, out=positions)
+    positions <<= 2
+    digits[invalid_chars] = 0
+    values = numpy.add.reduceat(digits << positions, starts)
+
+    tokens_per_line = numpy.bincount(token_lines, minlength=len(lines))
+    invalid_lines = numpy.bincount(token_lines, weights=invalid_tokens,
+                                   minlength=len(lines)) > 0
+    valid_lines = (tokens_per_line == token_count) & ~invalid_lines
+    rows = (values[valid_lines[token_lines] & decoded_tokens]
+            .reshape(-1, token_count - skip))
+    return rows, numpy.flatnonzero(valid_lines)
+
+
+def _convert_column(field, values, probe_start_time):
+    values, invalid = field.to_numpy(values)
+    if isinstance(field, TimestampField):
+        too_large = values > MAX_TIMESTAMP
+        invalid = too_large if invalid is None else invalid | too_large
+        values = (numpy.datetime64(probe_start_time, 'us') +
+                  numpy.minimum(values, MAX_TIMESTAMP)
+                  .astype('timedelta64[ms]'))
+    return values, invalid
+
+
+def _append_values(column, values):
+    try:
+        values = numpy.array(values, dtype=column.dtype)
+    except OverflowError:
+        # Value too large for int64; keep it as Python int
+        column = column.astype(object)
+        values = numpy.array(values, dtype=object)
+    return numpy.concatenate((column, values))
+
+
+def parse_batch(serializer, lines, probe_start_time):
+    """Parse given lines using ``serializer``
+
+    The values are the same as the ones returned by ``parse_fields``, except
+    that timestamps are stored as ``datetime64[us]`` (``tolist()`` converts
+    them back to :py:class:`datetime.datetime`). ``post_parse_data`` is not
+    called.
+
+    :param BaseSerializer serializer: serializer to use; it has to support
+        batch parsing (see :py:func:`supports_batch`)
+    :param list[str] lines: lines of output
+    :param datetime.datetime probe_start_time: datetime of probe software
+        start; used to create values in TimestampFields
+    :rtype: BatchResult
+    :raise TypeError: if the serializer does not support batch parsing
+    """
+    if not supports_batch(serializer):
+        raise TypeError('{} does not support batch parsing'
+                        .format(type(serializer).__name__))
+    fields = serializer.fields
+    # The first value is the message ID
+    if lines:
+        rows, indices = decode_hex_rows(lines, len(fields) + 1, skip=1)
+    else:
+        rows = numpy.empty((0, len(fields)), dtype=numpy.int64)
+        indices = numpy.empty(0, dtype=numpy.int64)
+    columns = OrderedDict()
+    invalid = numpy.zeros(len(indices), dtype=bool)
+    for i, (name, field) in enumerate(fields.items()):
+        columns[name], field_invalid = _convert_column(
+            field, rows[:, i], probe_start_time)
+        if field_invalid is not None:
+            invalid |= field_invalid
+
+    fallback = numpy.ones(len(lines), dtype=bool)
+    fallback[indices[~invalid]] = False
+    if invalid.any():
+        indices = indices[~invalid]
+        for name in columns:
+            columns[name] = columns[name][~invalid]
+    if not fallback.any():
+        return BatchResult(columns, indices, [])
+
+    # Parse the remaining lines one by one
+    errors = []
+    fallback_indices = []
+    fallback_values = []
+    for index in numpy.flatnonzero(fallback):
+        index = int(index)
+        try:
+            fallback_values.append(serializer.parse_fields(
+                serializer.get_data(lines[index]), probe_start_time))
+            fallback_indices.append(index)
+        except (ValidationError, OverflowError) as e:
+            # OverflowError is raised for timestamps out of datetime range
+            errors.append((index, e))
+    if fallback_indices:
+        indices = numpy.concatenate((indices, fallback_indices))
+        order = numpy.argsort(indices, kind='mergesort')
+        indices = indices[order]
+        for i, name in enumerate(fields):
+            columns[name] = _append_values(
+                columns[name], [v[i] for v in fallback_values])[order]
+    return BatchResult(columns, indices, errors)
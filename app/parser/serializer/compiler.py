@@ -0,0 +1,327 @@
+"""
+Generation of specialized parse functions and data classes for serializers.
+
+:py:class:`app.parser.serializer.SerializerMetaclass` uses
+:py:func:`compile_parse_fields` to compile each serializer class into a single
+function that converts all the fields at once. The code converting
+a particular field is taken from ``Field.compile_to_python``, so there is no
+per-field dynamic dispatch (and no chain of ``super().to_python()`` calls)
+when parsing a line. Fields with small fixed domains can also have the
+conversion replaced by looking up a precomputed table (see
+:py:func:`get_lookup_table`). The tables are built and the function is
+compiled with them on its first call, so that importing the parsers stays
+cheap for the processes that never parse such fields.
+
+Similarly, :py:func:`compile_data_class` creates ``__slots__``-based
+:py:class:`app.parser.serializer.SerializerData` subclasses with
+``__init__`` and ``as_dict`` generated for the fields of the serializer.
+"""
+import datetime
+
+import numpy
+
+from app.parser.serializer.fields import (
+    HexIntegerField, TimestampField, ValidationError
+)
+
+_lookup_tables = {}
+
+
+def field_count_error(count, field_count, optional_count):
+    """Create ValidationError for invalid number of fields parsed
+
+    :param int count: number of fields parsed
+    :param int field_count: number of fields declared
+    :param int optional_count: number of optional fields declared
+    :rtype: ValidationError
+    """
+    if optional_count != 0:
+        field_count = ('between {} and {}'
+                       .format(field_count - optional_count, field_count))
+    return ValidationError('Number of fields parsed ({}) is not equal to the '
+                           'number of fields declared ({})'
+                           .format(count, field_count))
+
+
+def get_defining_class(cls, attr):
+    """Return the class in the MRO of ``cls`` that defines ``attr``
+
+    :param type cls: class to check
+    :param str attr: name of the attribute
+    :rtype: type|None
+    """
+    for klass in cls.__mro__:
+        if attr in klass.__dict__:
+            return klass
+
+
+def is_compilable(field):
+    """Check if the conversion of given field can be compiled
+
+    The code returned by ``compile_to_python`` is only used if the method is
+    defined in the same class as ``to_python``; otherwise a subclass could
+    override ``to_python`` and the compiled code would not reflect that.
+
+    :param Field field: field to check
+    :rtype: bool
+    """
+    cls = type(field)
+    return (get_defining_class(cls, 'to_python') is
+            get_defining_class(cls, 'compile_to_python') and
+            field.compile_to_python('s', 'v', 'f') is not None)
+
+
+def uses_lookup_table(field):
+    """Check if given field may be converted with a lookup table, without
+    building it (see :py:func:`get_lookup_table`)
+
+    :param Field field: field to check
+    :rtype: bool
+    """
+    cls = type(field)
+    return (getattr(field, 'lookup_bits', None) is not None and
+            get_defining_class(cls, 'to_numpy') is
+            get_defining_class(cls, 'to_python'))
+
+
+def get_lookup_table(field):
+    """Return the table of converted values for given field
+
+    The table is used for the fields setting
+    :py:attr:`app.parser.serializer.fields.HexIntegerField.lookup_bits`;
+    it contains the results of ``to_numpy`` for all the integers below
+    ``1 << lookup_bits``. It's built on first use (the functions compiled by
+    :py:func:`compile_parse_fields` only ask for it when they are first
+    called) and shared by all instances of the field class.
+
+    :param Field field: field to get the table for
+    :return: list of converted values or ``None`` if the field does not use
+        a lookup table (or ``to_numpy`` is not defined in the same class as
+        ``to_python``, or some values in the table's domain are invalid)
+    :rtype: list|None
+    """
+    if not uses_lookup_table(field):
+        return None
+    cls = type(field)
+    if cls not in _lookup_tables:
+        values, invalid = field.to_numpy(numpy.arange(1 << field.lookup_bits))
+        _lookup_tables[cls] = (values.tolist() if invalid is None or
+                               not invalid.any() else None)
+    return _lookup_tables[cls]
+
+
+def _indent(lines, level):
+    return ['    ' * level + line for line in lines]
+
+
+def _compile_function(source, filename, namespace, name):
+    exec(compile(source, filename, 'exec'), namespace)
+    function = namespace[name]
+    function.source = source
+    return function
+
+
+def compile_parse_fields(name, fields, optional_count, lookup_tables=True):
+    """Compile a function that converts all given fields
+
+    The function takes the list of raw values (as returned by
+    ``Serializer.get_data``) and the probe start time as arguments and
+    returns the list of converted values, behaving exactly like
+    :py:meth:`app.parser.serializer.BaseSerializer.parse_fields`.
+
+    If some fields use the lookup tables, a placeholder is returned instead;
+    its first call builds the tables and replaces its code with the compiled
+    one (the ``source`` attribute is updated as well).
+
+    :param str name: name of the serializer (used for the function name)
+    :param collections.OrderedDict fields: serializer fields
+    :param int optional_count: number of optional fields at the end
+    :param bool lookup_tables: whether or not to use the lookup tables (see
+        :py:func:`get_lookup_table`)
+    :return: compiled function
+    :rtype: function
+    """
+    namespace = {}
+    if not (lookup_tables and any(uses_lookup_table(field)
+                                  for field in fields.values())):
+        return _compile_parse_fields(name, fields, optional_count, False,
+                                     namespace)
+
+    def install():
+        # Compiled into the namespace of the placeholder, so that the code
+        # can be swapped (concurrent first calls just compile it twice)
+        function = _compile_parse_fields(name, fields, optional_count, True,
+                                         namespace)
+        placeholder.__code__ = function.__code__
+        placeholder.source = function.source
+        return placeholder
+
+    namespace['install'] = install
+    placeholder = _compile_function(
+        'def parse_fields(data, probe_start_time):\n'
+        '    return install()(data, probe_start_time)\n',
+        '<{} parse_fields>'.format(name), namespace, 'parse_fields')
+    return placeholder
+
+
+def _compile_parse_fields(name, fields, optional_count, lookup_tables,
+                          namespace):
+    namespace.update({
+        'ValidationError': ValidationError,
+        'timedelta': datetime.timedelta,
+        'field_count_error': field_count_error,
+    })
+    required_count = len(fields) - optional_count
+    code = [
+        'def parse_fields(data, probe_start_time):',
+        '    count = len(data)',
+        '    if count < {} or count > {}:'.format(required_count, len(fields)),
+        '        raise field_count_error(count, {}, {})'
+        .format(len(fields), optional_count),
+    ]
+
+    for i, (field_name, field) in enumerate(fields.items()):
+        field_var = 'field_{}'.format(i)
+        value_var = 'v{}'.format(i)
+        namespace[field_var] = field
+
+        if i >= required_count:
+            # Optional field; return what we have got if it's not present
+            code += [
+                '    if count == {}:'.format(i),
+                '        return [{}]'.format(
+                    ', '.join('v{}'.format(j) for j in range(i))),
+            ]
+
+        if is_compilable(field):
+            conversion = field.compile_to_python('s', value_var, field_var)
+            if (conversion == ['{} = s'.format(value_var)] and field.empty and
+                    field.choices is None):
+                # Plain string that can't be invalid (e.g. IgnoredField)
+                code.append('    {} = data[{}] or None'.format(value_var, i))
+                continue
+        else:
+            conversion = ['{} = {}.to_python(s)'.format(value_var, field_var)]
+        table = get_lookup_table(field) if lookup_tables else None
+        if table is not None:
+            # Values outside the table go through the usual conversion (which
+            # also raises the errors)
+            table_var = 'table_{}'.format(i)
+            namespace[table_var] = table
+            conversion = HexIntegerField.compile_to_python(
+                field, 's', value_var, field_var) + [
+                'if 0 <= {} < {}:'.format(value_var, len(table)),
+                '    {0} = {1}[{0}]'.format(value_var, table_var),
+                'else:',
+            ] + _indent(conversion, 1)
+        if isinstance(field, TimestampField):
+            conversion.append(
+                '{0} = probe_start_time + timedelta(milliseconds={0})'
+                .format(value_var))
+
+        if field.empty:
+            empty = ['{} = None'.format(value_var)]
+        else:
+            # get_value() raises ValidationError with a proper message
+            empty = ['{}.get_value(s)'.format(field_var)]
+        if field.choices is not None:
+            choices_var = 'choices_{}'.format(i)
+            namespace[choices_var] = frozenset(field.choices)
+            conversion = [
+                'if s not in {}:'.format(choices_var),
+                '    {}.get_value(s)'.format(field_var),
+            ] + conversion
+
+        code += _indent([
+            's = data[{}]'.format(i),
+            'try:',
+            '    if not s:',
+        ] + _indent(empty, 2) + [
+            '    else:',
+        ] + _indent(conversion, 2) + [
+            'except ValidationError as e:',
+            '    # Set field name for better error messages',
+            '    e.field = {!r}'.format(field_name),
+            '    e.field_id = {}'.format(i + 1),
+            '    raise',
+        ], 1)
+
+    code.append('    return [{}]'.format(
+        ', '.join('v{}'.format(i) for i in range(len(fields)))))
+
+    return _compile_function('\n'.join(code) + '\n',
+                             '<{} parse_fields>'.format(name), namespace,
+                             'parse_fields')
+
+
+def compile_data_class(name, base, fields, optional_count):
+    """Create SerializerData subclass for given fields
+
+    The class stores the values in ``__slots__`` (so reading a field is
+    a plain attribute access) and has ``__init__`` and ``as_dict`` (for the
+    default arguments) generated for the fields.
+
+    :param str name: name of the class to create
+    :param type base: base class (i.e.
+        :py:class:`app.parser.serializer.SerializerData`)
+    :param collections.OrderedDict fields: serializer fields
+    :param int optional_count: number of optional fields at the end
+    :return: created class
+    :rtype: type
+    """
+    field_names = tuple(fields.keys())
+    required_names = field_names[:len(field_names) - optional_count]
+    optional_names = field_names[len(required_names):]
+    dict_included = tuple(key for key, field in fields.items()
+                          if field.dict_included)
+    namespace = {'base': base}
+
+    init = ['def __init__(self, values):']
+    if optional_names:
+        if required_names:
+            init.append('    {}, = values[:{}]'.format(
+                ', '.join('self.' + field for field in required_names),
+                len(required_names)))
+        # Slots of the optional fields that are not present stay unset
+        init.append('    count = len(values)')
+        for i, field in enumerate(optional_names, len(required_names)):
+            init += [
+                '    if count > {}:'.format(i),
+                '        self.{} = values[{}]'.format(field, i),
+            ]
+    elif field_names:
+        init.append('    {}, = values'.format(
+            ', '.join('self.' + field for field in field_names)))
+    else:
+        init.append('    pass')
+
+    as_dict = [
+        'def as_dict(self, fields=None, include_none=False):',
+        '    if fields is not None or include_none:',
+        '        return base.as_dict(self, fields, include_none)',
+        '    result = {}',
+    ]
+    for field in dict_included:
+        if field in optional_names:
+            as_dict.append(
+                '    value = getattr(self, {!r}, None)'.format(field))
+        else:
+            as_dict.append('    value = self.{}'.format(field))
+        as_dict += [
+            '    if value is not None:',
+            '        result[{!r}] = value'.format(field),
+        ]
+    as_dict.append('    return result')
+
+    return type(name, (base,), {
+        '__slots__': field_names,
+        '_field_names': field_names,
+        '_field_index': {field: i for i, field in enumerate(field_names)},
+        '_dict_included': dict_included,
+        '__init__': _compile_function('\n'.join(init) + '\n',
+                                      '<{} __init__>'.format(name),
+                                      namespace, '__init__'),
+        'as_dict': _compile_function('\n'.join(as_dict) + '\n',
+                                     '<{} as_dict>'.format(name),
+                                     namespace, 'as_dict'),
+    })
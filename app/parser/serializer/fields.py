@@ -1,5 +1,8 @@
+import operator
 from collections import namedtuple
 
+import numpy
+
 from app.parser import ParseError
 
 
@@ -35,7 +38,8 @@ class Field:
 
     Subclasses must override ``to_python``, which should convert provided data
     as string to Python type equivalent, possibly doing some validation as
-    well.
+    well. They may also override ``compile_to_python`` to make the conversion
+    faster.
     """
 
     def __init__(self, empty=False, ignored=False, optional=False,
@@ -70,6 +74,25 @@ class Field:
         """
         raise NotImplementedError
 
+    def compile_to_python(self, src, dst, field):
+        """Return Python code equivalent to ``to_python``
+
+        The code is used by :py:mod:`app.parser.serializer.compiler` to
+        generate a single parse function for the whole serializer. Note that
+        it is only used if this method is overridden in the same class as
+        ``to_python``.
+
+        :param str src: name of the variable containing data to convert (must
+            not be modified by the code)
+        :param str dst: name of the variable the parsed value should be
+            stored in
+        :param str field: name of the variable containing this field object
+        :return: list of lines of code or ``None`` if the conversion can't be
+            compiled (then ``to_python`` is called instead)
+        :rtype: list[str]|None
+        """
+        return None
+
     def get_value(self, data):
         """Get converted value of data
 
@@ -98,6 +121,9 @@ class StringField(Field):
     def to_python(self, data):
         return data
 
+    def compile_to_python(self, src, dst, field):
+        return ['{} = {}'.format(dst, src)]
+
 
 class IgnoredField(StringField):
     """
@@ -118,16 +144,57 @@ class IntegerField(Field):
         except ValueError:
             raise ValidationError('Invalid integer value: {}'.format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = int({})'.format(dst, src),
+            'except ValueError:',
+            "    raise ValidationError('Invalid integer value: {{}}'"
+            '.format({}))'.format(src),
+        ]
+
 
 class HexIntegerField(Field):
     """Field for storing hexadecimal integer values"""
 
+    lookup_bits = None
+    """If set, the compiled conversion of the values below
+    ``1 << lookup_bits`` is done by looking the result up in a table built
+    using ``to_numpy`` (see
+    :py:func:`app.parser.serializer.compiler.get_lookup_table`). The table is
+    shared by all instances of the class, so the conversion must not depend
+    on the instance attributes."""
+
     def to_python(self, data):
         try:
             return int(data, 16)
         except ValueError:
             raise ValidationError('Invalid hex integer value: {}'.format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = int({}, 16)'.format(dst, src),
+            'except ValueError:',
+            "    raise ValidationError('Invalid hex integer value: {{}}'"
+            '.format({}))'.format(src),
+        ]
+
+    def to_numpy(self, values):
+        """Vectorized equivalent of ``to_python``
+
+        Used by :py:mod:`app.parser.serializer.batch` when parsing multiple
+        lines at once. Like ``compile_to_python``, it is only used if it's
+        overridden in the same class as ``to_python``.
+
+        :param numpy.ndarray values: array of integers already decoded from
+            hex strings
+        :return: tuple of array of converted values and boolean array marking
+            invalid values (or ``None`` if all values are valid)
+        :rtype: (numpy.ndarray, numpy.ndarray|None)
+        """
+        return values, None
+
 
 class HexSignedIntegerField(HexIntegerField):
     """Field for storing hexadecimal signed integer values"""
@@ -149,6 +216,22 @@ class HexSignedIntegerField(HexIntegerField):
             return v - (1 << self.length)
         return v
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            'if {} >= {}:'.format(dst, 1 << self.length),
+            "    raise ValidationError('Number longer than declared "
+            "({} bits): {{}}'.format({}))".format(self.length, src),
+            'if {} >= {}:'.format(dst, 1 << (self.length - 1)),
+            '    {} -= {}'.format(dst, 1 << self.length),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        too_long = values >= 1 << self.length
+        invalid = too_long if invalid is None else invalid | too_long
+        return (numpy.where(values >= 1 << (self.length - 1),
+                            values - (1 << self.length), values), invalid)
+
 
 class FloatField(Field):
     """Field for storing float values"""
@@ -159,6 +242,15 @@ class FloatField(Field):
         except ValueError:
             raise ValidationError('Invalid float value: {}'.format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = float({})'.format(dst, src),
+            'except ValueError:',
+            "    raise ValidationError('Invalid float value: {{}}'"
+            '.format({}))'.format(src),
+        ]
+
 
 ####################
 # Telemetry fields #
@@ -170,8 +262,12 @@ ProbeError = namedtuple('ProbeError', 'id, name')
 
 class ErrorField(HexIntegerField):
     """
-    Field that converts error number as provided by the probe to a set
+    Field that converts error number as provided by the probe to a frozenset
     of ProbeErrors. Bit masks are used to identify each error.
+
+    The decoded values are cached and the same object is returned for the
+    same errors, so they can be cheaply compared (and don't take any extra
+    memory) even if every line contains them.
     """
 
     OK = ProbeError(1 << 0, 'ALL_OK')
@@ -193,17 +289,49 @@ class ErrorField(HexIntegerField):
         ERROR_GPS, ERROR_KUNDT_TUBE, ERROR_WATCHDOG, ERROR_BAROMETER,
         ERROR_MODE_TRIGG, ERROR_TRANSCEIVER
     ]
+    ERRORS_MASK = sum(map(operator.attrgetter('id'), ERRORS))
+
+    # Error number (without unknown bits) -> frozenset of ProbeErrors
+    _decoded = {}
 
     def to_python(self, data):
         """
-        :return: ``ErrorField.OK`` if 'OK' code was provided; set of errors
-            otherwise (possibly empty if unspecified error occurred)
-        :rtype: set|ProbeError
+        :return: ``ErrorField.OK`` if 'OK' code was provided; frozenset of
+            errors otherwise (possibly empty if unspecified error occurred)
+        :rtype: frozenset|ProbeError
+        """
+        return self.decode_errors(super().to_python(data))
+
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = {1}.decode_errors({0})'.format(dst, field),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        # There are only a few distinct error numbers, so decode each once
+        unique, inverse = numpy.unique(values, return_inverse=True)
+        decoded = numpy.empty(len(unique), dtype=object)
+        for i, v in enumerate(unique.tolist()):
+            # Item assignment, so ErrorField.OK is not treated as a sequence
+            decoded[i] = self.decode_errors(v)
+        return decoded[inverse.ravel()], invalid
+
+    @staticmethod
+    def decode_errors(v):
+        """Convert error number to ``ErrorField.OK`` or frozenset of errors
+
+        :param int v: error number as provided by the probe
+        :rtype: frozenset|ProbeError
         """
-        v = super().to_python(data)
         if v == ErrorField.OK.id:
             return ErrorField.OK
-        return {err for err in ErrorField.ERRORS if v & err.id == err.id}
+        v &= ErrorField.ERRORS_MASK
+        try:
+            return ErrorField._decoded[v]
+        except KeyError:
+            return ErrorField._decoded.setdefault(v, frozenset(
+                err for err in ErrorField.ERRORS if v & err.id == err.id))
 
 
 class TimestampField(HexIntegerField):
@@ -220,26 +348,20 @@ class TimestampField(HexIntegerField):
 
 class VoltageField(HexIntegerField):
     # todo docs
-
-    def to_python(self, data):
-        # todo implement conversion
-        return super().to_python(data)
+    # todo implement conversion
+    pass
 
 
 class CurrentField(HexIntegerField):
     # todo docs
-
-    def to_python(self, data):
-        # todo implement conversion
-        return super().to_python(data)
+    # todo implement conversion
+    pass
 
 
 class OxygenField(HexIntegerField):
     # todo docs
-
-    def to_python(self, data):
-        # todo implement conversion
-        return super().to_python(data)
+    # todo implement conversion
+    pass
 
 
 class TemperatureField(HexIntegerField):
@@ -248,10 +370,21 @@ class TemperatureField(HexIntegerField):
     Consult HTU21D sensor datasheet for reference.
     """
 
+    lookup_bits = 16
+
     def to_python(self, data):
         v = super().to_python(data)
         return -46.85 + 175.72 * v / 2 ** 16
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = -46.85 + 175.72 * {0} / 2 ** 16'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return -46.85 + 175.72 * values / 2 ** 16, invalid
+
 
 class HumidityField(HexIntegerField):
     """Field that converts relative humidity as LSB (raw sensor output) to %.
@@ -259,17 +392,26 @@ class HumidityField(HexIntegerField):
     Consult HTU21D sensor datasheet for reference.
     """
 
+    lookup_bits = 16
+
     def to_python(self, data):
         v = super().to_python(data)
         return -6 + 125 * v / 2 ** 16
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = -6 + 125 * {0} / 2 ** 16'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return -6 + 125 * values / 2 ** 16, invalid
+
 
 class RadiationField(HexIntegerField):
     """Field that converts radiation as LSB (raw sensor output) to R/h"""
-
-    def to_python(self, data):
-        # todo implement conversion
-        return super().to_python(data)
+    # todo implement conversion
+    pass
 
 
 class PressureField(HexIntegerField):
@@ -281,6 +423,15 @@ class PressureField(HexIntegerField):
     def to_python(self, data):
         return super().to_python(data) / 4096
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = {0} / 4096'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return values / 4096, invalid
+
 
 class GyroField(HexSignedIntegerField):
     """Field that convert angular velocity as LSB (raw sensor output) to dps.
@@ -288,12 +439,23 @@ class GyroField(HexSignedIntegerField):
     Consult AltIMU-10 v4 (L3GD20H) sensor datasheet for reference. This
     assumes ±245dps sensitivity is used.
     """
+    lookup_bits = 16
+
     def __init__(self, *args):
         super().__init__(16, *args)
 
     def to_python(self, data):
         return super().to_python(data) * 8.75 / 1000
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = {0} * 8.75 / 1000'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return values * 8.75 / 1000, invalid
+
 
 class AccelerationField(HexSignedIntegerField):
     """Field that converts acceleration as LSB (raw sensor output) to g.
@@ -301,12 +463,23 @@ class AccelerationField(HexSignedIntegerField):
     Consult AltIMU-10 v4 (LSM303D) sensor datasheet for reference. This
     assumes ±2g sensitivity is used.
     """
+    lookup_bits = 16
+
     def __init__(self, *args):
         super().__init__(16, *args)
 
     def to_python(self, data):
         return super().to_python(data) * 0.061 / 1000
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = {0} * 0.061 / 1000'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return values * 0.061 / 1000, invalid
+
 
 class MagneticField(HexSignedIntegerField):
     """Field that converts magnetic field as LSB (raw sensor output) to gauss.
@@ -314,12 +487,23 @@ class MagneticField(HexSignedIntegerField):
     Consult AltIMU-10 v4 (LSM303D) sensor datasheet for reference. This
     assumes ±4gauss sensitivity is used.
     """
+    lookup_bits = 16
+
     def __init__(self, *args):
         super().__init__(16, *args)
 
     def to_python(self, data):
         return super().to_python(data) * 0.080 / 1000
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = {0} * 0.080 / 1000'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return values * 0.080 / 1000, invalid
+
 
 ################
 # Kundt fields #
@@ -333,6 +517,15 @@ class FrequencyField(HexIntegerField):
         v = super().to_python(data)
         return (33050000 / ((v + 1) * 2)) * 4
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = (33050000 / (({0} + 1) * 2)) * 4'.format(dst),
+        ]
+
+    def to_numpy(self, values):
+        values, invalid = super().to_numpy(values)
+        return (33050000 / ((values + 1) * 2)) * 4, invalid
+
 
 ##############
 # GPS fields #
@@ -349,6 +542,17 @@ class GeographicCoordinateField(Field):
             raise ValidationError('Invalid geographic coordinate value: {}'
                                   .format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            "    {0} = {1}.index('.')".format(dst, src),
+            '    {0} = float({1}[:{0} - 2]) + float({1}[{0} - 2:]) / 60'
+            .format(dst, src),
+            'except ValueError:',
+            "    raise ValidationError('Invalid geographic coordinate value: "
+            "{{}}'.format({}))".format(src),
+        ]
+
 
 class LatitudeField(GeographicCoordinateField):
     """Field containing latitude value
@@ -362,6 +566,13 @@ class LatitudeField(GeographicCoordinateField):
                                   .format(result))
         return result
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            'if {0} < 0 or {0} > 90:'.format(dst),
+            "    raise ValidationError('Latitude is not in range <0, 90>: "
+            "{{}}'.format({}))".format(dst),
+        ]
+
 
 class LatitudeDirectionField(Field):
     """Field containing latitude hemisphere (north or south)
@@ -371,13 +582,24 @@ class LatitudeDirectionField(Field):
     def __init__(self, *args, **kwargs):
         super().__init__(dict_included=False, *args, **kwargs)
 
+    DIRECTIONS = {'N': 1, 'S': -1}
+
     def to_python(self, data):
         try:
-            return {'N': 1, 'S': -1}[data]
+            return self.DIRECTIONS[data]
         except KeyError:
             raise ValidationError('Latitude direction is neither N nor E: {}'
                                   .format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = {}.DIRECTIONS[{}]'.format(dst, field, src),
+            'except KeyError:',
+            "    raise ValidationError('Latitude direction is neither N nor "
+            "E: {{}}'.format({}))".format(src),
+        ]
+
 
 class LongitudeField(GeographicCoordinateField):
     """Field containing longitude value
@@ -391,6 +613,13 @@ class LongitudeField(GeographicCoordinateField):
                                   .format(result))
         return result
 
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            'if {0} < 0 or {0} > 180:'.format(dst),
+            "    raise ValidationError('Longitude is not in range <0, 180>: "
+            "{{}}'.format({}))".format(dst),
+        ]
+
 
 class LongitudeDirectionField(Field):
     """Field containing longitude hemisphere (east or west)
@@ -400,13 +629,24 @@ class LongitudeDirectionField(Field):
     def __init__(self, *args, **kwargs):
         super().__init__(dict_included=False, *args, **kwargs)
 
+    DIRECTIONS = {'E': 1, 'W': -1}
+
     def to_python(self, data):
         try:
-            return {'E': 1, 'W': -1}[data]
+            return self.DIRECTIONS[data]
         except KeyError:
             raise ValidationError('Longitude direction is neither E nor W: {}'
                                   .format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = {}.DIRECTIONS[{}]'.format(dst, field, src),
+            'except KeyError:',
+            "    raise ValidationError('Longitude direction is neither E nor "
+            "W: {{}}'.format({}))".format(src),
+        ]
+
 
 class FixQualityField(Field):
     """Field containing fix quality (no fix/GPS/DGPS)"""
@@ -422,6 +662,16 @@ class FixQualityField(Field):
         except (IndexError, ValueError):
             raise ValidationError("'{}' is not valid quality ID".format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = {!r}[int({})]'.format(
+                dst, (self.NO_FIX, self.GPS_QUALITY, self.DGPS_QUALITY), src),
+            'except (IndexError, ValueError):',
+            '    raise ValidationError("\'{{}}\' is not valid quality ID"'
+            '.format({}))'.format(src),
+        ]
+
 
 class FixTypeField(Field):
     """Field containing fix type (no fix/2D/3D)"""
@@ -436,9 +686,24 @@ class FixTypeField(Field):
         except (IndexError, ValueError):
             raise ValidationError("'{}' is not valid fix type ID".format(data))
 
+    def compile_to_python(self, src, dst, field):
+        return [
+            'try:',
+            '    {} = {!r}[int({}) - 1]'.format(
+                dst, (self.NO_FIX, self.FIX_2D, self.FIX_3D), src),
+            'except (IndexError, ValueError):',
+            '    raise ValidationError("\'{{}}\' is not valid fix type ID"'
+            '.format({}))'.format(src),
+        ]
+
 
 class KnotsSpeedField(FloatField):
     """Field that converts given speed in knots to kilometers per hour"""
 
     def to_python(self, data):
         return super().to_python(data) * 1.852
+
+    def compile_to_python(self, src, dst, field):
+        return super().compile_to_python(src, dst, field) + [
+            '{0} = {0} * 1.852'.format(dst),
+        ]
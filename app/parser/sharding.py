@@ -0,0 +1,261 @@
+"""
+Parallel parsing of archived output files.
+
+The file is split into byte ranges (shards) on line boundaries which are
+parsed in separate processes. The parsing is not entirely stateless, so
+a quick pre-scan of every shard is done first to carry the state across the
+shard boundaries:
+
+* ``last_timestamp`` of :py:class:`app.parser.outputparser.BaseOutputParser`
+  (the timestamp of the latest line that had one), which is used for the
+  messages without a timestamp
+* the state of stateful parsers (see :py:meth:`app.parser.Parser.get_state`),
+  e.g. :py:class:`app.parser.gps.GPSParser` merging ``$GPGGA`` and ``$GPRMC``
+
+The requests are then returned in the original order, exactly as if the file
+was parsed sequentially. Note that the data is not passed to the analyzer.
+"""
+import logging
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from app import logger
+from app.parser import Dispatcher, OutputLine, ParseError, Parser, reader
+from app.parser.outputparser import PARSERS, BaseOutputParser
+
+ShardState = namedtuple('ShardState', 'last_timestamp, parser_states')
+"""State of the parsing at the beginning of a shard (or the state changes
+made by a shard): ``last_timestamp`` and the list of states of the parsers
+(``None`` for stateless ones)"""
+
+ShardResult = namedtuple('ShardResult', 'requests, lines_parsed, lines_failed')
+"""Result of parsing a shard: list of ``(module, url, data)`` tuples of the
+requests to send and the numbers of lines parsed and failed"""
+
+
+def split_shards(path, count):
+    """Split given file into byte ranges starting at the beginning of a line
+
+    :param str path: path to the file
+    :param int count: maximum number of shards
+    :return: list of ``(start, end)`` byte offsets
+    :rtype: list[tuple[int, int]]
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, count):
+            position = size * i // count
+            if position <= offsets[-1]:
+                continue
+            # Move to the beginning of the next line
+            f.seek(position - 1)
+            f.readline()
+            position = f.tell()
+            if offsets[-1] < position < size:
+                offsets.append(position)
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets, offsets[1:])
+            if start < end]
+
+
+def read_shard(path, start, end):
+    """Read lines from given byte range of the file
+
+    :param str path: path to the file
+    :param int start: offset of the first byte
+    :param int end: offset after the last byte
+    :return: list of lines without line terminators
+    :rtype: list[str]
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+        if not data:
+            return []
+        if data.endswith(b'\n'):
+            data = data[:-1]
+        return reader.BlockLineReader(f.fileno()).decode_lines(data)
+
+
+def _is_stateful(parser):
+    return type(parser).get_state is not Parser.get_state
+
+
+class RequestList(list):
+    """
+    Replacement of :py:class:`app.sender.Sender` that just collects the
+    requests as ``(module, url, data)`` tuples
+    """
+
+    def add_request(self, module, url, data, files=None,
+                    append_timestamp=True, callback=None, priority=None,
+                    supersede_key=None):
+        if append_timestamp:
+            data['timestamp'] = datetime.utcnow()
+        self.append((module, url, data))
+
+
+class ShardOutputParser(BaseOutputParser):
+    """
+    OutputParser that parses a single shard of the file, starting with given
+    state
+    """
+
+    def __init__(self, parser_classes, probe_start_time, state):
+        """Constructor
+
+        :param list parser_classes: classes of the parsers to use
+        :param datetime.datetime probe_start_time: probe software start time
+        :param ShardState state: state at the beginning of the shard
+        """
+        super().__init__([cls() for cls in parser_classes], RequestList(),
+                         None)
+        self.set_probe_start_time(probe_start_time)
+        self.last_timestamp = state.last_timestamp
+        for parser, parser_state in zip(self._parsers, state.parser_states):
+            if parser_state is not None:
+                parser.set_state(parser_state)
+        self.lines_parsed = 0
+        self.lines_failed = 0
+
+    def parse_line(self, line):
+        try:
+            super().parse_line(line)
+        except ParseError:
+            self.lines_failed += 1
+            raise
+
+    def on_line_parsed(self, output_line):
+        self.lines_parsed += 1
+
+
+def scan_shard(path, start, end, parser_classes, probe_start_time):
+    """Find the state changes made by given shard
+
+    :param str path: path to the file
+    :param int start: offset of the first byte of the shard
+    :param int end: offset after the last byte of the shard
+    :param list parser_classes: classes of the parsers to use
+    :param datetime.datetime probe_start_time: probe software start time
+    :return: the last timestamp in the shard (or ``None`` if there is none)
+        and the states of the parsers after parsing the shard from an empty
+        state
+    :rtype: ShardState
+    """
+    lines = read_shard(path, start, end)
+    parsers = [cls() for cls in parser_classes]
+    dispatcher = Dispatcher(parsers)
+    now = datetime.now()
+
+    # The lines are parsed again later, so don't log the probe errors twice
+    logging.disable(logger.PROBE)
+    try:
+        last_timestamp = None
+        for line in reversed(lines):
+            parser, msg_id = dispatcher.classify(line)
+            # Stateful parsers would need the state to return the right data
+            # (and the ones we have don't return timestamps anyway)
+            if parser is None or _is_stateful(parser):
+                continue
+            try:
+                data = parser.parse(OutputLine(msg_id, now, None, line),
+                                    probe_start_time)
+            except ParseError:
+                continue
+            if data and 'timestamp' in data:
+                last_timestamp = data['timestamp']
+                break
+
+        stateful = set(parser for parser in parsers if _is_stateful(parser))
+        if stateful:
+            for line in lines:
+                parser, msg_id = dispatcher.classify(line)
+                if parser not in stateful:
+                    continue
+                try:
+                    parser.parse(OutputLine(msg_id, now, None, line),
+                                 probe_start_time)
+                except ParseError:
+                    pass
+    finally:
+        logging.disable(logging.NOTSET)
+
+    return ShardState(last_timestamp, [parser.get_state() if parser in
+                                       stateful else None
+                                       for parser in parsers])
+
+
+def parse_shard(path, start, end, parser_classes, probe_start_time, state):
+    """Parse given shard of the file
+
+    :param str path: path to the file
+    :param int start: offset of the first byte of the shard
+    :param int end: offset after the last byte of the shard
+    :param list parser_classes: classes of the parsers to use
+    :param datetime.datetime probe_start_time: probe software start time
+    :param ShardState state: state at the beginning of the shard
+    :rtype: ShardResult
+    """
+    output_parser = ShardOutputParser(parser_classes, probe_start_time, state)
+    output_parser.parse_lines(read_shard(path, start, end))
+    return ShardResult(output_parser.sender, output_parser.lines_parsed,
+                       output_parser.lines_failed)
+
+
+def propagate_states(changes, parser_classes, probe_start_time):
+    """Compute the state at the beginning of every shard
+
+    :param list[ShardState] changes: states returned by :py:func:`scan_shard`
+        for consecutive shards
+    :param list parser_classes: classes of the parsers used
+    :param datetime.datetime probe_start_time: probe software start time
+    :return: list of states at the beginning of each shard
+    :rtype: list[ShardState]
+    """
+    state = ShardState(probe_start_time, [None] * len(parser_classes))
+    states = []
+    for change in changes:
+        states.append(state)
+        state = ShardState(
+            change.last_timestamp or state.last_timestamp,
+            [parser_state if change_state is None else
+             change_state if parser_state is None else
+             cls.merge_states(parser_state, change_state)
+             for cls, parser_state, change_state in
+             zip(parser_classes, state.parser_states, change.parser_states)])
+    return states
+
+
+def parse_file(path, probe_start_time, jobs=None, shard_count=None,
+               parser_classes=PARSERS):
+    """Parse given file in a pool of processes
+
+    :param str path: path to the file
+    :param datetime.datetime probe_start_time: probe software start time
+    :param int|None jobs: number of processes to use (number of CPUs by
+        default)
+    :param int|None shard_count: number of shards to split the file into
+        (a few times the number of processes by default, so the work is
+        evenly distributed)
+    :param list parser_classes: classes of the parsers to use
+    :return: generator of the results of consecutive shards
+    :rtype: collections.Iterable[ShardResult]
+    """
+    jobs = jobs or os.cpu_count() or 1
+    shards = split_shards(path, shard_count or jobs * 4)
+    if not shards:
+        return
+    with ProcessPoolExecutor(jobs) as executor:
+        changes = list(executor.map(
+            scan_shard, *zip(*[(path, start, end, parser_classes,
+                                probe_start_time)
+                               for start, end in shards])))
+        states = propagate_states(changes, parser_classes, probe_start_time)
+        yield from executor.map(
+            parse_shard, *zip(*[(path, start, end, parser_classes,
+                                 probe_start_time, state)
+                                for (start, end), state in
+                                zip(shards, states)]))
@@ -5,6 +5,44 @@ from app.parser import Parser
 from app.parser.serializer import fields, Serializer
 
 
+class ProbeErrorReporter:
+    """
+    Logs the errors reported by the probe
+
+    The errors are only logged when they change, not for every line they are
+    reported in.
+    """
+
+    logger = logging.getLogger('Probe')
+
+    def __init__(self):
+        self.errors = fields.ErrorField.OK
+
+    def report(self, errors):
+        """Log given errors if they differ from the previous ones
+
+        :param frozenset|app.parser.serializer.fields.ProbeError errors:
+            errors as returned by
+            :py:class:`app.parser.serializer.fields.ErrorField`
+        """
+        # The decoded errors are interned, so this is usually an identity check
+        if errors is self.errors or errors == self.errors:
+            return
+        self.errors = errors
+        if errors == fields.ErrorField.OK:
+            self.logger.log(logger.PROBE, 'The probe reports no errors')
+        elif len(errors) == 0:
+            self.logger.log(logger.PROBE,
+                            'The probe reported an unspecified error')
+        elif len(errors) == 1:
+            self.logger.log(logger.PROBE, 'The probe reported an error: %s',
+                            next(iter(errors)).name)
+        else:
+            self.logger.log(logger.PROBE,
+                            'The probe reported multiple errors: %s',
+                            ', '.join(error.name for error in sorted(errors)))
+
+
 class TelemetrySerializer(Serializer):
     error = fields.ErrorField(dict_included=False)
     voltage = fields.VoltageField()
@@ -26,21 +64,13 @@ class TelemetrySerializer(Serializer):
     magnet_y = fields.MagneticField()
     magnet_z = fields.MagneticField()
 
+    def __init__(self):
+        super().__init__()
+        self.error_reporter = ProbeErrorReporter()
+
     def parse(self, line_content, probe_start_time):
         data = super().parse(line_content, probe_start_time)
-        err = data.error
-        if err != fields.ErrorField.OK:
-            if len(err) == 0:
-                logging.getLogger('Probe').log(
-                    logger.PROBE, 'The probe reported an unspecified error')
-            elif len(err) == 1:
-                logging.getLogger('Probe').log(
-                    logger.PROBE, 'The probe reported an error: %s',
-                    list(err)[0].name)
-            else:
-                logging.getLogger('Probe').log(
-                    logger.PROBE, 'The probe reported multiple errors: %s',
-                    ', '.join(error.name for error in err))
+        self.error_reporter.report(data.error)
         return data
 
     def get_collector_data(self, data):
@@ -0,0 +1,199 @@
+"""
+Strategies used by :py:class:`app.parser.outputparser.BaseOutputParser` to
+wait for new data in the parsed file.
+
+Every waiter owns a self-pipe, so a thread blocked in
+:py:meth:`InputWaiter.wait` can be woken up immediately with
+:py:meth:`InputWaiter.wake_up` (e.g. when the parser is being terminated).
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import stat
+import threading
+
+
+class InputWaiter:
+    """
+    Fallback waiter that just sleeps for a fixed interval
+
+    It is used whenever there is no better way to be notified about new data
+    (we are not able to differentiate between EOF and blocking IO, so we just
+    wait a while assuming we'll get some data later).
+    """
+
+    logger = logging.getLogger('Parser')
+
+    def __init__(self, fd, path, interval=0.05):
+        """Constructor
+
+        :param int fd: descriptor of the file being parsed
+        :param str path: path to the file being parsed
+        :param float|None interval: maximum time to wait in seconds or
+            ``None`` to wait until the waiter is notified
+        """
+        self.fd = fd
+        self.path = path
+        self.interval = interval
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._poll = select.poll()
+        self._poll.register(self._wake_r, select.POLLIN)
+        # Guards the self-pipe against being written to after it was closed
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def wait(self):
+        """Block until new data is (or may be) available
+
+        Returns immediately if :py:meth:`wake_up` was called before. Note that
+        the function may return even if no data arrived; caller is supposed
+        to just try to read again.
+        """
+        self._poll.poll(None if self.interval is None
+                        else self.interval * 1000)
+
+    def wake_up(self):
+        """Interrupt current and all future :py:meth:`wait` calls
+
+        This is safe to call from any thread, also after the waiter was
+        closed.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            try:
+                os.write(self._wake_w, b'\0')
+            except BlockingIOError:
+                # Pipe is full, so the waiter is woken up already
+                pass
+
+    def close(self):
+        """Release resources held by the waiter
+
+        Note that the descriptor of the parsed file is not closed.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+
+class PollInputWaiter(InputWaiter):
+    """
+    Waiter that uses ``poll()`` on the parsed file descriptor
+
+    Suitable for named pipes and character devices. In case of a named pipe,
+    the waiter keeps its own write end open, so the pipe does not signal
+    a hang up (which would make ``poll()`` return immediately) when the
+    writing process is restarted.
+    """
+
+    def __init__(self, fd, path, interval=None):
+        super().__init__(fd, path, interval)
+        self._dummy_writer = None
+        if stat.S_ISFIFO(os.fstat(fd).st_mode):
+            self._dummy_writer = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        self._poll.register(fd, select.POLLIN)
+
+    def close(self):
+        with self._lock:
+            if self._dummy_writer is not None:
+                os.close(self._dummy_writer)
+                self._dummy_writer = None
+        super().close()
+
+
+class InotifyInputWaiter(InputWaiter):
+    """
+    Waiter that uses Linux inotify to be notified when the regular file being
+    parsed is modified (i.e. appended to)
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = os.O_CLOEXEC
+
+    _libc = None
+
+    def __init__(self, fd, path, interval=None):
+        """Constructor
+
+        :raise OSError: if inotify is not available in the system
+        """
+        super().__init__(fd, path, interval)
+        try:
+            self._inotify_fd = self._init_inotify(path)
+        except OSError:
+            super().close()
+            raise
+        self._poll.register(self._inotify_fd, select.POLLIN)
+
+    @classmethod
+    def _get_libc(cls):
+        if cls._libc is None:
+            libc_name = ctypes.util.find_library('c')
+            if libc_name is None:
+                raise OSError('Could not find the C library')
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            if not hasattr(libc, 'inotify_init1'):
+                raise OSError('inotify is not supported in this system')
+            cls._libc = libc
+        return cls._libc
+
+    def _init_inotify(self, path):
+        libc = self._get_libc()
+        inotify_fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if inotify_fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        if libc.inotify_add_watch(inotify_fd, os.fsencode(path),
+                                  self.IN_MODIFY) < 0:
+            err = ctypes.get_errno()
+            os.close(inotify_fd)
+            raise OSError(err, os.strerror(err), path)
+        return inotify_fd
+
+    def wait(self):
+        super().wait()
+        # Discard the events; we only need to know that something happened
+        try:
+            while os.read(self._inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        with self._lock:
+            if self.closed:
+                return
+            os.close(self._inotify_fd)
+        super().close()
+
+
+def create_input_waiter(fd, path):
+    """Create the best InputWaiter available for given file
+
+    :param int fd: descriptor of the file being parsed
+    :param str path: path to the file being parsed
+    :return: :py:class:`PollInputWaiter` for named pipes and character
+        devices, :py:class:`InotifyInputWaiter` for regular files (if inotify
+        is available) or :py:class:`InputWaiter` otherwise
+    :rtype: InputWaiter
+    """
+    mode = os.fstat(fd).st_mode
+    if stat.S_ISFIFO(mode) or stat.S_ISCHR(mode):
+        return PollInputWaiter(fd, path)
+    if stat.S_ISREG(mode):
+        try:
+            return InotifyInputWaiter(fd, path)
+        except OSError as e:
+            InputWaiter.logger.warning(
+                'Could not use inotify, falling back to polling the file '
+                '(%s)', str(e))
+    return InputWaiter(fd, path)
@@ -0,0 +1,488 @@
+"""
+Headless replay of recorded probe output.
+
+Pushes a capture file through :py:class:`app.parser.outputparser.OutputParser`,
+:py:class:`app.sender.Sender` and :py:class:`app.analyzer.AnalyzerWorker`
+without any Qt event loop, either at (a multiple of) the original speed or as
+fast as possible, and prints the throughput and latency at the end. Both
+plain text output and binary captures (see :py:mod:`app.capture`) are
+supported; the latter are replayed with their original inter-arrival times.
+Use ``replay.py --help`` for the options.
+"""
+import argparse
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import dateutil.parser
+
+from app import capture, logger
+from app.analyzer import AnalyzerWorker
+from app.api import API, ENCODING_FORM, ENCODINGS
+from app.parser import ParseError, index, reader
+from app.parser.backpressure import BackpressurePolicy
+from app.parser.outputparser import OutputParser
+from app.sender import Sender
+
+
+class LocalSinkAPI:
+    """
+    In-process replacement of :py:class:`app.api.API` that accepts every
+    request without sending it anywhere
+    """
+
+    def __init__(self, latency=0):
+        """Constructor
+
+        :param float latency: time in seconds each request should take
+        """
+        self.latency = latency
+        self.lock = threading.Lock()
+        # URL -> number of requests received
+        self.requests = Counter()
+        # URL -> number of resources created
+        self.records = Counter()
+
+    def create(self, url, data, files=None, requests_object=None):
+        self.create_bulk(url, [data])
+
+    def create_bulk(self, url, data_list, requests_object=None):
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.requests[url] += 1
+            self.records[url] += len(data_list)
+
+
+class ReplayStatistics:
+    """Counters collected during the replay"""
+
+    def __init__(self):
+        self.start_time = None
+        self.parse_end_time = None
+        self.end_time = None
+        self.lines_parsed = 0
+        self.lines_failed = 0
+        self.records = 0
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        # Snapshot of the backpressure policy, if any (see
+        # app.parser.backpressure.BackpressurePolicy.snapshot)
+        self.backpressure = None
+        # Time between adding the request to the queue and processing it
+        self.latencies = []
+
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    def format(self):
+        """Return the summary of the replay
+
+        :rtype: list[str]
+        """
+        def rate(count, end_time):
+            elapsed = end_time - self.start_time
+            return count / elapsed if elapsed > 0 else float('inf')
+
+        lines = self.lines_parsed + self.lines_failed
+        result = [
+            'Parsing time:  {:.3f} s'.format(
+                self.parse_end_time - self.start_time),
+            'Total time:    {:.3f} s'.format(self.end_time - self.start_time),
+            'Lines:         {} ({} failed), {:,.0f} lines/s'.format(
+                lines, self.lines_failed, rate(lines, self.parse_end_time)),
+            'Records:       {}, {:,.0f} records/s'.format(
+                self.records, rate(self.records, self.parse_end_time)),
+            'Requests:      {} ({} errors, {} retries), {:,.0f} '
+            'requests/s'.format(self.requests, self.errors, self.retries,
+                                rate(self.requests, self.end_time)),
+        ]
+        if self.latencies:
+            latencies = sorted(self.latencies)
+            result.append(
+                'Latency:       mean {:.1f} ms, median {:.1f} ms, '
+                '95% {:.1f} ms, max {:.1f} ms'.format(
+                    statistics.mean(latencies) * 1000,
+                    statistics.median(latencies) * 1000,
+                    latencies[int(len(latencies) * 0.95)] * 1000,
+                    latencies[-1] * 1000))
+        if self.backpressure is not None:
+            result.append(
+                'Backpressure:  {mode}, {transitions} transitions, '
+                '{forwarded} records forwarded, {downsampled} downsampled '
+                '({aggregates} aggregates)'.format(**self.backpressure))
+        return result
+
+
+class ReplaySender(Sender):
+    """
+    Sender that collects the replay statistics and retries the requests that
+    failed due to permanent errors after ``retry_interval`` instead of waiting
+    for the user to unpause it
+    """
+
+    retry_interval = 1
+
+    def __init__(self, api, stats, **kwargs):
+        """Constructor
+
+        :param api: API instance to use
+        :param ReplayStatistics stats: statistics to update
+        :param kwargs: other arguments of :py:class:`app.sender.Sender`
+        """
+        super().__init__(api, **kwargs)
+        self.stats = stats
+        # The hooks may be called by multiple threads
+        self.stats_lock = threading.Lock()
+
+    def on_request_added(self, request_data):
+        with self.stats_lock:
+            self.stats.records += 1
+
+    def on_request_processed(self, request_data, skipped):
+        latency = time.monotonic() - request_data.added_time
+        with self.stats_lock:
+            self.stats.requests += 1
+            self.stats.latencies.append(latency)
+
+    def on_request_retrying(self, request_data, exception, attempt, delay):
+        with self.stats_lock:
+            self.stats.retries += 1
+
+    def on_error(self, request_data, exception, traceback_exception):
+        with self.stats_lock:
+            self.stats.errors += 1
+
+    def on_paused(self, paused):
+        if paused and not self.terminated:
+            timer = threading.Timer(self.retry_interval, self._unpause)
+            timer.daemon = True
+            timer.start()
+
+    def _unpause(self):
+        self.paused = False
+
+
+class ReplayOutputParser(OutputParser):
+    """
+    OutputParser that parses a capture file once (until EOF) instead of
+    following it, optionally keeping the original pace of the data
+    """
+
+    def __init__(self, sender, analyzer_worker, stats, speed=None,
+                 block_size=reader.DEFAULT_BLOCK_SIZE, backpressure=None):
+        """Constructor
+
+        :param app.sender.Sender sender: Sender instance to use to send
+            the parsed data
+        :param app.analyzer.AnalyzerWorker analyzer_worker: AnalyzerWorker
+            instance to pass the parsed data to
+        :param ReplayStatistics stats: statistics to update
+        :param float|None speed: real-time multiplier (the pace is taken from
+            the timestamps in the data) or ``None`` to parse as fast as
+            possible
+        :param int|None block_size: see
+            :py:class:`app.parser.outputparser.BaseOutputParser`
+        :param app.parser.backpressure.BackpressurePolicy|None backpressure:
+            see :py:class:`app.parser.outputparser.BaseOutputParser`
+        """
+        super().__init__(sender, analyzer_worker, block_size, backpressure)
+        self.stats = stats
+        self.speed = speed
+        self._first_timestamp = None
+        self._first_time = None
+        # Whether the pace is kept using the timestamps in the data
+        self._paced_by_data = speed is not None
+
+    def replay_file(self, filename):
+        """Parse all lines in given file
+
+        :param str filename: path to the file to parse
+        """
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            self._read_all(self.create_reader(fd))
+        finally:
+            os.close(fd)
+
+    def replay_range(self, filename, t0=None, t1=None):
+        """Parse the lines in given file with timestamps in given range
+
+        The lines are found using the index of the file (see
+        :py:mod:`app.parser.index`), which is created if needed.
+
+        :param str filename: path to the file to parse
+        :param float|None t0: start of the range in seconds since the start
+            of the probe software
+        :param float|None t1: end of the range in seconds since the start
+            of the probe software
+        """
+        with index.CaptureIndex(filename) as capture_index:
+            ranges = capture_index.get_line_ranges(t0, t1)
+            if ranges:
+                timestamp = capture_index.get_timestamp(ranges[0][0])
+                if timestamp != index.NO_TIMESTAMP:
+                    self.last_timestamp = (self.probe_start_time +
+                                           timedelta(milliseconds=timestamp))
+            self._read_all(capture_index.create_reader(
+                t0, t1, self.block_size or reader.DEFAULT_BLOCK_SIZE))
+
+    def _read_all(self, line_reader):
+        while not self.is_terminated:
+            lines = line_reader.read_lines()
+            if lines is None:
+                break
+            self.parse_lines(lines)
+        if not self.is_terminated:
+            self.parse_lines(line_reader.read_remaining())
+
+    def replay_capture(self, filename):
+        """Parse all frames in given binary capture file
+
+        The pace is kept using the receive times stored in the capture
+        instead of the timestamps in the data, so the load profile is
+        reproduced exactly.
+
+        :param str filename: path to the capture file
+        """
+        self._paced_by_data = False
+        with capture.CaptureReader(filename) as capture_reader:
+            for _, data in capture_reader.replay(self.speed):
+                if self.is_terminated:
+                    break
+                try:
+                    text = data.decode('utf-8')
+                except UnicodeDecodeError:
+                    self.stats.lines_failed += 1
+                    self.logger.error('Could not decode line: %s', data)
+                    continue
+                self.parse_lines(text.splitlines())
+
+    def parse_line(self, line):
+        try:
+            super().parse_line(line)
+        except ParseError:
+            self.stats.lines_failed += 1
+            raise
+        if self._paced_by_data:
+            self._keep_pace()
+
+    def _keep_pace(self):
+        if self.last_timestamp is None:
+            return
+        now = time.perf_counter()
+        if self._first_timestamp is None:
+            self._first_timestamp = self.last_timestamp
+            self._first_time = now
+            return
+        data_time = (self.last_timestamp -
+                     self._first_timestamp).total_seconds() / self.speed
+        delay = data_time - (now - self._first_time)
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_line_parsed(self, output_line):
+        self.stats.lines_parsed += 1
+
+
+def replay(path, api, speed=None, probe_start_time=None, analyzer=True,
+           block_size=reader.DEFAULT_BLOCK_SIZE, t0=None, t1=None,
+           batch_size=1, batch_age=0.5, concurrency=1, backpressure=None):
+    """Replay given capture file
+
+    :param str path: path to the capture file (plain text or binary capture)
+    :param api: API instance to send the data with (e.g.
+        :py:class:`LocalSinkAPI`)
+    :param float|None speed: see :py:class:`ReplayOutputParser`
+    :param datetime.datetime|None probe_start_time: probe software start time;
+        current time is used by default
+    :param bool analyzer: whether or not to run the analyzer
+    :param int|None block_size: see
+        :py:class:`app.parser.outputparser.BaseOutputParser`
+    :param float|None t0: if given, only the lines with timestamps starting
+        from ``t0`` seconds since the start of the probe software are
+        replayed (see :py:meth:`ReplayOutputParser.replay_range`; plain text
+        only)
+    :param float|None t1: if given, only the lines with timestamps before
+        ``t1`` seconds since the start of the probe software are replayed
+    :param int batch_size: see :py:class:`app.sender.Sender`
+    :param float batch_age: see :py:class:`app.sender.Sender`
+    :param int concurrency: see :py:class:`app.sender.Sender`
+    :param dict|None backpressure: arguments of
+        :py:class:`app.parser.backpressure.BackpressurePolicy` (other than
+        the sender) or ``None`` to send all records
+    :return: statistics of the replay
+    :rtype: ReplayStatistics
+    """
+    stats = ReplayStatistics()
+    sender = ReplaySender(api, stats, batch_size=batch_size,
+                          batch_age=batch_age, concurrency=concurrency)
+    analyzer_worker = AnalyzerWorker(sender) if analyzer else None
+    policy = (BackpressurePolicy(sender, **backpressure)
+              if backpressure is not None else None)
+    parser = ReplayOutputParser(sender, analyzer_worker, stats, speed,
+                                block_size, policy)
+    parser.set_probe_start_time(probe_start_time or datetime.utcnow())
+
+    threads = [threading.Thread(target=sender.process_indefinitely,
+                                name='Sender')]
+    if analyzer_worker is not None:
+        threads.append(threading.Thread(
+            target=analyzer_worker.calculate_indefinitely, name='Analyzer'))
+    for thread in threads:
+        thread.start()
+
+    stats.start()
+    try:
+        if capture.is_capture(path):
+            parser.replay_capture(path)
+        elif t0 is not None or t1 is not None:
+            parser.replay_range(path, t0, t1)
+        else:
+            parser.replay_file(path)
+        stats.parse_end_time = time.perf_counter()
+        if analyzer_worker is not None:
+            analyzer_worker.set_terminated()
+            threads[1].join()
+        # Wait for the queue to be processed
+        with sender.lock:
+            while len(sender):
+                sender.not_empty.wait(0.01)
+    except KeyboardInterrupt:
+        parser.mark_terminated()
+        if stats.parse_end_time is None:
+            stats.parse_end_time = time.perf_counter()
+    finally:
+        stats.end_time = time.perf_counter()
+        if policy is not None:
+            stats.backpressure = policy.snapshot()
+        if analyzer_worker is not None:
+            analyzer_worker.set_terminated()
+        sender.set_terminated()
+        for thread in threads:
+            thread.join()
+    return stats
+
+
+def parse_speed(value):
+    if value == 'max':
+        return None
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError('speed must be positive')
+    return speed
+
+
+def add_sender_arguments(arg_parser):
+    """Add the options of sending the requests to given parser
+
+    :param argparse.ArgumentParser arg_parser: parser to add the options to
+    """
+    arg_parser.add_argument(
+        '--batch-size', type=int, default=1, metavar='N',
+        help='maximum number of requests to the same endpoint combined into '
+             'a single bulk request (default: 1, i.e. no batching)')
+    arg_parser.add_argument(
+        '--batch-age', type=float, default=0.5, metavar='SECONDS',
+        help='maximum time a request waits for other requests to be sent '
+             'with (default: %(default)s)')
+    arg_parser.add_argument(
+        '--concurrency', type=int, default=1, metavar='N',
+        help='maximum number of requests (to different endpoints) sent at '
+             'the same time (default: 1)')
+    arg_parser.add_argument(
+        '--encoding', choices=ENCODINGS, default=ENCODING_FORM,
+        help='encoding of the request bodies sent to the API server '
+             '(default: %(default)s; bulk requests are always sent as JSON)')
+
+
+def main(args=None):
+    arg_parser = argparse.ArgumentParser(
+        description='Replay recorded probe output without the GUI.')
+    arg_parser.add_argument('path', help='path to the capture file')
+    arg_parser.add_argument(
+        '--speed', type=parse_speed, default=None, metavar='X',
+        help="real-time multiplier or 'max' to replay as fast as possible "
+             "(default)")
+    arg_parser.add_argument(
+        '--probe-start', type=dateutil.parser.parse, default=None,
+        metavar='DATETIME',
+        help='probe software start time (default: current time)')
+    arg_parser.add_argument(
+        '--server-url', help='URL of the API server; if not given, the data '
+                             'is passed to a local in-process sink')
+    arg_parser.add_argument('--token', help='API authentication token')
+    arg_parser.add_argument(
+        '--sink-latency', type=float, default=0, metavar='SECONDS',
+        help='time each request to the local sink takes')
+    arg_parser.add_argument('--no-analyzer', action='store_true',
+                            help='do not run the analyzer')
+    arg_parser.add_argument(
+        '--block-size', type=int, default=reader.DEFAULT_BLOCK_SIZE,
+        help='number of bytes read at once (0 to read line by line)')
+    add_sender_arguments(arg_parser)
+    arg_parser.add_argument(
+        '--from', type=float, default=None, metavar='SECONDS', dest='t0',
+        help='replay only the lines starting from given probe time (uses '
+             'the index of the file, see app/parser/index.py)')
+    arg_parser.add_argument(
+        '--to', type=float, default=None, metavar='SECONDS', dest='t1',
+        help='replay only the lines before given probe time')
+    arg_parser.add_argument(
+        '--backpressure-high', type=int, default=None, metavar='N',
+        help='queue length starting the downsampling of telemetry (default: '
+             'no downsampling)')
+    arg_parser.add_argument(
+        '--backpressure-low', type=int, default=None, metavar='N',
+        help='queue length ending the downsampling (default: 1/10 of the '
+             'high watermark)')
+    arg_parser.add_argument(
+        '--backpressure-growth', type=float, default=None, metavar='RATE',
+        help='queue growth rate (requests/s) starting the downsampling when '
+             'the queue is longer than the low watermark')
+    arg_parser.add_argument(
+        '--downsampling', choices=BackpressurePolicy.METHODS,
+        default=BackpressurePolicy.DECIMATE,
+        help='downsampling method (default: %(default)s)')
+    arg_parser.add_argument(
+        '--downsampling-factor', type=int, default=10, metavar='N',
+        help='number of records per record sent when downsampling (default: '
+             '%(default)s)')
+    args = arg_parser.parse_args(args)
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s | %(name)-12s | %(levelname)-8s | %(message)s')
+    logging.addLevelName(logger.PROBE, 'PROBE')
+
+    if args.server_url:
+        api = API()
+        api.set_server_url(args.server_url)
+        api.default_encoding = args.encoding
+        if args.token:
+            api.set_token(args.token)
+    else:
+        api = LocalSinkAPI(args.sink_latency)
+
+    backpressure = None
+    if args.backpressure_high is not None:
+        backpressure = {
+            'high_watermark': args.backpressure_high,
+            'low_watermark': (args.backpressure_low
+                              if args.backpressure_low is not None
+                              else args.backpressure_high // 10),
+            'growth_threshold': args.backpressure_growth,
+            'method': args.downsampling,
+            'factor': args.downsampling_factor,
+        }
+
+    stats = replay(args.path, api, args.speed, args.probe_start,
+                   not args.no_analyzer, args.block_size or None,
+                   args.t0, args.t1, args.batch_size, args.batch_age,
+                   args.concurrency, backpressure)
+    print('\n'.join(stats.format()))
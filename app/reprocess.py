@@ -0,0 +1,103 @@
+"""
+Post-flight reprocessing of archived output.
+
+Parses the whole capture file in a pool of processes (see
+:py:mod:`app.parser.sharding`) and sends the resulting requests in the
+original order. Use ``reprocess.py --help`` for the options.
+"""
+import argparse
+import logging
+import threading
+import time
+from datetime import datetime
+
+import dateutil.parser
+
+from app import logger
+from app.api import API
+from app.parser import sharding
+from app.replay import (
+    LocalSinkAPI, ReplaySender, ReplayStatistics, add_sender_arguments
+)
+
+
+def reprocess(path, api, probe_start_time=None, jobs=None, batch_size=1,
+              batch_age=0.5, concurrency=1):
+    """Parse given capture file in parallel and send the results
+
+    :param str path: path to the capture file
+    :param api: API instance to send the data with (e.g.
+        :py:class:`app.replay.LocalSinkAPI`)
+    :param datetime.datetime|None probe_start_time: probe software start time;
+        current time is used by default
+    :param int|None jobs: number of processes to use (number of CPUs by
+        default)
+    :param int batch_size: see :py:class:`app.sender.Sender`
+    :param float batch_age: see :py:class:`app.sender.Sender`
+    :param int concurrency: see :py:class:`app.sender.Sender`
+    :return: statistics of the reprocessing
+    :rtype: app.replay.ReplayStatistics
+    """
+    stats = ReplayStatistics()
+    sender = ReplaySender(api, stats, batch_size=batch_size,
+                          batch_age=batch_age, concurrency=concurrency)
+    thread = threading.Thread(target=sender.process_indefinitely,
+                              name='Sender')
+    thread.start()
+
+    stats.start()
+    try:
+        for result in sharding.parse_file(
+                path, probe_start_time or datetime.utcnow(), jobs):
+            stats.lines_parsed += result.lines_parsed
+            stats.lines_failed += result.lines_failed
+            for module, url, data in result.requests:
+                sender.add_request(module, url, data, append_timestamp=False)
+        stats.parse_end_time = time.perf_counter()
+        with sender.lock:
+            while len(sender):
+                sender.not_empty.wait(0.01)
+    finally:
+        if stats.parse_end_time is None:
+            stats.parse_end_time = time.perf_counter()
+        stats.end_time = time.perf_counter()
+        sender.set_terminated()
+        thread.join()
+    return stats
+
+
+def main(args=None):
+    arg_parser = argparse.ArgumentParser(
+        description='Parse archived probe output using multiple processes.')
+    arg_parser.add_argument('path', help='path to the capture file')
+    arg_parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of processes to use (default: number of CPUs)')
+    arg_parser.add_argument(
+        '--probe-start', type=dateutil.parser.parse, default=None,
+        metavar='DATETIME',
+        help='probe software start time (default: current time)')
+    arg_parser.add_argument(
+        '--server-url', help='URL of the API server; if not given, the data '
+                             'is passed to a local in-process sink')
+    arg_parser.add_argument('--token', help='API authentication token')
+    add_sender_arguments(arg_parser)
+    args = arg_parser.parse_args(args)
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s | %(name)-12s | %(levelname)-8s | %(message)s')
+    logging.addLevelName(logger.PROBE, 'PROBE')
+
+    if args.server_url:
+        api = API()
+        api.set_server_url(args.server_url)
+        api.default_encoding = args.encoding
+        if args.token:
+            api.set_token(args.token)
+    else:
+        api = LocalSinkAPI()
+
+    stats = reprocess(args.path, api, args.probe_start, args.jobs,
+                      args.batch_size, args.batch_age, args.concurrency)
+    print('\n'.join(stats.format()))
@@ -1,18 +1,40 @@
+import itertools
 import logging
 import sys
+import time
 from collections import deque, namedtuple
 from datetime import datetime
-from threading import RLock, Condition
+from threading import RLock, Condition, Thread
 from traceback import TracebackException
 
 import requests
+import requests.adapters
 from PyQt5.QtCore import QThread, QObject, pyqtSignal
 
 from app import api
 from app.api import APIError
+from app.sender.metrics import SenderMetrics
+from app.sender.requestqueue import RequestQueue
+from app.sender.retry import CircuitBreaker, RetryPolicy
 
 RequestData = namedtuple('RequestData', 'id, module, url, data, files, '
-                                        'callback')
+                                        'callback, added_time, priority, '
+                                        'supersede_key')
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+def _get_body_size(request):
+    """Return the size of the body of given request in bytes
+
+    :param requests.PreparedRequest|None request: request sent
+    :rtype: int
+    """
+    if request is None or request.body is None:
+        return 0
+    return len(request.body)
 
 
 class Sender:
@@ -20,25 +42,101 @@ class Sender:
     Class that maintains API request queue, as well as allows adding and
     processing elements within it.
 
-    The operations are thread-safe. Note that you probably want to use this
-    class in a separate thread (see :py:class:`QtSenderWorker`).
+    Requests to the URLs listed in ``bulk_urls`` can be sent in batches (see
+    ``batch_size`` and ``batch_age`` parameters of the constructor): the
+    queued requests to the same URL are combined into a single bulk request
+    (see :py:meth:`app.api.API.create_bulk`). If the server rejects a bulk
+    request, the requests are sent one by one, so that the error can be
+    attributed to a particular request. The hooks (``on_request_*``) and
+    callbacks are still called for every request.
+
+    The requests with higher priority (see ``module_priorities``) are sent
+    before the ones with lower priority; otherwise, the oldest requests are
+    sent first. A request can also supersede a pending request with the same
+    key (e.g. a newer snapshot of the same data).
+
+    Requests that failed due to transient errors (e.g. the server could not
+    be reached) are retried automatically according to the retry policy,
+    while a circuit breaker holds back all requests if the server seems to be
+    down (see :py:mod:`app.sender.retry`). Other errors pause the sender
+    until the user decides what to do; the sender can also be paused
+    manually at any time.
+
+    The requests can be stored on disk, so that they survive restarts of the
+    application (see the ``queue`` parameter of the constructor). If the
+    server can't be reached for a long time, the new requests can also be
+    written to a compressed spool and sent in the background when it is back
+    (see :py:mod:`app.sender.spool`).
+
+    The latencies, throughput and retries of the requests to every URL are
+    measured (see :py:meth:`get_metrics`).
+
+    The operations are thread-safe. Adding a request never waits for the
+    threads sending the requests: if they hold the lock, the request is put
+    in an inbox they empty before taking the next batch. Note that you
+    probably want to use this class in a separate thread (see
+    :py:class:`QtSenderWorker`).
     """
 
     logger = logging.getLogger('Sender')
 
-    def __init__(self, api):
+    bulk_urls = frozenset(['/telemetry/', '/gps/'])
+    """URLs that accept bulk requests"""
+
+    module_priorities = {
+        'MissionStatus': PRIORITY_HIGH,
+        'GSInfoDialog': PRIORITY_HIGH,
+        'VideoIDDialog': PRIORITY_HIGH,
+    }
+    """Priorities of the requests added by the modules (the ones not listed
+    get :py:data:`PRIORITY_NORMAL`)"""
+
+    def __init__(self, api, batch_size=1, batch_age=0.5, concurrency=1,
+                 queue=None, retry_policy=None, circuit_breaker=None,
+                 spool=None):
         """Constructor
 
         :param app.api.API api: API instance to use
+        :param int batch_size: maximum number of requests to send at once;
+            1 disables batching
+        :param float batch_age: maximum time in seconds a request may wait
+            for other requests to be sent with
+        :param int concurrency: maximum number of requests (to different
+            URLs) being sent at the same time
+        :param queue: queue to store the requests in (e.g.
+            :py:class:`app.sender.persistentqueue.PersistentRequestQueue`);
+            in-memory :py:class:`RequestQueue` by default
+        :param app.sender.retry.RetryPolicy retry_policy: policy of retrying
+            the requests that failed due to transient errors
+        :param app.sender.retry.CircuitBreaker circuit_breaker: circuit
+            breaker to use
+        :param app.sender.spool.Spool|None spool: spool to store the new
+            requests in during long outages; ``None`` to always queue them
         """
         self.api = api  # API instance
-        # Session instance for persistent connection
+        # Session instance for persistent connection (shared by the threads)
         self.session = requests.Session()
-        # ID for the next RequestData to use
-        self.id = 1
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=max(concurrency, requests.adapters.DEFAULT_POOLSIZE))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.batch_size = batch_size
+        self.batch_age = batch_age
+        self.concurrency = concurrency
+        self.retry_policy = (retry_policy if retry_policy is not None
+                             else RetryPolicy())
+        self.circuit_breaker = (circuit_breaker if circuit_breaker is not None
+                                else CircuitBreaker())
+        self.metrics = SenderMetrics()
 
         # Queue containing RequestData objects
-        self.queue = deque()
+        self.queue = queue if queue is not None else RequestQueue()
+        # IDs for the next RequestData objects to use (next() is atomic)
+        self._ids = itertools.count(self.queue.last_id + 1)
+        # Requests added while the lock was held by another thread; appended
+        # without the lock and moved to the queue by whoever holds it next
+        self._inbox = deque()
+        self.spool = spool
 
         # Lock to avoid overriding queue data by multiple threads (also used
         # for variables listed immediately below)
@@ -46,11 +144,31 @@ class Sender:
         # Condition object that notifies waiting thread whenever an item is
         # added to the queue, so the thread can grab it and process
         self.not_empty = Condition(self.lock)
-        # Whether or not a request is currently being processed in
-        # process_request. Used for better estimation of queue size in __len__
-        self.currently_processing = False
+        # Condition object that notifies the threads waiting to retry
+        # a request or for the circuit breaker that they should check their
+        # state
+        self.retry_wakeup = Condition(self.lock)
+        # Condition object that notifies the thread sending the spooled
+        # requests that there are new ones
+        self.spool_not_empty = Condition(self.lock)
+        # Time of the first failure since the last successful request (None
+        # if the last request was successful)
+        self._outage_since = None
+        # Whether or not the new requests are spooled
+        self.spooling = False
+        # Number of requests currently being processed in process_request.
+        # Used for better estimation of queue size in __len__
+        self.currently_processing = 0
+        # Number of threads waiting for not_empty in process_request; the
+        # threads adding requests only notify them if there are any
+        self._idle_waiters = 0
+        # URLs the requests are currently being sent to
+        self._busy_urls = set()
         # Whether or not the next request should be skipped by process_request
         self.skip_current = False
+        # ID of the (first) request of the batch that failed to be sent last;
+        # that's the one skip_current applies to
+        self._failed_id = None
         # Whether or not the sender was told to be terminated and
         # process_request or process_indefinitely should return ASAP
         self.terminated = False
@@ -64,9 +182,14 @@ class Sender:
         self.unpaused = Condition(self.pause_lock)
 
     def add_request(self, module, url, data, files=None,
-                    append_timestamp=True, callback=None):
+                    append_timestamp=True, callback=None, priority=None,
+                    supersede_key=None):
         """Add request to the queue
 
+        If ``supersede_key`` is given and there is a pending request (i.e. not
+        being sent yet) to the same URL with the same key, that request is
+        replaced with the new one, keeping its ID and place in the queue.
+
         :param str module: name of the module that adds the queue. The value
             is only used when displaying the queue
         :param str url: relative URL to send the request to
@@ -76,20 +199,96 @@ class Sender:
             included in POST data
         :param function callback: function to be called when the request is
             processed
+        :param int|None priority: priority of the request (one of the
+            ``PRIORITY_*`` constants); taken from ``module_priorities`` by
+            default
+        :param str|None supersede_key: key identifying the requests that
+            make the older ones obsolete; ``None`` if the request should
+            always be sent
         """
+        if priority is None:
+            priority = self.module_priorities.get(module, PRIORITY_NORMAL)
         if append_timestamp:
             data['timestamp'] = datetime.utcnow()
 
         self.prepare_request_data(data)
 
-        with self.lock:
-            request_data = RequestData(self.id, module, url, data, files,
-                                       callback)
-            self.id += 1
+        request_data = RequestData(next(self._ids), module, url, data, files,
+                                   callback, time.monotonic(), priority,
+                                   supersede_key)
+        if supersede_key is not None:
+            # The pending request to replace may be anywhere in the queue
+            with self.lock:
+                self._drain_inbox()
+                replaced = self.queue.supersede(request_data)
+                if replaced is not None:
+                    self.on_request_superseded(replaced)
+                    return
+                self.on_request_added(request_data)
+                self.queue.append(request_data)
+                self.not_empty.notify()
+            return
+        if self.spool is not None and self._outage_since is not None:
+            with self.lock:
+                spool = self._should_spool(request_data)
+            if spool:
+                self.spool.append(request_data)
+                self.on_request_spooled(request_data)
+                with self.lock:
+                    self.spool_not_empty.notify()
+                return
+
+        # Announced before the request can be taken by a sending thread, so
+        # that on_request_processing is never called before
+        self.on_request_added(request_data)
+        self._inbox.append(request_data)
+        if self.lock.acquire(blocking=False):
+            try:
+                self._drain_inbox()
+            finally:
+                self.lock.release()
+        elif self._idle_waiters:
+            # The lock holder is about to wait (see process_request), so it
+            # will be released soon
+            with self.lock:
+                self._drain_inbox()
+
+    def _drain_inbox(self):
+        """Move the requests from the inbox to the queue, waking up a thread
+        waiting for them
+
+        Must be called with ``lock`` held.
+        """
+        if not self._inbox:
+            return
+        while True:
+            try:
+                request_data = self._inbox.popleft()
+            except IndexError:
+                break
             self.queue.append(request_data)
-            self.on_request_added(request_data)
+        if self._idle_waiters:
             self.not_empty.notify()
 
+    def _should_spool(self, request_data):
+        """Check if given request should be spooled instead of queued
+
+        Must be called with ``lock`` held.
+
+        :param RequestData request_data: request being added
+        :rtype: bool
+        """
+        if not self.spooling:
+            if (self._outage_since is None or
+                    time.monotonic() - self._outage_since <
+                    self.spool.spool_after):
+                return False
+            self.spooling = True
+            self.logger.warning(
+                'Server unavailable for %.0f s; storing new requests in %s',
+                time.monotonic() - self._outage_since, self.spool.directory)
+        return self.spool.accepts(request_data)
+
     def prepare_request_data(self, data):
         """Prepare request's POST data to be sent
 
@@ -107,71 +306,483 @@ class Sender:
     def __len__(self):
         """Return number of requests currently in the request queue
 
-        Note that this returns 1 more than just a length of the underlying
-        queue if some request is currently being processed.
+        Note that this includes the requests that are currently being
+        processed, but not the spooled ones. The lock is not acquired, so the
+        result may be off by the requests being moved at the moment.
 
         :rtype: int
         """
+        return (len(self.queue) + len(self._inbox) +
+                self.currently_processing)
+
+    def get_metrics(self):
+        """Return the metrics of the requests sent so far, recording the
+        current length of the queue
+
+        The method is cheap enough to be called every second.
+
+        :rtype: app.sender.metrics.MetricsSnapshot
+        """
+        return self.metrics.snapshot(len(self))
+
+    def announce_queued_requests(self, limit=1000):
+        """Call :py:meth:`on_request_added` for the requests already in the
+        queue, i.e. the ones restored by a persistent queue
+
+        Only the oldest ``limit`` requests are announced one by one, so that
+        neither this method nor the receivers of the hooks have to go through
+        (and keep) the whole backlog; the rest is reported with
+        :py:meth:`on_requests_not_announced`.
+
+        Must be called before the requests start being processed.
+
+        :param int limit: maximum number of requests to announce
+        """
         with self.lock:
-            return len(self.queue) + (1 if self.currently_processing else 0)
+            last_id = 0
+            for request_data in itertools.islice(self.queue, limit):
+                self.on_request_added(request_data)
+                last_id = request_data.id
+            count = len(self.queue) - min(limit, len(self.queue))
+            if count:
+                self.on_requests_not_announced(count, last_id + 1,
+                                               self.queue.last_id)
 
     def process_indefinitely(self):
         """Process requests as long as sender is not terminated
 
-        See :py:method:`set_terminated` to terminate executing of this
-        function.
+        If ``concurrency`` is greater than 1, additional threads are started
+        to process the requests in parallel; the function returns when all of
+        them are finished. See :py:method:`set_terminated` to terminate
+        executing of this function.
         """
+        threads = [Thread(target=self._process_until_terminated,
+                          name='Sender-{}'.format(i), daemon=True)
+                   for i in range(1, self.concurrency)]
+        if self.spool is not None:
+            threads.append(Thread(target=self._catch_up, name='Sender-spool',
+                                  daemon=True))
+        for thread in threads:
+            thread.start()
+        self._process_until_terminated()
+        for thread in threads:
+            thread.join()
+        with self.lock:
+            self.queue.flush()
+            if self.spool is not None:
+                self.spool.close()
+
+    def _process_until_terminated(self):
         while not self.terminated:
             self.process_request()
 
     def process_request(self):
-        """Process single request"""
+        """Process single request (or a batch of requests to the same URL)
+
+        The requests to a URL that is already being sent to (by another
+        thread) are not taken, so the requests to every URL are sent in the
+        order they were added.
+        """
         with self.lock:
-            self.currently_processing = False
-            while not len(self.queue):
-                self.not_empty.wait()
+            while True:
                 if self.terminated:
                     return
-            request_data = self.queue.popleft()
-            self.currently_processing = True
+                self._drain_inbox()
+                batch, timeout = self._take_batch()
+                if batch:
+                    break
+                # Nothing to do, so it's a good time to save the queue
+                self.queue.flush()
+                if self.spool is not None:
+                    self.spool.flush()
+                # A request added after the inbox was checked is seen by the
+                # thread adding it as waiting for (see add_request)
+                self._idle_waiters += 1
+                try:
+                    if not self._inbox:
+                        self.not_empty.wait(timeout)
+                finally:
+                    self._idle_waiters -= 1
+            self.currently_processing += len(batch)
+            self._busy_urls.add(batch[0].url)
+        self.metrics.record_taken(batch, time.monotonic())
+
+        try:
+            self._process_batch(batch)
+        finally:
+            with self.lock:
+                self._busy_urls.discard(batch[0].url)
+                # The URL may be the only one other threads are waiting for
+                self.not_empty.notify_all()
+
+    def _process_batch(self, batch):
+        result = self._send(batch)
+        if result == 'rejected':
+            self.logger.warning(
+                'Bulk request with %d items to %s was rejected; sending them '
+                'separately', len(batch), batch[0].url)
+            for i, request_data in enumerate(batch):
+                result = self._send([request_data])
+                if result is None:
+                    self._abandon(batch[i:])
+                    return
+                self._finish(request_data, result == 'skipped')
+        elif result is None:
+            self._abandon(batch)
+        else:
+            for request_data in batch:
+                self._finish(request_data, result == 'skipped')
+
+    def _take_batch(self):
+        """Remove the requests to process next from the queue
+
+        Must be called with ``lock`` held.
+
+        :return: list of the requests (empty if there is nothing to send yet)
+            and maximum time to wait for the next batch (``None`` if there
+            is no limit)
+        :rtype: tuple[list[RequestData], float|None]
+        """
+        now = time.monotonic()
+        selected = None
+        timeout = None
+        for url, head, count in self.queue.heads():
+            if url in self._busy_urls:
+                continue
+            limit = self._get_batch_limit(head)
+            if limit > 1 and count < limit:
+                # Wait for more requests, unless the oldest one is too old
+                wait = head.added_time + self.batch_age - now
+                if wait > 0:
+                    timeout = wait if timeout is None else min(timeout, wait)
+                    continue
+            if selected is None or ((head.priority, head.id) <
+                                    (selected[1].priority, selected[1].id)):
+                selected = url, head, limit
+        if selected is None:
+            return [], timeout
+
+        url, head, limit = selected
+        batch = [self.queue.popleft(url)]
+        while len(batch) < limit:
+            request_data = self.queue.peek(url)
+            if request_data is None or request_data.files:
+                break
+            batch.append(self.queue.popleft(url))
+        return batch, None
+
+    def _get_batch_limit(self, request_data):
+        """Return the maximum number of requests to send with given request
+
+        :param RequestData request_data: first request of the batch
+        :rtype: int
+        """
+        if request_data.url not in self.bulk_urls or request_data.files:
+            return 1
+        return self.batch_size
 
-        repeat = True
-        skipped = False
-        while repeat:
-            repeat = False
+    def _finish(self, request_data, skipped):
+        if not skipped:
+            self.metrics.record_processed(request_data, time.monotonic())
+        self.on_request_processed(request_data, skipped)
+        if request_data.callback:
+            request_data.callback()
+        with self.lock:
+            self.queue.acknowledge(request_data)
+            self.currently_processing -= 1
+
+    def _abandon(self, batch):
+        """Forget the requests that won't be processed due to termination"""
+        with self.lock:
+            self.currently_processing -= len(batch)
 
+    def _send(self, batch):
+        """Send given requests, retrying until they are sent or skipped
+
+        The requests are retried automatically after transient errors (see
+        :py:attr:`retry_policy`) and after the sender is unpaused otherwise.
+
+        :param list[RequestData] batch: requests to the same URL to send; if
+            there are more than one, they are sent with a bulk request
+        :return: ``'sent'``, ``'skipped'``, ``'rejected'`` (if the server
+            rejected a bulk request) or ``None`` if the sender was terminated
+        :rtype: str|None
+        """
+        attempt = 0
+        while True:
             with self.pause_lock:
                 if self._paused:
                     self.unpaused.wait()
             with self.lock:
-                if self.skip_current:
+                # Skip the request that caused the error (if any)
+                if self.skip_current and self._failed_id in (None,
+                                                             batch[0].id):
                     self.skip_current = False
-                    skipped = True
+                    self._failed_id = None
+                    return 'skipped'
+                if self.terminated:
+                    return None
+                allowed, wait = self.circuit_breaker.allow_request()
+                if not allowed:
+                    self.retry_wakeup.wait(wait)
+                    continue
+
+            for request_data in batch:
+                self.on_request_processing(request_data)
+
+            attempt += 1
+            try:
+                if len(batch) == 1:
+                    self._create(batch[0].url, batch[0].data, batch[0].files)
+                else:
+                    self._create(
+                        batch[0].url,
+                        [request_data.data for request_data in batch])
+                with self.lock:
+                    self._record_result(True)
+                    if self._failed_id == batch[0].id:
+                        self._failed_id = None
+                return 'sent'
+            except (APIError, requests.exceptions.RequestException) as e:
+                with self.lock:
+                    # Errors other than transient ones mean that the server
+                    # is up
+                    self._record_result(not self.retry_policy.is_transient(e))
+                if self.retry_policy.should_retry(e, attempt):
+                    self._wait_before_retry(batch, e, attempt)
+                elif isinstance(e, APIError) and len(batch) > 1:
+                    return 'rejected'
+                else:
+                    self._handle_error(batch[0])
+
+    def _create(self, url, data, files=None):
+        """Create the resource(s) with the API, recording the metrics of the
+        request
+
+        :param str url: relative URL
+        :param dict|list[dict] data: data of the resource or, if it's a list,
+            of the resources to create with a bulk request
+        :param dict|None files: files to send with a single resource
+        :raise APIError: if the server did not respond with 201 status code
+        :raise requests.exceptions.RequestException: if the request could not
+            be sent
+        """
+        bulk = isinstance(data, list)
+        start = time.monotonic()
+        try:
+            if bulk:
+                response = self.api.create_bulk(url, data,
+                                                requests_object=self.session)
+            else:
+                response = self.api.create(url, data, files,
+                                           requests_object=self.session)
+        except (APIError, requests.exceptions.RequestException) as e:
+            request = getattr(e, 'request', None)
+            if request is None and e.response is not None:
+                request = e.response.request
+            self.metrics.record_response(
+                url, len(data) if bulk else 1, start, time.monotonic(),
+                _get_body_size(request), False)
+            raise
+        self.metrics.record_response(
+            url, len(data) if bulk else 1, start, time.monotonic(),
+            _get_body_size(getattr(response, 'request', None)), True)
+
+    def _record_result(self, success):
+        """Report the result of sending a request to the circuit breaker
+
+        Must be called with ``lock`` held.
+        """
+        if success:
+            self.circuit_breaker.record_success()
+            self._outage_since = None
+            if self.spooling:
+                self.spooling = False
+                self.logger.info('Server available again; sending %d '
+                                 'spooled requests', len(self.spool))
+        else:
+            self.circuit_breaker.record_failure()
+            if self._outage_since is None:
+                self._outage_since = time.monotonic()
+        # The threads may wait for the result of the probe
+        self.retry_wakeup.notify_all()
+
+    def _wait_before_retry(self, batch, exception, attempt):
+        """Wait before sending given requests again after a transient error
+
+        The wait is interrupted if the sender is paused, terminated or told to
+        skip the current request.
+
+        :param list[RequestData] batch: requests that failed to be sent
+        :param BaseException exception: exception raised when sending them
+        :param int attempt: number of the failed attempt (starting from 1)
+        """
+        delay = self.retry_policy.get_delay(attempt, exception)
+        self.logger.warning(
+            'Could not send request to %s (attempt %d): %s; retrying in '
+            '%.1f s', batch[0].url, attempt, exception, delay)
+        self.metrics.record_retry(batch[0].url)
+        for request_data in batch:
+            self.on_request_retrying(request_data, exception, attempt, delay)
+
+        deadline = time.monotonic() + delay
+        with self.lock:
+            while not (self.terminated or self.skip_current or self._paused):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
+                self.retry_wakeup.wait(remaining)
+
+    def _catch_up(self):
+        """Send the spooled requests until terminated
+
+        The requests are sent with bulk requests where possible. While there
+        are live requests to send, sending the spooled ones takes at most
+        ``backlog_share`` of the time. During the outage, the spooled requests
+        are only used to check if the server is back when there are no live
+        requests to do that.
+        """
+        attempt = 0
+        while True:
+            with self.pause_lock:
+                if self._paused:
+                    self.unpaused.wait()
+            with self.lock:
                 if self.terminated:
                     return
+                if not len(self.spool):
+                    self.spool_not_empty.wait()
+                    continue
+                if self.spooling and len(self):
+                    # Woken up whenever a live request is sent
+                    self.retry_wakeup.wait(1)
+                    continue
+                entry = self.spool.peek(self.spool.batch_size)
+                if entry is None:
+                    continue
+                allowed, wait = self.circuit_breaker.allow_request()
+                if not allowed:
+                    self.retry_wakeup.wait(wait)
+                    continue
+            url, records = entry
+            if url not in self.bulk_urls:
+                records = records[:1]
+
+            attempt += 1
+            start = time.monotonic()
+            try:
+                self._send_spooled(url, records)
+            except (APIError, requests.exceptions.RequestException) as e:
+                transient = self.retry_policy.is_transient(e)
+                with self.lock:
+                    self._record_result(not transient)
+                if transient:
+                    self._wait_before_retry_spooled(url, e, attempt)
+                    continue
+                self.logger.error('Spooled request to %s was rejected (%s); '
+                                  'dropping it', url, e)
+                self.spool.advance(url, 1, sent=False)
+            else:
+                with self.lock:
+                    self._record_result(True)
+            attempt = 0
+            if not len(self.spool):
+                self.logger.info('All spooled requests were sent')
+            self._yield_to_live(time.monotonic() - start)
+
+    def _send_spooled(self, url, records):
+        """Send given spooled requests and remove them from the spool
+
+        If the server rejects a bulk request, the requests are sent one by
+        one and the rejected ones are dropped.
+
+        :param str url: URL of the requests
+        :param list[dict] records: spooled requests
+        :raise APIError: if the request could not be sent (unless it was
+            rejected when sent separately)
+        :raise requests.exceptions.RequestException: if the request could not
+            be sent
+        """
+        try:
+            if len(records) == 1:
+                self._create(url, records[0]['data'])
+            else:
+                self._create(url, [record['data'] for record in records])
+        except APIError as e:
+            if len(records) == 1 or self.retry_policy.is_transient(e):
+                raise
+            self.logger.warning(
+                'Bulk request with %d spooled items to %s was rejected; '
+                'sending them separately', len(records), url)
+        else:
+            self.spool.advance(url, len(records))
+            return
+
+        for record in records:
+            try:
+                self._create(url, record['data'])
+            except (APIError, requests.exceptions.RequestException) as e:
+                if self.retry_policy.is_transient(e):
+                    raise
+                self.logger.error('Spooled request to %s was rejected (%s); '
+                                  'dropping it', url, e)
+                self.spool.advance(url, 1, sent=False)
+            else:
+                self.spool.advance(url, 1)
+
+    def _wait_before_retry_spooled(self, url, exception, attempt):
+        """Wait before sending the spooled requests again after a transient
+        error
+
+        The wait is interrupted if the sender is terminated or a live request
+        is sent successfully in the meantime.
+        """
+        delay = self.retry_policy.get_delay(attempt, exception)
+        self.logger.debug('Could not send spooled requests to %s (attempt '
+                          '%d): %s; retrying in %.1f s', url, attempt,
+                          exception, delay)
+        self.metrics.record_retry(url)
+        deadline = time.monotonic() + delay
+        with self.lock:
+            while not self.terminated and self._outage_since is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.retry_wakeup.wait(remaining)
 
-            self.on_request_processing(request_data)
+    def _yield_to_live(self, elapsed):
+        """Leave the time for the live requests after sending the spooled
+        ones for ``elapsed`` seconds (as long as there are any to send)"""
+        share = self.spool.backlog_share
+        deadline = time.monotonic() + elapsed * (1 - share) / share
+        with self.lock:
+            while not self.terminated and len(self):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Woken up whenever a live request is sent
+                self.retry_wakeup.wait(remaining)
 
-            try:
-                self.api.create(
-                    request_data.url, request_data.data, request_data.files,
-                    requests_object=self.session)
-            except (requests.exceptions.RequestException, APIError):
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                request = exc_value.response.request
-                self.logger.exception(
-                    'Could not send request: %s\nURL: %s\nRequest body: %s',
-                    str(exc_value), request.url, request.body)
-                tb_exc = TracebackException.from_exception(exc_value)
-                self.on_error(request_data, exc_value, tb_exc)
-                self.paused = True
-
-                repeat = True
+    def _handle_error(self, request_data):
+        """Report the exception being handled (which is not going to be
+        retried automatically) and pause the sender
 
-        self.on_request_processed(request_data, skipped)
-        if request_data.callback:
-            request_data.callback()
+        :param RequestData request_data: request (or the first request of
+            the batch) being sent when the error occurred
+        """
+        exc_type, exc_value, exc_traceback = sys.exc_info()
+        request = (exc_value.response.request
+                   if exc_value.response is not None
+                   else getattr(exc_value, 'request', None))
+        self.logger.exception(
+            'Could not send request: %s\nURL: %s\nRequest body: %s',
+            str(exc_value), request.url if request else request_data.url,
+            request.body if request else None)
+        tb_exc = TracebackException.from_exception(exc_value)
+        with self.lock:
+            self._failed_id = request_data.id
+        self.on_error(request_data, exc_value, tb_exc)
+        self.paused = True
 
     @property
     def paused(self):
@@ -193,15 +804,23 @@ class Sender:
         with self.pause_lock:
             self._paused = paused
             if not paused:
-                self.unpaused.notify()
+                self.unpaused.notify_all()
             self.on_paused(paused)
+        with self.lock:
+            self.retry_wakeup.notify_all()
 
     def set_skip_current(self):
-        """Causes the currently processed request to be skipped"""
+        """Causes the currently processed request to be skipped
+
+        If sending a request failed, that request is skipped (when the sender
+        retries it); otherwise, the next request processed is. If a batch of
+        requests is being sent, the whole batch is skipped.
+        """
         with self.lock:
             if not self.skip_current:
                 self.skip_current = True
                 self.logger.warning('Skipping current request')
+                self.retry_wakeup.notify_all()
 
     def set_terminated(self):
         """Terminate processing requests
@@ -214,18 +833,56 @@ class Sender:
         self.terminated = True
         with self.lock, self.pause_lock:
             self.not_empty.notify_all()
+            self.retry_wakeup.notify_all()
+            self.spool_not_empty.notify_all()
             self.unpaused.notify_all()
 
     def on_request_added(self, request_data):
         """Called when a request is added to the queue.
 
-        The method is supposed to be overridden by subclasses.
+        The method is called by the thread adding the request, usually without
+        the lock held, just before the request is queued. The method is
+        supposed to be overridden by subclasses.
 
         :param RequestData request_data: RequestData instance for the request
             being added to the queue
         """
         pass
 
+    def on_requests_not_announced(self, count, first_id, last_id):
+        """Called by :py:meth:`announce_queued_requests` for the queued
+        requests that were not announced one by one.
+
+        The requests are still processed as usual (and reported by the other
+        hooks). The method is supposed to be overridden by subclasses.
+
+        :param int count: number of the requests
+        :param int first_id: lowest ID the requests may have
+        :param int last_id: highest ID the requests may have
+        """
+        pass
+
+    def on_request_superseded(self, request_data):
+        """Called when a pending request was replaced with a newer one.
+
+        The method is supposed to be overridden by subclasses.
+
+        :param RequestData request_data: RequestData instance for the request
+            after the replacement (with the ID of the replaced request)
+        """
+        pass
+
+    def on_request_spooled(self, request_data):
+        """Called when a request is stored in the spool instead of being
+        added to the queue.
+
+        The method is supposed to be overridden by subclasses.
+
+        :param RequestData request_data: RequestData instance for the request
+            being spooled
+        """
+        pass
+
     def on_request_processing(self, request_data):
         """Called when a request is started being processed.
 
@@ -247,6 +904,20 @@ class Sender:
         """
         pass
 
+    def on_request_retrying(self, request_data, exception, attempt, delay):
+        """Called when sending a request failed due to a transient error
+        and it is going to be retried automatically.
+
+        The method is supposed to be overridden by subclasses.
+
+        :param RequestData request_data: RequestData instance for the request
+            being retried
+        :param BaseException exception: exception thrown
+        :param int attempt: number of the failed attempt (starting from 1)
+        :param float delay: time in seconds before the next attempt
+        """
+        pass
+
     def on_paused(self, paused):
         """Called when the queue is (un)paused.
 
@@ -275,20 +946,36 @@ class QtSender(QObject, Sender):
     """
 
     request_added = pyqtSignal(RequestData)
+    requests_not_announced = pyqtSignal(int, int, int)
+    request_superseded = pyqtSignal(RequestData)
+    request_spooled = pyqtSignal(RequestData)
     request_processing = pyqtSignal(RequestData)
     request_processed = pyqtSignal(RequestData, bool)
+    request_retrying = pyqtSignal(RequestData, BaseException, int, float)
     queue_paused = pyqtSignal(bool)
     error_occurred = pyqtSignal(RequestData, BaseException, TracebackException)
 
     def on_request_added(self, request_data):
         self.request_added.emit(request_data)
 
+    def on_requests_not_announced(self, count, first_id, last_id):
+        self.requests_not_announced.emit(count, first_id, last_id)
+
+    def on_request_superseded(self, request_data):
+        self.request_superseded.emit(request_data)
+
+    def on_request_spooled(self, request_data):
+        self.request_spooled.emit(request_data)
+
     def on_request_processing(self, request_data):
         self.request_processing.emit(request_data)
 
     def on_request_processed(self, request_data, skipped):
         self.request_processed.emit(request_data, skipped)
 
+    def on_request_retrying(self, request_data, exception, attempt, delay):
+        self.request_retrying.emit(request_data, exception, attempt, delay)
+
     def on_paused(self, paused):
         self.queue_paused.emit(paused)
 
@@ -301,14 +988,16 @@ class QtSenderWorker(QThread):
     Creates QtSender and processes the requests indefinitely.
     """
 
-    def __init__(self, api, parent=None):
+    def __init__(self, api, parent=None, **kwargs):
         """Constructor
 
         :param app.api.API api: API instance to use
         :param QObject parent: thread parent
+        :param kwargs: other arguments of :py:class:`Sender` (e.g.
+            ``concurrency``)
         """
         super().__init__(parent)
-        self.sender = QtSender(self, api=api)
+        self.sender = QtSender(self, api=api, **kwargs)
 
     def run(self):
         self.sender.process_indefinitely()
@@ -0,0 +1,235 @@
+"""
+Instrumentation of :py:class:`app.sender.Sender`.
+
+For every URL, the sender counts the requests sent, the HTTP requests made
+(a bulk request sends many requests at once), the failed attempts, the
+retries and the bytes sent, and measures three latencies of every request:
+
+* queue wait: from adding the request to taking it from the queue to send
+  it, i.e. the time spent in our own queue,
+* response time: from making the HTTP request to receiving the response
+  (the link and the server),
+* total: from adding the request to processing it, including the retries.
+
+The latencies are kept in :py:class:`LatencyHistogram` objects, so that the
+memory used and the cost of :py:meth:`SenderMetrics.snapshot` don't depend on
+the number of requests sent. The length of the queue is recorded with every
+snapshot.
+"""
+import time
+from collections import deque, namedtuple
+from threading import Lock
+
+LatencySummary = namedtuple('LatencySummary', 'count, mean, p50, p95, p99, '
+                                              'max')
+"""Summary of a :py:class:`LatencyHistogram`; the times are in seconds"""
+
+EndpointSnapshot = namedtuple('EndpointSnapshot',
+                              'url, requests, http_requests, failures, '
+                              'retries, bytes_sent, queue_wait, '
+                              'response_time, total_time')
+"""Metrics of the requests to a single URL; the latencies are
+:py:class:`LatencySummary` objects"""
+
+MetricsSnapshot = namedtuple('MetricsSnapshot', 'time, endpoints, queue_depth')
+"""Metrics of all the URLs at given (monotonic) time
+
+``endpoints`` maps the URLs to :py:class:`EndpointSnapshot` objects and
+``queue_depth`` is a list of ``(time, length of the queue)`` tuples, oldest
+first."""
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with bounded relative error, similar to
+    HdrHistogram
+
+    The values are recorded in ``resolution`` units. Every range of values
+    between consecutive powers of two is split into ``2 ** SUB_BUCKET_BITS``
+    buckets, so the values reported are within ~3% of the recorded ones,
+    while a histogram of values from 1 µs to an hour has less than 1000
+    buckets.
+
+    The class is not thread-safe; :py:class:`SenderMetrics` protects it with
+    its own lock.
+    """
+
+    SUB_BUCKET_BITS = 5
+    SUB_BUCKETS = 2 ** SUB_BUCKET_BITS
+
+    def __init__(self, resolution=1e-6):
+        """Constructor
+
+        :param float resolution: smallest difference between the values
+            distinguished in seconds
+        """
+        self.resolution = resolution
+        # Bucket index -> number of values recorded
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, seconds):
+        """Record given value
+
+        :param float seconds: latency in seconds (negative values are
+            recorded as 0)
+        """
+        value = max(0, int(seconds / self.resolution))
+        index = self._get_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p):
+        """Return the value given percentage of the recorded values is lower
+        than or equal to
+
+        :param float p: percentage (0-100)
+        :return: value in seconds (``None`` if nothing was recorded)
+        :rtype: float|None
+        """
+        if not self.count:
+            return None
+        rank = max(1, p / 100 * self.count)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                break
+        return min(self._get_value(index), self.max) * self.resolution
+
+    def summarize(self):
+        """Return the summary of the recorded values
+
+        :rtype: LatencySummary
+        """
+        if not self.count:
+            return LatencySummary(0, None, None, None, None, None)
+        return LatencySummary(
+            self.count, self.total / self.count * self.resolution,
+            self.percentile(50), self.percentile(95), self.percentile(99),
+            self.max * self.resolution)
+
+    def _get_index(self, value):
+        shift = max(0, value.bit_length() - self.SUB_BUCKET_BITS - 1)
+        return shift * self.SUB_BUCKETS + (value >> shift)
+
+    def _get_value(self, index):
+        """Return the middle of the range of values of given bucket"""
+        shift = max(0, index // self.SUB_BUCKETS - 1)
+        lowest = (index - shift * self.SUB_BUCKETS) << shift
+        return lowest + ((1 << shift) - 1) // 2
+
+
+class _Endpoint:
+    __slots__ = ('requests', 'http_requests', 'failures', 'retries',
+                 'bytes_sent', 'queue_wait', 'response_time', 'total_time')
+
+    def __init__(self):
+        self.requests = 0
+        self.http_requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.queue_wait = LatencyHistogram()
+        self.response_time = LatencyHistogram()
+        self.total_time = LatencyHistogram()
+
+
+class SenderMetrics:
+    """
+    Per-URL metrics of the requests sent
+
+    The class is thread-safe; the methods recording the metrics are called
+    by :py:class:`app.sender.Sender`.
+    """
+
+    def __init__(self, history=600, clock=time.monotonic):
+        """Constructor
+
+        :param int history: number of the queue lengths to keep (one is
+            recorded with every snapshot)
+        :param function clock: function returning current time in seconds
+        """
+        self.clock = clock
+        self.lock = Lock()
+        # URL -> _Endpoint
+        self._endpoints = {}
+        self._queue_depth = deque(maxlen=history)
+
+    def _get_endpoint(self, url):
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            endpoint = self._endpoints[url] = _Endpoint()
+        return endpoint
+
+    def record_taken(self, batch, now):
+        """Record taking given requests from the queue to send them
+
+        :param list[app.sender.RequestData] batch: requests to the same URL
+        :param float now: current time
+        """
+        with self.lock:
+            histogram = self._get_endpoint(batch[0].url).queue_wait
+            for request_data in batch:
+                histogram.record(now - request_data.added_time)
+
+    def record_response(self, url, count, start, end, size, success):
+        """Record an HTTP request
+
+        :param str url: URL of the request
+        :param int count: number of the requests sent with it
+        :param float start: time the request was made
+        :param float end: time the response was received (or the request
+            failed)
+        :param int size: size of the request body in bytes
+        :param bool success: whether or not the requests were sent
+        """
+        with self.lock:
+            endpoint = self._get_endpoint(url)
+            endpoint.http_requests += 1
+            endpoint.bytes_sent += size
+            endpoint.response_time.record(end - start)
+            if success:
+                endpoint.requests += count
+            else:
+                endpoint.failures += 1
+
+    def record_retry(self, url):
+        """Record scheduling a retry of the requests to given URL"""
+        with self.lock:
+            self._get_endpoint(url).retries += 1
+
+    def record_processed(self, request_data, now):
+        """Record sending given request (after the retries, if any)
+
+        :param app.sender.RequestData request_data: request sent
+        :param float now: current time
+        """
+        with self.lock:
+            self._get_endpoint(request_data.url).total_time.record(
+                now - request_data.added_time)
+
+    def snapshot(self, queue_depth):
+        """Return the metrics recorded so far
+
+        The method is cheap enough to be called every second.
+
+        :param int queue_depth: current length of the queue to record
+        :rtype: MetricsSnapshot
+        """
+        now = self.clock()
+        with self.lock:
+            self._queue_depth.append((now, queue_depth))
+            endpoints = {
+                url: EndpointSnapshot(
+                    url, endpoint.requests, endpoint.http_requests,
+                    endpoint.failures, endpoint.retries, endpoint.bytes_sent,
+                    endpoint.queue_wait.summarize(),
+                    endpoint.response_time.summarize(),
+                    endpoint.total_time.summarize())
+                for url, endpoint in self._endpoints.items()}
+            return MetricsSnapshot(now, endpoints, list(self._queue_depth))
@@ -0,0 +1,336 @@
+"""
+Request queue stored in an SQLite database, so that the requests that were
+not sent survive crashes and restarts of the application.
+
+The database is used in WAL mode. To avoid waiting for the disk on every
+request, the changes are committed in groups: after ``group_size`` changes,
+when the oldest uncommitted change is ``commit_interval`` seconds old (checked
+when the queue is modified) or when :py:meth:`PersistentRequestQueue.flush` is
+called (:py:class:`app.sender.Sender` does that whenever it runs out of
+requests to send). A crash can therefore lose at most the last group of
+changes; use ``group_size=1`` to commit every change separately.
+
+Only the first ``cache_size`` requests of every URL are kept in memory; the
+rest is read from the database when needed, so the memory usage does not
+depend on the length of the backlog.
+"""
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict, deque
+
+from app.sender import RequestData
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS requests (
+    id INTEGER PRIMARY KEY,
+    module TEXT NOT NULL,
+    url TEXT NOT NULL,
+    data TEXT NOT NULL,
+    added_time REAL NOT NULL,
+    has_files INTEGER NOT NULL DEFAULT 0,
+    priority INTEGER NOT NULL DEFAULT 1,
+    supersede_key TEXT
+);
+CREATE INDEX IF NOT EXISTS requests_url ON requests (url, id);
+'''
+
+# Columns added after the first version of the schema
+ADDED_COLUMNS = [
+    ('priority', 'INTEGER NOT NULL DEFAULT 1'),
+    ('supersede_key', 'TEXT'),
+]
+
+COLUMNS = 'id, module, url, data, added_time, priority, supersede_key'
+
+
+class _Lane:
+    __slots__ = ('url', 'cache', 'count', 'loaded_id')
+
+    def __init__(self, url, count=0, loaded_id=0):
+        self.url = url
+        # First requests of the lane
+        self.cache = deque()
+        # Number of requests in the lane (including the ones not cached)
+        self.count = count
+        # ID of the last request that was cached
+        self.loaded_id = loaded_id
+
+    @property
+    def complete(self):
+        """Whether or not all requests of the lane are cached"""
+        return self.count == len(self.cache)
+
+
+class PersistentRequestQueue:
+    """
+    Queue of the requests to send stored in an SQLite database
+
+    The class has the same interface as
+    :py:class:`app.sender.requestqueue.RequestQueue`. The requests removed
+    with :py:meth:`popleft` stay in the database until they are acknowledged
+    (see :py:meth:`acknowledge`), so the requests being sent when the
+    application was terminated are restored as well.
+
+    Files and callbacks of the requests can't be stored, so they are only kept
+    in memory: restored requests have no callbacks and the ones that had
+    files are dropped.
+
+    The class is not thread-safe; :py:class:`app.sender.Sender` protects it
+    with its own lock.
+    """
+
+    logger = logging.getLogger('Sender')
+
+    persistent = True
+
+    def __init__(self, path, durable=True, group_size=100,
+                 commit_interval=0.5, cache_size=1000):
+        """Constructor
+
+        Opens (or creates) the database and restores the requests stored in
+        it.
+
+        :param str path: path to the database file
+        :param bool durable: whether or not to wait for the data to be
+            written to the disk on commit (``synchronous`` SQLite setting);
+            if ``False``, the requests survive crashes of the application, but
+            not of the operating system
+        :param int group_size: maximum number of changes committed at once
+        :param float commit_interval: maximum time in seconds a change may
+            wait for the commit
+        :param int cache_size: maximum number of requests of every URL to
+            keep in memory
+        """
+        self.path = path
+        self.group_size = group_size
+        self.commit_interval = commit_interval
+        self.cache_size = cache_size
+
+        self.connection = sqlite3.connect(path, isolation_level=None,
+                                          check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous={}'.format(
+            'FULL' if durable else 'OFF'))
+        self.connection.executescript(SCHEMA)
+        existing = {row[1] for row in self.connection.execute(
+            'PRAGMA table_info(requests)')}
+        for name, definition in ADDED_COLUMNS:
+            if name not in existing:
+                self.connection.execute(
+                    'ALTER TABLE requests ADD COLUMN {} {}'.format(
+                        name, definition))
+        # Number of uncommitted changes and the time of the oldest one
+        self._pending = 0
+        self._pending_since = None
+        # ID -> (files, callback) of the requests having any of them
+        self._extras = {}
+        # (URL, supersede key) -> ID of the pending request with that key
+        self._superseding = {}
+
+        dropped = self.connection.execute(
+            'DELETE FROM requests WHERE has_files').rowcount
+        if dropped:
+            self.logger.warning('Dropped %d restored requests with files '
+                                'which had not been stored', dropped)
+        (self.last_id,) = self.connection.execute(
+            'SELECT COALESCE(MAX(id), 0) FROM requests').fetchone()
+        self._restored_id = self.last_id
+        self._restored_time = time.monotonic()
+
+        # URL -> _Lane, in the order of the first requests
+        self._lanes = OrderedDict()
+        self._count = 0
+        for url, count in self.connection.execute(
+                'SELECT url, COUNT(*) FROM requests GROUP BY url '
+                'ORDER BY MIN(id)'):
+            self._lanes[url] = _Lane(url, count)
+            self._count += count
+        for url, key, request_id in self.connection.execute(
+                'SELECT url, supersede_key, MAX(id) FROM requests WHERE '
+                'supersede_key IS NOT NULL GROUP BY url, supersede_key'):
+            self._superseding[url, key] = request_id
+        if self._count:
+            self.logger.info('Restored %d requests from %s', self._count,
+                             path)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Iterate over all requests in the queue in the order of their IDs
+
+        The queue must not be modified during the iteration.
+        """
+        cursor = self.connection.execute(
+            'SELECT {} FROM requests ORDER BY id'.format(COLUMNS))
+        for row in cursor:
+            yield self._create_request_data(row)
+
+    def append(self, request_data):
+        """Add given request at the end of its lane and store it
+
+        :param app.sender.RequestData request_data: request to add
+        """
+        self._write(
+            'INSERT INTO requests ({}, has_files) VALUES (?, ?, ?, ?, ?, ?, '
+            '?, ?)'.format(COLUMNS),
+            (request_data.id, request_data.module, request_data.url,
+             self._encode_data(request_data.data), request_data.added_time,
+             request_data.priority, request_data.supersede_key,
+             bool(request_data.files)))
+        self._set_extras(request_data)
+        self.last_id = max(self.last_id, request_data.id)
+        if request_data.supersede_key is not None:
+            self._superseding[request_data.url,
+                              request_data.supersede_key] = request_data.id
+
+        lane = self._lanes.get(request_data.url)
+        if lane is None:
+            lane = self._lanes[request_data.url] = _Lane(
+                request_data.url)
+        if lane.complete and len(lane.cache) < self.cache_size:
+            lane.cache.append(request_data)
+            lane.loaded_id = request_data.id
+        lane.count += 1
+        self._count += 1
+
+    def supersede(self, request_data):
+        """Replace the pending request with the same URL and supersede key
+        as given request
+
+        The replaced request keeps its ID, time of adding and place in the
+        queue.
+
+        :param app.sender.RequestData request_data: newer request
+        :return: request after the replacement or ``None`` if there is no
+            request to replace (then the request has to be appended)
+        :rtype: app.sender.RequestData|None
+        """
+        request_id = self._superseding.get((request_data.url,
+                                            request_data.supersede_key))
+        if request_id is None:
+            return None
+        lane = self._lanes[request_data.url]
+        for i, item in enumerate(lane.cache):
+            if item.id == request_id:
+                new = request_data._replace(id=request_id,
+                                            added_time=item.added_time)
+                lane.cache[i] = new
+                break
+        else:
+            (added_time,) = self.connection.execute(
+                'SELECT added_time FROM requests WHERE id = ?',
+                (request_id,)).fetchone()
+            new = request_data._replace(id=request_id, added_time=added_time)
+        self._write(
+            'UPDATE requests SET module = ?, data = ?, priority = ?, '
+            'has_files = ? WHERE id = ?',
+            (new.module, self._encode_data(new.data), new.priority,
+             bool(new.files), request_id))
+        self._extras.pop(request_id, None)
+        self._set_extras(new)
+        return new
+
+    def heads(self):
+        """Return the first requests of all non-empty lanes
+
+        :return: list of ``(url, request_data, count)`` tuples, where
+            ``count`` is the number of requests in the lane
+        :rtype: list[tuple[str, app.sender.RequestData, int]]
+        """
+        return [(url, self._get_cache(lane)[0], lane.count)
+                for url, lane in self._lanes.items()]
+
+    def peek(self, url):
+        """Return the first request in given lane without removing it
+
+        :param str url: URL of the lane
+        :rtype: app.sender.RequestData|None
+        """
+        lane = self._lanes.get(url)
+        return self._get_cache(lane)[0] if lane else None
+
+    def popleft(self, url):
+        """Remove and return the first request in given lane
+
+        The request is still stored until it is acknowledged.
+
+        :param str url: URL of the lane
+        :rtype: app.sender.RequestData
+        :raise KeyError: if the lane is empty
+        """
+        lane = self._lanes[url]
+        request_data = self._get_cache(lane).popleft()
+        lane.count -= 1
+        if not lane.count:
+            del self._lanes[url]
+        self._count -= 1
+        if request_data.supersede_key is not None:
+            key = url, request_data.supersede_key
+            if self._superseding.get(key) == request_data.id:
+                del self._superseding[key]
+        return request_data
+
+    def acknowledge(self, request_data):
+        """Remove given request (which was processed) from the database
+
+        :param app.sender.RequestData request_data: request removed from the
+            queue with :py:meth:`popleft`
+        """
+        self._extras.pop(request_data.id, None)
+        self._write('DELETE FROM requests WHERE id = ?', (request_data.id,))
+
+    def flush(self):
+        """Commit the pending changes"""
+        if self.connection.in_transaction:
+            self.connection.execute('COMMIT')
+        self._pending = 0
+        self._pending_since = None
+
+    def close(self):
+        """Commit the pending changes and close the database"""
+        self.flush()
+        self.connection.close()
+
+    def _write(self, sql, parameters):
+        if not self.connection.in_transaction:
+            self.connection.execute('BEGIN')
+            self._pending_since = time.monotonic()
+        self.connection.execute(sql, parameters)
+        self._pending += 1
+        if (self._pending >= self.group_size or
+                time.monotonic() - self._pending_since >=
+                self.commit_interval):
+            self.flush()
+
+    def _get_cache(self, lane):
+        """Return the cached requests of given lane, reading the next ones
+        from the database if there are none"""
+        if not lane.cache:
+            for row in self.connection.execute(
+                    'SELECT {} FROM requests WHERE url = ? AND id > ? '
+                    'ORDER BY id LIMIT ?'.format(COLUMNS),
+                    (lane.url, lane.loaded_id, self.cache_size)):
+                lane.cache.append(self._create_request_data(row))
+            lane.loaded_id = lane.cache[-1].id
+        return lane.cache
+
+    def _set_extras(self, request_data):
+        if request_data.files or request_data.callback:
+            self._extras[request_data.id] = (request_data.files,
+                                             request_data.callback)
+
+    @staticmethod
+    def _encode_data(data):
+        return json.dumps(data, separators=(',', ':'), default=str)
+
+    def _create_request_data(self, row):
+        request_id, module, url, data, added_time, priority, key = row
+        files, callback = self._extras.get(request_id, (None, None))
+        if request_id <= self._restored_id:
+            # The monotonic clock of a previous run is meaningless now
+            added_time = self._restored_time
+        return RequestData(request_id, module, url, json.loads(data), files,
+                           callback, added_time, priority, key)
@@ -0,0 +1,131 @@
+import heapq
+import operator
+from collections import OrderedDict, deque
+
+
+class RequestQueue:
+    """
+    Queue of the requests to send, split into lanes by URL
+
+    The requests in every lane are kept in the order they were added. Since
+    the IDs of the requests are increasing, the oldest request in the whole
+    queue is the lane head with the lowest ID.
+
+    Pending requests having a ``supersede_key`` can be replaced with newer
+    ones (see :py:meth:`supersede`).
+
+    The class is not thread-safe; :py:class:`app.sender.Sender` protects it
+    with its own lock.
+    """
+
+    persistent = False
+    """Whether or not the requests survive restarts of the application"""
+
+    def __init__(self):
+        # URL -> deque of RequestData objects
+        self._lanes = OrderedDict()
+        self._count = 0
+        # ID of the last request added
+        self.last_id = 0
+        # (URL, supersede key) -> pending RequestData with that key
+        self._superseding = {}
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Iterate over all requests in the queue in the order of their IDs
+
+        The queue must not be modified during the iteration.
+        """
+        return heapq.merge(*self._lanes.values(),
+                           key=operator.attrgetter('id'))
+
+    def append(self, request_data):
+        """Add given request at the end of its lane
+
+        :param app.sender.RequestData request_data: request to add
+        """
+        lane = self._lanes.get(request_data.url)
+        if lane is None:
+            lane = self._lanes[request_data.url] = deque()
+        lane.append(request_data)
+        self._count += 1
+        self.last_id = max(self.last_id, request_data.id)
+        if request_data.supersede_key is not None:
+            self._superseding[request_data.url,
+                              request_data.supersede_key] = request_data
+
+    def supersede(self, request_data):
+        """Replace the pending request with the same URL and supersede key
+        as given request
+
+        The replaced request keeps its ID, time of adding and place in the
+        queue.
+
+        :param app.sender.RequestData request_data: newer request
+        :return: request after the replacement or ``None`` if there is no
+            request to replace (then the request has to be appended)
+        :rtype: app.sender.RequestData|None
+        """
+        key = request_data.url, request_data.supersede_key
+        old = self._superseding.get(key)
+        if old is None:
+            return None
+        new = request_data._replace(id=old.id, added_time=old.added_time)
+        lane = self._lanes[old.url]
+        for i, item in enumerate(lane):
+            if item is old:
+                lane[i] = new
+                break
+        self._superseding[key] = new
+        return new
+
+    def heads(self):
+        """Return the first requests of all non-empty lanes
+
+        :return: list of ``(url, request_data, count)`` tuples, where
+            ``count`` is the number of requests in the lane
+        :rtype: list[tuple[str, app.sender.RequestData, int]]
+        """
+        return [(url, lane[0], len(lane)) for url, lane in self._lanes.items()]
+
+    def peek(self, url):
+        """Return the first request in given lane without removing it
+
+        :param str url: URL of the lane
+        :rtype: app.sender.RequestData|None
+        """
+        lane = self._lanes.get(url)
+        return lane[0] if lane else None
+
+    def popleft(self, url):
+        """Remove and return the first request in given lane
+
+        :param str url: URL of the lane
+        :rtype: app.sender.RequestData
+        :raise KeyError: if the lane is empty
+        """
+        lane = self._lanes[url]
+        request_data = lane.popleft()
+        if not lane:
+            del self._lanes[url]
+        self._count -= 1
+        if request_data.supersede_key is not None:
+            key = url, request_data.supersede_key
+            if self._superseding.get(key) is request_data:
+                del self._superseding[key]
+        return request_data
+
+    def acknowledge(self, request_data):
+        """Mark given request (removed with :py:meth:`popleft`) as processed
+
+        Does nothing; persistent queues remove the request from the storage.
+
+        :param app.sender.RequestData request_data: processed request
+        """
+        pass
+
+    def flush(self):
+        """Save the pending changes; does nothing for in-memory queue"""
+        pass
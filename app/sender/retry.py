@@ -0,0 +1,216 @@
+"""
+Retrying the requests that failed due to transient errors.
+
+:py:class:`RetryPolicy` decides which errors are worth retrying and how long
+to wait before the next attempt; :py:class:`CircuitBreaker` stops sending
+anything after a series of failures, so that the backlog is not thrown at
+a server that is down, and lets a single request through from time to time to
+check whether it is back.
+"""
+import logging
+import random
+import time
+
+import requests
+
+from app.api import APIError
+
+
+class RetryPolicy:
+    """
+    Classification of the errors and exponential backoff with jitter
+
+    The delay before the ``n``-th retry is drawn uniformly from ``[0,
+    min(max_delay, base_delay * multiplier ** n)]`` ("full jitter"), so that
+    the clients don't retry in lockstep. If the server sent ``Retry-After``
+    header (in seconds), the delay is not shorter than that.
+    """
+
+    transient_status_codes = frozenset([408, 425, 429, 500, 502, 503, 504])
+    """HTTP status codes meaning that the request may succeed later"""
+
+    transient_exceptions = (requests.exceptions.ConnectionError,
+                            requests.exceptions.Timeout,
+                            requests.exceptions.ChunkedEncodingError)
+    """Exceptions meaning that the request may succeed later"""
+
+    def __init__(self, base_delay=0.5, max_delay=30, multiplier=2,
+                 max_attempts=None):
+        """Constructor
+
+        :param float base_delay: maximum delay in seconds before the first
+            retry
+        :param float max_delay: maximum delay in seconds before any retry
+        :param float multiplier: factor the maximum delay grows by with every
+            retry
+        :param int|None max_attempts: maximum number of attempts to send
+            a request (after that the error is treated as a permanent one);
+            ``None`` for no limit
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.max_attempts = max_attempts
+
+    def is_transient(self, exception):
+        """Check if the request may succeed if it is sent again
+
+        :param BaseException exception: exception raised when sending the
+            request
+        :rtype: bool
+        """
+        if isinstance(exception, APIError):
+            return (exception.response is not None and
+                    exception.response.status_code in
+                    self.transient_status_codes)
+        return isinstance(exception, self.transient_exceptions)
+
+    def should_retry(self, exception, attempt):
+        """Check if the request should be retried automatically
+
+        :param BaseException exception: exception raised when sending the
+            request
+        :param int attempt: number of the failed attempt (starting from 1)
+        :rtype: bool
+        """
+        return (self.is_transient(exception) and
+                (self.max_attempts is None or attempt < self.max_attempts))
+
+    def get_delay(self, attempt, exception=None):
+        """Return the time to wait before the next attempt
+
+        :param int attempt: number of the failed attempt (starting from 1)
+        :param BaseException|None exception: exception raised when sending the
+            request
+        :return: delay in seconds
+        :rtype: float
+        """
+        delay = random.uniform(0, min(
+            self.max_delay,
+            self.base_delay * self.multiplier ** (attempt - 1)))
+        retry_after = self._get_retry_after(exception)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    @staticmethod
+    def _get_retry_after(exception):
+        response = getattr(exception, 'response', None)
+        if response is None:
+            return None
+        try:
+            return float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the requests sent to the server
+
+    The breaker is *closed* (the requests are sent normally) until
+    ``failure_threshold`` requests in a row fail. It is then *open* (no
+    requests are sent) for ``reset_timeout`` seconds, after which it is
+    *half-open*: a single request is sent as a probe. If it succeeds, the
+    breaker is closed again; otherwise, it is opened for twice as long as
+    before (up to ``max_reset_timeout``).
+
+    The class is not thread-safe; :py:class:`app.sender.Sender` protects it
+    with its own lock.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    logger = logging.getLogger('Sender')
+
+    def __init__(self, failure_threshold=3, reset_timeout=2,
+                 max_reset_timeout=60, clock=time.monotonic):
+        """Constructor
+
+        :param int failure_threshold: number of consecutive failures opening
+            the breaker
+        :param float reset_timeout: time in seconds after which the first
+            probe is sent
+        :param float max_reset_timeout: maximum time in seconds between the
+            probes
+        :param function clock: function returning the current time in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+
+        self.state = self.CLOSED
+        # Number of consecutive failures
+        self.failures = 0
+        # Time when the breaker was opened and for how long it stays open
+        self._opened_at = None
+        self._timeout = reset_timeout
+        # Whether or not the probe is being sent in the half-open state
+        self._probing = False
+
+    def allow_request(self):
+        """Check if a request can be sent now
+
+        If ``True`` is returned in the half-open state, the caller is
+        expected to send the probe and report its result.
+
+        :return: whether or not the request can be sent and the time in
+            seconds after which to ask again (``None`` if the time is not
+            known, i.e. when waiting for the result of the probe)
+        :rtype: tuple[bool, float|None]
+        """
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self._timeout - self.clock()
+            if remaining > 0:
+                return False, remaining
+            self._set_state(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                return False, None
+            self._probing = True
+        return True, None
+
+    def record_success(self):
+        """Report that the server responded"""
+        self.failures = 0
+        self._probing = False
+        self._timeout = self.reset_timeout
+        if self.state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self):
+        """Report that the server could not be reached or was unavailable"""
+        self.failures += 1
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+            self._timeout = min(self._timeout * 2, self.max_reset_timeout)
+            self._open()
+        elif (self.state == self.CLOSED and
+              self.failures >= self.failure_threshold):
+            self._open()
+
+    def _open(self):
+        self._opened_at = self.clock()
+        self._set_state(self.OPEN)
+
+    def _set_state(self, state):
+        self.state = state
+        if state == self.OPEN:
+            self.logger.warning(
+                'Server unavailable (%d failures); next attempt in %.1f s',
+                self.failures, self._timeout)
+        elif state == self.CLOSED:
+            self.logger.info('Server available again')
+        self.on_state_changed(state)
+
+    def on_state_changed(self, state):
+        """Called when the state of the breaker changes.
+
+        The method is supposed to be overridden by subclasses.
+
+        :param str state: new state
+        """
+        pass
@@ -0,0 +1,327 @@
+"""
+Store-and-forward spool of the requests added during long outages.
+
+When the server can't be reached for longer than ``spool_after`` seconds,
+:py:class:`app.sender.Sender` stops queueing the new requests and writes
+them to the spool instead (except the ones that can't be stored or have to be
+sent as soon as possible, see :py:meth:`Spool.accepts`). Once the server is
+back, the spooled requests are sent in the background with bulk requests
+where possible, while the live requests are sent as usual.
+
+The requests are stored in gzip-compressed segments of JSON lines, one
+directory per URL (so that the segments can be sent with bulk requests in the
+original order)::
+
+    spool/%2Ftelemetry%2F/00000001.jsonl.gz
+    spool/%2Ftelemetry%2F/00000001.done      <- number of records sent
+    spool/%2Ftelemetry%2F/00000002.jsonl.gz.part  <- segment being written
+
+Only the segment being written and the one being sent are open; a crash can
+lose the part of the segment being written that was not flushed yet (the
+spool is flushed whenever the sender runs out of requests to send).
+"""
+import gzip
+import json
+import logging
+import os
+import urllib.parse
+import zlib
+from collections import OrderedDict, deque
+from threading import Lock
+
+from app.api import encode_json
+from app.sender import PRIORITY_NORMAL
+
+SEGMENT_SUFFIX = '.jsonl.gz'
+PART_SUFFIX = '.part'
+DONE_SUFFIX = '.done'
+
+
+def read_segment(path):
+    """Return the records stored in given segment
+
+    A segment that was not closed properly (e.g. due to a crash) is read up to
+    the last complete record.
+
+    :param str path: path to the segment
+    :rtype: list[dict]
+    """
+    records = []
+    try:
+        with gzip.open(path, 'rb') as f:
+            for line in f:
+                records.append(json.loads(line.decode()))
+    except (EOFError, OSError, zlib.error, ValueError):
+        pass
+    return records
+
+
+class _Lane:
+    __slots__ = ('url', 'directory', 'segments', 'next_number', 'writer',
+                 'writer_number', 'writer_count', 'unflushed', 'reading',
+                 'records', 'position', 'count')
+
+    def __init__(self, url, directory):
+        self.url = url
+        self.directory = directory
+        # Numbers of the complete segments, oldest first
+        self.segments = deque()
+        self.next_number = 1
+        # Segment being written
+        self.writer = None
+        self.writer_number = None
+        self.writer_count = 0
+        self.unflushed = False
+        # Segment being sent, its records and the number of records sent
+        self.reading = None
+        self.records = []
+        self.position = 0
+        # Number of records not sent yet
+        self.count = 0
+
+
+class Spool:
+    """
+    Requests stored on disk to be sent when the server is available again
+
+    Besides the storage, the object holds the parameters of spooling used by
+    :py:class:`app.sender.Sender`. The class is thread-safe.
+    """
+
+    logger = logging.getLogger('Sender')
+
+    def __init__(self, directory, spool_after=60, backlog_share=0.5,
+                 batch_size=100, segment_size=1000, compresslevel=6):
+        """Constructor
+
+        Creates the directory if necessary and restores the requests stored
+        in it.
+
+        :param str directory: directory to store the segments in
+        :param float spool_after: time in seconds since the first failure
+            after which the new requests are spooled (if nothing was sent in
+            the meantime)
+        :param float backlog_share: share of the time spent on sending the
+            spooled requests while there are live requests to send (0-1)
+        :param int batch_size: maximum number of spooled requests to the URLs
+            accepting bulk requests sent at once
+        :param int segment_size: maximum number of requests in a segment
+        :param int compresslevel: gzip compression level (1-9)
+        :raise ValueError: if ``backlog_share`` is not in the (0, 1] range
+        """
+        if not 0 < backlog_share <= 1:
+            raise ValueError('Backlog share must be in the (0, 1] range')
+        self.directory = directory
+        self.spool_after = spool_after
+        self.backlog_share = backlog_share
+        self.batch_size = batch_size
+        self.segment_size = segment_size
+        self.compresslevel = compresslevel
+
+        self.lock = Lock()
+        # Number of the spooled requests sent and dropped (rejected by the
+        # server)
+        self.sent = 0
+        self.dropped = 0
+        # URL -> _Lane
+        self._lanes = OrderedDict()
+        self._count = 0
+
+        os.makedirs(directory, exist_ok=True)
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if os.path.isdir(path):
+                self._restore_lane(urllib.parse.unquote(name), path)
+        if self._count:
+            self.logger.info('Restored %d spooled requests from %s',
+                             self._count, directory)
+
+    def __len__(self):
+        """Return the number of requests waiting to be sent"""
+        return self._count
+
+    @staticmethod
+    def accepts(request_data):
+        """Check if given request may be spooled
+
+        Requests with files or callbacks can't be stored, the ones with
+        supersede keys have to stay in the queue to be superseded and the
+        ones with high priority are not delayed.
+
+        :param app.sender.RequestData request_data: request to check
+        :rtype: bool
+        """
+        return (not request_data.files and request_data.callback is None and
+                request_data.supersede_key is None and
+                request_data.priority >= PRIORITY_NORMAL)
+
+    def append(self, request_data):
+        """Store given request
+
+        :param app.sender.RequestData request_data: request to store
+        """
+        line = encode_json({'module': request_data.module,
+                            'data': request_data.data}) + b'\n'
+        with self.lock:
+            lane = self._get_lane(request_data.url)
+            if lane.writer is None:
+                lane.writer_number = lane.next_number
+                lane.next_number += 1
+                lane.writer = gzip.open(
+                    self._get_path(lane, lane.writer_number) + PART_SUFFIX,
+                    'wb', self.compresslevel)
+                lane.writer_count = 0
+            lane.writer.write(line)
+            lane.writer_count += 1
+            lane.unflushed = True
+            lane.count += 1
+            self._count += 1
+            if lane.writer_count >= self.segment_size:
+                self._seal(lane)
+
+    def peek(self, limit):
+        """Return the next spooled requests to send
+
+        The URLs are taken in turns; the requests are not removed until
+        :py:meth:`advance` is called.
+
+        :param int limit: maximum number of requests to return
+        :return: URL and the data of the requests (dictionaries with
+            ``module`` and ``data`` keys) or ``None`` if the spool is empty
+        :rtype: tuple[str, list[dict]]|None
+        """
+        with self.lock:
+            for _ in range(len(self._lanes)):
+                url, lane = next(iter(self._lanes.items()))
+                self._lanes.move_to_end(url)
+                if not lane.count:
+                    continue
+                records = self._load(lane)
+                if records:
+                    return url, records[lane.position:lane.position + limit]
+        return None
+
+    def advance(self, url, count, sent=True):
+        """Remove the first requests returned by :py:meth:`peek`
+
+        :param str url: URL of the requests
+        :param int count: number of requests to remove
+        :param bool sent: whether the requests were sent or dropped
+        """
+        with self.lock:
+            lane = self._lanes[url]
+            lane.position += count
+            lane.count -= count
+            self._count -= count
+            if sent:
+                self.sent += count
+            else:
+                self.dropped += count
+            path = self._get_path(lane, lane.reading)
+            if lane.position >= len(lane.records):
+                self._remove(path)
+                lane.reading = None
+                lane.records = []
+                lane.position = 0
+            else:
+                with open(path + DONE_SUFFIX + '.tmp', 'w') as f:
+                    f.write(str(lane.position))
+                os.replace(path + DONE_SUFFIX + '.tmp', path + DONE_SUFFIX)
+
+    def flush(self):
+        """Write the buffered requests to the disk"""
+        with self.lock:
+            for lane in self._lanes.values():
+                if lane.unflushed:
+                    lane.writer.flush()
+                    lane.unflushed = False
+
+    def close(self):
+        """Close the segments being written"""
+        with self.lock:
+            for lane in self._lanes.values():
+                if lane.writer is not None:
+                    self._seal(lane)
+
+    def _get_lane(self, url):
+        lane = self._lanes.get(url)
+        if lane is None:
+            directory = os.path.join(self.directory,
+                                     urllib.parse.quote(url, safe=''))
+            os.makedirs(directory, exist_ok=True)
+            lane = self._lanes[url] = _Lane(url, directory)
+        return lane
+
+    @staticmethod
+    def _get_path(lane, number):
+        return os.path.join(lane.directory,
+                            '{:08d}{}'.format(number, SEGMENT_SUFFIX))
+
+    def _restore_lane(self, url, directory):
+        lane = None
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(SEGMENT_SUFFIX + PART_SUFFIX):
+                # Not closed properly; read what was written
+                path = os.path.join(directory, name)
+                os.replace(path, path[:-len(PART_SUFFIX)])
+                name = name[:-len(PART_SUFFIX)]
+            elif not name.endswith(SEGMENT_SUFFIX):
+                continue
+            number = int(name[:-len(SEGMENT_SUFFIX)])
+            path = os.path.join(directory, name)
+            count = len(read_segment(path)) - self._read_done(path)
+            if count <= 0:
+                self._remove(path)
+                continue
+            if lane is None:
+                lane = self._get_lane(url)
+            lane.segments.append(number)
+            lane.next_number = number + 1
+            lane.count += count
+            self._count += count
+
+    def _load(self, lane):
+        """Return the records of the segment being sent, opening the next
+        segment if necessary"""
+        while lane.reading is None:
+            if not lane.segments:
+                if not lane.writer_count:
+                    self._count -= lane.count
+                    lane.count = 0
+                    return []
+                # Send the segment being written as well
+                self._seal(lane)
+            lane.reading = lane.segments.popleft()
+            path = self._get_path(lane, lane.reading)
+            lane.records = read_segment(path)
+            lane.position = self._read_done(path)
+            if lane.position >= len(lane.records):
+                self._remove(path)
+                lane.reading = None
+        return lane.records
+
+    def _seal(self, lane):
+        """Close the segment being written"""
+        lane.writer.close()
+        path = self._get_path(lane, lane.writer_number)
+        os.replace(path + PART_SUFFIX, path)
+        lane.segments.append(lane.writer_number)
+        lane.writer = None
+        lane.writer_count = 0
+        lane.unflushed = False
+
+    @staticmethod
+    def _read_done(path):
+        try:
+            with open(path + DONE_SUFFIX) as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return 0
+
+    @staticmethod
+    def _remove(path):
+        for name in (path, path + DONE_SUFFIX):
+            try:
+                os.remove(name)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,62 @@
+from PyQt5.QtWidgets import QDialog, QMessageBox
+from serial.tools import list_ports
+
+from app.settings import Settings
+from app.ui.ui_serialport import Ui_SerialPortDialog
+
+BAUDRATES = [9600, 19200, 38400, 57600, 115200, 230400]
+
+
+class SerialPortDialog(QDialog, Ui_SerialPortDialog):
+    """Read Serial Port dialog
+
+    Starts the parser reading the data directly from the port chosen (see
+    :py:meth:`app.parser.outputparser.ParserManager.parse_serial`). The
+    settings are remembered for the next time.
+    """
+
+    CONFIG_PORT_KEY = 'serialPort/port'
+    CONFIG_BAUDRATE_KEY = 'serialPort/baudrate'
+    CONFIG_ARCHIVE_FILE_KEY = 'serialPort/archiveFile'
+
+    def __init__(self, parser_manager, parent=None):
+        """Constructor
+
+        :param parser_manager: ParserManager instance to start the parser
+            with
+        :type parser_manager: app.parser.outputparser.ParserManager
+        :param QWidget parent: dialog parent
+        """
+        super().__init__(parent)
+        self.setupUi(self)
+        self._parser_manager = parser_manager
+
+        settings = Settings()
+        self.portComboBox.addItems(
+            sorted(port.device for port in list_ports.comports()))
+        if self.CONFIG_PORT_KEY in settings:
+            self.portComboBox.setEditText(settings[self.CONFIG_PORT_KEY])
+        self.baudrateComboBox.addItems([str(x) for x in BAUDRATES])
+        self.baudrateComboBox.setEditText(
+            str(settings.value(self.CONFIG_BAUDRATE_KEY, 57600, type=int)))
+        self.archiveLineEdit.setText(
+            settings.value(self.CONFIG_ARCHIVE_FILE_KEY, ''))
+
+    def accept(self):
+        port = self.portComboBox.currentText().strip()
+        try:
+            baudrate = int(self.baudrateComboBox.currentText())
+        except ValueError:
+            baudrate = 0
+        if not port or baudrate <= 0:
+            QMessageBox.warning(self, 'Invalid settings',
+                                'Please enter the port and the baud rate.')
+            return
+        archive_path = self.archiveLineEdit.text().strip()
+
+        settings = Settings()
+        settings[self.CONFIG_PORT_KEY] = port
+        settings[self.CONFIG_BAUDRATE_KEY] = baudrate
+        settings[self.CONFIG_ARCHIVE_FILE_KEY] = archive_path
+        self._parser_manager.parse_serial(port, baudrate, archive_path or None)
+        self.done(QDialog.Accepted)
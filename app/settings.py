@@ -1,4 +1,6 @@
-from PyQt5.QtCore import QSettings
+import os
+
+from PyQt5.QtCore import QSettings, QStandardPaths
 
 
 class Settings(QSettings):
@@ -34,3 +36,26 @@ class Settings(QSettings):
         :rtype: list[bool]
         """
         return [x == 'true' for x in self.value(key, default)]
+
+    def get_data_path(self, key, default_name):
+        """Get path of a data file or directory from settings
+
+        If the path is not set, ``default_name`` in the data directory of the
+        application (e.g. ``~/.local/share/kraksat/receiver``) is returned,
+        so that the data does not depend on the working directory. The data
+        directory is created if necessary.
+
+        :param str key: key to get the path from
+        :param str default_name: name of the file or directory in the data
+            directory
+        :rtype: str
+        """
+        path = self.value(key)
+        if path:
+            return path
+        directory = os.path.join(
+            QStandardPaths.writableLocation(
+                QStandardPaths.GenericDataLocation),
+            self.organizationName(), self.applicationName())
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, default_name)
@@ -7,13 +7,27 @@ from PyQt5.QtCore import QTimer
 class Statistics:
     """
     Class that manages statistics data (such as time since start, total number
-    of requests sent) and notifies about changes in that data.
+    of requests sent) and notifies about changes in that data. If a sender is
+    given, its metrics (see :py:meth:`app.sender.Sender.get_metrics`) are
+    retrieved every second as well, and so is the state of the backpressure
+    policy of the parser (see
+    :py:meth:`app.parser.backpressure.BackpressurePolicy.snapshot`).
 
     Note that this is abstract class; :py:method:`create_timer` and
     ``update_*`` methods should be implemented by subclasses.
     """
 
-    def __init__(self):
+    def __init__(self, sender=None, backpressure=None):
+        """Constructor
+
+        :param app.sender.Sender|None sender: sender to retrieve the metrics
+            of
+        :param backpressure: backpressure policy to retrieve the state of
+        :type backpressure: app.parser.backpressure.BackpressurePolicy|None
+        """
+        self.sender = sender
+        self.backpressure = backpressure
+        self.sender_metrics = None
         self.start_time = datetime.now()
         self.last_receive_time = None
         self.requests_sent = 0
@@ -31,11 +45,27 @@ class Statistics:
         raise NotImplementedError
 
     def on_clock_tick(self):
-        """Called every clock tick. Updates time since start and receive."""
+        """Called every clock tick. Updates time since start and receive and
+        the metrics of the sender."""
         now = datetime.now()
         self.update_time_since_start(now - self.start_time)
         if self.last_receive_time is not None:
             self.update_time_since_last_receive(now - self.last_receive_time)
+        if self.sender is not None:
+            previous = self.sender_metrics
+            self.sender_metrics = self.sender.get_metrics()
+            self.update_sender_metrics(self.sender_metrics, previous)
+        if self.backpressure is not None:
+            self.update_backpressure(self.backpressure.snapshot())
+
+    def on_backpressure_mode_changed(self, mode, depth, growth_rate):
+        """Should be called when the mode of the backpressure policy changes
+
+        The function calls :py:method:`update_backpressure`, so that the new
+        mode is shown without waiting for the clock tick.
+        """
+        if self.backpressure is not None:
+            self.update_backpressure(self.backpressure.snapshot())
 
     def update_time_since_start(self, timedelta):
         """Called when time since start is updated (so basically every second)
@@ -88,6 +118,24 @@ class Statistics:
         """
         raise NotImplementedError
 
+    def update_sender_metrics(self, snapshot, previous):
+        """Called every clock tick with the metrics of the sender
+
+        :param app.sender.metrics.MetricsSnapshot snapshot: current metrics
+        :param app.sender.metrics.MetricsSnapshot|None previous: metrics
+            retrieved on the previous tick (to calculate the rates)
+        """
+        raise NotImplementedError
+
+    def update_backpressure(self, snapshot):
+        """Called every clock tick and on every mode change with the state of
+        the backpressure policy
+
+        :param dict snapshot: see
+            :py:meth:`app.parser.backpressure.BackpressurePolicy.snapshot`
+        """
+        raise NotImplementedError
+
     def on_line_parsed(self, output_line):
         """Should be called whenever a line of data is parsed properly
 
@@ -141,6 +189,8 @@ class QtStatistics(QObject, Statistics):
     parse_failures_changed = pyqtSignal(int)
     requests_sent_changed = pyqtSignal(int)
     total_data_received_changed = pyqtSignal(int)
+    sender_metrics_changed = pyqtSignal(object, object)
+    backpressure_changed = pyqtSignal(dict)
 
     def __init__(self, sender, parser_manager, parent=None):
         """Constructor
@@ -150,7 +200,8 @@ class QtStatistics(QObject, Statistics):
         :type parser_manager: app.parser.outputparser.ParserManager
         :param QObject parent: QObject parent
         """
-        super().__init__(parent)
+        super().__init__(parent, sender=sender,
+                         backpressure=parser_manager.backpressure)
 
         # Connect sender signals
         sender.request_processed.connect(self.on_request_processed)
@@ -158,6 +209,8 @@ class QtStatistics(QObject, Statistics):
         # Connect ParserManager signals
         parser_manager.line_parsed.connect(self.on_line_parsed)
         parser_manager.line_parse_failed.connect(self.on_line_parse_failed)
+        parser_manager.backpressure.mode_changed.connect(
+            self.on_backpressure_mode_changed)
 
     def on_request_processed(self, request_data, skipped):
         if not skipped:
@@ -185,3 +238,9 @@ class QtStatistics(QObject, Statistics):
 
     def update_total_data_received(self, total_data_received):
         self.total_data_received_changed.emit(total_data_received)
+
+    def update_sender_metrics(self, snapshot, previous):
+        self.sender_metrics_changed.emit(snapshot, previous)
+
+    def update_backpressure(self, snapshot):
+        self.backpressure_changed.emit(snapshot)
@@ -0,0 +1,135 @@
+from unittest import TestCase
+
+from PyQt5.QtCore import QCoreApplication, QObject, Qt, pyqtSignal
+
+from app.mainwindow.queuetablemodel import QueueTableModel
+from app.sender import RequestData
+from app.tests.sender.test_persistentqueue import request
+
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+class StandInSender(QObject):
+    request_added = pyqtSignal(RequestData)
+    request_processing = pyqtSignal(RequestData)
+    request_processed = pyqtSignal(RequestData, bool)
+    request_retrying = pyqtSignal(RequestData, BaseException, int, float)
+    error_occurred = pyqtSignal(RequestData, BaseException, object)
+    requests_not_announced = pyqtSignal(int, int, int)
+
+
+class QueueTableModelTests(TestCase):
+    def setUp(self):
+        self.sender = StandInSender()
+        self.model = QueueTableModel(self.sender)
+        self.inserted = []
+        self.removed = []
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: self.inserted.append((first, last)))
+        self.model.rowsRemoved.connect(
+            lambda parent, first, last: self.removed.append((first, last)))
+
+    def add(self, *ids):
+        for request_id in ids:
+            self.sender.request_added.emit(request(request_id))
+
+    def process(self, *ids):
+        for request_id in ids:
+            self.sender.request_processing.emit(request(request_id))
+            self.sender.request_processed.emit(request(request_id), False)
+
+    def rows(self):
+        return [(self.model.data(self.model.index(row, 0), Qt.DisplayRole),
+                 self.model.data(self.model.index(row, 2), Qt.DisplayRole))
+                for row in range(self.model.rowCount())]
+
+    def test_batched_updates(self):
+        """Test that the changes are applied at once"""
+        self.add(1, 2, 3, 4)
+        self.process(4)
+        self.assertEqual(self.model.rowCount(), 0)
+        self.model.apply_pending()
+        self.assertEqual(self.inserted, [(0, 2)])
+        self.sender.request_processing.emit(request(2))
+        self.model.apply_pending()
+        self.assertEqual(self.rows(), [(1, 'Waiting'), (2, 'Processing'),
+                                       (3, 'Waiting')])
+
+    def test_remove_in_order(self):
+        self.add(1, 2, 3, 4)
+        self.model.apply_pending()
+        self.process(1, 2)
+        self.model.apply_pending()
+        self.assertEqual(self.removed, [(0, 1)])
+        self.add(5)
+        self.sender.request_processing.emit(request(4))
+        self.model.apply_pending()
+        self.assertEqual(self.rows(), [(3, 'Waiting'), (4, 'Processing'),
+                                       (5, 'Waiting')])
+
+    def test_remove_out_of_order(self):
+        """Test that the rows are still found after removing the requests
+        processed out of order"""
+        self.add(*range(1, 9))
+        self.model.apply_pending()
+        self.process(1, 3, 4, 7)
+        self.model.apply_pending()
+        self.assertEqual(self.removed, [(6, 6), (2, 3), (0, 0)])
+        for request_id in (2, 5, 6, 8):
+            self.sender.request_processing.emit(request(request_id))
+            self.model.apply_pending()
+        self.assertEqual(self.rows(), [(request_id, 'Processing')
+                                       for request_id in (2, 5, 6, 8)])
+        self.process(5, 2)
+        self.model.apply_pending()
+        self.assertEqual([row[0] for row in self.rows()], [6, 8])
+
+        with self.assertLogs('MainWindow', 'WARNING'):
+            self.process(2)
+        self.model.apply_pending()
+        self.assertEqual(self.model.rowCount(), 2)
+
+    def test_reset(self):
+        """Test removing too many ranges of rows at once"""
+        self.model.max_removed_ranges = 1
+        self.add(*range(1, 7))
+        self.model.apply_pending()
+        self.process(2, 4)
+        self.model.apply_pending()
+        self.assertEqual(self.removed, [])
+        self.assertEqual([row[0] for row in self.rows()], [1, 3, 5, 6])
+        self.process(5)
+        self.model.apply_pending()
+        self.assertEqual([row[0] for row in self.rows()], [1, 3, 6])
+
+    def test_reset_row_count(self):
+        """Test that the row count is up to date when the model is reset
+        after removing more than ``max_removed_ranges`` ranges"""
+        counts = []
+        self.model.modelReset.connect(
+            lambda: counts.append(self.model.rowCount()))
+        self.add(*range(1, 41))
+        self.model.apply_pending()
+        self.process(*range(1, 41, 2))
+        self.model.apply_pending()
+        self.assertEqual(self.removed, [])
+        self.assertEqual(counts, [20])
+        self.assertEqual([row[0] for row in self.rows()],
+                         list(range(2, 41, 2)))
+
+    def test_not_announced(self):
+        """Test that the requests not announced are only counted"""
+        counts = []
+        self.model.unlisted_count_changed.connect(counts.append)
+        self.add(1, 2)
+        self.sender.requests_not_announced.emit(3, 3, 6)
+        self.add(7)
+        self.model.apply_pending()
+        with self.assertLogs('MainWindow', 'WARNING') as logs:
+            self.process(1, 3, 5)
+            self.process(8)
+            self.model.apply_pending()
+        self.assertEqual(len(logs.output), 2)
+        self.assertEqual(self.rows(), [(2, 'Waiting'), (7, 'Waiting')])
+        self.assertEqual(self.model.unlisted_count, 1)
+        self.assertEqual(counts, [3, 1])
@@ -0,0 +1,71 @@
+import random
+from unittest import TestCase
+
+from app.parser.gps import GPGGASerializer
+from app.parser.kundt import KundtSerializer
+from app.parser.telemetry import TelemetrySerializer
+from app.tests.parser import ParserTestCase
+from app.tests.parser.test_telemetry import TELEMETRY_LINE
+
+INVALID_VALUES = ['', 'zz', '10000', '1ffff', '0x10', ' 1f', 'ź', 'f' * 20]
+
+
+class BatchTests(TestCase):
+    def setUp(self):
+        self.serializer = TelemetrySerializer()
+
+    def parse_one(self, line):
+        return self.serializer.parse_fields(self.serializer.get_data(line),
+                                            ParserTestCase.TIMESTAMP)
+
+    def assertSameAsScalar(self, lines):
+        """Assert that parse_batch gives the same results as parse_fields"""
+        result = self.serializer.parse_batch(lines, ParserTestCase.TIMESTAMP)
+        errors = dict(result.errors)
+        self.assertEqual(len(result.indices) + len(errors), len(lines))
+
+        for i, index in enumerate(result.indices):
+            values = [result.columns[name][i] for name in
+                      self.serializer.fields]
+            values = [v.tolist() if hasattr(v, 'tolist') else v
+                      for v in values]
+            self.assertEqual(values, self.parse_one(lines[index]))
+        for index, error in errors.items():
+            with self.assertRaises(Exception) as cm:
+                self.parse_one(lines[index])
+            self.assertEqual(str(error), str(cm.exception))
+
+    def test_valid(self):
+        """Test parsing random valid lines"""
+        rnd = random.Random(0)
+        lines = [','.join(['S'] + ['{:x}'.format(rnd.randrange(1 << 16))
+                                   for _ in range(19)])
+                 for _ in range(200)]
+        result = self.serializer.parse_batch(lines, ParserTestCase.TIMESTAMP)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.indices.tolist(), list(range(200)))
+        self.assertSameAsScalar(lines + [TELEMETRY_LINE])
+
+    def test_invalid(self):
+        """Test that invalid lines are reported and do not affect others"""
+        values = TELEMETRY_LINE.split(',')
+        lines = ['', 'S', 'S,1,2', TELEMETRY_LINE + ',1', TELEMETRY_LINE]
+        for i in range(1, len(values)):
+            for invalid_value in INVALID_VALUES:
+                lines.append(','.join(
+                    values[:i] + [invalid_value] + values[i + 1:]))
+        lines.append(TELEMETRY_LINE.upper())
+        self.assertSameAsScalar(lines)
+
+    def test_empty(self):
+        """Test parsing no lines at all"""
+        result = self.serializer.parse_batch([], ParserTestCase.TIMESTAMP)
+        self.assertEqual(len(result.indices), 0)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(list(result.columns), list(self.serializer.fields))
+
+    def test_unsupported(self):
+        """Test that serializers that can't be vectorized are rejected"""
+        for serializer in (GPGGASerializer(), KundtSerializer()):
+            self.assertRaises(TypeError, serializer.parse_batch, [],
+                              ParserTestCase.TIMESTAMP)
@@ -0,0 +1,192 @@
+from unittest import TestCase
+
+from app.parser.gps import (
+    GPGGASerializer, GPGSASerializer, GPGSVSerializer, GPRMCSerializer
+)
+from app.parser.kundt import KundtSerializer
+from app.parser.serializer import (
+    BaseSerializer, Serializer, SerializerData, fields
+)
+from app.parser.serializer import compiler
+from app.parser.serializer.compiler import (
+    compile_parse_fields, get_lookup_table, is_compilable
+)
+from app.parser.serializer.fields import ValidationError
+from app.parser.telemetry import TelemetrySerializer
+from app.tests.parser import ParserTestCase
+from app.tests.parser.test_gps import (
+    GPGGA_LINE, GPGGA_NO_FIX_LINE, GPGSA_LINE, GPGSA_NO_FIX_LINE, GPGSV_LINE,
+    GPRMC_LINE, GPRMC_NO_FIX_LINE
+)
+from app.tests.parser.test_telemetry import TELEMETRY_LINE
+
+INVALID_VALUES = ['', 'zz', '10000', '-1', '3', 'X', 'N', '1.5', '123.45']
+
+
+class DoubledHexField(fields.HexIntegerField):
+    def to_python(self, data):
+        return super().to_python(data) * 2
+
+
+class CustomSerializer(Serializer):
+    value = DoubledHexField()
+    optional_value = fields.IntegerField(optional=True)
+
+
+class DoubledGyroField(fields.GyroField):
+    def to_python(self, data):
+        return super().to_python(data) * 2
+
+
+class CompilerTests(TestCase):
+    def assertSameResult(self, serializer, data):
+        """Assert that compiled and generic parse_fields give the same result
+        """
+        try:
+            expected = BaseSerializer.parse_fields(
+                serializer, data, ParserTestCase.TIMESTAMP)
+        except Exception as e:
+            with self.assertRaises(type(e)) as cm:
+                serializer.parse_fields(data, ParserTestCase.TIMESTAMP)
+            self.assertEqual(str(cm.exception), str(e))
+            if isinstance(e, ValidationError):
+                self.assertEqual(cm.exception.field, e.field)
+                self.assertEqual(cm.exception.field_id, e.field_id)
+        else:
+            self.assertEqual(
+                serializer.parse_fields(data, ParserTestCase.TIMESTAMP),
+                expected, data)
+
+    def assertCompiledCorrectly(self, serializer_cls, lines):
+        serializer = serializer_cls()
+        for line in lines:
+            data = serializer.get_data(line.partition('*')[0])
+            self.assertSameResult(serializer, data)
+            # Number of fields
+            self.assertSameResult(serializer, data[:-1])
+            self.assertSameResult(serializer, data + ['0'])
+            # Invalid values
+            for i in range(len(data)):
+                for value in INVALID_VALUES:
+                    self.assertSameResult(
+                        serializer, data[:i] + [value] + data[i + 1:])
+
+    def test_telemetry(self):
+        """Test compiled TelemetrySerializer"""
+        self.assertCompiledCorrectly(TelemetrySerializer, [TELEMETRY_LINE])
+
+    def test_gps(self):
+        """Test compiled GPS serializers"""
+        self.assertCompiledCorrectly(GPGGASerializer,
+                                     [GPGGA_LINE, GPGGA_NO_FIX_LINE])
+        self.assertCompiledCorrectly(GPGSASerializer,
+                                     [GPGSA_LINE, GPGSA_NO_FIX_LINE])
+        self.assertCompiledCorrectly(GPGSVSerializer, [GPGSV_LINE])
+        self.assertCompiledCorrectly(GPRMCSerializer,
+                                     [GPRMC_LINE, GPRMC_NO_FIX_LINE])
+
+    def test_kundt(self):
+        """Test compiled KundtSerializer"""
+        self.assertCompiledCorrectly(KundtSerializer, ['7530,400'])
+
+    def test_not_compilable(self):
+        """Test that overridden to_python is respected"""
+        self.assertFalse(is_compilable(DoubledHexField()))
+        self.assertTrue(is_compilable(fields.HexIntegerField()))
+        for field in (fields.VoltageField(), fields.CurrentField(),
+                      fields.OxygenField(), fields.RadiationField()):
+            self.assertTrue(is_compilable(field))
+        self.assertCompiledCorrectly(CustomSerializer, ['X,10,5', 'X,10'])
+        self.assertEqual(CustomSerializer().parse_fields(['10'], None), [32])
+
+
+class LookupTableTests(TestCase):
+    FIELDS = [fields.TemperatureField(), fields.HumidityField(),
+              fields.GyroField(), fields.AccelerationField(),
+              fields.MagneticField()]
+
+    def test_table(self):
+        """Test that the tables contain exactly the to_python results"""
+        for field in self.FIELDS:
+            table = get_lookup_table(field)
+            self.assertEqual(len(table), 1 << 16)
+            self.assertEqual(table, [field.to_python('{:x}'.format(v))
+                                     for v in range(1 << 16)])
+            # Shared by the instances
+            self.assertIs(get_lookup_table(type(field)()), table)
+
+    def test_not_used(self):
+        """Test that the tables are only used when to_numpy is up to date"""
+        self.assertIsNone(get_lookup_table(fields.PressureField()))
+        self.assertIsNone(get_lookup_table(DoubledGyroField()))
+        TelemetrySerializer.parse_fields(
+            TelemetrySerializer().get_data(TELEMETRY_LINE),
+            ParserTestCase.TIMESTAMP)
+        self.assertIn('table_', TelemetrySerializer.parse_fields.source)
+
+    def test_built_on_first_call(self):
+        """Test that the tables are not built when the class is created"""
+        class LazyTemperatureField(fields.TemperatureField):
+            pass
+
+        class LazySerializer(Serializer):
+            temperature = LazyTemperatureField()
+
+        self.assertNotIn(LazyTemperatureField, compiler._lookup_tables)
+        self.assertNotIn('table_', LazySerializer.parse_fields.source)
+        self.assertEqual(LazySerializer.parse_fields(['1a2b'], None),
+                         [LazyTemperatureField().to_python('1a2b')])
+        self.assertIn(LazyTemperatureField, compiler._lookup_tables)
+        self.assertIn('table_', LazySerializer.parse_fields.source)
+        self.assertEqual(LazySerializer.parse_fields(['1a2b'], None),
+                         [LazyTemperatureField().to_python('1a2b')])
+
+    def test_disabled(self):
+        """Test compiling the serializer without the lookup tables"""
+        parse_fields = compile_parse_fields(
+            'TelemetrySerializer', TelemetrySerializer.fields, 0,
+            lookup_tables=False)
+        self.assertNotIn('table_', parse_fields.source)
+        data = TelemetrySerializer().get_data(TELEMETRY_LINE)
+        self.assertEqual(
+            parse_fields(data, ParserTestCase.TIMESTAMP),
+            TelemetrySerializer.parse_fields(data, ParserTestCase.TIMESTAMP))
+
+
+class DataClassTests(TestCase):
+    def test_as_dict(self):
+        """Test generated as_dict against the generic implementation"""
+        for serializer_cls, line in ((TelemetrySerializer, TELEMETRY_LINE),
+                                     (GPGGASerializer, GPGGA_NO_FIX_LINE),
+                                     (GPRMCSerializer, GPRMC_LINE)):
+            data = serializer_cls().parse_data(line.partition('*')[0],
+                                               ParserTestCase.TIMESTAMP)
+            self.assertEqual(data.as_dict(),
+                             SerializerData.as_dict(data, None))
+            self.assertEqual(
+                data.as_dict(include_none=True),
+                {name: getattr(data, name) for name in data._dict_included})
+
+    def test_optional(self):
+        """Test data classes with optional fields not present"""
+        data = CustomSerializer().parse_data('X,10', None)
+        self.assertEqual(data.value, 32)
+        self.assertRaises(AttributeError, getattr, data, 'optional_value')
+        self.assertIn('optional_value', data)
+        self.assertEqual(data.as_dict(), {'value': 32})
+        self.assertEqual(data.as_dict(['optional_value']), {})
+
+        data = CustomSerializer().parse_data('X,10,5', None)
+        self.assertEqual(data.as_dict(), {'value': 32, 'optional_value': 5})
+        self.assertEqual(data.as_dict(['optional_value']),
+                         {'optional_value': 5})
+
+    def test_setattr(self):
+        """Test that only declared fields can be set"""
+        data = CustomSerializer().parse_data('X,10', None)
+        data.optional_value = None
+        self.assertEqual(data.as_dict(include_none=True),
+                         {'value': 32, 'optional_value': None})
+        self.assertNotIn('foo', data)
+        with self.assertRaises(AttributeError):
+            data.foo = 1
@@ -15,3 +15,12 @@ class TestTelemetryFields(TestCase):
         self.assertEqual(ErrorField().to_python('1ffe'), set(ErrorField.ERRORS))
         self.assertRaises(ValidationError, ErrorField().to_python,
                           'foobar')
+
+    def test_error_field_cached(self):
+        """Test that the same errors are decoded into the same frozenset"""
+        errors = ErrorField().to_python('c')
+        self.assertIsInstance(errors, frozenset)
+        self.assertIs(ErrorField().to_python('c'), errors)
+        # Unknown bits are ignored
+        self.assertIs(ErrorField().to_python('e00c'), errors)
+        self.assertIs(ErrorField().to_python('d'), errors)
@@ -0,0 +1,163 @@
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.parser.backpressure import BackpressurePolicy, aggregate
+from app.parser.outputparser import BaseOutputParser
+from app.parser.telemetry import TelemetryParser
+from app.tests.parser.test_telemetry import TELEMETRY_LINE
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+class BackpressurePolicyTests(TestCase):
+    def setUp(self):
+        self.queue = []
+        self.clock = FakeClock()
+
+    def create_policy(self, **kwargs):
+        kwargs.setdefault('high_watermark', 10)
+        kwargs.setdefault('low_watermark', 2)
+        kwargs.setdefault('factor', 3)
+        kwargs.setdefault('check_interval', 1)
+        policy = BackpressurePolicy(self.queue, clock=self.clock, **kwargs)
+        policy.on_mode_changed = Mock()
+        return policy
+
+    def send(self, policy, count, url='/telemetry/'):
+        """Pass ``count`` records through the policy, advancing the clock by
+        a second each time"""
+        result = []
+        for i in range(count):
+            self.clock.time += 1
+            data = policy.filter(url, {'value': i})
+            if data is not None:
+                result.append(data)
+        return result
+
+    def test_normal(self):
+        """Test that all records are sent while the queue is short"""
+        policy = self.create_policy()
+        self.queue.extend(range(9))
+        self.assertEqual(len(self.send(policy, 10)), 10)
+        self.assertEqual(policy.mode, BackpressurePolicy.NORMAL)
+        self.assertEqual(policy.forwarded, 10)
+
+    def test_decimate(self):
+        """Test that every n-th record is sent when the queue is long and all
+        records are sent again when it's drained"""
+        policy = self.create_policy()
+        self.queue.extend(range(10))
+        self.assertEqual(self.send(policy, 7),
+                         [{'value': 0}, {'value': 3}, {'value': 6}])
+        self.assertEqual(policy.mode, BackpressurePolicy.DOWNSAMPLING)
+        policy.on_mode_changed.assert_called_once_with(
+            BackpressurePolicy.DOWNSAMPLING, 10, 0.0)
+
+        # Hysteresis: the queue must be drained to the low watermark
+        del self.queue[3:]
+        self.assertEqual(len(self.send(policy, 3)), 1)
+        del self.queue[2:]
+        self.assertEqual(len(self.send(policy, 3)), 3)
+        self.assertEqual(policy.mode, BackpressurePolicy.NORMAL)
+        self.assertEqual(policy.snapshot()['transitions'], 2)
+        self.assertEqual(policy.downsampled, 6)
+
+    def test_growth_rate(self):
+        """Test that the downsampling starts when the queue grows fast"""
+        policy = self.create_policy(growth_threshold=2)
+        self.queue.extend(range(3))
+        self.send(policy, 1)
+        self.queue.extend(range(3))
+        self.clock.time += 1
+        policy.check()
+        self.assertEqual(policy.mode, BackpressurePolicy.DOWNSAMPLING)
+        self.assertEqual(policy.growth_rate, 3.0)
+
+        policy = self.create_policy(growth_threshold=None)
+        self.send(policy, 1)
+        self.queue.extend(range(3))
+        self.clock.time += 1
+        policy.check()
+        self.assertEqual(policy.mode, BackpressurePolicy.NORMAL)
+
+    def test_check_interval(self):
+        """Test that the queue is not checked more often than requested"""
+        policy = self.create_policy(check_interval=5)
+        policy.filter('/telemetry/', {})
+        self.queue.extend(range(10))
+        self.send(policy, 4)
+        self.assertEqual(policy.mode, BackpressurePolicy.NORMAL)
+        self.send(policy, 1)
+        self.assertEqual(policy.mode, BackpressurePolicy.DOWNSAMPLING)
+
+    def test_other_urls(self):
+        """Test that only the data of selected endpoints are downsampled"""
+        policy = self.create_policy()
+        self.queue.extend(range(10))
+        self.assertEqual(len(self.send(policy, 5, '/gps/')), 5)
+
+    def test_aggregate(self):
+        """Test that the records are aggregated in windows and the last
+        window is sent when the downsampling ends"""
+        policy = self.create_policy(method=BackpressurePolicy.AGGREGATE)
+        self.queue.extend(range(10))
+        sent = self.send(policy, 7)
+        self.assertEqual([data['value'] for data in sent], [1, 4])
+        self.assertEqual(sent[0], {'value': 1, 'value_min': 0,
+                                   'value_max': 2, 'sample_count': 3})
+
+        self.queue.clear()
+        sent = self.send(policy, 2)
+        # The record left from the first call (6) and the first one (0)
+        self.assertEqual(sent[0], {'value': 3, 'value_min': 0,
+                                   'value_max': 6, 'sample_count': 2})
+        self.assertEqual(sent[1], {'value': 1})
+        self.assertEqual(policy.aggregates, 3)
+
+    def test_aggregate_values(self):
+        """Test that only numeric values are averaged"""
+        t0, t1 = datetime(2016, 6, 1), datetime(2016, 6, 2)
+        result = aggregate([
+            {'timestamp': t0, 'temperature': 20.0, 'flag': True, 'n': 1},
+            {'timestamp': t1, 'temperature': 22.0, 'flag': False, 'n': None},
+        ])
+        self.assertEqual(result['timestamp'], t1)
+        self.assertEqual(result['temperature'], 21.0)
+        self.assertIs(result['flag'], False)
+        self.assertIsNone(result['n'])
+        self.assertEqual(result['temperature_max'], 22.0)
+        self.assertNotIn('flag_max', result)
+        self.assertEqual(result['sample_count'], 2)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.create_policy(method='median')
+        with self.assertRaises(ValueError):
+            self.create_policy(factor=0)
+        with self.assertRaises(ValueError):
+            self.create_policy(low_watermark=20)
+
+
+class OutputParserBackpressureTests(TestCase):
+    def test_analyzer_receives_all(self):
+        """Test that the collector receives every sample while the sent data
+        is downsampled"""
+        sender = Mock()
+        sender.__len__ = Mock(return_value=100)
+        collector = Mock()
+        policy = BackpressurePolicy(sender, high_watermark=10,
+                                    low_watermark=1, factor=5)
+        parser = BaseOutputParser([TelemetryParser()], sender, collector,
+                                  backpressure=policy)
+        parser.set_probe_start_time(datetime(2016, 6, 1))
+        for _ in range(10):
+            parser.parse_line(TELEMETRY_LINE)
+        self.assertEqual(sender.add_request.call_count, 2)
+        self.assertEqual(collector.add_value.call_count, 30)
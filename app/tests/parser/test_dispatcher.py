@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from app.parser import Dispatcher
+from app.parser.gps import GPSParser, ExtendedGPSParser
+from app.parser.kundt import KundtParser
+from app.parser.telemetry import TelemetryParser
+from app.tests.parser.test_gps import GPGGA_LINE, GPRMC_LINE, GPVTG_LINE
+from app.tests.parser.test_telemetry import TELEMETRY_LINE
+
+
+class DispatcherTests(TestCase):
+    def setUp(self):
+        self.gps = GPSParser()
+        self.telemetry = TelemetryParser()
+        self.kundt = KundtParser()
+        self.dispatcher = Dispatcher([self.gps, self.telemetry, self.kundt])
+
+    def test_classify(self):
+        """Test finding parsers by message ID"""
+        self.assertEqual(self.dispatcher.classify(GPGGA_LINE),
+                         (self.gps, '$GPGGA'))
+        self.assertEqual(self.dispatcher.classify(GPRMC_LINE),
+                         (self.gps, '$GPRMC'))
+        self.assertEqual(self.dispatcher.classify(TELEMETRY_LINE),
+                         (self.telemetry, 'S'))
+
+    def test_classify_fallback(self):
+        """Test finding parsers for messages without ID"""
+        self.assertEqual(self.dispatcher.classify('7530,400'),
+                         (self.kundt, 'KUNDT'))
+        self.assertEqual(self.dispatcher.classify('KUNDT,7530,400'),
+                         (None, None))
+
+    def test_classify_unknown(self):
+        """Test classifying lines no parser can handle"""
+        self.assertEqual(self.dispatcher.classify(GPVTG_LINE), (None, None))
+        self.assertEqual(self.dispatcher.classify('SS,0'), (None, None))
+        self.assertEqual(self.dispatcher.classify(''), (None, None))
+
+    def test_first_parser_wins(self):
+        """Test that the first parser is used for duplicate message IDs"""
+        extended_gps = ExtendedGPSParser()
+        dispatcher = Dispatcher([self.gps, extended_gps])
+        self.assertEqual(dispatcher.classify(GPGGA_LINE),
+                         (self.gps, '$GPGGA'))
+        self.assertEqual(dispatcher.classify(GPVTG_LINE),
+                         (extended_gps, '$GPVTG'))
@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import numpy
+
+from app.parser import index
+from app.tests.parser.test_gps import GPGGA_LINE
+
+
+def telemetry_line(timestamp):
+    return ('S,0,f,e,d,c,{:x},68c2,6448,3295,3d1,7e,fdd3,d,e83d,e6bd,cdb6,'
+            '58c,fcbe,995'.format(timestamp))
+
+
+class CaptureIndexTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'output')
+        # Timestamp is in effect until the next line that has one
+        self.lines = ['7530,400', telemetry_line(0), GPGGA_LINE,
+                      telemetry_line(1000), telemetry_line(2000) + '\r',
+                      'S,invalid', '7531,401', telemetry_line(3500)]
+        self.timestamps = [index.NO_TIMESTAMP, 0, 0, 1000, 2000, 2000, 2000,
+                           3500]
+        self.write_lines(self.lines)
+
+    def write_lines(self, lines, mode='w'):
+        with open(self.path, mode) as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def open_index(self):
+        capture_index = index.CaptureIndex(self.path)
+        self.addCleanup(capture_index.close)
+        return capture_index
+
+    def get_lines(self, capture_index, t0=None, t1=None):
+        return [str(line, 'utf-8')
+                for line in capture_index.open_range(t0, t1)]
+
+    def test_index(self):
+        """Test the offsets and timestamps of the lines"""
+        capture_index = self.open_index()
+        self.assertEqual(len(capture_index), len(self.lines))
+        self.assertEqual(capture_index.entries['timestamp'].tolist(),
+                         self.timestamps)
+        offsets = numpy.cumsum([0] + [len(line) + 1 for line in self.lines])
+        self.assertEqual(capture_index.index['offset'].tolist(),
+                         offsets.tolist())
+        self.assertTrue(os.path.exists(self.path + index.INDEX_SUFFIX))
+
+    def test_open_range(self):
+        """Test getting the lines from a time range"""
+        capture_index = self.open_index()
+        self.assertEqual(self.get_lines(capture_index),
+                         [line.rstrip('\r') for line in self.lines])
+        self.assertEqual(self.get_lines(capture_index, 1, 3.5),
+                         [telemetry_line(1000), telemetry_line(2000),
+                          'S,invalid', '7531,401'])
+        self.assertEqual(self.get_lines(capture_index, None, 0),
+                         ['7530,400'])
+        self.assertEqual(self.get_lines(capture_index, 10), [])
+
+    def test_unsorted(self):
+        """Test time range when the timestamps are not monotonic"""
+        self.write_lines([telemetry_line(0), '7530,400'], 'a')
+        capture_index = self.open_index()
+        self.assertFalse(capture_index.sorted)
+        self.assertEqual(capture_index.get_line_ranges(0, 1),
+                         [(1, 3), (8, 10)])
+        self.assertEqual(self.get_lines(capture_index, 0, 1)[-2:],
+                         [telemetry_line(0), '7530,400'])
+
+    def test_update(self):
+        """Test that only the new lines are indexed when the file grows"""
+        self.open_index().close()
+        # Incomplete line is not indexed
+        with open(self.path, 'a') as f:
+            f.write('7532,402\n' + telemetry_line(5000))
+        capture_index = self.open_index()
+        self.assertEqual(capture_index.entries['timestamp'].tolist(),
+                         self.timestamps + [3500])
+        with open(self.path, 'a') as f:
+            f.write('\n')
+        capture_index = self.open_index()
+        self.assertEqual(capture_index.entries['timestamp'].tolist(),
+                         self.timestamps + [3500, 5000])
+        self.assertEqual(self.get_lines(capture_index, 5),
+                         [telemetry_line(5000)])
+
+    def test_reader(self):
+        """Test reading the lines in a time range in small blocks"""
+        self.write_lines([telemetry_line(0), '7530,400'], 'a')
+        capture_index = self.open_index()
+        line_reader = capture_index.create_reader(0, 1, block_size=16)
+        lines = []
+        while True:
+            result = line_reader.read_lines()
+            if result is None:
+                break
+            lines += result
+        self.assertEqual(lines, self.get_lines(capture_index, 0, 1))
+
+    def test_empty(self):
+        """Test indexing empty file"""
+        self.write_lines([])
+        os.truncate(self.path, 0)
+        capture_index = self.open_index()
+        self.assertEqual(len(capture_index), 0)
+        self.assertEqual(self.get_lines(capture_index), [])
@@ -0,0 +1,69 @@
+import os
+from unittest import TestCase
+
+from app.parser.reader import BlockLineReader, TextLineReader
+
+
+class ReaderTestCase(TestCase):
+    reader_class = None
+
+    def setUp(self):
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        self.addCleanup(os.close, self.read_fd)
+        self.addCleanup(os.close, self.write_fd)
+
+    def write(self, data):
+        os.write(self.write_fd, data)
+
+    def read_all(self, line_reader):
+        result = []
+        lines = line_reader.read_lines()
+        while lines is not None:
+            result += lines
+            lines = line_reader.read_lines()
+        return result
+
+
+class BlockLineReaderTests(ReaderTestCase):
+    def test_read_lines(self):
+        """Test reading lines split between blocks"""
+        line_reader = BlockLineReader(self.read_fd, block_size=4)
+        self.write(b'7530,400\nS,0\r\n\n$GP')
+        self.assertEqual(self.read_all(line_reader),
+                         ['7530,400', 'S,0', ''])
+        self.write(b'GGA\n')
+        self.assertEqual(self.read_all(line_reader), ['$GPGGA'])
+
+    def test_no_data(self):
+        """Test that None is returned if there is no data available"""
+        line_reader = BlockLineReader(self.read_fd)
+        self.assertIsNone(line_reader.read_lines())
+        self.write(b'7530,')
+        self.assertEqual(line_reader.read_lines(), [])
+        self.assertIsNone(line_reader.read_lines())
+
+    def test_read_remaining(self):
+        """Test that the unterminated last line is returned at EOF"""
+        line_reader = BlockLineReader(self.read_fd, block_size=4)
+        self.write(b'S,0\n7530,400')
+        self.assertEqual(self.read_all(line_reader), ['S,0'])
+        self.assertEqual(line_reader.read_remaining(), ['7530,400'])
+        self.assertEqual(line_reader.read_remaining(), [])
+
+    def test_invalid_encoding(self):
+        """Test that lines that can't be decoded are skipped"""
+        line_reader = BlockLineReader(self.read_fd)
+        self.write(b'S,0\n\xff\n7530,400\n')
+        with self.assertLogs('Parser', 'WARNING'):
+            self.assertEqual(self.read_all(line_reader), ['S,0', '7530,400'])
+
+
+class TextLineReaderTests(ReaderTestCase):
+    def test_read_lines(self):
+        """Test reading lines one by one"""
+        line_reader = TextLineReader(self.read_fd)
+        self.write(b'7530,400\nS,0\r\n')
+        self.assertEqual(line_reader.read_lines(), ['7530,400'])
+        self.assertEqual(line_reader.read_lines(), ['S,0'])
+        self.assertIsNone(line_reader.read_lines())
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tty
+from unittest import TestCase
+from unittest.mock import Mock
+
+from app.parser import reader
+from app.parser.kundt import KundtParser
+from app.parser.outputparser import BaseOutputParser
+
+
+class SerialTestCase(TestCase):
+    """Test case providing a pty pair in place of a serial device"""
+
+    def setUp(self):
+        self.master, slave = os.openpty()
+        tty.setraw(slave)
+        self.port = os.ttyname(slave)
+        # Keep the slave open, so the master does not get EIO
+        self.addCleanup(os.close, slave)
+        self.addCleanup(os.close, self.master)
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.archive_path = os.path.join(self.dir, 'archive')
+
+
+class SerialLineReaderTests(SerialTestCase):
+    def setUp(self):
+        super().setUp()
+        self.reader = reader.SerialLineReader(self.port, 57600,
+                                              self.archive_path)
+        self.addCleanup(self.reader.close)
+
+    def read_all_lines(self, count):
+        lines = []
+        for _ in range(100):
+            lines += self.reader.read_lines() or []
+            if len(lines) >= count:
+                break
+        return lines
+
+    def test_read_lines(self):
+        """Test reading lines split between writes"""
+        os.write(self.master, b'7530,400\r\n75')
+        self.assertEqual(self.read_all_lines(1), ['7530,400'])
+        os.write(self.master, b'31,401\n')
+        self.assertEqual(self.read_all_lines(1), ['7531,401'])
+
+    def test_timeout(self):
+        """Test that read_lines returns when there is no data"""
+        start = time.monotonic()
+        self.assertIsNone(self.reader.read_lines())
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_archive(self):
+        """Test that the raw data is copied to the archive"""
+        data = b'7530,400\r\n\xff\xfe\n7531,401\n'
+        os.write(self.master, data)
+        self.assertEqual(self.read_all_lines(2), ['7530,400', '7531,401'])
+        # Flushed when idle
+        self.assertIsNone(self.reader.read_lines())
+        with open(self.archive_path, 'rb') as f:
+            self.assertEqual(f.read(), data)
+
+
+class ParseSerialTests(SerialTestCase):
+    def test_parse_serial(self):
+        """Test parsing lines from a serial port until terminated"""
+        parser = BaseOutputParser([KundtParser()], Mock(), None)
+        parser.on_line_parsed = Mock()
+        thread = threading.Thread(target=parser.parse_serial,
+                                  args=(self.port, 57600, self.archive_path))
+        thread.start()
+
+        # The archive is created after opening the port (which discards any
+        # data received before)
+        for _ in range(100):
+            if os.path.exists(self.archive_path):
+                break
+            time.sleep(0.01)
+        os.write(self.master, b'7530,400\n7531,401\n')
+        for _ in range(100):
+            if parser.on_line_parsed.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(parser.on_line_parsed.call_count, 2)
+
+        parser.mark_terminated()
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        with open(self.archive_path, 'rb') as f:
+            self.assertEqual(f.read(), b'7530,400\n7531,401\n')
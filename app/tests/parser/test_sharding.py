@@ -0,0 +1,80 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from app.parser import sharding
+from app.parser.outputparser import PARSERS
+from app.tests.parser import ParserTestCase
+from app.tests.parser.test_gps import (
+    GPGGA_LINE, GPGGA_NO_FIX_LINE, GPRMC_LINE, GPRMC_NO_FIX_LINE
+)
+
+
+def telemetry_line(timestamp):
+    return ('S,0,f,e,d,c,{:x},68c2,6448,3295,3d1,7e,fdd3,d,e83d,e6bd,cdb6,'
+            '58c,fcbe,995'.format(timestamp))
+
+
+class ShardingTests(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+        # GPS messages without fix don't contain position, so the values
+        # from previous $GPGGA have to be carried across shard boundaries
+        rnd = random.Random(0)
+        choices = [GPGGA_LINE, GPGGA_NO_FIX_LINE, GPRMC_LINE,
+                   GPRMC_NO_FIX_LINE, '7530,400', 'invalid', '']
+        self.lines = []
+        for i in range(300):
+            if rnd.random() < 0.3:
+                self.lines.append(telemetry_line(i * 100))
+            else:
+                self.lines.append(rnd.choice(choices))
+        with open(self.path, 'w') as f:
+            f.write('\n'.join(self.lines) + '\n')
+
+    def parse_sequentially(self):
+        state = sharding.ShardState(ParserTestCase.TIMESTAMP,
+                                    [None] * len(PARSERS))
+        parser = sharding.ShardOutputParser(PARSERS, ParserTestCase.TIMESTAMP,
+                                            state)
+        parser.parse_lines(self.lines)
+        return parser.sender, parser.lines_parsed, parser.lines_failed
+
+    def test_split_shards(self):
+        """Test that the shards cover the whole file and start at new lines"""
+        for count in (1, 2, 7, 1000):
+            shards = sharding.split_shards(self.path, count)
+            self.assertLessEqual(len(shards), count)
+            self.assertEqual(shards[0][0], 0)
+            self.assertEqual(shards[-1][1], os.path.getsize(self.path))
+            lines = []
+            for (start, end), (next_start, _) in zip(shards, shards[1:]):
+                self.assertEqual(end, next_start)
+            for start, end in shards:
+                lines += sharding.read_shard(self.path, start, end)
+            self.assertEqual(lines, self.lines)
+
+    def test_parse_file(self):
+        """Test that the results are the same as when parsing sequentially"""
+        expected = self.parse_sequentially()
+        for shard_count in (1, 3, 16):
+            requests = []
+            lines_parsed = lines_failed = 0
+            for result in sharding.parse_file(
+                    self.path, ParserTestCase.TIMESTAMP, jobs=2,
+                    shard_count=shard_count):
+                requests += result.requests
+                lines_parsed += result.lines_parsed
+                lines_failed += result.lines_failed
+            self.assertEqual((requests, lines_parsed, lines_failed), expected)
+
+    def test_empty_file(self):
+        """Test parsing empty file"""
+        with open(self.path, 'w'):
+            pass
+        self.assertEqual(list(sharding.parse_file(
+            self.path, ParserTestCase.TIMESTAMP, jobs=2)), [])
@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+from app import logger
 from app.parser.telemetry import TelemetryParser
 from app.tests.parser import ParserTestCase
 
@@ -25,3 +26,18 @@ class TelemetryTests(ParserTestCase):
         """Test parsing telemetry ("S") message"""
         d = self.parse(TELEMETRY_LINE)
         self.assertDictAlmostEqual(d, TELEMETRY_DATA)
+
+    def test_error_reporting(self):
+        """Test that the probe errors are only logged when they change"""
+        def line(error):
+            return 'S,{:x},'.format(error) + TELEMETRY_LINE.split(',', 2)[2]
+
+        with self.assertLogs('Probe', logger.PROBE) as cm:
+            for error in [1, 0x4, 0x4, 0x6, 0x6, 0x1, 0x1, 0x0]:
+                self.parse(line(error))
+        self.assertEqual([record.getMessage() for record in cm.records], [
+            'The probe reported an error: HTU21D_DISABLED',
+            'The probe reported multiple errors: HARD_RST, HTU21D_DISABLED',
+            'The probe reports no errors',
+            'The probe reported an unspecified error',
+        ])
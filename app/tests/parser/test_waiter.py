@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase, skipUnless
+from unittest.mock import Mock
+
+from app.parser import waiter
+from app.parser.kundt import KundtParser
+from app.parser.outputparser import BaseOutputParser
+
+
+class WaiterTestCase(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'data')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def assertReturnsWithin(self, func, timeout):
+        start = time.monotonic()
+        func()
+        self.assertLess(time.monotonic() - start, timeout)
+
+    def call_later(self, func, delay=0.05):
+        timer = threading.Timer(delay, func)
+        timer.start()
+        self.addCleanup(timer.join)
+
+
+class PollInputWaiterTests(WaiterTestCase):
+    def setUp(self):
+        super().setUp()
+        os.mkfifo(self.path)
+        self.fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        self.addCleanup(os.close, self.fd)
+        self.waiter = waiter.create_input_waiter(self.fd, self.path)
+        self.addCleanup(self.waiter.close)
+
+    def test_create(self):
+        """Test that PollInputWaiter is used for named pipes"""
+        self.assertIsInstance(self.waiter, waiter.PollInputWaiter)
+
+    def test_data_arrival(self):
+        """Test that the waiter returns when the data is written"""
+        def write():
+            with open(self.path, 'w') as f:
+                f.write('7530,400\n')
+
+        self.call_later(write)
+        self.assertReturnsWithin(self.waiter.wait, 1)
+        self.assertEqual(os.read(self.fd, 100), b'7530,400\n')
+
+    def test_writer_closed(self):
+        """Test that the waiter blocks again after the writer is closed"""
+        with open(self.path, 'w') as f:
+            f.write('7530,400\n')
+        os.read(self.fd, 100)
+        self.call_later(self.waiter.wake_up, 0.2)
+        start = time.monotonic()
+        self.waiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_wake_up(self):
+        """Test that wake_up interrupts waiting and the following waits"""
+        self.call_later(self.waiter.wake_up)
+        self.assertReturnsWithin(self.waiter.wait, 1)
+        self.assertReturnsWithin(self.waiter.wait, 0.01)
+
+
+@skipUnless(hasattr(os, 'uname') and os.uname().sysname == 'Linux',
+            'inotify is only available on Linux')
+class InotifyInputWaiterTests(WaiterTestCase):
+    def test_data_arrival(self):
+        """Test that the waiter returns when the file is appended to"""
+        open(self.path, 'w').close()
+        fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        self.addCleanup(os.close, fd)
+        input_waiter = waiter.create_input_waiter(fd, self.path)
+        self.addCleanup(input_waiter.close)
+        self.assertIsInstance(input_waiter, waiter.InotifyInputWaiter)
+
+        def append():
+            with open(self.path, 'a') as f:
+                f.write('7530,400\n')
+
+        self.call_later(append)
+        self.assertReturnsWithin(input_waiter.wait, 1)
+
+
+class OutputParserWaitTests(WaiterTestCase):
+    def test_mark_terminated(self):
+        """Test that mark_terminated wakes up the waiting parser"""
+        os.mkfifo(self.path)
+        parser = BaseOutputParser([KundtParser()], Mock(), None)
+        parser.on_line_parsed = Mock()
+        thread = threading.Thread(target=parser.parse_file, args=(self.path,))
+        thread.start()
+
+        with open(self.path, 'w') as f:
+            f.write('7530,400\n')
+        for _ in range(100):
+            if parser.on_line_parsed.called:
+                break
+            time.sleep(0.01)
+        self.assertEqual(parser.on_line_parsed.call_count, 1)
+
+        start = time.monotonic()
+        parser.mark_terminated()
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - start, 0.5)
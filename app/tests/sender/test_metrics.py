@@ -0,0 +1,32 @@
+import random
+from unittest import TestCase
+
+from app.sender.metrics import LatencyHistogram
+
+
+class LatencyHistogramTests(TestCase):
+    def test_percentiles(self):
+        """Test that the percentiles are within the relative error"""
+        rng = random.Random(0)
+        values = sorted(rng.expovariate(20) for _ in range(10000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        for p in (50, 95, 99):
+            expected = values[int(len(values) * p / 100) - 1]
+            self.assertAlmostEqual(histogram.percentile(p) / expected, 1,
+                                   delta=0.04, msg=p)
+        summary = histogram.summarize()
+        self.assertEqual(summary.count, len(values))
+        self.assertAlmostEqual(summary.max, values[-1], delta=1e-6)
+        self.assertAlmostEqual(summary.mean, sum(values) / len(values),
+                               delta=1e-6)
+
+    def test_small_values(self):
+        """Test that the small values are recorded exactly"""
+        histogram = LatencyHistogram(resolution=1)
+        for value in (0, 1, 1, 5, 63):
+            histogram.record(value)
+        self.assertEqual([histogram.percentile(p) for p in (0, 40, 70, 100)],
+                         [0, 1, 5, 63])
+        self.assertIsNone(LatencyHistogram().summarize().p50)
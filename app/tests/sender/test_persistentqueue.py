@@ -0,0 +1,132 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+from app.sender import PRIORITY_NORMAL, RequestData
+from app.sender.persistentqueue import PersistentRequestQueue
+
+
+def request(request_id, url='/telemetry/', **kwargs):
+    fields = dict(module='Test', data={'value': str(request_id)}, files=None,
+                  callback=None, added_time=0.0, priority=PRIORITY_NORMAL,
+                  supersede_key=None)
+    fields.update(kwargs)
+    return RequestData(request_id, url=url, **fields)
+
+
+class PersistentRequestQueueTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'queue.db')
+
+    def open_queue(self, **kwargs):
+        queue = PersistentRequestQueue(self.path, durable=False, **kwargs)
+        self.addCleanup(queue.connection.close)
+        return queue
+
+    def count_stored(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(
+                'SELECT COUNT(*) FROM requests').fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_restore(self):
+        """Test that the unacknowledged requests are restored"""
+        queue = self.open_queue()
+        for i in range(1, 5):
+            queue.append(request(i, '/kundt/' if i == 2 else '/telemetry/'))
+        sent = queue.popleft('/telemetry/')
+        queue.acknowledge(sent)
+        # Being sent, but not acknowledged
+        queue.popleft('/telemetry/')
+        queue.close()
+
+        queue = self.open_queue()
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.last_id, 4)
+        self.assertEqual([request_data.id for request_data in queue],
+                         [2, 3, 4])
+        self.assertEqual(
+            sorted((url, head.id, count) for url, head, count in
+                   queue.heads()),
+            [('/kundt/', 2, 1), ('/telemetry/', 3, 2)])
+        self.assertEqual(queue.popleft('/telemetry/').data, {'value': '3'})
+
+    def test_cache_size(self):
+        """Test that only first requests of every URL are kept in memory"""
+        queue = self.open_queue(cache_size=3)
+        for i in range(1, 11):
+            queue.append(request(i))
+        lane = queue._lanes['/telemetry/']
+        self.assertEqual(len(lane.cache), 3)
+
+        ids = []
+        for i in range(1, 11):
+            if i == 5:
+                queue.append(request(11))
+            ids.append(queue.popleft('/telemetry/').id)
+            self.assertLessEqual(len(lane.cache), 3)
+        ids.append(queue.popleft('/telemetry/').id)
+        self.assertEqual(ids, list(range(1, 12)))
+        self.assertEqual(len(queue), 0)
+        self.assertIsNone(queue.peek('/telemetry/'))
+
+    def test_group_commit(self):
+        """Test that the changes are committed in groups"""
+        queue = self.open_queue(group_size=4, commit_interval=60)
+        for i in range(1, 4):
+            queue.append(request(i))
+        self.assertEqual(self.count_stored(), 0)
+        queue.append(request(4))
+        self.assertEqual(self.count_stored(), 4)
+        queue.append(request(5))
+        queue.flush()
+        self.assertEqual(self.count_stored(), 5)
+
+    def test_extras(self):
+        """Test that the files and callbacks are only kept in memory"""
+        queue = self.open_queue(cache_size=1)
+        callback = object()
+        queue.append(request(1))
+        queue.append(request(2, callback=callback))
+        queue.append(request(3, files={'file': b'data'}))
+        queue.popleft('/telemetry/')
+        self.assertIs(queue.popleft('/telemetry/').callback, callback)
+        queue.close()
+
+        with self.assertLogs('Sender', 'WARNING'):
+            queue = self.open_queue()
+        self.assertEqual([(request_data.id, request_data.callback)
+                          for request_data in queue], [(1, None), (2, None)])
+
+    def test_supersede(self):
+        """Test replacing pending requests, including the ones not cached"""
+        queue = self.open_queue(cache_size=1)
+        queue.append(request(1, '/planetarydata/', supersede_key='p'))
+        queue.append(request(2, '/planetarydata/'))
+        queue.append(request(3, '/planetarydata/', supersede_key='q'))
+        self.assertIsNone(queue.supersede(request(4, supersede_key='p')))
+        replaced = queue.supersede(request(5, '/planetarydata/',
+                                           supersede_key='p'))
+        self.assertEqual((replaced.id, replaced.data), (1, {'value': '5'}))
+        replaced = queue.supersede(request(6, '/planetarydata/',
+                                           supersede_key='q'))
+        self.assertEqual((replaced.id, replaced.data), (3, {'value': '6'}))
+        queue.close()
+
+        queue = self.open_queue()
+        self.assertEqual(queue.popleft('/planetarydata/').data,
+                         {'value': '5'})
+        # Requests being sent can't be replaced
+        self.assertIsNone(queue.supersede(request(7, '/planetarydata/',
+                                                  supersede_key='p')))
+        replaced = queue.supersede(request(8, '/planetarydata/',
+                                           supersede_key='q'))
+        self.assertEqual(replaced.id, 3)
+        self.assertEqual([request_data.data['value'] for request_data in
+                          queue], ['5', '2', '8'])
@@ -0,0 +1,101 @@
+from unittest import TestCase
+
+import requests
+
+from app.api import APIError
+from app.sender.retry import CircuitBreaker, RetryPolicy
+
+
+def api_error(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return APIError('Error', response)
+
+
+class RetryPolicyTests(TestCase):
+    def test_is_transient(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_transient(
+            requests.exceptions.ConnectionError()))
+        self.assertTrue(policy.is_transient(requests.exceptions.ReadTimeout()))
+        self.assertTrue(policy.is_transient(api_error(503)))
+        self.assertTrue(policy.is_transient(api_error(429)))
+        self.assertFalse(policy.is_transient(api_error(400)))
+        self.assertFalse(policy.is_transient(
+            requests.exceptions.InvalidURL()))
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+        error = api_error(502)
+        self.assertTrue(policy.should_retry(error, 2))
+        self.assertFalse(policy.should_retry(error, 3))
+        self.assertFalse(policy.should_retry(api_error(404), 1))
+
+    def test_get_delay(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5, multiplier=2)
+        for attempt, limit in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+            delays = [policy.get_delay(attempt) for _ in range(50)]
+            self.assertLessEqual(max(delays), limit)
+            self.assertGreaterEqual(min(delays), 0)
+            # Jitter
+            self.assertGreater(len(set(delays)), 1)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=10)
+        self.assertGreaterEqual(
+            policy.get_delay(1, api_error(503, {'Retry-After': '3'})), 3)
+        self.assertEqual(
+            policy.get_delay(1, api_error(503, {'Retry-After': '60'})), 10)
+        self.assertLessEqual(
+            policy.get_delay(1, api_error(503, {'Retry-After': 'never'})),
+            0.1)
+
+
+class CircuitBreakerTests(TestCase):
+    def setUp(self):
+        self.time = 0
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=1,
+                                      max_reset_timeout=3,
+                                      clock=lambda: self.time)
+
+    def test_open(self):
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.allow_request(), (True, None))
+        with self.assertLogs('Sender', 'WARNING'):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.time = 0.25
+        self.assertEqual(self.breaker.allow_request(), (False, 0.75))
+
+    def test_success_resets(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_probe(self):
+        with self.assertLogs('Sender', 'WARNING'):
+            self.breaker.record_failure()
+            self.breaker.record_failure()
+        self.time = 1
+        # Only a single probe is let through
+        self.assertEqual(self.breaker.allow_request(), (True, None))
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(self.breaker.allow_request(), (False, None))
+
+        # Failed probe doubles the timeout (up to the maximum)
+        with self.assertLogs('Sender', 'WARNING'):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.allow_request(), (False, 2))
+        self.time = 3
+        self.assertTrue(self.breaker.allow_request()[0])
+        with self.assertLogs('Sender', 'WARNING'):
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.allow_request(), (False, 3))
+
+        self.time = 6
+        self.assertTrue(self.breaker.allow_request()[0])
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.allow_request(), (True, None))
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from app.sender import PRIORITY_HIGH
+from app.sender.spool import Spool
+from app.tests.sender.test_persistentqueue import request
+
+
+def values(entry):
+    url, records = entry
+    return url, [record['data']['value'] for record in records]
+
+
+class SpoolTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def open_spool(self, **kwargs):
+        spool = Spool(self.dir, **kwargs)
+        self.addCleanup(spool.close)
+        return spool
+
+    def list_files(self):
+        return sorted(os.path.join(os.path.basename(root), name)
+                      for root, dirs, files in os.walk(self.dir)
+                      for name in files)
+
+    def test_peek_advance(self):
+        """Test that the requests are returned by URL in the original order"""
+        spool = self.open_spool(segment_size=2)
+        for i in range(1, 6):
+            spool.append(request(i, '/kundt/' if i == 3 else '/telemetry/'))
+        self.assertEqual(len(spool), 5)
+        self.assertEqual(values(spool.peek(5)), ('/telemetry/', ['1', '2']))
+        spool.advance('/telemetry/', 1)
+        self.assertEqual(values(spool.peek(5)), ('/kundt/', ['3']))
+        spool.advance('/kundt/', 1, sent=False)
+        self.assertEqual(values(spool.peek(5)), ('/telemetry/', ['2']))
+        spool.advance('/telemetry/', 1)
+        # The segment being written is sent as well
+        self.assertEqual(values(spool.peek(5)), ('/telemetry/', ['4', '5']))
+        spool.advance('/telemetry/', 2)
+        self.assertIsNone(spool.peek(5))
+        self.assertEqual((len(spool), spool.sent, spool.dropped), (0, 4, 1))
+        self.assertEqual(self.list_files(), [])
+
+    def test_restore(self):
+        """Test that the requests not sent are restored, including the ones
+        in the segments that were not closed"""
+        spool = self.open_spool(segment_size=3)
+        for i in range(1, 6):
+            spool.append(request(i))
+        spool.peek(2)
+        spool.advance('/telemetry/', 2)
+        spool.flush()
+        # Simulate a crash: the segment being written is not closed
+        spool._lanes.clear()
+
+        spool = self.open_spool()
+        self.assertEqual(len(spool), 3)
+        self.assertEqual(values(spool.peek(5)), ('/telemetry/', ['3']))
+        spool.advance('/telemetry/', 1)
+        self.assertEqual(values(spool.peek(5)), ('/telemetry/', ['4', '5']))
+
+    def test_accepts(self):
+        self.assertTrue(Spool.accepts(request(1)))
+        self.assertFalse(Spool.accepts(request(1, files={'f': b''})))
+        self.assertFalse(Spool.accepts(request(1, callback=print)))
+        self.assertFalse(Spool.accepts(request(1, supersede_key='k')))
+        self.assertFalse(Spool.accepts(request(1, priority=PRIORITY_HIGH)))
+
+    def test_invalid_share(self):
+        with self.assertRaises(ValueError):
+            Spool(self.dir, backlog_share=0)
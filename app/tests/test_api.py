@@ -0,0 +1,82 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from app import api
+from app.tests.test_sender import StandInServer
+
+JSON = 'application/json'
+FORM = 'application/x-www-form-urlencoded'
+
+
+class EncodingTests(TestCase):
+    def test_encode_datetime(self):
+        self.assertEqual(api.encode_datetime(datetime(2016, 6, 1, 12, 0, 1)),
+                         '2016-06-01T12:00:01Z')
+        self.assertEqual(
+            api.encode_datetime(datetime(2016, 6, 1, 12, 0, 1, 5000)),
+            '2016-06-01T12:00:01.005000Z')
+        self.assertEqual(api.encode_datetime(
+            datetime(2016, 6, 1, 12, 0, 1, tzinfo=timezone.utc)),
+            '2016-06-01T12:00:01Z')
+        self.assertEqual(api.encode_datetime(
+            datetime(2016, 6, 1, 12, 0, 1,
+                     tzinfo=timezone(timedelta(hours=2)))),
+            '2016-06-01T12:00:01+02:00')
+
+    def test_encode_json(self):
+        self.assertEqual(
+            api.encode_json([{'a': 1, 'b': datetime(2016, 6, 1, 12)}]),
+            b'[{"a":1,"b":"2016-06-01T12:00:00Z"}]')
+        with self.assertRaises(TypeError):
+            api.encode_json({'a': object()})
+
+
+class NegotiationTests(TestCase):
+    def setUp(self):
+        self.server = StandInServer(bulk_urls=('/telemetry/',))
+        server_thread = threading.Thread(target=self.server.serve_forever)
+        server_thread.start()
+        self.addCleanup(server_thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.api = api.API()
+        self.api.set_server_url(
+            'http://127.0.0.1:{}'.format(self.server.server_port))
+        self.api.gzip_min_size = 100
+        self.small = {'value': '1'}
+        self.large = {'value': '1', 'text': 'x' * 1000}
+
+    def test_gzip(self):
+        """Test that only the large bodies are compressed"""
+        self.api.set_encoding('/telemetry/', api.ENCODING_JSON_GZIP)
+        self.api.create('/telemetry/', self.small)
+        self.api.create('/telemetry/', self.large)
+        self.api.create('/kundt/', self.large)
+        self.assertEqual(
+            [body[:3] for body in self.server.bodies],
+            [('/telemetry/', JSON, None), ('/telemetry/', JSON, 'gzip'),
+             ('/kundt/', FORM, None)])
+        self.assertLess(self.server.bodies[1][3], 100)
+        self.assertEqual(self.server.received[1], ('/telemetry/', self.large))
+
+    def test_fallback(self):
+        """Test using simpler encoding if the server rejects the body"""
+        self.server.content_encodings = set()
+        self.server.content_types = {FORM}
+        self.api.default_encoding = api.ENCODING_JSON_GZIP
+        with self.assertLogs('API', 'INFO'):
+            self.api.create('/telemetry/', self.large)
+        self.assertEqual(self.api.get_encoding('/telemetry/'),
+                         api.ENCODING_FORM)
+        self.assertEqual(
+            [body[1:3] for body in self.server.bodies],
+            [(JSON, 'gzip'), (JSON, None), (FORM, None)])
+
+        # Bulk requests can't be form-encoded
+        with self.assertRaises(api.APIError):
+            self.api.create_bulk('/telemetry/', [self.small, self.small])
+        self.assertEqual(self.server.bodies[-1][1:3], (JSON, None))
+        self.assertEqual(self.server.received[0],
+                         ('/telemetry/', self.large))
@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from app import capture
+
+
+class CaptureTests(TestCase):
+    FRAMES = [(1000, b'7530,400\r\n'), (2000, b'\xff\xfe\n'),
+              (500000000, b'7531,401\n')]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'data.cap')
+
+    def write_frames(self, frames, **kwargs):
+        with capture.CaptureWriter(self.path, **kwargs) as writer:
+            for timestamp, data in frames:
+                writer.write_frame(data, timestamp)
+
+    def read_frames(self):
+        with capture.CaptureReader(self.path) as reader:
+            return list(reader)
+
+    def test_round_trip(self):
+        """Test that the frames are read back unchanged"""
+        for fsync in capture.FSYNC_POLICIES:
+            self.path = os.path.join(self.dir, fsync)
+            self.write_frames(self.FRAMES, fsync=fsync)
+            self.assertTrue(capture.is_capture(self.path))
+            self.assertEqual(self.read_frames(), self.FRAMES)
+
+    def test_batching(self):
+        """Test that the frames are written in batches"""
+        writer = capture.CaptureWriter(self.path, batch_size=100,
+                                       flush_interval=60)
+        self.addCleanup(writer.close)
+        size = os.path.getsize(self.path)
+        writer.write_frame(b'7530,400\n')
+        self.assertEqual(os.path.getsize(self.path), size)
+        writer.write_frame(b'x' * 100)
+        self.assertGreater(os.path.getsize(self.path), size)
+
+    def test_append(self):
+        """Test appending to an existing capture"""
+        self.write_frames(self.FRAMES[:1])
+        self.write_frames(self.FRAMES[1:])
+        self.assertEqual(self.read_frames(), self.FRAMES)
+
+    def test_truncated(self):
+        """Test that a frame truncated at the end of the file is ignored"""
+        self.write_frames(self.FRAMES)
+        with open(self.path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.path) - 3)
+        with self.assertLogs('Capture', 'WARNING'):
+            self.assertEqual(self.read_frames(), self.FRAMES[:2])
+
+    def test_not_capture(self):
+        """Test that other files are rejected"""
+        with open(self.path, 'w') as f:
+            f.write('7530,400\n')
+        self.assertFalse(capture.is_capture(self.path))
+        with self.assertRaises(ValueError):
+            capture.CaptureReader(self.path)
+        with self.assertRaises(ValueError):
+            capture.CaptureWriter(self.path)
+        with self.assertRaises(ValueError):
+            capture.CaptureWriter(self.path + '.cap', fsync='sometimes')
+
+    def test_replay(self):
+        """Test that the replay keeps the original inter-arrival times"""
+        self.write_frames(self.FRAMES)
+        with capture.CaptureReader(self.path) as reader:
+            start = time.monotonic()
+            self.assertEqual(list(reader.replay(2)), self.FRAMES)
+            self.assertGreaterEqual(time.monotonic() - start, 0.25)
+        with capture.CaptureReader(self.path) as reader:
+            start = time.monotonic()
+            self.assertEqual(list(reader.replay(None)), self.FRAMES)
+            self.assertLess(time.monotonic() - start, 0.25)
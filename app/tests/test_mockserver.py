@@ -0,0 +1,103 @@
+import threading
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from app.api import API, APIError, ENCODING_JSON_GZIP
+from app.mockserver import MockAPIServer
+
+
+class MockAPIServerTests(TestCase):
+    def start(self, **kwargs):
+        server = MockAPIServer(keep_records=True, **kwargs)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        api = API()
+        api.set_server_url('http://127.0.0.1:{}'.format(server.server_port))
+        return server, api
+
+    def test_token_auth(self):
+        server, api = self.start(username='user', password='secret')
+        self.assertIsNone(api.obtain_token('user', 'wrong'))
+        token = api.obtain_token('user', 'secret')
+        self.assertEqual(token, server.token)
+
+        with self.assertRaises(APIError) as cm:
+            api.create('/telemetry/', {'value': 1})
+        self.assertEqual(cm.exception.response.status_code, 401)
+        api.set_token(token)
+        api.create('/telemetry/', {'value': 1})
+
+    def test_create(self):
+        """Test that the resources are created with all encodings"""
+        server, api = self.start()
+        api.set_token(server.token)
+        api.create('/kundt/', {'value': '1'})
+        api.set_encoding('/telemetry/', ENCODING_JSON_GZIP)
+        api.gzip_min_size = 0
+        api.create_bulk('/telemetry/', [{'value': 2}, {'value': 3}])
+        self.assertEqual([item['value']
+                          for item in server.records['/telemetry/']], [2, 3])
+        self.assertEqual(server.records['/kundt/'][0]['value'], '1')
+
+        with self.assertRaises(APIError) as cm:
+            api.create_bulk('/kundt/', [{'value': 4}])
+        self.assertEqual(cm.exception.response.status_code, 400)
+        self.assertEqual(server.created['/kundt/'], 1)
+
+    def test_latest(self):
+        """Test that the latest status is returned (204 before any status was
+        created)"""
+        server, api = self.start()
+        api.set_token(server.token)
+        self.assertIsNone(api.get_status())
+        self.assertIsNone(api.get_gsinfo())
+
+        api.create('/status/', {'timestamp': '2016-06-01T12:00:00Z',
+                                'phase': 'launch', 'cansat_online': False})
+        self.assertEqual(api.get_status(),
+                         (datetime(2016, 6, 1, 12, tzinfo=timezone.utc),
+                          'launch', None, False))
+        api.create('/gsinfo/', {'latitude': 50.0, 'longitude': 20.0,
+                                'timezone': 120})
+        timestamp, latitude, longitude, offset = api.get_gsinfo()
+        self.assertEqual((latitude, longitude, offset.to_minutes()),
+                         (50.0, 20.0, 120))
+        self.assertEqual(server.responses[204], 2)
+
+    def test_errors(self):
+        server, api = self.start(error_rate=1)
+        api.set_token(server.token)
+        with self.assertRaises(APIError) as cm:
+            api.create('/gps/', {'value': 1})
+        self.assertEqual(cm.exception.response.status_code, 503)
+        self.assertEqual(server.created['/gps/'], 0)
+
+    def test_throttling(self):
+        server, api = self.start(rate_limit=0.5, burst=2)
+        api.set_token(server.token)
+        api.create('/gps/', {'value': 1})
+        api.create('/gps/', {'value': 2})
+        with self.assertRaises(APIError) as cm:
+            api.create('/gps/', {'value': 3})
+        response = cm.exception.response
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '2')
+
+    def test_throttling_below_one_request(self):
+        """Test that a rate limit below 1 request per second still lets the
+        requests through"""
+        server = MockAPIServer(rate_limit=0.5)
+        self.addCleanup(server.server_close)
+        self.assertEqual(server.burst, 1)
+        self.assertIsNone(server.admit())
+        self.assertEqual(server.admit(), 429)
+        server._refilled_at -= 2
+        self.assertIsNone(server.admit())
+
+    def test_invalid_burst(self):
+        with self.assertRaises(ValueError):
+            MockAPIServer(rate_limit=10, burst=0.5)
@@ -0,0 +1,91 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app import capture
+from app.parser import index
+from app.replay import LocalSinkAPI, replay
+from app.tests.parser import ParserTestCase
+
+
+def telemetry_line(timestamp):
+    return ('S,0,f,e,d,c,{:x},68c2,6448,3295,3d1,7e,fdd3,d,e83d,e6bd,cdb6,'
+            '58c,fcbe,995'.format(timestamp))
+
+
+class ReplayTests(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def write_lines(self, lines):
+        with open(self.path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def test_replay(self):
+        """Test that all lines are parsed and sent to the sink"""
+        self.write_lines([telemetry_line(i * 100) for i in range(50)] +
+                         ['7530,400', 'invalid line'])
+        api = LocalSinkAPI()
+        stats = replay(self.path, api,
+                       probe_start_time=ParserTestCase.TIMESTAMP,
+                       analyzer=False)
+        self.assertEqual(stats.lines_parsed, 51)
+        self.assertEqual(stats.lines_failed, 1)
+        # Kundt's tube data is only passed to the analyzer
+        self.assertEqual(stats.records, 50)
+        self.assertEqual(stats.requests, 50)
+        self.assertEqual(len(stats.latencies), 50)
+        self.assertEqual(api.requests, {'/telemetry/': 50})
+        self.assertTrue(stats.format())
+
+    def test_unterminated_last_line(self):
+        """Test that the last line is parsed without the line terminator"""
+        with open(self.path, 'w') as f:
+            f.write('\n'.join(telemetry_line(i * 100) for i in range(3)))
+        api = LocalSinkAPI()
+        stats = replay(self.path, api,
+                       probe_start_time=ParserTestCase.TIMESTAMP,
+                       analyzer=False)
+        self.assertEqual(stats.lines_parsed, 3)
+        self.assertEqual(api.requests, {'/telemetry/': 3})
+
+    def test_speed(self):
+        """Test that the replay keeps the pace of the data"""
+        self.write_lines([telemetry_line(0), telemetry_line(400)])
+        stats = replay(self.path, LocalSinkAPI(), speed=2,
+                       probe_start_time=ParserTestCase.TIMESTAMP,
+                       analyzer=False)
+        self.assertGreaterEqual(stats.parse_end_time - stats.start_time, 0.2)
+
+    def test_capture(self):
+        """Test replaying a binary capture with its original timing"""
+        os.remove(self.path)
+        with capture.CaptureWriter(self.path) as writer:
+            writer.write_frame(telemetry_line(0).encode() + b'\n', 0)
+            writer.write_frame(b'\xff\xfe\n', 100000000)
+            # The data timestamps are ignored when replaying a capture
+            writer.write_frame(telemetry_line(100000).encode() + b'\r\n',
+                               400000000)
+        stats = replay(self.path, LocalSinkAPI(), speed=2,
+                       probe_start_time=ParserTestCase.TIMESTAMP,
+                       analyzer=False)
+        self.assertEqual(stats.lines_parsed, 2)
+        self.assertEqual(stats.lines_failed, 1)
+        self.assertEqual(stats.requests, 2)
+        elapsed = stats.parse_end_time - stats.start_time
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 10)
+
+    def test_range(self):
+        """Test replaying only the lines from a time range"""
+        self.write_lines([telemetry_line(i * 100) for i in range(50)] +
+                         ['7530,400'])
+        api = LocalSinkAPI()
+        stats = replay(self.path, api,
+                       probe_start_time=ParserTestCase.TIMESTAMP,
+                       analyzer=False, t0=1, t1=2.5)
+        self.addCleanup(os.remove, self.path + index.INDEX_SUFFIX)
+        self.assertEqual(stats.lines_parsed, 15)
+        self.assertEqual(api.requests, {'/telemetry/': 15})
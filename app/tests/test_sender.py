@@ -0,0 +1,454 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest import TestCase
+
+from app.api import API
+from app.sender import PRIORITY_HIGH, PRIORITY_LOW, Sender
+from app.sender.persistentqueue import PersistentRequestQueue
+from app.sender.retry import CircuitBreaker, RetryPolicy
+from app.sender.spool import Spool
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        content_type = self.headers['Content-Type']
+        content_encoding = self.headers['Content-Encoding']
+        with self.server.lock:
+            self.server.bodies.append((self.path, content_type,
+                                       content_encoding, len(body)))
+        if ((content_encoding is not None and
+             content_encoding not in self.server.content_encodings) or
+                content_type not in self.server.content_types):
+            self.respond(415)
+            return
+        if content_encoding == 'gzip':
+            body = gzip.decompress(body)
+        if content_type == 'application/json':
+            data = json.loads(body.decode())
+        else:
+            data = {key: value[0] for key, value in
+                    urllib.parse.parse_qs(body.decode()).items()}
+        with self.server.lock:
+            self.server.received.append((self.path, data))
+            self.server.in_flight[self.path] += 1
+            self.server.max_in_flight[self.path] = max(
+                self.server.max_in_flight[self.path],
+                self.server.in_flight[self.path])
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.in_flight[self.path] -= 1
+            unavailable = self.server.unavailable > 0
+            if unavailable:
+                self.server.unavailable -= 1
+
+        items = data if isinstance(data, list) else [data]
+        if unavailable:
+            status = 503
+        elif ((isinstance(data, list) and
+               self.path not in self.server.bulk_urls) or
+              any(item.get('value') == 'invalid' for item in items)):
+            status = 400
+        else:
+            status = 201
+        self.respond(status)
+
+    def respond(self, status):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """Local HTTP server accepting the requests like the API server does
+
+    Lists of objects are only accepted for the URLs in ``bulk_urls``; objects
+    with ``value`` set to ``'invalid'`` are rejected. Every request takes
+    ``delay`` seconds. The first ``unavailable`` requests get 503 status
+    code. The bodies are accepted in the ``content_types`` and
+    ``content_encodings``; the others get 415 status code.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, bulk_urls, delay=0):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.bulk_urls = bulk_urls
+        self.delay = delay
+        self.unavailable = 0
+        self.content_types = {'application/json',
+                              'application/x-www-form-urlencoded'}
+        self.content_encodings = {'gzip'}
+        self.lock = threading.Lock()
+        self.received = []
+        # (URL, Content-Type, Content-Encoding, size) of the request bodies
+        self.bodies = []
+        # URL -> number of requests being handled (at most)
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+
+
+class RecordingSender(Sender):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.added = []
+        self.processed = []
+        self.errors = []
+        self.retries = []
+        self.superseded = []
+        self.spooled = []
+        self.not_announced = []
+
+    def on_requests_not_announced(self, count, first_id, last_id):
+        self.not_announced.append((count, first_id, last_id))
+
+    def on_request_spooled(self, request_data):
+        self.spooled.append(request_data.data['value'])
+
+    def on_request_superseded(self, request_data):
+        self.superseded.append(request_data.data['value'])
+
+    def on_request_retrying(self, request_data, exception, attempt, delay):
+        self.retries.append((request_data.data['value'], attempt))
+
+    def on_request_added(self, request_data):
+        self.added.append(request_data.data['value'])
+
+    def on_request_processed(self, request_data, skipped):
+        self.processed.append((request_data.data['value'], skipped))
+
+    def on_error(self, request_data, exception, traceback_exception):
+        self.errors.append(request_data.data['value'])
+
+    def get_processed(self, prefix):
+        return [value for value, skipped in self.processed
+                if value.startswith(prefix)]
+
+
+class SenderTests(TestCase):
+    def start(self, batch_size=1, batch_age=0.5, bulk_urls=('/telemetry/',),
+              concurrency=1, delay=0, queue=None, **kwargs):
+        server = StandInServer(bulk_urls, delay)
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+        self.addCleanup(server_thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        api = API()
+        api.set_server_url('http://127.0.0.1:{}'.format(server.server_port))
+        sender = RecordingSender(api, batch_size=batch_size,
+                                 batch_age=batch_age, concurrency=concurrency,
+                                 queue=queue, **kwargs)
+        self.addCleanup(sender.session.close)
+        return server, sender
+
+    def run_sender(self, sender):
+        thread = threading.Thread(target=sender.process_indefinitely)
+        thread.start()
+
+        def stop():
+            sender.set_terminated()
+            thread.join()
+        self.addCleanup(stop)
+
+    def wait_for(self, condition):
+        for _ in range(500):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail('Timed out')
+
+    def add_requests(self, sender, url, values, **kwargs):
+        for value in values:
+            sender.add_request('Test', url, {'value': value},
+                               append_timestamp=False, **kwargs)
+
+    def test_single(self):
+        """Test sending one request at a time"""
+        server, sender = self.start()
+        callback_count = []
+        self.add_requests(sender, '/telemetry/', ['1', '2'],
+                          callback=lambda: callback_count.append(1))
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 2)
+        self.assertEqual(server.received, [('/telemetry/', {'value': '1'}),
+                                           ('/telemetry/', {'value': '2'})])
+        self.assertEqual(len(callback_count), 2)
+        self.assertEqual(len(sender), 0)
+
+    def test_batch(self):
+        """Test combining the requests to the same URL"""
+        server, sender = self.start(batch_size=4, batch_age=0)
+        values = [str(i) for i in range(10)]
+        self.add_requests(sender, '/telemetry/', values)
+        self.add_requests(sender, '/kundt/', ['k'])
+        self.assertEqual(len(sender), 11)
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 11)
+
+        bulk = [data for url, data in server.received if url == '/telemetry/']
+        self.assertEqual(bulk, [[{'value': value} for value in values[:4]],
+                                [{'value': value} for value in values[4:8]],
+                                [{'value': value} for value in values[8:]]])
+        self.assertIn(('/kundt/', {'value': 'k'}), server.received)
+        self.assertEqual(sorted(sender.processed),
+                         sorted((value, False) for value in values + ['k']))
+
+    def test_add_while_locked(self):
+        """Test that adding requests does not wait for the lock holder"""
+        server, sender = self.start()
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with sender.lock:
+                locked.set()
+                release.wait(5)
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        locked.wait()
+        start = time.monotonic()
+        self.add_requests(sender, '/telemetry/', ['1', '2', '3'])
+        elapsed = time.monotonic() - start
+        release.set()
+        holder.join()
+        self.assertLess(elapsed, 1)
+        self.assertEqual(len(sender), 3)
+        self.assertEqual(sender.added, ['1', '2', '3'])
+
+        self.run_sender(sender)
+        self.add_requests(sender, '/telemetry/', ['4'])
+        self.wait_for(lambda: len(sender.processed) == 4)
+        self.assertEqual(sender.get_processed(''), ['1', '2', '3', '4'])
+
+    def test_batch_age(self):
+        """Test that the requests wait for a batch up to batch_age"""
+        server, sender = self.start(batch_size=100, batch_age=0.2)
+        self.run_sender(sender)
+        start = time.monotonic()
+        self.add_requests(sender, '/telemetry/', ['1', '2', '3'])
+        self.wait_for(lambda: len(sender.processed) == 3)
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual(server.received, [
+            ('/telemetry/', [{'value': '1'}, {'value': '2'}, {'value': '3'}])
+        ])
+
+    def test_rejected(self):
+        """Test that the errors are attributed to particular requests"""
+        server, sender = self.start(batch_size=10, batch_age=0)
+        self.add_requests(sender, '/telemetry/', ['1', 'invalid', '3'])
+        self.run_sender(sender)
+        self.wait_for(lambda: sender.paused)
+        self.assertEqual(sender.errors, ['invalid'])
+        self.assertEqual(sender.processed, [('1', False)])
+
+        sender.set_skip_current()
+        sender.paused = False
+        self.wait_for(lambda: len(sender.processed) == 3)
+        self.assertEqual(sender.processed,
+                         [('1', False), ('invalid', True), ('3', False)])
+        self.assertEqual(len(sender), 0)
+
+    def test_concurrency(self):
+        """Test sending to different URLs at the same time"""
+        server, sender = self.start(concurrency=3, delay=0.1)
+        urls = ['/telemetry/', '/gps/', '/planetarydata/']
+        for i in range(4):
+            for url in urls:
+                self.add_requests(sender, url, [url + str(i)])
+        start = time.monotonic()
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 12)
+        self.assertEqual(len(sender), 0)
+
+        # The URLs don't block each other...
+        self.assertLess(time.monotonic() - start, 1.1)
+        for url in urls:
+            # ...but the requests to every URL are sent one at a time, in
+            # order
+            self.assertEqual(server.max_in_flight[url], 1)
+            self.assertEqual(sender.get_processed(url),
+                             [url + str(i) for i in range(4)])
+
+    def test_concurrency_skip(self):
+        """Test that the failed request is skipped, not a concurrent one"""
+        server, sender = self.start(concurrency=2, delay=0.05)
+        self.add_requests(sender, '/gps/', ['invalid', 'g1'])
+        self.add_requests(sender, '/telemetry/',
+                          [str(i) for i in range(5)])
+        self.run_sender(sender)
+        self.wait_for(lambda: sender.paused)
+        self.assertEqual(sender.errors, ['invalid'])
+
+        sender.set_skip_current()
+        sender.paused = False
+        self.wait_for(lambda: len(sender.processed) == 7)
+        self.assertIn(('invalid', True), sender.processed)
+        self.assertEqual([value for value, skipped in sender.processed
+                          if skipped], ['invalid'])
+
+    def test_persistent_queue(self):
+        """Test sending the requests restored from the previous run"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'queue.db')
+
+        server, sender = self.start(queue=PersistentRequestQueue(path))
+        self.add_requests(sender, '/telemetry/', ['1', '2'])
+        self.add_requests(sender, '/kundt/', ['3'])
+        sender.queue.close()
+
+        server, sender = self.start(queue=PersistentRequestQueue(path))
+        self.addCleanup(sender.queue.close)
+        sender.announce_queued_requests(limit=2)
+        self.assertEqual(sender.not_announced, [(1, 3, 3)])
+        self.assertEqual(len(sender), 3)
+        self.run_sender(sender)
+        self.add_requests(sender, '/telemetry/', ['4'])
+        self.wait_for(lambda: len(sender.processed) == 4)
+        self.assertEqual(sender.added, ['1', '2', '4'])
+        self.assertEqual(sender.get_processed(''), ['1', '2', '3', '4'])
+        self.wait_for(lambda: len(sender) == 0)
+        self.assertEqual(len(sender.queue), 0)
+
+    def test_retry(self):
+        """Test that transient errors are retried without pausing"""
+        server, sender = self.start(
+            retry_policy=RetryPolicy(base_delay=0.01),
+            circuit_breaker=CircuitBreaker(failure_threshold=10))
+        server.unavailable = 2
+        self.add_requests(sender, '/telemetry/', ['1', '2'])
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 2)
+        self.assertEqual(sender.retries, [('1', 1), ('1', 2)])
+        self.assertEqual(sender.errors, [])
+        self.assertFalse(sender.paused)
+        self.assertEqual(len(server.received), 4)
+
+    def test_metrics(self):
+        server, sender = self.start(
+            batch_size=2, batch_age=0,
+            retry_policy=RetryPolicy(base_delay=0.01),
+            circuit_breaker=CircuitBreaker(failure_threshold=10))
+        server.unavailable = 1
+        self.add_requests(sender, '/telemetry/', ['1', '2'])
+        self.add_requests(sender, '/kundt/', ['k'])
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 3)
+
+        snapshot = sender.get_metrics()
+        self.assertEqual(snapshot.queue_depth, [(snapshot.time, 0)])
+        telemetry = snapshot.endpoints['/telemetry/']
+        kundt = snapshot.endpoints['/kundt/']
+        self.assertEqual((telemetry.requests, kundt.requests), (2, 1))
+        self.assertEqual(telemetry.http_requests + kundt.http_requests, 3)
+        self.assertEqual(telemetry.failures + kundt.failures, 1)
+        self.assertEqual(telemetry.retries + kundt.retries, 1)
+        self.assertEqual(telemetry.bytes_sent,
+                         sum(size for url, content_type, encoding, size
+                             in server.bodies if url == '/telemetry/'))
+        self.assertEqual(telemetry.queue_wait.count, 2)
+        self.assertEqual(kundt.total_time.count, 1)
+        self.assertGreaterEqual(kundt.total_time.p50,
+                                kundt.response_time.p50)
+
+    def test_circuit_breaker(self):
+        """Test that the requests are held back while the server is down"""
+        server, sender = self.start(
+            retry_policy=RetryPolicy(base_delay=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=2,
+                                           reset_timeout=0.2))
+        server.unavailable = 3
+        self.add_requests(sender, '/telemetry/', ['t'])
+        self.add_requests(sender, '/kundt/', ['k'])
+        start = time.monotonic()
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 2)
+
+        # Two failures open the breaker; the probe fails, so the next one is
+        # sent after twice as long
+        self.assertGreaterEqual(time.monotonic() - start, 0.6)
+        self.assertEqual(len(server.received), 5)
+        self.assertEqual(sender.circuit_breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(sender.errors, [])
+
+    def test_spool(self):
+        """Test that the requests are spooled during an outage and sent with
+        bulk requests when the server is back"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        server, sender = self.start(
+            retry_policy=RetryPolicy(base_delay=0.05),
+            circuit_breaker=CircuitBreaker(failure_threshold=100),
+            spool=Spool(directory, spool_after=0))
+        server.unavailable = 10 ** 6
+        self.add_requests(sender, '/telemetry/', ['1'])
+        self.run_sender(sender)
+        self.wait_for(lambda: sender.retries)
+
+        self.add_requests(sender, '/telemetry/', ['2', '3', '4'])
+        self.add_requests(sender, '/kundt/', ['k'])
+        self.add_requests(sender, '/status/', ['s'], priority=PRIORITY_HIGH)
+        self.assertEqual(sender.spooled, ['2', '3', '4', 'k'])
+        self.assertEqual(len(sender), 2)
+
+        server.unavailable = 0
+        self.wait_for(lambda: len(sender.spool) == 0 and
+                      len(sender.processed) == 2)
+        self.add_requests(sender, '/telemetry/', ['5'])
+        self.wait_for(lambda: len(sender.processed) == 3)
+        self.assertFalse(sender.spooling)
+        self.assertIn(('/telemetry/', [{'value': '2'}, {'value': '3'},
+                                       {'value': '4'}]), server.received)
+        self.assertIn(('/kundt/', {'value': 'k'}), server.received)
+        self.assertEqual(sender.get_processed(''), ['1', 's', '5'])
+        self.assertEqual(sender.spool.sent, 4)
+
+    def test_priority(self):
+        """Test that the requests with higher priority are sent first"""
+        server, sender = self.start()
+        self.add_requests(sender, '/telemetry/', ['1', '2'])
+        sender.add_request('MissionStatus', '/status/', {'value': 's'},
+                           append_timestamp=False)
+        self.add_requests(sender, '/kundt/', ['k'], priority=PRIORITY_LOW)
+        self.add_requests(sender, '/gps/', ['g'])
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 5)
+        self.assertEqual(sender.get_processed(''), ['s', '1', '2', 'g', 'k'])
+
+    def test_supersede(self):
+        """Test replacing pending requests with newer ones"""
+        server, sender = self.start()
+        self.add_requests(sender, '/telemetry/', ['1'])
+        self.add_requests(sender, '/planetarydata/', ['p1', 'p2'],
+                          supersede_key='planetarydata')
+        self.add_requests(sender, '/telemetry/', ['2'])
+        self.add_requests(sender, '/planetarydata/', ['p3'],
+                          supersede_key='planetarydata')
+        self.assertEqual(len(sender), 3)
+        self.assertEqual(sender.added, ['1', 'p1', '2'])
+        self.assertEqual(sender.superseded, ['p2', 'p3'])
+
+        self.run_sender(sender)
+        self.wait_for(lambda: len(sender.processed) == 3)
+        # The replaced request keeps its place
+        self.assertEqual(sender.get_processed(''), ['1', 'p3', '2'])
+        self.add_requests(sender, '/planetarydata/', ['p4'],
+                          supersede_key='planetarydata')
+        self.wait_for(lambda: len(sender.processed) == 4)
+        self.assertEqual(server.received[-1],
+                         ('/planetarydata/', {'value': 'p4'}))
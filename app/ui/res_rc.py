@@ -0,0 +1,1071 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\x6c\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x31\x2e\x39\x39\x20\x32\x43\x36\x2e\x34\x37\x20\x32\x20\x32\
+\x20\x36\x2e\x34\x38\x20\x32\x20\x31\x32\x73\x34\x2e\x34\x37\x20\
+\x31\x30\x20\x39\x2e\x39\x39\x20\x31\x30\x43\x31\x37\x2e\x35\x32\
+\x20\x32\x32\x20\x32\x32\x20\x31\x37\x2e\x35\x32\x20\x32\x32\x20\
+\x31\x32\x53\x31\x37\x2e\x35\x32\x20\x32\x20\x31\x31\x2e\x39\x39\
+\x20\x32\x7a\x4d\x31\x32\x20\x32\x30\x63\x2d\x34\x2e\x34\x32\x20\
+\x30\x2d\x38\x2d\x33\x2e\x35\x38\x2d\x38\x2d\x38\x73\x33\x2e\x35\
+\x38\x2d\x38\x20\x38\x2d\x38\x20\x38\x20\x33\x2e\x35\x38\x20\x38\
+\x20\x38\x2d\x33\x2e\x35\x38\x20\x38\x2d\x38\x20\x38\x7a\x22\x2f\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\
+\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\x20\x20\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x2e\x35\x20\x37\
+\x48\x31\x31\x76\x36\x6c\x35\x2e\x32\x35\x20\x33\x2e\x31\x35\x2e\
+\x37\x35\x2d\x31\x2e\x32\x33\x2d\x34\x2e\x35\x2d\x32\x2e\x36\x37\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x6e\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x37\x2e\x36\x35\x20\x36\x2e\x33\x35\x43\x31\x36\x2e\x32\x20\
+\x34\x2e\x39\x20\x31\x34\x2e\x32\x31\x20\x34\x20\x31\x32\x20\x34\
+\x63\x2d\x34\x2e\x34\x32\x20\x30\x2d\x37\x2e\x39\x39\x20\x33\x2e\
+\x35\x38\x2d\x37\x2e\x39\x39\x20\x38\x73\x33\x2e\x35\x37\x20\x38\
+\x20\x37\x2e\x39\x39\x20\x38\x63\x33\x2e\x37\x33\x20\x30\x20\x36\
+\x2e\x38\x34\x2d\x32\x2e\x35\x35\x20\x37\x2e\x37\x33\x2d\x36\x68\
+\x2d\x32\x2e\x30\x38\x63\x2d\x2e\x38\x32\x20\x32\x2e\x33\x33\x2d\
+\x33\x2e\x30\x34\x20\x34\x2d\x35\x2e\x36\x35\x20\x34\x2d\x33\x2e\
+\x33\x31\x20\x30\x2d\x36\x2d\x32\x2e\x36\x39\x2d\x36\x2d\x36\x73\
+\x32\x2e\x36\x39\x2d\x36\x20\x36\x2d\x36\x63\x31\x2e\x36\x36\x20\
+\x30\x20\x33\x2e\x31\x34\x2e\x36\x39\x20\x34\x2e\x32\x32\x20\x31\
+\x2e\x37\x38\x4c\x31\x33\x20\x31\x31\x68\x37\x56\x34\x6c\x2d\x32\
+\x2e\x33\x35\x20\x32\x2e\x33\x35\x7a\x22\x2f\x3e\x0a\x20\x20\x20\
+\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\
+\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\
+\x6f\x6e\x65\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xc7\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x30\x20\x32\x30\x76\x2d\x36\x68\x34\x76\x36\x68\x35\x76\x2d\
+\x38\x68\x33\x4c\x31\x32\x20\x33\x20\x32\x20\x31\x32\x68\x33\x76\
+\x38\x7a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x35\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\
+\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\x20\x20\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x31\x20\x33\x2e\x30\
+\x31\x48\x33\x63\x2d\x31\x2e\x31\x20\x30\x2d\x32\x20\x2e\x39\x2d\
+\x32\x20\x32\x56\x39\x68\x32\x56\x34\x2e\x39\x39\x68\x31\x38\x76\
+\x31\x34\x2e\x30\x33\x48\x33\x56\x31\x35\x48\x31\x76\x34\x2e\x30\
+\x31\x63\x30\x20\x31\x2e\x31\x2e\x39\x20\x31\x2e\x39\x38\x20\x32\
+\x20\x31\x2e\x39\x38\x68\x31\x38\x63\x31\x2e\x31\x20\x30\x20\x32\
+\x2d\x2e\x38\x38\x20\x32\x2d\x31\x2e\x39\x38\x76\x2d\x31\x34\x63\
+\x30\x2d\x31\x2e\x31\x31\x2d\x2e\x39\x2d\x32\x2d\x32\x2d\x32\x7a\
+\x4d\x31\x31\x20\x31\x36\x6c\x34\x2d\x34\x2d\x34\x2d\x34\x76\x33\
+\x48\x31\x76\x32\x68\x31\x30\x76\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\
+\x00\x00\x02\xa1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
+\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
+\x6e\x6f\x22\x3f\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\
+\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\
+\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\
+\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\
+\x6e\x73\x3a\x63\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\
+\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\
+\x67\x2f\x6e\x73\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
+\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\
+\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\
+\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\
+\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\
+\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x0a\x20\x20\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x32\x22\x0a\
+\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x0a\x20\x20\
+\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\
+\x20\x32\x34\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x32\x34\x22\x0a\x20\x20\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\
+\x30\x30\x30\x30\x22\x3e\x0a\x20\x20\x3c\x64\x65\x66\x73\x0a\x20\
+\x20\x20\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x31\x30\x22\x20\
+\x2f\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\
+\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x23\x35\x66\x35\
+\x66\x35\x66\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x31\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\
+\x68\x34\x22\x0a\x20\x20\x20\x20\x20\x64\x3d\x22\x4d\x31\x39\x20\
+\x36\x2e\x34\x31\x4c\x31\x37\x2e\x35\x39\x20\x35\x20\x31\x32\x20\
+\x31\x30\x2e\x35\x39\x20\x36\x2e\x34\x31\x20\x35\x20\x35\x20\x36\
+\x2e\x34\x31\x20\x31\x30\x2e\x35\x39\x20\x31\x32\x20\x35\x20\x31\
+\x37\x2e\x35\x39\x20\x36\x2e\x34\x31\x20\x31\x39\x20\x31\x32\x20\
+\x31\x33\x2e\x34\x31\x20\x31\x37\x2e\x35\x39\x20\x31\x39\x20\x31\
+\x39\x20\x31\x37\x2e\x35\x39\x20\x31\x33\x2e\x34\x31\x20\x31\x32\
+\x7a\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\x20\x20\
+\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\x36\x22\x0a\x20\x20\
+\x20\x20\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x0a\x20\
+\x20\x20\x20\x20\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\x34\x76\x32\
+\x34\x48\x30\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x04\x27\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\
+\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x64\x3d\x22\x4d\x30\x20\x30\
+\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x2f\x3e\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x31\x30\x20\x32\x63\x2d\x2e\x32\x35\x20\
+\x30\x2d\x2e\x34\x36\x2e\x31\x38\x2d\x2e\x34\x39\x2e\x34\x32\x6c\
+\x2d\x2e\x33\x38\x20\x32\x2e\x36\x35\x63\x2d\x2e\x33\x35\x35\x2e\
+\x31\x34\x36\x2d\x2e\x36\x39\x2e\x33\x33\x2d\x31\x2e\x30\x31\x33\
+\x2e\x35\x32\x38\x6c\x33\x2e\x30\x31\x38\x20\x33\x2e\x30\x32\x33\
+\x63\x2e\x32\x37\x38\x2d\x2e\x30\x37\x2e\x35\x36\x35\x2d\x2e\x31\
+\x32\x2e\x38\x36\x35\x2d\x2e\x31\x32\x20\x31\x2e\x39\x33\x20\x30\
+\x20\x33\x2e\x35\x20\x31\x2e\x35\x37\x20\x33\x2e\x35\x20\x33\x2e\
+\x35\x20\x30\x20\x2e\x33\x30\x33\x2d\x2e\x30\x35\x2e\x35\x39\x32\
+\x2d\x2e\x31\x32\x33\x2e\x38\x37\x33\x6c\x34\x2e\x38\x35\x35\x20\
+\x34\x2e\x38\x36\x37\x20\x31\x2e\x34\x32\x38\x2d\x32\x2e\x34\x37\
+\x63\x2e\x31\x32\x2d\x2e\x32\x32\x2e\x30\x37\x2d\x2e\x34\x39\x2d\
+\x2e\x31\x32\x2d\x2e\x36\x34\x6c\x2d\x32\x2e\x31\x31\x2d\x31\x2e\
+\x36\x35\x63\x2e\x30\x34\x2d\x2e\x33\x32\x2e\x30\x37\x2d\x2e\x36\
+\x34\x2e\x30\x37\x2d\x2e\x39\x38\x20\x30\x2d\x2e\x33\x34\x2d\x2e\
+\x30\x33\x2d\x2e\x36\x36\x2d\x2e\x30\x37\x2d\x2e\x39\x38\x6c\x32\
+\x2e\x31\x31\x2d\x31\x2e\x36\x35\x63\x2e\x31\x39\x2d\x2e\x31\x35\
+\x2e\x32\x34\x2d\x2e\x34\x32\x2e\x31\x32\x2d\x2e\x36\x34\x6c\x2d\
+\x32\x2d\x33\x2e\x34\x36\x63\x2d\x2e\x31\x32\x2d\x2e\x32\x32\x2d\
+\x2e\x33\x39\x2d\x2e\x33\x2d\x2e\x36\x31\x2d\x2e\x32\x32\x6c\x2d\
+\x32\x2e\x34\x39\x20\x31\x63\x2d\x2e\x35\x32\x2d\x2e\x34\x2d\x31\
+\x2e\x30\x38\x2d\x2e\x37\x33\x2d\x31\x2e\x36\x39\x2d\x2e\x39\x38\
+\x6c\x2d\x2e\x33\x38\x2d\x32\x2e\x36\x35\x43\x31\x34\x2e\x34\x36\
+\x20\x32\x2e\x31\x38\x20\x31\x34\x2e\x32\x35\x20\x32\x20\x31\x34\
+\x20\x32\x68\x2d\x34\x7a\x4d\x34\x2e\x37\x37\x35\x20\x35\x2e\x30\
+\x31\x36\x63\x2d\x2e\x31\x37\x35\x2d\x2e\x30\x30\x33\x2d\x2e\x33\
+\x34\x35\x2e\x30\x39\x2d\x2e\x34\x33\x35\x2e\x32\x35\x34\x6c\x2d\
+\x32\x20\x33\x2e\x34\x36\x63\x2d\x2e\x31\x33\x2e\x32\x32\x2d\x2e\
+\x30\x37\x2e\x34\x39\x2e\x31\x32\x2e\x36\x34\x6c\x32\x2e\x31\x31\
+\x20\x31\x2e\x36\x35\x63\x2d\x2e\x30\x34\x2e\x33\x32\x2d\x2e\x30\
+\x37\x2e\x36\x35\x2d\x2e\x30\x37\x2e\x39\x38\x20\x30\x20\x2e\x33\
+\x33\x2e\x30\x33\x2e\x36\x36\x2e\x30\x37\x2e\x39\x38\x6c\x2d\x32\
+\x2e\x31\x31\x20\x31\x2e\x36\x35\x63\x2d\x2e\x31\x39\x2e\x31\x35\
+\x2d\x2e\x32\x34\x2e\x34\x32\x2d\x2e\x31\x32\x2e\x36\x34\x6c\x32\
+\x20\x33\x2e\x34\x36\x63\x2e\x31\x32\x2e\x32\x32\x2e\x33\x39\x2e\
+\x33\x2e\x36\x31\x2e\x32\x32\x6c\x32\x2e\x34\x39\x2d\x31\x63\x2e\
+\x35\x32\x2e\x34\x20\x31\x2e\x30\x38\x2e\x37\x33\x20\x31\x2e\x36\
+\x39\x2e\x39\x38\x6c\x2e\x33\x38\x20\x32\x2e\x36\x35\x63\x2e\x30\
+\x33\x2e\x32\x34\x2e\x32\x34\x2e\x34\x32\x2e\x34\x39\x2e\x34\x32\
+\x68\x34\x63\x2e\x32\x35\x20\x30\x20\x2e\x34\x36\x2d\x2e\x31\x38\
+\x2e\x34\x39\x2d\x2e\x34\x32\x6c\x2e\x33\x38\x2d\x32\x2e\x36\x35\
+\x63\x2e\x36\x31\x2d\x2e\x32\x35\x20\x31\x2e\x31\x37\x2d\x2e\x35\
+\x39\x20\x31\x2e\x36\x39\x2d\x2e\x39\x38\x6c\x32\x2e\x33\x35\x2e\
+\x39\x34\x33\x2d\x34\x2e\x34\x32\x34\x2d\x34\x2e\x34\x33\x34\x63\
+\x2d\x2e\x36\x33\x34\x2e\x36\x34\x2d\x31\x2e\x35\x31\x34\x20\x31\
+\x2e\x30\x34\x2d\x32\x2e\x34\x38\x36\x20\x31\x2e\x30\x34\x2d\x31\
+\x2e\x39\x33\x20\x30\x2d\x33\x2e\x35\x2d\x31\x2e\x35\x37\x2d\x33\
+\x2e\x35\x2d\x33\x2e\x35\x20\x30\x2d\x2e\x39\x37\x35\x2e\x34\x30\
+\x32\x2d\x31\x2e\x38\x35\x37\x20\x31\x2e\x30\x34\x37\x2d\x32\x2e\
+\x34\x39\x32\x4c\x35\x2e\x32\x20\x35\x2e\x31\x35\x32\x6c\x2d\x2e\
+\x32\x35\x2d\x2e\x31\x63\x2d\x2e\x30\x35\x38\x2d\x2e\x30\x32\x34\
+\x2d\x2e\x31\x31\x36\x2d\x2e\x30\x33\x36\x2d\x2e\x31\x37\x35\x2d\
+\x2e\x30\x33\x36\x7a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x2e\x36\x33\x36\x20\x31\x2e\x38\x33\
+\x6c\x32\x31\x2e\x35\x30\x38\x20\x32\x31\x2e\x35\x36\x22\x20\x66\
+\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\
+\x65\x3d\x22\x23\x30\x30\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\
+\x77\x69\x64\x74\x68\x3d\x22\x31\x2e\x37\x35\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x05\x4a\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\
+\x34\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\
+\x32\x34\x20\x32\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\
+\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\x20\x20\x20\
+\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x32\x2e\x31\x31\
+\x37\x20\x31\x38\x2e\x38\x36\x35\x63\x2e\x30\x32\x2d\x2e\x31\x35\
+\x38\x2e\x30\x33\x34\x2d\x2e\x33\x31\x36\x2e\x30\x33\x34\x2d\x2e\
+\x34\x38\x34\x20\x30\x2d\x2e\x31\x36\x37\x2d\x2e\x30\x31\x33\x2d\
+\x2e\x33\x32\x36\x2d\x2e\x30\x33\x33\x2d\x2e\x34\x38\x34\x6c\x31\
+\x2e\x30\x34\x33\x2d\x2e\x38\x31\x35\x61\x2e\x32\x35\x2e\x32\x35\
+\x20\x30\x20\x30\x20\x30\x20\x2e\x30\x36\x2d\x2e\x33\x31\x36\x6c\
+\x2d\x2e\x39\x39\x2d\x31\x2e\x37\x31\x61\x2e\x32\x34\x38\x2e\x32\
+\x34\x38\x20\x30\x20\x30\x20\x30\x2d\x2e\x33\x2d\x2e\x31\x31\x6c\
+\x2d\x31\x2e\x32\x33\x32\x2e\x34\x39\x35\x61\x33\x2e\x36\x31\x32\
+\x20\x33\x2e\x36\x31\x32\x20\x30\x20\x30\x20\x30\x2d\x2e\x38\x33\
+\x35\x2d\x2e\x34\x38\x35\x6c\x2d\x2e\x31\x38\x38\x2d\x31\x2e\x33\
+\x31\x61\x2e\x32\x34\x2e\x32\x34\x20\x30\x20\x30\x20\x30\x2d\x2e\
+\x32\x34\x32\x2d\x2e\x32\x30\x37\x68\x2d\x31\x2e\x39\x37\x38\x61\
+\x2e\x32\x34\x2e\x32\x34\x20\x30\x20\x30\x20\x30\x2d\x2e\x32\x34\
+\x32\x2e\x32\x30\x37\x6c\x2d\x2e\x31\x38\x38\x20\x31\x2e\x33\x31\
+\x61\x33\x2e\x37\x39\x38\x20\x33\x2e\x37\x39\x38\x20\x30\x20\x30\
+\x20\x30\x2d\x2e\x38\x33\x35\x2e\x34\x38\x35\x6c\x2d\x31\x2e\x32\
+\x33\x2d\x2e\x34\x39\x35\x61\x2e\x32\x34\x2e\x32\x34\x20\x30\x20\
+\x30\x20\x30\x2d\x2e\x33\x30\x32\x2e\x31\x31\x6c\x2d\x2e\x39\x39\
+\x20\x31\x2e\x37\x31\x61\x2e\x32\x34\x34\x2e\x32\x34\x34\x20\x30\
+\x20\x30\x20\x30\x20\x2e\x30\x36\x2e\x33\x31\x36\x6c\x31\x2e\x30\
+\x34\x33\x2e\x38\x31\x36\x61\x33\x2e\x39\x32\x20\x33\x2e\x39\x32\
+\x20\x30\x20\x30\x20\x30\x2d\x2e\x30\x33\x33\x2e\x34\x38\x35\x63\
+\x30\x20\x2e\x31\x36\x34\x2e\x30\x31\x35\x2e\x33\x32\x37\x2e\x30\
+\x33\x34\x2e\x34\x38\x35\x6c\x2d\x31\x2e\x30\x34\x32\x2e\x38\x31\
+\x36\x61\x2e\x32\x35\x2e\x32\x35\x20\x30\x20\x30\x20\x30\x2d\x2e\
+\x30\x36\x2e\x33\x31\x37\x6c\x2e\x39\x39\x20\x31\x2e\x37\x31\x63\
+\x2e\x30\x36\x2e\x31\x31\x2e\x31\x39\x32\x2e\x31\x35\x2e\x33\x2e\
+\x31\x31\x6c\x31\x2e\x32\x33\x32\x2d\x2e\x34\x39\x35\x63\x2e\x32\
+\x35\x37\x2e\x31\x39\x38\x2e\x35\x33\x34\x2e\x33\x36\x2e\x38\x33\
+\x35\x2e\x34\x38\x34\x6c\x2e\x31\x38\x38\x20\x31\x2e\x33\x31\x61\
+\x2e\x32\x34\x2e\x32\x34\x20\x30\x20\x30\x20\x30\x20\x2e\x32\x34\
+\x32\x2e\x32\x30\x38\x68\x31\x2e\x39\x37\x38\x61\x2e\x32\x34\x2e\
+\x32\x34\x20\x30\x20\x30\x20\x30\x20\x2e\x32\x34\x32\x2d\x2e\x32\
+\x30\x38\x6c\x2e\x31\x38\x38\x2d\x31\x2e\x33\x31\x63\x2e\x33\x2d\
+\x2e\x31\x32\x33\x2e\x35\x37\x38\x2d\x2e\x32\x39\x2e\x38\x33\x35\
+\x2d\x2e\x34\x38\x34\x6c\x31\x2e\x32\x33\x2e\x34\x39\x34\x61\x2e\
+\x32\x34\x2e\x32\x34\x20\x30\x20\x30\x20\x30\x20\x2e\x33\x30\x32\
+\x2d\x2e\x31\x31\x6c\x2e\x39\x39\x2d\x31\x2e\x37\x31\x61\x2e\x32\
+\x35\x2e\x32\x35\x20\x30\x20\x30\x20\x30\x2d\x2e\x30\x36\x2d\x2e\
+\x33\x31\x35\x6c\x2d\x31\x2e\x30\x34\x33\x2d\x2e\x38\x31\x35\x7a\
+\x6d\x2d\x33\x2e\x36\x37\x33\x20\x31\x2e\x32\x34\x36\x63\x2d\x2e\
+\x39\x35\x34\x20\x30\x2d\x31\x2e\x37\x33\x2d\x2e\x37\x37\x35\x2d\
+\x31\x2e\x37\x33\x2d\x31\x2e\x37\x33\x20\x30\x2d\x2e\x39\x35\x33\
+\x2e\x37\x37\x36\x2d\x31\x2e\x37\x33\x20\x31\x2e\x37\x33\x2d\x31\
+\x2e\x37\x33\x73\x31\x2e\x37\x33\x2e\x37\x37\x37\x20\x31\x2e\x37\
+\x33\x20\x31\x2e\x37\x33\x63\x30\x20\x2e\x39\x35\x35\x2d\x2e\x37\
+\x37\x36\x20\x31\x2e\x37\x33\x2d\x31\x2e\x37\x33\x20\x31\x2e\x37\
+\x33\x7a\x4d\x33\x37\x2e\x34\x30\x32\x20\x38\x2e\x36\x32\x61\x33\
+\x2e\x32\x36\x36\x20\x33\x2e\x32\x36\x36\x20\x30\x20\x30\x20\x30\
+\x20\x30\x20\x36\x2e\x35\x33\x20\x33\x2e\x32\x36\x36\x20\x33\x2e\
+\x32\x36\x36\x20\x30\x20\x30\x20\x30\x20\x30\x2d\x36\x2e\x35\x33\
+\x7a\x6d\x2d\x2e\x33\x32\x36\x20\x34\x2e\x35\x37\x68\x2d\x2e\x36\
+\x35\x33\x76\x2d\x32\x2e\x36\x31\x68\x2e\x36\x35\x33\x76\x32\x2e\
+\x36\x31\x7a\x6d\x31\x2e\x33\x30\x36\x20\x30\x68\x2d\x2e\x36\x35\
+\x33\x76\x2d\x32\x2e\x36\x31\x68\x2e\x36\x35\x32\x76\x32\x2e\x36\
+\x31\x7a\x4d\x32\x36\x2e\x34\x32\x35\x20\x32\x31\x2e\x32\x34\x68\
+\x2e\x36\x32\x76\x2d\x32\x2e\x34\x38\x68\x2d\x2e\x36\x32\x76\x32\
+\x2e\x34\x38\x7a\x6d\x2e\x39\x33\x2d\x34\x2e\x33\x34\x33\x61\x33\
+\x2e\x31\x30\x35\x20\x33\x2e\x31\x30\x35\x20\x30\x20\x30\x20\x30\
+\x20\x30\x20\x36\x2e\x32\x30\x36\x20\x33\x2e\x31\x30\x35\x20\x33\
+\x2e\x31\x30\x35\x20\x30\x20\x30\x20\x30\x20\x30\x2d\x36\x2e\x32\
+\x30\x36\x7a\x6d\x30\x20\x35\x2e\x35\x38\x36\x41\x32\x2e\x34\x38\
+\x36\x20\x32\x2e\x34\x38\x36\x20\x30\x20\x30\x20\x31\x20\x32\x34\
+\x2e\x38\x37\x36\x20\x32\x30\x61\x32\x2e\x34\x38\x36\x20\x32\x2e\
+\x34\x38\x36\x20\x30\x20\x30\x20\x31\x20\x32\x2e\x34\x38\x2d\x32\
+\x2e\x34\x38\x33\x41\x32\x2e\x34\x38\x36\x20\x32\x2e\x34\x38\x36\
+\x20\x30\x20\x30\x20\x31\x20\x32\x39\x2e\x38\x34\x20\x32\x30\x61\
+\x32\x2e\x34\x38\x36\x20\x32\x2e\x34\x38\x36\x20\x30\x20\x30\x20\
+\x31\x2d\x32\x2e\x34\x38\x34\x20\x32\x2e\x34\x38\x33\x7a\x6d\x2e\
+\x33\x31\x32\x2d\x31\x2e\x32\x34\x32\x68\x2e\x36\x32\x76\x2d\x32\
+\x2e\x34\x38\x68\x2d\x2e\x36\x32\x76\x32\x2e\x34\x38\x7a\x22\x2f\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x32\x20\x31\x39\x68\x34\x56\x35\x48\x32\x76\x31\x34\x7a\x6d\x38\
+\x2d\x31\x34\x76\x31\x34\x68\x34\x56\x35\x68\x2d\x34\x7a\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x3d\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\
+\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\x20\x20\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x20\x31\x31\x63\
+\x2d\x31\x2e\x31\x20\x30\x2d\x32\x20\x2e\x39\x2d\x32\x20\x32\x73\
+\x2e\x39\x20\x32\x20\x32\x20\x32\x20\x32\x2d\x2e\x39\x20\x32\x2d\
+\x32\x2d\x2e\x39\x2d\x32\x2d\x32\x2d\x32\x7a\x6d\x36\x20\x32\x63\
+\x30\x2d\x33\x2e\x33\x31\x2d\x32\x2e\x36\x39\x2d\x36\x2d\x36\x2d\
+\x36\x73\x2d\x36\x20\x32\x2e\x36\x39\x2d\x36\x20\x36\x63\x30\x20\
+\x32\x2e\x32\x32\x20\x31\x2e\x32\x31\x20\x34\x2e\x31\x35\x20\x33\
+\x20\x35\x2e\x31\x39\x6c\x31\x2d\x31\x2e\x37\x34\x63\x2d\x31\x2e\
+\x31\x39\x2d\x2e\x37\x2d\x32\x2d\x31\x2e\x39\x37\x2d\x32\x2d\x33\
+\x2e\x34\x35\x20\x30\x2d\x32\x2e\x32\x31\x20\x31\x2e\x37\x39\x2d\
+\x34\x20\x34\x2d\x34\x73\x34\x20\x31\x2e\x37\x39\x20\x34\x20\x34\
+\x63\x30\x20\x31\x2e\x34\x38\x2d\x2e\x38\x31\x20\x32\x2e\x37\x35\
+\x2d\x32\x20\x33\x2e\x34\x35\x6c\x31\x20\x31\x2e\x37\x34\x63\x31\
+\x2e\x37\x39\x2d\x31\x2e\x30\x34\x20\x33\x2d\x32\x2e\x39\x37\x20\
+\x33\x2d\x35\x2e\x31\x39\x7a\x4d\x31\x32\x20\x33\x43\x36\x2e\x34\
+\x38\x20\x33\x20\x32\x20\x37\x2e\x34\x38\x20\x32\x20\x31\x33\x63\
+\x30\x20\x33\x2e\x37\x20\x32\x2e\x30\x31\x20\x36\x2e\x39\x32\x20\
+\x34\x2e\x39\x39\x20\x38\x2e\x36\x35\x6c\x31\x2d\x31\x2e\x37\x33\
+\x43\x35\x2e\x36\x31\x20\x31\x38\x2e\x35\x33\x20\x34\x20\x31\x35\
+\x2e\x39\x36\x20\x34\x20\x31\x33\x63\x30\x2d\x34\x2e\x34\x32\x20\
+\x33\x2e\x35\x38\x2d\x38\x20\x38\x2d\x38\x73\x38\x20\x33\x2e\x35\
+\x38\x20\x38\x20\x38\x63\x30\x20\x32\x2e\x39\x36\x2d\x31\x2e\x36\
+\x31\x20\x35\x2e\x35\x33\x2d\x34\x20\x36\x2e\x39\x32\x6c\x31\x20\
+\x31\x2e\x37\x33\x63\x32\x2e\x39\x39\x2d\x31\x2e\x37\x33\x20\x35\
+\x2d\x34\x2e\x39\x35\x20\x35\x2d\x38\x2e\x36\x35\x20\x30\x2d\x35\
+\x2e\x35\x32\x2d\x34\x2e\x34\x38\x2d\x31\x30\x2d\x31\x30\x2d\x31\
+\x30\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x2e\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x73\x74\x79\x6c\
+\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x23\x62\x65\x62\x65\x62\x65\x3b\
+\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x22\x20\
+\x64\x3d\x22\x4d\x31\x39\x20\x36\x2e\x34\x31\x4c\x31\x37\x2e\x35\
+\x39\x20\x35\x20\x31\x32\x20\x31\x30\x2e\x35\x39\x20\x36\x2e\x34\
+\x31\x20\x35\x20\x35\x20\x36\x2e\x34\x31\x20\x31\x30\x2e\x35\x39\
+\x20\x31\x32\x20\x35\x20\x31\x37\x2e\x35\x39\x20\x36\x2e\x34\x31\
+\x20\x31\x39\x20\x31\x32\x20\x31\x33\x2e\x34\x31\x20\x31\x37\x2e\
+\x35\x39\x20\x31\x39\x20\x31\x39\x20\x31\x37\x2e\x35\x39\x20\x31\
+\x33\x2e\x34\x31\x20\x31\x32\x7a\x22\x2f\x3e\x0a\x20\x20\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\x34\
+\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\
+\x6e\x65\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\x09\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\
+\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\x20\x20\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x37\x20\x31\x30\x2e\
+\x35\x56\x37\x63\x30\x2d\x2e\x35\x35\x2d\x2e\x34\x35\x2d\x31\x2d\
+\x31\x2d\x31\x48\x34\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x20\x2e\
+\x34\x35\x2d\x31\x20\x31\x76\x31\x30\x63\x30\x20\x2e\x35\x35\x2e\
+\x34\x35\x20\x31\x20\x31\x20\x31\x68\x31\x32\x63\x2e\x35\x35\x20\
+\x30\x20\x31\x2d\x2e\x34\x35\x20\x31\x2d\x31\x76\x2d\x33\x2e\x35\
+\x6c\x34\x20\x34\x76\x2d\x31\x31\x6c\x2d\x34\x20\x34\x7a\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\xa1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
+\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
+\x6e\x6f\x22\x3f\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\
+\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\
+\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\
+\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\
+\x6e\x73\x3a\x63\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\
+\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\
+\x67\x2f\x6e\x73\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
+\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\
+\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\
+\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\
+\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\
+\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x0a\x20\x20\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x32\x22\x0a\
+\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x0a\x20\x20\
+\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\
+\x20\x32\x34\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x32\x34\x22\x0a\x20\x20\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\
+\x30\x30\x30\x30\x22\x3e\x0a\x20\x20\x3c\x64\x65\x66\x73\x0a\x20\
+\x20\x20\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x31\x30\x22\x20\
+\x2f\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\
+\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x23\x62\x65\x62\
+\x65\x62\x65\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x31\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\
+\x68\x34\x22\x0a\x20\x20\x20\x20\x20\x64\x3d\x22\x4d\x31\x39\x20\
+\x36\x2e\x34\x31\x4c\x31\x37\x2e\x35\x39\x20\x35\x20\x31\x32\x20\
+\x31\x30\x2e\x35\x39\x20\x36\x2e\x34\x31\x20\x35\x20\x35\x20\x36\
+\x2e\x34\x31\x20\x31\x30\x2e\x35\x39\x20\x31\x32\x20\x35\x20\x31\
+\x37\x2e\x35\x39\x20\x36\x2e\x34\x31\x20\x31\x39\x20\x31\x32\x20\
+\x31\x33\x2e\x34\x31\x20\x31\x37\x2e\x35\x39\x20\x31\x39\x20\x31\
+\x39\x20\x31\x37\x2e\x35\x39\x20\x31\x33\x2e\x34\x31\x20\x31\x32\
+\x7a\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\x20\x20\
+\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\x36\x22\x0a\x20\x20\
+\x20\x20\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x0a\x20\
+\x20\x20\x20\x20\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\x34\x76\x32\
+\x34\x48\x30\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x1a\x02\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x01\x0a\x08\x06\x00\x00\x00\xf0\xd2\xac\x6e\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x2e\x23\x00\x00\
+\x2e\x23\x01\x78\xa5\x3f\x76\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xdf\x0c\x0c\x17\x16\x09\xdc\xb7\xee\x65\x00\x00\x19\x8f\x49\x44\
+\x41\x54\x78\xda\xed\x9d\x77\x9c\x55\xd5\xb5\xc7\xbf\xc3\x30\x0c\
+\xd2\x2c\x54\x51\x40\xb0\x23\x82\x1d\x05\x8d\x0d\xbb\x31\xb6\x18\
+\xbb\x89\xfd\xf9\xf1\xc5\x16\x7c\x26\xcf\x18\xf5\x19\x8d\xef\x45\
+\xcd\x8b\x1a\x4b\x7c\xf6\x1e\xa3\xb1\xa0\x22\x8a\x8a\x85\xa8\x58\
+\x40\x51\x01\x0b\x02\x52\x05\x01\x19\xea\x30\xf3\xfe\x58\xeb\x66\
+\xce\x5c\x6e\x39\xf7\xdc\xbd\xef\x3d\xfb\x9c\xfd\xfb\x7c\xf6\x67\
+\x60\xee\x9d\x7d\xf6\x59\xe7\x77\xf6\x5e\x7b\xed\x55\xc0\xc3\xc3\
+\xc3\xc3\xc3\xc3\xc3\xc3\x1a\x06\x02\x35\x5e\x0c\x1e\xa5\xa0\x2d\
+\x50\x9b\xe7\xb3\x6e\xc0\xcb\xc0\x6c\xe0\x0c\x2f\x2a\x8f\xb0\xd8\
+\x17\x78\x11\x78\x1a\x38\x2e\xeb\xb3\x4e\x40\x73\xa0\xbd\xe5\xc5\
+\xe5\x11\x06\xc7\x67\x11\xa7\x19\x18\x04\xb4\x03\x86\x03\xd3\x72\
+\x7c\xee\xe1\x41\x07\xa0\x2f\xd0\x23\x87\x7e\xb4\x7f\x0e\xd2\x34\
+\x03\x73\x81\xcf\xf3\x7c\xd6\x0c\x9c\xeb\xc5\x9a\x6e\x8c\xc8\x22\
+\xc8\xa1\x81\xcf\xda\x03\x8b\x0a\x90\xa7\x58\xdb\xc1\x8b\x37\x9d\
+\xd8\x0c\x58\x9d\x45\x86\xaf\x80\xf5\x81\x7a\xe0\x83\x32\x48\xd5\
+\x0c\x2c\xf4\x22\x4e\x27\x9e\xcc\x43\x88\x57\x81\xbf\x96\x49\xaa\
+\x66\xdd\x21\x7a\xa4\x0c\x7b\x18\x20\x4e\xb1\x76\x45\x9a\x04\xda\
+\xc6\x73\x0a\x80\x3e\x15\xb8\xc6\x20\x4f\xac\xf4\xa1\x4b\x05\xae\
+\xf1\x53\x60\x4b\x4f\xac\x74\x61\x14\xd0\x50\x81\xeb\x74\xf4\xc4\
+\x4a\x17\xd6\x02\x8d\x06\xfa\x29\x66\x0c\x9d\xec\x89\x95\x2e\xcc\
+\x07\xe6\x95\xd9\xc7\x02\xe0\x43\x60\x16\xf0\x0d\xb0\x26\x87\x89\
+\x61\x80\x17\x75\xfa\xf0\x4c\x99\xbb\xbe\xde\xda\x4f\x4f\xa0\x2b\
+\x70\x20\xb0\x33\x30\x29\xf0\x9d\x6d\xf5\x3b\xde\xe3\x21\xe1\xa8\
+\xd1\x59\xbb\x06\xb8\xab\x0c\x52\xfd\xba\xc0\x35\xda\x03\x9f\x02\
+\xb7\xe9\x75\x6a\x94\x60\xbd\xbc\xf8\x93\x8b\x6d\x80\xeb\x80\x71\
+\x65\xce\x56\x3b\x87\xd8\x75\xd6\xe8\xf5\x7e\x0e\xfc\x00\xfc\xc3\
+\x8b\x3f\x99\xa8\x23\xb7\x27\x42\xa9\x6d\x7a\x09\xd7\x5c\x93\xf5\
+\xb7\x9b\x79\xe5\x3d\x79\xd8\x1f\xd8\xc2\x40\x3f\x5f\x87\xfc\x5e\
+\x27\xc4\x39\x30\x88\x03\x3c\xb1\x92\xa5\x57\x6d\x08\xfc\xc5\x50\
+\x7f\xef\x84\xfc\x5e\x2e\x4f\xd2\xa1\x9e\x58\xc9\x21\xd5\x66\xc0\
+\x44\xa0\xbf\x61\x19\xd6\x14\xd8\xed\x6d\x0c\x8c\xcc\xf1\xfb\xf7\
+\xbd\x46\x92\x0c\xf4\x04\x66\x60\xf6\x70\xf9\x58\xed\xfb\x40\x60\
+\x4f\xe4\xdc\xb1\x4d\x60\xb7\x59\x07\x7c\x9c\xe7\x6f\x07\xfa\x47\
+\x92\x0c\xfc\x18\xf3\x5e\x0b\x9b\x00\x7b\xe9\xbf\x57\x22\x86\xd6\
+\xab\x81\x43\x80\xdd\x81\xb1\x79\xfe\x6e\x95\x7f\x1c\x6e\x2e\x79\
+\xb9\x96\xa5\x0b\x2d\x10\xab\x0f\xf0\x6e\x9e\xcf\x56\x16\xf8\xbb\
+\x71\x49\x7e\x00\x6d\x13\x78\x4f\xb5\xc0\x10\x25\xd6\x24\xa0\x49\
+\x9b\xad\xc0\x86\xfb\x80\x5d\xf3\x7c\x56\x5f\xe0\xef\xfe\xec\xdf\
+\x7f\x77\x5e\x92\x4d\x74\xe9\x69\x00\x96\x23\xfe\xeb\x23\x91\xe8\
+\x99\x9d\x11\xa3\x64\x73\x0c\xda\x5a\xf2\xc7\x24\x7a\xc4\x0c\xb7\
+\x02\xdf\xe7\x79\x90\xab\x81\x15\x31\x21\x55\xa6\x1d\xe3\x1f\x59\
+\xfc\x71\x45\xcc\x48\x13\xa6\x7d\x03\x6c\xef\x1f\x5d\xbc\x31\xd1\
+\x41\x62\x35\x23\x47\x4a\x89\x74\xfe\x4b\x8a\x81\xf4\x51\x47\xc7\
+\xbd\x05\x09\x3e\xd6\x49\xca\x0b\xf2\xad\xa3\xb3\xd6\x70\xff\xf8\
+\xe2\x8d\x33\x1c\x24\xd5\x0a\xff\xd8\xdc\xc0\x13\x8e\x11\xeb\xf5\
+\x24\xdb\x7e\x92\xb2\x14\xfe\x82\xd6\xb9\x16\x5c\xc0\x78\x3f\x17\
+\xc4\x17\x35\xc0\x7f\x3a\xb8\x0c\x7e\x8a\x0f\x66\x89\x35\x8e\x77\
+\x90\x54\x8d\x48\x58\xbf\x47\x8c\x31\xc9\x41\x62\x9d\x97\xf4\x87\
+\x92\x04\x1d\xab\xc9\x81\x31\xae\xa5\xe5\x30\xfc\x65\xe0\x76\x4f\
+\xac\xf8\xe3\x33\x24\xfa\xa5\xbe\x0a\xd7\xce\x1c\x28\xb7\x2d\x40\
+\xf2\x66\xe0\x21\xc4\xca\xfe\x08\xf0\x65\x5a\x14\xdf\x24\xe0\x74\
+\xe0\x4f\x40\xe7\x0a\x10\x29\x43\xa6\x35\x48\xc8\xfc\x78\x24\xe1\
+\x47\x57\x60\x02\xb0\x24\x6b\xb7\xfa\x3a\x12\x62\xe6\xe1\x28\xf6\
+\x45\x42\xb1\x6c\xe9\x45\x4d\x3a\xeb\xbc\x00\x5c\x09\x0c\x0e\x5c\
+\xbb\x2b\x70\xa4\x7f\x04\xc9\x86\x69\x42\xad\x41\xdc\x88\x3f\x43\
+\xd2\x46\x7a\xa4\x44\xc7\x0a\xc2\x74\xd2\x8d\xd5\xc0\x63\xba\xe4\
+\xdd\x91\xb5\xcc\x79\xa4\x08\xe5\xe4\x5f\xc8\x6e\x3f\x00\x87\x7b\
+\x91\x7a\x00\xbc\x67\x88\x54\x0d\xaa\xb3\x79\x78\xd0\x5f\x67\x19\
+\x13\xc4\xba\xcc\x8b\xb3\x3c\x24\xe9\xac\xea\xcf\x48\x7e\x04\x13\
+\xd8\xc2\x53\xc3\x23\x83\x17\x69\x1d\xe6\x55\x6e\xdb\x0f\x9f\x20\
+\xcd\x03\xd8\x4a\x4d\x02\x8d\x06\xf5\xac\x3d\xbd\x58\x3d\x40\x0c\
+\x95\x4f\x61\xd6\x8e\xb5\xa9\x17\xab\x47\x06\x33\x0d\x12\xeb\xf7\
+\x5e\x9c\xe9\x56\xde\x83\xf7\x64\xd2\x97\xbc\x83\xa7\x89\x27\x16\
+\xba\x33\xec\x69\xb0\xbf\x8f\xf1\x9e\x9e\x25\x23\x89\xf9\x03\xae\
+\x40\xea\x0e\x9a\x42\x3d\x72\x56\xf8\x75\x60\xd7\xe9\x91\x42\xd8\
+\xf2\x28\x1d\x05\x0c\xf3\xe2\x4d\x2f\xae\x44\xf2\x52\x35\x5a\x20\
+\xd7\x6c\x24\xa3\x8d\x47\x0a\x51\x07\x5c\x02\x8c\xd6\x25\xcc\x34\
+\xb9\xde\xf1\x22\xf6\x78\x04\x3b\x0e\x7f\x3e\xb7\x55\x0a\x77\x85\
+\x41\x3c\x6b\xa1\xcf\xc9\x88\x6b\xb2\x47\x8a\x89\xd5\xce\x42\x9f\
+\xf7\x7a\xda\x78\x62\x99\x9e\x59\xbe\xc7\xe7\x0e\xf5\x00\xfa\x02\
+\x53\x91\x14\xd9\xa6\x74\x2c\x9f\x9b\xdd\x03\x10\x4b\xfc\x60\x25\
+\x98\x09\x62\x7d\x85\x94\x4c\xf1\xf0\xf8\xd7\xec\xd5\x60\x88\x5c\
+\xcf\x85\xbc\x66\x5b\x2f\xf6\x74\xe0\x6d\x83\x4b\xe2\x5e\x05\xae\
+\x53\xab\x44\x3e\x0a\xe8\xe1\xc5\x9e\x7c\x3c\x63\x90\x58\xd3\x0b\
+\x6c\x7e\x0e\x02\xa6\xe8\xf7\x46\xfa\x5d\x61\xb2\xd1\x9e\x96\xba\
+\xcd\x26\xd0\x0f\x38\x35\xc7\xef\xd7\x47\xdc\xa4\xb7\xd2\xff\xaf\
+\xe7\xdf\xe7\x64\xe3\x50\xec\x1c\x4e\x07\xd1\x8e\x75\x73\xce\x3f\
+\xe4\x45\x9f\x6c\xf4\xc7\xce\xc1\x34\x88\x33\x60\x4f\xe0\x9a\x1c\
+\x9f\x8f\xf5\xa2\x4f\x36\xda\x92\xbf\x6e\x60\x39\x35\x71\xda\x03\
+\xd7\x02\x73\xf3\x7c\xe7\x6c\x2f\xfa\xe4\xe3\x6c\xc4\x7a\x6e\x32\
+\x4c\xac\x98\x7f\xfd\x60\x2f\xf6\x74\x60\x53\xe0\x43\x2a\x97\x16\
+\xb2\x97\x17\x79\x7a\xb0\x31\xb0\xb8\x02\xa4\x9a\xe3\x45\x9d\x3e\
+\x3c\x59\x01\x62\x9d\x90\x56\xe1\xa6\x39\xfa\xc4\x76\x05\xf9\xa9\
+\x88\xa3\xa1\xcd\xcd\x48\x07\x62\x7a\x6c\x94\xe6\xb3\xac\xcd\x2d\
+\xf7\xff\xba\xe5\xe7\x76\x08\xb0\x9b\xbe\x20\xcf\xe2\x9d\x0f\x63\
+\x81\x2e\xc0\x02\x8b\x4b\xe0\x52\xcc\xc6\x36\x06\x51\x8b\x24\x84\
+\x0b\x5e\x6f\x04\x3e\xb0\x36\x16\x18\x62\x59\xb7\x7a\xdc\xf0\x78\
+\xeb\x90\x82\x99\xdd\x75\xa6\x9a\x96\x83\xc8\x7f\x00\x36\xf0\x8f\
+\xb6\xba\x18\x58\x01\xc5\x7d\x77\x35\x35\x6c\xa4\x33\x64\x94\x4a\
+\xaa\xed\xb5\x8f\x93\x91\x94\xde\x5f\x14\xb9\xe6\x13\xc0\xd6\xfe\
+\xf1\x56\x57\xb7\x7c\x01\xb3\x86\xd2\x7c\x79\x4c\xc7\x02\x0f\x00\
+\xd7\x2b\xc1\xd6\x2b\xb0\x69\xea\xa0\x6d\x43\xc4\xed\xe6\x22\x24\
+\xc1\x6e\x29\xd7\x5c\x18\x07\x72\x25\x31\xb1\x58\x07\x24\x9e\x70\
+\x6d\x08\x72\x4d\xa4\xb2\xae\xc6\x63\x81\x57\x80\x71\x88\x27\x6a\
+\x46\xfe\x8d\xaa\x3b\x9d\xae\xe3\xda\x55\x97\xbc\xa8\xcf\xe7\x5b\
+\x24\x83\xf4\x6a\x3f\x87\x98\x41\x27\xe0\x77\x48\x9d\xe5\x30\xb1\
+\x7f\x3f\x21\x1e\x45\x9b\x66\x62\xfe\x80\xfc\x58\xbc\x07\xab\x11\
+\xb4\x01\x6e\xa5\x25\x1b\xdf\xc1\x21\x89\x38\x0f\x37\x6b\x49\x17\
+\x6b\xcb\xf5\xc5\xf1\xe4\x2a\x13\xbb\x64\x09\x76\x41\xc8\x59\xeb\
+\x1f\x09\x25\x56\xa6\xe6\xf4\x4f\x74\x37\xe9\x11\xd1\xb6\xf3\x60\
+\x0e\x65\x7c\xb8\x6e\xd5\xb3\xbf\xdb\x25\x40\xba\x61\x11\x14\x64\
+\xd7\x8a\x6e\x4e\xc2\x7e\x01\xab\x75\x84\x9c\x04\x1c\xae\xdb\xf1\
+\x6c\x65\x77\x95\x0a\x74\x25\xe2\xdd\xd9\x41\xc9\x76\x81\x92\x70\
+\x05\x92\x9d\x66\xfb\x84\xab\x08\x3d\x11\x57\xea\xd1\x48\x6d\x20\
+\x8f\x2c\x01\xd5\xe7\xf9\xfd\x0c\xc2\x05\x3f\x7c\x9c\xe0\x99\x29\
+\x4c\xbb\x09\xd8\xce\x53\xa9\xf5\xcc\xba\xb7\x6e\xc7\x7b\x65\x99\
+\x0c\x8e\x4d\x39\x59\x4a\x6d\xdf\x29\xb9\xda\xa5\x9d\x54\x35\xba\
+\xc3\xcb\x08\x66\xbe\xda\x9e\xb6\x40\x0a\x50\x36\x57\xc0\xd0\x99\
+\xb4\xb6\x0a\x38\x4d\xed\x65\xbd\x91\x34\xe6\x1d\x55\xf7\x4c\x8d\
+\x81\x74\x08\xf0\x91\x9f\xb4\xad\xe1\x53\xa4\xf0\xc2\x27\xc8\xf1\
+\xd3\xed\xfa\xbb\x44\x13\xab\x1d\x92\x8f\x2a\x6d\xb5\x6d\x1a\x80\
+\x65\x48\x7d\xc4\x66\xd5\x23\xd7\xea\xac\xd2\x2d\xeb\xb9\xd5\x1b\
+\x7e\x8e\xf3\x31\xe0\x99\x11\x37\xe3\x59\x17\x24\xe0\x73\x3e\x72\
+\x5e\x36\x32\x85\xa4\x9a\x0e\xdc\x03\xbc\x0a\xbc\x11\xd8\xa0\x34\
+\x21\x3e\x64\xe7\x07\x36\x31\x6b\x80\x1d\x75\xe7\xdb\x01\xf1\xe7\
+\x2f\xd7\x7d\xa6\x87\xda\x04\x27\x24\x41\x98\x5d\x90\xb8\xbf\x1b\
+\x75\x5a\x3e\x1b\x73\xb5\x07\x5d\x6a\x53\x89\x5e\x62\xa5\x3d\x70\
+\xb5\x2a\xe7\xe5\x8e\xe3\xf2\x24\x90\x6a\x00\x70\x0b\xe6\x6a\x0d\
+\xba\x4c\xaa\x3e\x06\xe4\x79\x12\x72\x9c\x53\xce\x58\xce\x4f\x02\
+\xb1\x46\xa7\x9c\x50\x8d\x88\x97\x45\x1f\x83\x32\xbd\x4e\x8d\xbf\
+\x51\xc7\x34\x34\x09\x3a\xd6\x0a\xd2\x8d\x29\xc0\x4e\x98\xf5\x59\
+\xff\xb5\xda\xfe\x4e\x23\x5a\x1a\xa5\xde\xaa\xb7\xb5\x51\x53\xc4\
+\xfa\x3a\x0b\x2e\x00\x16\xb9\x62\xa3\xda\x2a\xb0\xfb\x49\x63\x7b\
+\xd6\xa2\x7c\x87\x13\x2d\x93\x61\x03\x70\x83\x9a\x1e\xa6\xea\xc6\
+\x61\x2e\xf0\xb0\x6b\x6f\xed\x39\xc0\x07\xaa\x67\x35\xa6\x8c\x58\
+\xb6\x9d\xf1\x76\x00\xbe\x34\x38\xde\x50\xbb\xf4\xb8\x1c\x42\xbf\
+\x0f\xdc\x1f\x58\x0e\xfa\x91\x9e\x98\xc7\x5a\xe4\xac\x73\xba\xda\
+\xed\x56\x19\xee\x7f\x2e\xf0\x9a\x2a\xf5\xf5\x86\x6c\x8b\xa3\x54\
+\x8d\x5a\x0f\x87\x0e\xb5\xeb\x91\x2a\xa9\x0b\x52\x36\x73\xdd\x89\
+\x1c\x12\xef\x80\x9d\x64\x6d\x7f\x34\x34\xce\x95\x3a\xbe\x43\xd5\
+\x2c\x51\xef\xda\x9b\x7c\x12\xf0\x4d\x0a\x09\x36\x1b\x71\xeb\xe9\
+\xab\x16\x70\x53\xab\xca\xcf\x75\x45\x30\xb1\x74\x8f\x0a\x98\x87\
+\x7e\x83\x83\x5e\xaa\xdb\x12\x1f\xbf\xf4\x4a\xb7\x0f\x90\xe0\x8b\
+\xc3\x11\x67\xc5\x76\x81\x19\xbd\x27\xe2\xe5\xd1\x53\x4d\x03\x61\
+\x66\x8d\x4e\xba\x12\xd8\x38\xb0\x3f\xcc\x55\x3d\x24\xed\xde\x08\
+\xa7\x02\xa7\x28\x91\x4e\x57\xc2\xbd\x01\xbc\xa9\x3a\xd9\xb9\x84\
+\x0f\x56\x7d\xd5\xc2\xf8\x5e\x70\x91\x54\x3d\x3c\xb1\xfe\xd5\x26\
+\x14\xf8\xec\x8e\x90\xf2\xec\x8e\x9c\xc5\x9a\x1c\xd7\x74\x17\x77\
+\x4c\x0f\x7a\x42\x85\x6a\xf3\x91\xf3\xc2\x30\xd8\x07\xf1\x1a\x59\
+\x6e\xe8\xda\x0d\x44\x3f\xe3\xac\x38\xda\x00\x47\x7b\xc2\x94\x94\
+\x0f\x75\xfd\x12\xe4\xdb\x1d\xb8\xdb\xd0\xb5\x97\xe2\x40\xe6\xc2\
+\x3a\x55\x46\x47\x90\xec\xe8\x19\x1b\xad\x54\x3f\x2a\x53\xc9\x51\
+\xbe\x26\x2b\x0a\x28\x4e\xdb\xc4\xf5\x90\x9c\x03\xdb\x20\x0e\x6d\
+\xb7\xe3\x83\x2d\xa3\xbc\x94\xa5\x60\x22\x12\xf2\xbf\x7f\x84\x6b\
+\x2d\xd4\x25\xb0\x8d\x1e\xf5\xfc\x10\x57\xa1\x1c\xa7\x83\xf5\x33\
+\x4f\x79\x61\xf5\xa5\xa2\xab\x5a\xfe\xf3\x79\x43\x7c\x9f\xe3\x77\
+\x8b\x91\x0c\x38\x5b\x23\xf1\x07\xb1\xae\x17\x74\xab\x27\x46\xd9\
+\xb5\xaa\x9f\x8e\x28\xfb\x11\x2a\xff\x39\x39\xfa\xbd\x04\xf1\x87\
+\x0f\xfe\xee\x62\xd7\xcc\x0a\x8b\x3d\x41\xca\x6a\x93\x28\xef\x8c\
+\xf5\x30\xe4\xdc\x76\x06\xe2\x73\x9f\xc9\xd3\xba\x25\x92\xe3\x62\
+\xb5\xce\x60\x45\xeb\x35\xc6\x29\x12\xba\x41\xb7\xcc\x5b\xeb\xf4\
+\x9c\xc4\x14\x4b\xb6\x31\x8e\xf2\xb2\x09\x4e\x43\x12\xf2\x3e\x8f\
+\x9c\x09\x9e\x86\x78\x9b\x2c\xa2\x25\xb5\xf8\xb3\x48\x11\x2a\xe7\
+\xd0\x0d\xb3\x6e\x1e\x69\x6a\x0f\x5a\x7e\x36\x6d\xc3\xce\x88\x71\
+\x74\x4d\xf9\x0e\x09\x0a\x58\xee\x27\xa0\x48\xb6\x3f\x9b\x68\x54\
+\x5d\xce\x49\x62\x01\xdc\x87\xe4\xd3\xf4\x28\x0d\x7d\xe3\xa2\xde\
+\xc4\xd9\x99\x6e\x96\xe7\x49\xc9\x18\xae\xcd\x13\xab\x00\x7e\xe4\
+\x79\x12\x09\xe7\x78\x62\xe5\x47\x3f\x92\x9d\xb3\xca\x26\x26\xc6\
+\x61\x10\x6d\xab\x4c\xea\xce\xaa\x13\x34\x23\xc7\x38\x99\xec\xc1\
+\x57\x53\xda\x81\xaa\x47\x0b\xee\x4e\x33\xb1\x6a\x90\x4a\xef\xfb\
+\x28\xb9\x56\x23\xbe\xde\x4b\x68\xf1\x8a\xf4\x88\x86\x2d\x75\x67\
+\x9d\x4a\x62\x6d\x86\x18\xda\x6a\x3d\x0f\x8c\x63\x6b\x60\x7c\x5a\
+\x75\xac\x3d\x3c\xa9\xac\xa1\x2e\x0e\x83\xa8\x16\xb1\x32\x39\x43\
+\x3d\xcc\x63\x97\x34\x13\xeb\x0b\x7c\x39\x0e\x5b\xd8\x8e\x18\x9c\
+\xb3\x56\x8b\x58\x73\x11\x4f\x06\x0f\xf3\xd8\x38\x0e\x6a\x46\x35\
+\xed\x58\xef\x78\x0e\x58\xc1\x3c\xc4\x6c\x93\x4a\x62\xd5\x00\xbf\
+\x45\x5c\x65\x3c\xcc\x62\x39\xe2\x21\x52\x55\xd4\x56\xf9\xcd\xea\
+\x84\x64\x2f\xe9\xec\xf9\x60\x0c\x03\x90\x93\x8b\xd4\x1f\xe2\x1f\
+\x81\x44\x79\x78\x7f\xaa\xea\x46\xec\x24\x12\xc3\x10\x8f\x45\x4f\
+\x08\x73\xed\xec\xb4\x2e\x85\x41\xcc\x44\x02\x1e\x7b\xe1\xcf\x08\
+\x4d\xa1\x19\x78\x34\xed\x42\xc8\xd8\x5d\xf6\x42\x8c\xa7\x4b\x49\
+\x5f\x66\x3f\x1b\x91\xd1\x3d\xd3\x3e\x63\x65\x30\x03\x71\xfb\x98\
+\xab\xad\x16\x89\x77\x5b\x4a\x4b\xd6\xbb\x5e\xa4\x27\xdb\x5f\xb9\
+\x2f\xeb\x4a\x24\xbb\x4c\xd5\x66\x8a\xb8\xa2\x3f\x72\xa8\x5a\x0b\
+\xbc\x8b\x24\x61\x7b\x04\xd8\x8f\x98\x07\x49\xc6\x04\xf3\x11\x83\
+\x69\x93\x17\x45\x38\x3c\xe1\x97\xba\xd0\x6d\x0f\x4f\x97\x70\xe8\
+\x85\x24\x1b\xf3\xa4\x09\xd7\xde\xa7\x0a\x1e\x0f\x2e\xea\x2a\xdd\
+\xf1\x45\x1c\x4b\xc1\x4e\x48\xba\x4d\xaf\x63\x85\x18\xb3\xd7\x19\
+\x4a\x33\x3b\x7c\x8b\x14\xbd\x9c\xeb\x67\xac\xfc\xd8\xcf\x73\xa5\
+\xe4\x17\x71\x53\xe0\xbf\xfc\x52\x58\x18\x69\xab\xbd\xf3\xa1\x9a\
+\x5b\xca\xc5\x99\x54\xd0\xf8\xec\x22\xb1\xfa\xa5\x8c\x58\xff\x0d\
+\x5c\x8f\x99\x0a\x10\x67\xe3\xd1\x8a\xfc\xbd\x75\x3a\xdf\x97\x75\
+\x73\x35\x25\xbd\x7d\x84\x84\xc6\xdd\x83\xb8\x19\x95\xd3\xd7\x0c\
+\xbc\x71\xb9\x95\x4e\xf5\x08\x92\xfc\x3e\xad\x26\x83\x6b\x91\x88\
+\xaa\x9b\x0d\xf4\x75\x02\x3e\x05\x27\x20\x07\xd4\x69\xb7\x45\x4d\
+\xa7\xe5\xf8\x6d\x32\xe5\x65\xfd\x5b\x84\x14\x23\x18\x81\xc4\x72\
+\xa6\xf6\xd0\x3f\xe9\xa4\x79\x8b\xe2\x06\xdf\xa5\x6a\xbf\x03\xa9\
+\x42\x61\xe2\xba\xab\x90\x44\x6b\xd7\xa7\x91\x54\x1b\x24\x9c\x54\
+\x73\x80\x8d\x90\xb4\x4d\x85\xbe\xb7\x9c\x96\xa3\x99\x4c\x0a\xed\
+\x0f\x91\xd4\x90\x4d\x01\xa2\x44\x2d\x68\xb5\x71\xda\x88\x75\x42\
+\xc2\x89\xf5\x77\xbd\xcf\x2e\x21\xbe\x3b\x0e\x49\x55\xde\x01\x78\
+\x4e\x97\xb2\x3d\xb4\x8f\x31\xaa\xdc\x5f\x1e\x71\x1c\xc3\xd2\x42\
+\xa8\x8c\x72\xb9\x03\xc9\xf6\x2c\xcd\xf8\xa5\xf7\x20\x5c\x55\xae\
+\x37\x55\x36\xd9\x27\x26\x9d\xf4\x67\x57\x35\x4b\x94\x3a\x8e\xbe\
+\x49\xb7\x63\x75\xd6\xb7\xe7\x44\xc4\x65\xe6\x53\xdd\x0d\x26\x15\
+\xdf\x07\x66\xe6\x30\xc7\x6b\xc3\x91\xea\x5f\xd9\xe5\x45\x96\xe9\
+\xcf\x85\x48\x30\x70\xa9\x06\xd8\x19\xa6\x6f\x2c\x6e\x8e\x7e\x47\
+\x20\x09\x5a\x4f\x02\x06\xab\xc2\x5a\x07\xec\x96\x40\x52\x2d\x43\
+\x72\xa8\x77\x46\xaa\xab\x86\x8d\x54\x1a\xa2\xb2\x59\xac\x3a\x5a\
+\x63\x8e\xcd\x4e\x29\xf5\x03\x1f\x01\x5e\x4a\xfa\x12\x78\x47\x4a\
+\xcc\x07\xab\x80\xab\xf4\x9e\x5f\x8a\xd8\xc7\x32\xe0\xac\x1c\x32\
+\xec\x86\xa4\x83\x0a\xdb\xcf\x3e\x69\xd0\xad\xc6\xa5\x84\x58\x6f\
+\x04\xee\xf9\xf9\x32\xfa\x59\x42\xee\xaa\x5b\xa5\xbc\xa0\xbb\x24\
+\x9d\x54\x6d\x31\x57\x3f\x2f\xee\xed\xca\xc0\x7d\x0f\x2d\x71\x86\
+\xc9\x6e\x57\x65\xe9\x67\x35\xc0\x26\x84\x0f\x46\xe9\x6b\xe3\x61\
+\xc6\x49\x79\xdf\x07\x3b\xd5\xdb\xe3\x88\x3e\x81\x7f\xbf\xa3\xb3\
+\x56\x54\x9c\x47\xeb\x02\x98\x19\xff\xab\xb7\x43\xfe\x7d\xfb\xa4\
+\x13\x6b\x7f\xd2\x83\x23\x68\xb1\xa4\x03\xdc\x50\x46\x5f\x0d\xac\
+\xeb\xf8\x58\x03\x5c\x17\xf2\xef\x4f\x4b\x32\xb1\x6a\x81\xe3\x53\
+\x44\xac\x6e\xc0\x21\x81\xff\x4f\x22\xba\x57\xec\xeb\xba\x19\xc8\
+\xde\x19\xae\x2e\xe1\x85\xee\x18\x78\x0e\x7d\x11\x23\x6c\x9c\xad\
+\x07\xa1\xb1\x29\xe9\x3b\x58\x7e\x2c\xa0\x1b\x75\x8e\x68\xd8\xfc\
+\x1c\xd8\x3c\x20\xc7\x3a\x35\x47\x6c\xaf\x66\x84\xb0\xfd\x5c\x83\
+\x24\x13\x39\x11\xb1\xe4\x8f\x44\xc2\xee\x7a\x23\xf9\xf6\x4f\x50\
+\xbd\xcd\x39\xac\x4f\x38\xcb\x73\xd2\x5a\xd7\x80\x0c\x1e\x8b\xf0\
+\xf7\xd9\x85\x2f\xf7\x44\x12\xac\x7c\x11\xa1\xaf\x57\xb3\xfe\xff\
+\x1a\x72\x86\x99\xd9\x50\x3d\x8e\x24\x25\x76\x0e\x69\xac\xff\x1c\
+\x4c\x3b\x5e\x6a\x61\xf5\xa9\x39\x36\x3b\xd7\x5a\x1e\xef\x4b\x48\
+\xbd\x6e\xa7\x94\xf7\x79\xa4\x0f\x03\x03\xff\x1e\x0d\x8c\x45\xfc\
+\xa5\xa6\x51\xb8\xfa\xd9\x2a\x24\x38\x22\xdb\xff\xff\x5d\xcb\xe3\
+\x1d\xe6\xe2\xce\xfd\xb3\x14\xce\x58\x37\xe6\xd8\xfa\xff\x4a\xf5\
+\x9a\xd7\x69\x6d\x65\x5f\x8c\x14\xf4\x5e\x08\xfc\xad\x80\x1c\xc7\
+\x58\x1c\xef\x7b\x61\x1f\x66\x25\xe3\x0a\xfb\x21\x81\xa6\x73\x74\
+\xd9\xcb\xec\x5a\xea\x81\xdd\x75\x4d\x4f\x1b\xd6\xa8\x4d\x2b\xd7\
+\x6c\xfd\x6f\x88\x13\xde\xb7\xc8\x41\xfc\x4a\x25\xde\x22\xe0\x19\
+\x5d\x0a\x73\xa1\x87\xda\xc5\x76\xb6\xa4\xae\x1c\xa1\xb3\x6b\x2c\
+\xf0\x23\xdd\x6d\x8c\x05\x2e\x43\xbc\x20\xf7\x44\x8e\x13\xce\xd3\
+\x37\x21\xad\x6e\xc7\x8f\x93\x3b\x04\x3e\x93\xa7\x35\xca\x91\xcb\
+\x6e\x3a\xbb\xd9\x18\xef\x57\x71\x21\xd5\x06\xaa\x33\x64\x0f\xf0\
+\x4b\x7d\x53\x7d\x7e\x85\x16\x47\xbb\xae\x4a\xa4\x7d\x02\xb6\xa5\
+\xa8\xb8\x1e\x98\x12\xd1\x8c\x51\xa8\xc5\x26\x8d\xfa\x95\x9e\x38\
+\x45\xdb\xbd\x6a\x30\xbd\x51\x97\xbe\x66\xe0\xe2\x32\x64\x9e\x51\
+\x71\xf6\x46\xaa\x81\x99\x24\xd7\x77\x71\x21\xd6\x14\x4f\x9c\xc8\
+\x19\xf9\x4c\xb9\x0c\xdf\x8d\xb9\x02\xee\x0b\xfd\x6e\xcf\xfd\x66\
+\x32\x1b\xdf\x61\xc0\x04\xcc\xf8\x92\x55\x15\x6d\x81\xe3\x74\xea\
+\xf4\x24\x89\x1e\xc5\x63\x32\xb8\xb4\x2b\xf0\x01\xe5\xfb\x92\x55\
+\xd5\x96\xb5\x93\x27\x86\x91\xe5\x70\x90\xe1\xe7\xb2\x07\xe1\x82\
+\x80\x17\xe9\xf5\x83\xbf\x9b\x47\xc8\x14\x9d\x36\x2d\xef\x87\xe2\
+\x51\x2e\xda\x00\x07\x18\xee\x73\x3c\x70\x69\x9e\xcf\x32\x41\x19\
+\x9f\xeb\xae\x32\x93\x2f\x22\x83\x0f\x91\xbc\xa6\xa1\x96\x2b\x5b\
+\x58\xe5\x79\x61\x04\xa7\x00\x37\x19\xee\xf3\xef\x6a\x02\x5a\x8d\
+\x94\xa1\x43\x97\xc8\xe7\x91\x40\x8d\xdf\xd3\x72\x3c\x34\x47\x27\
+\x89\xed\x88\x49\x61\xad\xdd\xfd\x52\x66\x2c\x04\xdf\x06\x76\x54\
+\x43\xea\x28\xe0\x65\x0a\xbb\x28\x6f\x8e\x38\x23\xc6\xa2\xe6\xd1\
+\xde\x9e\x14\x46\xda\xad\x15\x78\x56\xc6\x09\x63\x4b\xc7\xea\x81\
+\x04\x56\x7a\x94\x8f\xa5\x15\xb8\xc6\x0f\x36\x4c\x02\xa6\x89\x3a\
+\x00\x39\x0f\x3c\xd5\x73\xc2\x08\x3a\xba\x38\xe8\x72\x88\x55\x8f\
+\xf8\x46\xd7\x23\x9e\x85\xb5\x88\x4b\xec\x31\x48\xc2\x0a\x0f\x33\
+\xd8\xc1\xc5\x41\x47\x75\x9b\xd9\x5f\x95\xbf\xee\x48\x1a\x9e\x03\
+\xd5\x68\xd6\x3d\xa1\x0f\xf7\x07\xc4\xd0\xbb\x01\xb0\x61\x85\xaf\
+\xbd\x44\x57\x81\x45\x49\x9f\xb1\x06\x22\xfe\x38\xb5\x29\x98\x2d\
+\xd6\x22\xd9\xf4\x1e\x52\x1b\xce\x00\xe0\x0a\x2a\x9b\x05\x6f\x4d\
+\x0a\xe4\x4c\x0d\xf0\x74\x8a\x76\x64\x9f\x02\x07\x67\xc9\x60\x24\
+\x95\x3d\xa6\xfa\x2a\x0d\x2f\x71\xe7\x94\x6d\xf5\xef\xcb\xa3\x3a\
+\x8c\xaa\xe0\x18\x16\xe2\x60\xc6\xbd\x52\xcd\x0d\x69\x4b\x84\xfa\
+\x51\xd6\xff\x9b\xf5\xe7\xac\x0a\x8e\x61\x23\xdd\x10\x25\x9a\x58\
+\xbb\xa7\x88\x54\x53\x80\xbb\xf2\x7c\x36\xbe\xc2\x63\x39\xcb\x35\
+\xb3\x43\xa9\xc4\xda\xcb\x71\xb2\xac\x2e\xe1\xbb\xbf\x22\xbf\xe1\
+\x70\x65\x85\xc7\x3d\x18\x71\x41\x4a\xec\xae\xd0\xe5\xa5\x70\x26\
+\x12\x76\xbe\x11\x72\xdc\xb4\x1a\xa9\xe5\xb7\x1b\x92\x34\x36\x88\
+\x37\x91\x04\xb2\x85\x74\xcd\x4a\xe3\x4c\x24\xec\x6b\x59\x12\x97\
+\x87\x7b\x1d\x55\xc2\x1b\x81\x9f\x05\xee\xe3\x70\x5a\x32\xd9\x1d\
+\x84\x24\xe5\xc8\xe4\x93\xfa\x26\xc7\x4e\x30\x1b\xe7\x54\xe9\x3e\
+\x2e\x26\xa1\xb8\xc9\x51\x62\x15\xd3\x89\x76\x53\x7d\x6a\x34\x12\
+\xea\x5e\x0c\x07\x55\xe9\x3e\x66\x21\xa9\xbb\x13\x87\xa3\x1d\x24\
+\xd5\x74\xc2\x57\x18\x0d\xfb\xd0\xfa\x54\xf1\x7e\x7e\x93\x44\x62\
+\x65\x2a\xa2\xbb\x42\xaa\x45\xc0\x91\x96\x64\x51\xad\xba\xd4\x2b\
+\x80\x93\x91\x23\xb5\x44\x55\xf2\x1a\xef\x10\xb1\xae\xb5\x28\x87\
+\x37\x68\xed\x9b\x3e\x9f\x96\x5c\xa2\x0d\xd8\xcd\xa7\xba\x0a\x89\
+\xb8\x39\x19\xc9\x61\x15\x3b\x44\x39\x2a\x18\x8a\x9d\xbc\x00\xa6\
+\xb1\x42\x95\x74\x5b\x67\x6d\x8b\x74\x89\x5d\x05\x3c\xac\x3b\xce\
+\x49\xc8\x21\xf5\xdd\xc0\x3f\x91\xfc\x0a\x83\x30\x7f\x24\x53\xab\
+\x84\x3a\x04\xe8\xa9\x3b\xde\x39\xae\xcf\x58\x4f\x3a\x32\x5b\x4d\
+\xa9\x80\x2c\xae\x40\xea\xd7\x04\x73\x2f\xec\x9a\xf5\x9d\x5b\x54\
+\xe9\xb6\x79\xaf\x63\x70\xb3\x70\x7c\x2b\x7c\xea\x08\xb1\x6e\x8e\
+\x89\xbc\xda\x21\x89\x4f\x6c\xdf\x6f\xac\x4a\x1a\xb7\x29\x51\x40\
+\xc3\x71\x23\x17\x65\x23\xf0\x40\x4c\xc6\xb2\x9a\xca\x94\x14\x39\
+\xd8\x45\x62\xed\x0d\x5c\x04\xfc\xc5\x11\x3b\xca\xcb\xd8\xcf\x6e\
+\x57\x0a\xda\x57\xe0\x1a\x4e\x55\x98\xe8\x88\x1c\x80\x46\x49\x96\
+\x5a\xcd\x16\x47\x6f\x00\x9b\x39\x56\x57\x61\x3e\xb0\xd5\x2a\x7e\
+\xe7\xa0\x41\x74\x19\xb0\x65\x0c\x65\x79\x0d\xeb\x86\xac\x9b\x6a\
+\x0f\xbb\x44\xaa\x11\xb8\x79\x7c\xf3\x40\x8c\x65\xfa\xa0\xa5\x7b\
+\xde\xc9\x25\x62\x7d\xed\x28\xb1\xf6\x8c\xb1\x4c\x37\xb4\x70\xbf\
+\x4d\x38\xe6\x75\xe2\x22\xa9\xe6\x12\x32\x0f\x79\x15\xf1\x37\xcc\
+\x7b\x6e\x74\x8b\xdb\x4d\x26\xea\xac\x49\x77\x82\x71\x4f\x46\x32\
+\x52\x75\x2d\x53\xa8\x05\xb6\xf2\xc4\xf2\x98\x0e\x4c\x36\xdc\xe7\
+\x36\x2e\x11\xeb\x43\x07\x1f\xda\x2c\x47\xc6\x39\xd6\x82\x29\xc3\
+\x19\x62\x8d\x71\x90\x58\xb7\x39\x32\x4e\xd3\x96\xf8\x1a\x97\x88\
+\x55\xe7\x18\xa9\x1a\x81\x8f\x1d\x19\xab\xe9\x03\xf2\x0f\xbc\x8e\
+\x65\x0f\x2e\x9d\xee\x9b\x94\xfb\x3f\x89\x51\xb5\x88\x0c\xda\x56\
+\xe9\xba\x4d\xb4\x58\x8b\x07\x62\xc6\xc0\xb7\xd2\x21\x62\xfd\xbb\
+\xa1\x7e\xd6\x20\xae\xca\x2b\x5c\x9a\x01\xfe\x84\x1d\x5b\xd3\x52\
+\xed\x3b\xe3\xfc\xf6\x94\xa1\x7e\xdf\x77\x44\xae\x9d\x54\x06\x26\
+\xee\x79\x36\x95\x39\xe0\x36\x3a\x63\xf5\xb5\x74\xcd\xbb\x81\x0b\
+\xf5\xdf\x9d\x91\xc4\xf6\x26\x30\xd7\x11\x62\x0d\xc3\x5c\x5c\xe2\
+\x4a\x5a\xc2\xfe\x9d\x59\xeb\x6d\x18\xdd\x66\x22\x19\x79\x33\xf8\
+\xb1\xc1\x4d\xc2\x60\x62\x92\x7c\xb5\x08\x86\x1a\xec\x6b\x61\x1c\
+\x4d\x0d\xc5\x66\x2c\x1b\xca\xf0\x2b\xc0\x82\x2c\x62\x99\xc2\xa6\
+\xc0\x55\x48\x22\x8f\x2f\x10\x1f\xf0\xaf\x63\x28\xf3\x8e\x86\x9f\
+\x5f\xad\xee\x88\x9d\xc1\x12\x0b\xfa\xd5\x25\x59\xd7\x58\x61\x49\
+\x8f\xfb\x04\xa9\x03\x38\x20\x86\x72\xdd\x9b\x96\xa8\xeb\x72\xdb\
+\x12\x24\xcb\xa0\x33\x18\x66\xe1\x61\x3f\x42\xeb\xc3\x52\x93\x02\
+\x76\x2d\xb8\xf3\x21\x83\xf7\xb8\x99\x4b\xc4\x1a\x8f\xd9\xc0\xd4\
+\xe7\x69\xed\xda\xb1\x11\xf0\x36\xf6\xbd\x1d\xce\x8b\xa9\x7c\xfb\
+\x63\xae\x02\xea\x61\xae\x90\xaa\x37\xe6\xdd\x3a\x86\xe4\xb0\xe3\
+\xd8\x26\xd5\x0c\xa0\x57\x8c\xe5\x7c\xb9\xa1\xfb\xbc\xc5\x15\x62\
+\xdd\x65\xe1\x01\x67\xef\xfc\xee\xa8\x00\xb1\x6e\x88\xb9\x9c\xeb\
+\x90\x00\x57\x13\x39\x4a\x63\x77\xfc\x96\xcb\xdc\x70\x86\xe1\x6b\
+\xbc\xc7\xba\xd1\xc8\x93\x2d\xdf\x57\x93\x2a\xef\x71\xc6\x1a\xe0\
+\x59\x43\xcb\xea\xd0\xb8\x13\xcb\xc6\x11\x4f\xae\x2a\xa1\xb3\x2d\
+\xdf\xd7\x18\x62\x52\xa9\xaa\x08\x4c\x1d\x1e\x0f\x89\x3b\xb1\xb6\
+\xb3\x70\x8d\x3e\x39\x7e\xb7\xb9\xc5\x7b\x7a\x19\x89\x2e\x72\x01\
+\xa6\xc8\x1f\xfb\xa5\xd0\x46\x49\xd6\x6d\x73\xfc\xce\x56\x34\xf5\
+\x18\x5d\xca\xdf\x71\x84\x58\xb3\x58\x37\x33\x73\x14\x1c\x82\x24\
+\x1e\x8e\xad\x87\x47\x67\xcc\x1b\x46\xdf\xcf\x71\xc3\xc3\x30\x6f\
+\x1c\x7d\x15\x7b\xe7\x9b\x36\x61\x6a\x23\xf3\x11\xf0\x4b\xaa\xe7\
+\xb1\x52\x14\xff\x6b\xf8\x81\x2f\x26\x77\x78\xd2\x5b\x86\xaf\xe3\
+\x6a\x46\xe7\xeb\x31\x1b\x0a\xf6\xd3\xb8\xee\x0a\x6f\xa7\x75\x1d\
+\x60\x13\x7a\x44\x2e\x7f\x21\x93\x7e\xdf\x0b\x90\x2c\x38\x2e\x62\
+\xaa\xc1\xbe\x6a\x80\xa3\xe2\x4a\xac\xcf\x90\xe3\x17\x53\xb8\x99\
+\xdc\x27\xf0\x6f\x18\xbc\xc6\xc7\xc8\x49\xbf\x8b\x98\x64\xb8\xbf\
+\xb9\x71\x25\x16\xc0\x1f\x0d\xf5\xbf\x96\xfc\xd1\x3e\xdf\xe8\xd4\
+\x6d\x02\xdf\xe1\x2e\xbe\x34\xdc\xdf\x6b\x71\x26\xd6\x14\x43\x4b\
+\xcb\x5c\xf2\xd7\xd9\x5b\x63\x90\x58\x63\x1c\x26\xd6\x25\x86\xfb\
+\x7b\x25\xee\x37\x6c\xc2\x35\xf9\xc5\x02\x5b\xe0\x01\x4a\x2e\x13\
+\x4a\x6b\x47\x47\x49\x35\x30\xa0\x74\x9b\x52\xe0\x8b\xb9\xd1\x74\
+\x46\x0c\xaa\x56\x2b\x8a\x15\xda\x9a\x9a\xf0\x4c\xcc\x78\x30\xe4\
+\x42\x17\xcc\x24\x7d\x9d\x6e\x78\xb3\x51\x49\xec\x18\x50\xba\x4d\
+\x61\x7d\xdd\x89\xe7\xc2\x7a\x88\xf1\x78\x27\x95\xdb\x45\x6a\x5e\
+\xaa\xd8\x52\x68\x6a\xad\x2e\x64\xfc\xeb\x67\x48\xa0\x13\xf1\x08\
+\xe2\xcc\x02\x9f\x5d\xaa\x4b\xef\xbe\xc0\x2f\x80\xf3\xab\x31\x63\
+\x3d\x8f\xf8\xa8\xf7\x89\xd8\xf7\xd7\xc0\x0b\x05\x3e\x37\x55\x3f\
+\x7a\x03\x87\x49\x70\xa0\xe1\xfe\x9a\x91\x40\x95\x59\xb4\xd4\x92\
+\xae\xd1\x97\xaf\x2b\x70\x65\xd6\xf7\x47\xaa\x0e\xfc\x7f\x54\xd8\
+\x77\xfe\xbe\x32\xd6\xfa\x62\x4a\xa4\x29\x43\xec\x5c\x1c\x72\x76\
+\x53\x74\x05\x4e\xc4\x9e\x6b\x76\x93\x12\x26\xe8\xba\xd4\x50\xe0\
+\xfb\xff\x51\x69\x01\xbc\x5a\xc6\xcd\xbd\x51\x64\xb6\x9a\x61\x50\
+\x90\xb3\x71\xc7\x45\xf7\x14\xe0\x4e\xd5\x83\xe2\x92\x57\x6c\x0d\
+\xe1\x8a\x53\x19\x43\x39\xbb\xb6\xd1\x79\xfa\xac\x47\xac\xfb\xa6\
+\x85\xf3\x1c\xf1\x4f\xba\xb6\x77\x91\x99\xa3\x9a\x6d\x5a\x25\x05\
+\x51\x4e\xba\xc8\xa7\xf3\xf4\x39\xc8\xa2\x70\x7a\xc4\x88\x44\xd9\
+\xae\x2c\x47\xeb\x66\x26\xce\x19\x11\x8f\xad\x84\xf2\x4e\x99\xdb\
+\xf8\x4e\x79\x7e\xbf\x12\xf8\x1e\xc9\xc7\x69\x12\x33\x0b\x6c\xb3\
+\x2b\x89\x5a\xc4\xa7\x7f\x63\xd5\x33\xbb\xa8\x62\x7c\x5b\xcc\x88\
+\x9f\x0b\x77\x20\x31\x99\x1f\xd9\xbe\x50\x39\x95\xbe\x3e\x2e\x60\
+\x4e\xb8\x10\xf3\x79\xcf\x1f\x8d\x91\x0e\x95\x19\xd3\x17\xc0\x3c\
+\x24\x78\xd6\x95\x3c\xae\xa3\x2a\x21\xa4\x17\xcb\x18\xe0\x3c\x72\
+\xbb\xcb\x64\xc8\xf6\x89\x61\x81\xc4\xc5\x6b\x74\x3e\x6e\x26\x06\
+\x0e\xb6\xae\x36\x0d\xa4\x20\x59\x51\xa2\xa2\x26\xcf\x8c\x95\xb1\
+\xc4\x37\x19\x7e\xa0\x71\x38\x2f\xec\x68\xd0\x3e\x57\x4d\x1c\x6d\
+\x9b\x58\xe5\x64\x32\xa9\xa5\xb0\x65\xdd\xa4\x7b\xf2\xe7\xc8\xf1\
+\x51\xb5\x71\x16\xc9\xc0\xd9\x94\x79\xfe\x5a\x8c\x58\xe5\x1c\x54\
+\x2e\xa1\x70\x32\xb4\xe7\x0d\x0a\x62\x22\xd5\x0f\x28\xa8\x01\x2e\
+\x48\x08\xb1\x76\x01\x0e\x2d\x77\x07\x53\x08\xfb\x23\xe9\x81\xa2\
+\xe0\x7e\xb5\x2d\xe5\x7b\x08\x0d\x48\xe9\x59\x13\xe8\x82\xe4\x85\
+\x58\x4c\xf5\x2a\x8d\xf6\xc7\x9d\xe8\xa0\x30\xe8\x8e\x58\xef\x7b\
+\x22\xc6\x6c\xa3\xf8\x9f\x32\x14\xc0\xcb\x8a\xf4\x9d\x19\xb0\x49\
+\xa5\xf3\x45\x0b\x66\x8c\xb0\xb0\x91\x48\xa5\x9a\xad\x11\xf8\x56\
+\x57\x83\x81\xa6\x97\xc2\x72\xf2\x4b\x15\x0b\x6e\x98\x87\xd4\x3f\
+\x34\x89\x83\x90\x0c\x33\xd5\x88\x54\x99\x4e\xb2\x90\xa9\x3b\x3d\
+\x58\x57\x2e\xa3\x38\x94\xf2\xc2\x91\x8a\xa1\x17\x12\x0a\x6f\xfa\
+\x4d\xfb\xad\x6e\x0e\x8e\x04\x7e\x56\xa1\x07\x31\x20\x61\x33\x56\
+\xf6\x4a\x60\x14\xdb\x22\xb5\x69\x6c\x11\x0b\xc4\x2d\xc7\x46\x9e\
+\xac\x87\x91\xc3\xe9\x85\xc0\x6e\x15\x20\xd6\x19\x09\x26\x96\x95\
+\x3c\xa7\x13\x22\x0e\xe4\xce\x12\xae\xb1\xd6\xb2\x50\x9e\xa9\x00\
+\xb1\x76\xc6\x9d\x42\xec\xa5\xb6\x92\x37\x44\x61\x12\xd9\x47\x35\
+\x0b\x84\x8d\x3e\xa9\x55\x25\xd1\x26\x0e\xc6\x7e\x31\xee\xf7\x91\
+\x92\x71\x49\xc4\x33\x36\x88\x15\xd5\xf0\x58\x57\xc2\x6c\x35\xda\
+\xb2\x60\xea\x80\x1b\xb1\x97\x33\x22\x83\x4f\x12\x4a\xac\xf7\x28\
+\xd1\x8d\x3c\x0c\xb1\x26\x47\xb4\x63\x94\xb2\x33\xab\x84\x2f\xd0\
+\xb6\xc0\x1f\xb0\x1b\x8a\xef\x42\x11\x83\x39\x11\x9f\x65\xb3\x69\
+\x62\xcd\x04\x5e\x8f\x30\x98\x79\x31\x7c\xd3\x4f\x46\x22\xb3\x2f\
+\x07\xb6\xb7\xd0\xff\x57\x31\x27\x55\x33\x70\x4f\x84\xbf\x9b\x15\
+\x85\x89\x61\x10\x65\xc6\x2a\x25\x6b\x5f\x25\xf3\x94\x0f\xd1\xb6\
+\xab\x9a\x23\x4c\xef\x78\x5e\x40\xd2\x0a\xc5\x05\x4b\x75\x26\x9d\
+\xa6\xbb\xe4\xa7\x28\x2d\x9b\x74\x33\xf0\xa6\xad\xc1\x45\xb1\x2a\
+\x97\x52\x78\xe9\x28\x60\x99\x85\xdd\x4c\x03\x12\xd5\x3d\x55\x7f\
+\xce\x40\x0c\x99\x4b\x10\x8b\x72\x3b\xc3\x72\xaa\x41\xdc\x8f\xab\
+\xbd\x8b\x6b\x42\xdc\xca\xef\x47\x9c\x0e\xb7\x0f\xac\x4e\xed\x95\
+\x28\xa5\xd8\x05\x23\x09\x22\xec\xce\xad\xd4\x0b\xec\xaa\xa6\x8a\
+\x30\xe8\xa1\x86\xcc\xcd\x11\xef\xd2\x53\x54\x10\x1d\x94\x1c\xfd\
+\x02\x63\xc8\xcc\xb2\x6b\x74\x56\xec\x80\x44\xbb\x74\x40\xf2\x44\
+\xcc\x0f\x08\x71\x9a\xb6\x1a\x5a\x22\xa6\x1b\x11\xc3\xec\x4c\xc4\
+\xa9\xad\xc9\xc2\x8b\xf8\x25\xe1\x8a\x17\x64\xfc\xd6\x3e\xd1\x71\
+\xcc\x06\xb6\x40\xce\x3d\x3b\x21\xd5\x36\xa2\xe2\x06\x24\xdc\x6b\
+\x59\x8e\xcf\x06\x01\xa7\xaa\x9c\xc3\x64\x96\xde\x86\x12\x6b\x2c\
+\x86\x25\x56\x1b\xc4\x35\x65\xcb\x12\xfa\x1e\x8a\x14\xff\x8e\x82\
+\x23\x94\x40\x99\x4a\x59\x03\x11\xe7\xb3\x05\xfa\xb3\x8f\x92\x76\
+\x82\x92\x65\xb9\xfe\x7c\x57\x89\x55\x6d\xdc\x00\x5c\x1c\xf2\xbb\
+\xe7\x23\xd1\x50\x4d\x4a\xf6\x6d\xf4\x45\xeb\x84\xb8\xaf\x8c\x88\
+\x38\x86\xce\x79\x48\x15\x7c\xa6\x27\xeb\x35\x86\x17\xe9\xeb\x04\
+\x2c\x79\xe8\xd6\x50\x7a\xea\xe8\x6d\x2d\x3e\xb8\x6e\x31\x57\x92\
+\x2f\x0c\x29\xa3\xc9\x45\x36\x50\x3b\xea\xec\x17\x65\x39\x1c\x19\
+\x72\xe2\xd8\x49\x75\xb0\x42\x7d\xfd\xd2\xa6\xb0\x4a\xf1\x7f\xff\
+\xca\x82\xfe\xe2\x12\x0e\x40\x32\x16\x4e\x52\xfd\x2e\x9f\x1e\x14\
+\x26\xd0\xf6\x18\xe0\x49\xc4\x05\xa9\x90\xcc\x3f\x57\x53\xc2\x2c\
+\xe4\x04\xe0\x8e\x12\xc6\xbb\x6f\x91\xbe\x07\xd9\xd2\xb1\x40\x72\
+\x02\xfc\x35\xe4\x77\xaf\x23\xbe\x75\x6c\x2a\x81\x7a\x7d\x18\x1b\
+\xa8\xee\x37\x04\x71\xf7\xdd\x31\xa2\xfc\x7b\xab\xd2\x7d\xbe\x92\
+\xf1\x4b\x25\x52\x13\x62\xfc\x5d\xad\xcb\x69\x57\xd5\x3d\x17\x23\
+\xa9\xbe\x4b\x51\x0b\xee\x51\x55\xe7\x07\x24\xf4\xbf\x4d\x44\x9e\
+\x94\xfc\x07\x1d\x91\xea\xeb\xc3\x72\x7c\xb6\x1c\x71\xb1\x99\xa0\
+\x6b\xfb\x05\x51\x6c\x1f\x09\xc7\x8f\xf4\xe5\x3c\x1c\xf1\x19\x9b\
+\xa0\x1b\x9c\x52\xd0\x06\x39\x9a\xfa\x82\xd6\x29\x26\xeb\x11\x67\
+\x81\x72\xd0\x51\xd5\x97\xa5\x6a\x86\x09\xaa\x1b\x97\xda\x16\xce\
+\x2e\xba\x6b\x0b\x46\xcf\x3e\x03\x9c\xab\x2c\xef\x42\xbc\xeb\xd7\
+\x54\x1b\x9d\x94\x5c\x37\xeb\xf2\xe3\x0a\x2a\x92\xe6\xfb\x62\x24\
+\x11\xc7\x38\xc4\x5f\xab\xbf\xe7\x8b\x87\x09\xd4\x01\x27\xe5\xd0\
+\x17\x3c\x3c\x3c\x3c\x3c\x3c\x3c\x3c\x3c\x04\xff\x0f\xa0\xeb\x2d\
+\x3e\x4f\x86\x3d\x7d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x02\xf3\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
+\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
+\x6e\x6f\x22\x3f\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\
+\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\
+\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\
+\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\
+\x6e\x73\x3a\x63\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\
+\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\
+\x67\x2f\x6e\x73\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
+\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\
+\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\
+\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\
+\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\
+\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x0a\x20\x20\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x32\x22\x0a\
+\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x0a\x20\x20\
+\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\
+\x20\x32\x34\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x32\x34\x22\x0a\x20\x20\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\
+\x30\x30\x30\x30\x22\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\x20\
+\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\
+\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
+\x63\x69\x74\x79\x3a\x30\x2e\x34\x37\x30\x35\x38\x38\x32\x34\x22\
+\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\x34\x22\
+\x0a\x20\x20\x20\x20\x20\x64\x3d\x22\x4d\x31\x37\x2e\x36\x35\x20\
+\x36\x2e\x33\x35\x43\x31\x36\x2e\x32\x20\x34\x2e\x39\x20\x31\x34\
+\x2e\x32\x31\x20\x34\x20\x31\x32\x20\x34\x63\x2d\x34\x2e\x34\x32\
+\x20\x30\x2d\x37\x2e\x39\x39\x20\x33\x2e\x35\x38\x2d\x37\x2e\x39\
+\x39\x20\x38\x73\x33\x2e\x35\x37\x20\x38\x20\x37\x2e\x39\x39\x20\
+\x38\x63\x33\x2e\x37\x33\x20\x30\x20\x36\x2e\x38\x34\x2d\x32\x2e\
+\x35\x35\x20\x37\x2e\x37\x33\x2d\x36\x68\x2d\x32\x2e\x30\x38\x63\
+\x2d\x2e\x38\x32\x20\x32\x2e\x33\x33\x2d\x33\x2e\x30\x34\x20\x34\
+\x2d\x35\x2e\x36\x35\x20\x34\x2d\x33\x2e\x33\x31\x20\x30\x2d\x36\
+\x2d\x32\x2e\x36\x39\x2d\x36\x2d\x36\x73\x32\x2e\x36\x39\x2d\x36\
+\x20\x36\x2d\x36\x63\x31\x2e\x36\x36\x20\x30\x20\x33\x2e\x31\x34\
+\x2e\x36\x39\x20\x34\x2e\x32\x32\x20\x31\x2e\x37\x38\x4c\x31\x33\
+\x20\x31\x31\x68\x37\x56\x34\x6c\x2d\x32\x2e\x33\x35\x20\x32\x2e\
+\x33\x35\x7a\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\
+\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\x36\x22\x0a\
+\x20\x20\x20\x20\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\
+\x0a\x20\x20\x20\x20\x20\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\x34\
+\x76\x32\x34\x48\x30\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x00\xc3\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x36\x20\x31\x39\x68\x34\x56\x35\x48\x36\x76\x31\x34\x7a\x6d\x38\
+\x2d\x31\x34\x76\x31\x34\x68\x34\x56\x35\x68\x2d\x34\x7a\x22\x2f\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\x30\x7a\x22\x20\x66\x69\
+\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\
+\x00\x00\x01\x09\
+\x3c\
+\x73\x76\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x30\x30\x30\x30\x30\
+\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\
+\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\
+\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x78\x6d\
+\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\
+\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x39\x20\x36\x2e\x34\x31\x4c\x31\x37\x2e\x35\x39\x20\x35\x20\
+\x31\x32\x20\x31\x30\x2e\x35\x39\x20\x36\x2e\x34\x31\x20\x35\x20\
+\x35\x20\x36\x2e\x34\x31\x20\x31\x30\x2e\x35\x39\x20\x31\x32\x20\
+\x35\x20\x31\x37\x2e\x35\x39\x20\x36\x2e\x34\x31\x20\x31\x39\x20\
+\x31\x32\x20\x31\x33\x2e\x34\x31\x20\x31\x37\x2e\x35\x39\x20\x31\
+\x39\x20\x31\x39\x20\x31\x37\x2e\x35\x39\x20\x31\x33\x2e\x34\x31\
+\x20\x31\x32\x7a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x30\x20\x30\x68\x32\x34\x76\x32\x34\x48\
+\x30\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00\x78\xc3\
+\x00\x72\
+\x00\x65\x00\x73\
+\x00\x08\
+\x00\x38\x55\xa7\
+\x00\x74\
+\x00\x69\x00\x6d\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x05\x78\x42\xa7\
+\x00\x72\
+\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x06\x38\x57\x27\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x06\xc1\x54\x07\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x06\xcb\x42\x47\
+\x00\x72\
+\x00\x65\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x15\
+\x07\x4b\x34\x47\
+\x00\x73\
+\x00\x75\x00\x73\x00\x70\x00\x65\x00\x6e\x00\x64\x00\x70\x00\x72\x00\x6f\x00\x63\x00\x65\x00\x73\x00\x73\x00\x69\x00\x6e\x00\x67\
+\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x12\
+\x07\x69\x7c\x07\
+\x00\x70\
+\x00\x61\x00\x75\x00\x73\x00\x65\x00\x5f\x00\x61\x00\x6e\x00\x61\x00\x6c\x00\x79\x00\x7a\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\
+\x00\x67\
+\x00\x11\
+\x08\xae\x50\x87\
+\x00\x67\
+\x00\x72\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\x73\x00\x74\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x16\
+\x09\xf9\x3b\x87\
+\x00\x74\
+\x00\x65\x00\x72\x00\x6d\x00\x69\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\
+\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x0a\xc2\xa3\x27\
+\x00\x76\
+\x00\x69\x00\x64\x00\x65\x00\x6f\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x13\
+\x0a\xc7\xc4\xe7\
+\x00\x72\
+\x00\x65\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\
+\x00\x76\x00\x67\
+\x00\x0c\
+\x0a\xe8\x9d\x07\
+\x00\x6c\
+\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x31\x00\x35\x00\x30\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0c\x6a\x21\xc7\
+\x00\x72\
+\x00\x65\x00\x66\x00\x72\x00\x65\x00\x73\x00\x68\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x0c\x98\xb7\xc7\
+\x00\x70\
+\x00\x61\x00\x75\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0d\x36\xdb\xa7\
+\x00\x74\
+\x00\x65\x00\x72\x00\x6d\x00\x69\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x02\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x01\x70\
+\x00\x00\x00\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xe2\
+\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x03\xad\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x04\xe6\
+\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x07\x8b\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xb6\
+\x00\x00\x00\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x11\x04\
+\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\x13\x45\
+\x00\x00\x01\x36\x00\x00\x00\x00\x00\x01\x00\x00\x14\x77\
+\x00\x00\x01\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x15\x84\
+\x00\x00\x01\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x18\x29\
+\x00\x00\x01\x98\x00\x00\x00\x00\x00\x01\x00\x00\x32\x2f\
+\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x35\x26\
+\x00\x00\x01\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x35\xed\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x01\x70\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xe2\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x03\xad\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x04\xe6\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x07\x8b\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xb6\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x00\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x11\x04\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\x13\x45\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\x36\x00\x00\x00\x00\x00\x01\x00\x00\x14\x77\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x15\x84\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x18\x29\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\x98\x00\x00\x00\x00\x00\x01\x00\x00\x32\x2f\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x35\x26\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+\x00\x00\x01\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x35\xed\
+\x00\x00\x01\x53\xf8\x41\x04\xe0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/gsinfo.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_GSInfoDialog(object):
+    def setupUi(self, GSInfoDialog):
+        GSInfoDialog.setObjectName("GSInfoDialog")
+        GSInfoDialog.resize(275, 158)
+        self.verticalLayout = QtWidgets.QVBoxLayout(GSInfoDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(GSInfoDialog)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.latitudeSpinBox = QtWidgets.QDoubleSpinBox(GSInfoDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.latitudeSpinBox.sizePolicy().hasHeightForWidth())
+        self.latitudeSpinBox.setSizePolicy(sizePolicy)
+        self.latitudeSpinBox.setAccelerated(True)
+        self.latitudeSpinBox.setDecimals(7)
+        self.latitudeSpinBox.setMinimum(-90.0)
+        self.latitudeSpinBox.setMaximum(90.0)
+        self.latitudeSpinBox.setSingleStep(0.01)
+        self.latitudeSpinBox.setObjectName("latitudeSpinBox")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.latitudeSpinBox)
+        self.label_2 = QtWidgets.QLabel(GSInfoDialog)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.longitudeSpinBox = QtWidgets.QDoubleSpinBox(GSInfoDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.longitudeSpinBox.sizePolicy().hasHeightForWidth())
+        self.longitudeSpinBox.setSizePolicy(sizePolicy)
+        self.longitudeSpinBox.setAccelerated(True)
+        self.longitudeSpinBox.setDecimals(7)
+        self.longitudeSpinBox.setMinimum(-180.0)
+        self.longitudeSpinBox.setMaximum(180.0)
+        self.longitudeSpinBox.setSingleStep(0.01)
+        self.longitudeSpinBox.setObjectName("longitudeSpinBox")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.longitudeSpinBox)
+        self.label_3 = QtWidgets.QLabel(GSInfoDialog)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.timezoneComboBox = QtWidgets.QComboBox(GSInfoDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.timezoneComboBox.sizePolicy().hasHeightForWidth())
+        self.timezoneComboBox.setSizePolicy(sizePolicy)
+        self.timezoneComboBox.setObjectName("timezoneComboBox")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.timezoneComboBox)
+        self.label_4 = QtWidgets.QLabel(GSInfoDialog)
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.lastChangedLabel = QtWidgets.QLabel(GSInfoDialog)
+        self.lastChangedLabel.setObjectName("lastChangedLabel")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.lastChangedLabel)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.buttonBox = QtWidgets.QDialogButtonBox(GSInfoDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.label.setBuddy(self.latitudeSpinBox)
+        self.label_2.setBuddy(self.longitudeSpinBox)
+        self.label_3.setBuddy(self.timezoneComboBox)
+
+        self.retranslateUi(GSInfoDialog)
+        self.buttonBox.accepted.connect(GSInfoDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(GSInfoDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(GSInfoDialog)
+
+    def retranslateUi(self, GSInfoDialog):
+        _translate = QtCore.QCoreApplication.translate
+        GSInfoDialog.setWindowTitle(_translate("GSInfoDialog", "Set Ground Station info"))
+        self.label.setText(_translate("GSInfoDialog", "L&atitude:"))
+        self.latitudeSpinBox.setSuffix(_translate("GSInfoDialog", "°"))
+        self.label_2.setText(_translate("GSInfoDialog", "L&ongitude:"))
+        self.longitudeSpinBox.setSuffix(_translate("GSInfoDialog", "°"))
+        self.label_3.setText(_translate("GSInfoDialog", "&Timezone:"))
+        self.label_4.setText(_translate("GSInfoDialog", "Last change:"))
+        self.lastChangedLabel.setToolTip(_translate("GSInfoDialog", "Timestamp of the last change (in your local timezone)"))
+        self.lastChangedLabel.setText(_translate("GSInfoDialog", "None"))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/login.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LoginDialog(object):
+    def setupUi(self, LoginDialog):
+        LoginDialog.setObjectName("LoginDialog")
+        LoginDialog.resize(318, 502)
+        LoginDialog.setWindowOpacity(1.0)
+        self.verticalLayout = QtWidgets.QVBoxLayout(LoginDialog)
+        self.verticalLayout.setSpacing(9)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label = QtWidgets.QLabel(LoginDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(150, 0))
+        self.label.setText("")
+        self.label.setPixmap(QtGui.QPixmap(":/res/logo_150.png"))
+        self.label.setScaledContents(False)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.verticalLayout.addWidget(self.label)
+        self.label_2 = QtWidgets.QLabel(LoginDialog)
+        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout.addWidget(self.label_2)
+        self.line = QtWidgets.QFrame(LoginDialog)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout.addWidget(self.line)
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.serverLabel = QtWidgets.QLabel(LoginDialog)
+        self.serverLabel.setObjectName("serverLabel")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.serverLabel)
+        self.serverEdit = QtWidgets.QLineEdit(LoginDialog)
+        self.serverEdit.setInputMethodHints(QtCore.Qt.ImhPreferLowercase|QtCore.Qt.ImhUrlCharactersOnly)
+        self.serverEdit.setObjectName("serverEdit")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.serverEdit)
+        self.usernameLabel = QtWidgets.QLabel(LoginDialog)
+        self.usernameLabel.setObjectName("usernameLabel")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.usernameLabel)
+        self.usernameEdit = QtWidgets.QLineEdit(LoginDialog)
+        self.usernameEdit.setObjectName("usernameEdit")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.usernameEdit)
+        self.passwordLabel = QtWidgets.QLabel(LoginDialog)
+        self.passwordLabel.setObjectName("passwordLabel")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.passwordLabel)
+        self.passwordEdit = QtWidgets.QLineEdit(LoginDialog)
+        self.passwordEdit.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.passwordEdit.setObjectName("passwordEdit")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.passwordEdit)
+        self.label_3 = QtWidgets.QLabel(LoginDialog)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.webappURLEdit = QtWidgets.QLineEdit(LoginDialog)
+        self.webappURLEdit.setInputMethodHints(QtCore.Qt.ImhPreferLowercase|QtCore.Qt.ImhUrlCharactersOnly)
+        self.webappURLEdit.setObjectName("webappURLEdit")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.webappURLEdit)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.rememberCheckBox = QtWidgets.QCheckBox(LoginDialog)
+        self.rememberCheckBox.setObjectName("rememberCheckBox")
+        self.verticalLayout.addWidget(self.rememberCheckBox)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.buttonBox = QtWidgets.QDialogButtonBox(LoginDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.serverLabel.setBuddy(self.serverEdit)
+        self.usernameLabel.setBuddy(self.usernameEdit)
+        self.passwordLabel.setBuddy(self.passwordEdit)
+        self.label_3.setBuddy(self.webappURLEdit)
+
+        self.retranslateUi(LoginDialog)
+        self.buttonBox.accepted.connect(LoginDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(LoginDialog.reject) # type: ignore
+        self.serverEdit.editingFinished.connect(LoginDialog.check_server_contents) # type: ignore
+        self.webappURLEdit.editingFinished.connect(LoginDialog.check_webapp_url_contents) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(LoginDialog)
+
+    def retranslateUi(self, LoginDialog):
+        _translate = QtCore.QCoreApplication.translate
+        LoginDialog.setWindowTitle(_translate("LoginDialog", "Login to KrakSat Server"))
+        self.label_2.setText(_translate("LoginDialog", "<html><head/><body><p><span style=\" font-size:18pt;\">KrakSat 2016<br/></span>Ground Station Software</p></body></html>"))
+        self.serverLabel.setText(_translate("LoginDialog", "&Server:"))
+        self.serverEdit.setPlaceholderText(_translate("LoginDialog", "http://"))
+        self.usernameLabel.setText(_translate("LoginDialog", "&Username:"))
+        self.passwordLabel.setText(_translate("LoginDialog", "&Password:"))
+        self.label_3.setText(_translate("LoginDialog", "&Webapp URL:"))
+        self.webappURLEdit.setPlaceholderText(_translate("LoginDialog", "http://"))
+        self.rememberCheckBox.setText(_translate("LoginDialog", "&Remember me"))
+from . import res_rc
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/logs.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LogsDock(object):
+    def setupUi(self, LogsDock):
+        LogsDock.setObjectName("LogsDock")
+        LogsDock.resize(540, 217)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.filterComboBox = FilterComboBox(self.dockWidgetContents)
+        self.filterComboBox.setObjectName("filterComboBox")
+        self.verticalLayout.addWidget(self.filterComboBox)
+        self.table = QtWidgets.QTableView(self.dockWidgetContents)
+        self.table.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+        self.table.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.table.setWordWrap(False)
+        self.table.setObjectName("table")
+        self.table.horizontalHeader().setHighlightSections(False)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.table)
+        LogsDock.setWidget(self.dockWidgetContents)
+        self.actionCopy = QtWidgets.QAction(LogsDock)
+        self.actionCopy.setObjectName("actionCopy")
+
+        self.retranslateUi(LogsDock)
+        self.filterComboBox.popup_hidden.connect(LogsDock.reset_filter) # type: ignore
+        self.actionCopy.triggered.connect(LogsDock.copy_selected) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(LogsDock)
+
+    def retranslateUi(self, LogsDock):
+        _translate = QtCore.QCoreApplication.translate
+        LogsDock.setWindowTitle(_translate("LogsDock", "&Logs"))
+        self.filterComboBox.setToolTip(_translate("LogsDock", "Filter logs by module"))
+        self.actionCopy.setText(_translate("LogsDock", "Copy"))
+        self.actionCopy.setShortcut(_translate("LogsDock", "Ctrl+C"))
+from app.widgets.filtercombobox import FilterComboBox
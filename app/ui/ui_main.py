@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/main.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(923, 702)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/res/logo_150.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        MainWindow.setWindowIcon(icon)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.webView = QtWebEngineWidgets.QWebEngineView(self.centralwidget)
+        self.webView.setObjectName("webView")
+        self.verticalLayout_3.addWidget(self.webView)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 923, 19))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuView = QtWidgets.QMenu(self.menubar)
+        self.menuView.setObjectName("menuView")
+        self.menuHelp = QtWidgets.QMenu(self.menubar)
+        self.menuHelp.setObjectName("menuHelp")
+        self.menuActions = QtWidgets.QMenu(self.menubar)
+        self.menuActions.setObjectName("menuActions")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.fileToolBar = QtWidgets.QToolBar(MainWindow)
+        self.fileToolBar.setObjectName("fileToolBar")
+        MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.fileToolBar)
+        self.webViewToolBar = QtWidgets.QToolBar(MainWindow)
+        self.webViewToolBar.setObjectName("webViewToolBar")
+        MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.webViewToolBar)
+        self.actionsToolbar = QtWidgets.QToolBar(MainWindow)
+        self.actionsToolbar.setObjectName("actionsToolbar")
+        MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.actionsToolbar)
+        self.actionAbout = QtWidgets.QAction(MainWindow)
+        self.actionAbout.setMenuRole(QtWidgets.QAction.AboutRole)
+        self.actionAbout.setObjectName("actionAbout")
+        self.actionQuit = QtWidgets.QAction(MainWindow)
+        self.actionQuit.setMenuRole(QtWidgets.QAction.QuitRole)
+        self.actionQuit.setObjectName("actionQuit")
+        self.actionReload = QtWidgets.QAction(MainWindow)
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/res/reload.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionReload.setIcon(icon1)
+        self.actionReload.setObjectName("actionReload")
+        self.actionHome = QtWidgets.QAction(MainWindow)
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/res/home.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionHome.setIcon(icon2)
+        self.actionHome.setObjectName("actionHome")
+        self.actionSetGSInfo = QtWidgets.QAction(MainWindow)
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/res/groundstation.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionSetGSInfo.setIcon(icon3)
+        self.actionSetGSInfo.setObjectName("actionSetGSInfo")
+        self.actionTerminateParser = QtWidgets.QAction(MainWindow)
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap(":/res/terminate.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon4.addPixmap(QtGui.QPixmap(":/res/terminate_disabled.svg"), QtGui.QIcon.Disabled, QtGui.QIcon.Off)
+        icon4.addPixmap(QtGui.QPixmap(":/res/terminate_disabled.svg"), QtGui.QIcon.Disabled, QtGui.QIcon.On)
+        self.actionTerminateParser.setIcon(icon4)
+        self.actionTerminateParser.setObjectName("actionTerminateParser")
+        self.actionPauseQueue = QtWidgets.QAction(MainWindow)
+        self.actionPauseQueue.setCheckable(True)
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap(":/res/pause.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionPauseQueue.setIcon(icon5)
+        self.actionPauseQueue.setObjectName("actionPauseQueue")
+        self.actionParseFile = QtWidgets.QAction(MainWindow)
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap(":/res/open.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionParseFile.setIcon(icon6)
+        self.actionParseFile.setObjectName("actionParseFile")
+        self.actionReadSerialPort = QtWidgets.QAction(MainWindow)
+        self.actionReadSerialPort.setObjectName("actionReadSerialPort")
+        self.actionSuspendProcessing = QtWidgets.QAction(MainWindow)
+        self.actionSuspendProcessing.setCheckable(True)
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap(":/res/suspendprocessing.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionSuspendProcessing.setIcon(icon7)
+        self.actionSuspendProcessing.setObjectName("actionSuspendProcessing")
+        self.actionAboutQt = QtWidgets.QAction(MainWindow)
+        self.actionAboutQt.setObjectName("actionAboutQt")
+        self.actionSetProbeStartTime = QtWidgets.QAction(MainWindow)
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap(":/res/time.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionSetProbeStartTime.setIcon(icon8)
+        self.actionSetProbeStartTime.setObjectName("actionSetProbeStartTime")
+        self.actionSetVideoID = QtWidgets.QAction(MainWindow)
+        icon9 = QtGui.QIcon()
+        icon9.addPixmap(QtGui.QPixmap(":/res/video.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionSetVideoID.setIcon(icon9)
+        self.actionSetVideoID.setObjectName("actionSetVideoID")
+        self.actionPauseAnalyzer = QtWidgets.QAction(MainWindow)
+        self.actionPauseAnalyzer.setCheckable(True)
+        icon10 = QtGui.QIcon()
+        icon10.addPixmap(QtGui.QPixmap(":/res/pause_analyzer.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionPauseAnalyzer.setIcon(icon10)
+        self.actionPauseAnalyzer.setObjectName("actionPauseAnalyzer")
+        self.menuFile.addAction(self.actionParseFile)
+        self.menuFile.addAction(self.actionReadSerialPort)
+        self.menuFile.addAction(self.actionTerminateParser)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionPauseQueue)
+        self.menuFile.addAction(self.actionSuspendProcessing)
+        self.menuFile.addAction(self.actionPauseAnalyzer)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionQuit)
+        self.menuView.addAction(self.actionReload)
+        self.menuView.addAction(self.actionHome)
+        self.menuView.addSeparator()
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuHelp.addAction(self.actionAboutQt)
+        self.menuActions.addAction(self.actionSetGSInfo)
+        self.menuActions.addAction(self.actionSetProbeStartTime)
+        self.menuActions.addAction(self.actionSetVideoID)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
+        self.menubar.addAction(self.menuActions.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.fileToolBar.addAction(self.actionParseFile)
+        self.fileToolBar.addAction(self.actionTerminateParser)
+        self.fileToolBar.addSeparator()
+        self.fileToolBar.addAction(self.actionPauseQueue)
+        self.fileToolBar.addAction(self.actionSuspendProcessing)
+        self.fileToolBar.addAction(self.actionPauseAnalyzer)
+        self.webViewToolBar.addAction(self.actionHome)
+        self.webViewToolBar.addAction(self.actionReload)
+        self.actionsToolbar.addAction(self.actionSetGSInfo)
+        self.actionsToolbar.addAction(self.actionSetProbeStartTime)
+        self.actionsToolbar.addAction(self.actionSetVideoID)
+
+        self.retranslateUi(MainWindow)
+        self.actionQuit.triggered.connect(MainWindow.close) # type: ignore
+        self.actionAbout.triggered.connect(MainWindow.show_about) # type: ignore
+        self.actionReload.triggered.connect(self.webView.reload) # type: ignore
+        self.actionHome.triggered.connect(MainWindow.webview_go_home) # type: ignore
+        self.actionSetGSInfo.triggered.connect(MainWindow.show_set_gs_info) # type: ignore
+        self.actionPauseQueue.triggered['bool'].connect(MainWindow.set_queue_paused) # type: ignore
+        self.actionParseFile.triggered.connect(MainWindow.choose_parser_file) # type: ignore
+        self.actionReadSerialPort.triggered.connect(MainWindow.choose_serial_port) # type: ignore
+        self.actionAboutQt.triggered.connect(MainWindow.show_about_qt) # type: ignore
+        self.actionTerminateParser.triggered.connect(MainWindow.terminate_parser) # type: ignore
+        self.actionSetProbeStartTime.triggered.connect(MainWindow.show_set_probe_start_time) # type: ignore
+        self.actionSuspendProcessing.triggered['bool'].connect(MainWindow.set_processing_suspended) # type: ignore
+        self.actionSetVideoID.triggered.connect(MainWindow.show_set_video_id) # type: ignore
+        self.actionPauseAnalyzer.triggered['bool'].connect(MainWindow.set_analyzer_paused) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "KrakSat 2016 Ground Station Software"))
+        self.menuFile.setTitle(_translate("MainWindow", "&File"))
+        self.menuView.setTitle(_translate("MainWindow", "&View"))
+        self.menuHelp.setTitle(_translate("MainWindow", "&Help"))
+        self.menuActions.setTitle(_translate("MainWindow", "&Actions"))
+        self.fileToolBar.setWindowTitle(_translate("MainWindow", "&File"))
+        self.webViewToolBar.setWindowTitle(_translate("MainWindow", "&Web View"))
+        self.actionsToolbar.setWindowTitle(_translate("MainWindow", "&Actions"))
+        self.actionAbout.setText(_translate("MainWindow", "&About"))
+        self.actionQuit.setText(_translate("MainWindow", "&Quit"))
+        self.actionReload.setText(_translate("MainWindow", "&Reload"))
+        self.actionReload.setStatusTip(_translate("MainWindow", "Reload current website"))
+        self.actionReload.setShortcut(_translate("MainWindow", "F5"))
+        self.actionHome.setText(_translate("MainWindow", "&Home"))
+        self.actionHome.setStatusTip(_translate("MainWindow", "Go to KrakSat website home"))
+        self.actionHome.setShortcut(_translate("MainWindow", "Alt+Home"))
+        self.actionSetGSInfo.setText(_translate("MainWindow", "Set &Ground Station Info"))
+        self.actionSetGSInfo.setStatusTip(_translate("MainWindow", "Set Ground Station latitude, longitude and timezone"))
+        self.actionSetGSInfo.setShortcut(_translate("MainWindow", "F6"))
+        self.actionTerminateParser.setText(_translate("MainWindow", "&Terminate Parser"))
+        self.actionTerminateParser.setToolTip(_translate("MainWindow", "Terminate Parser"))
+        self.actionTerminateParser.setStatusTip(_translate("MainWindow", "Stop the currently running parser"))
+        self.actionPauseQueue.setText(_translate("MainWindow", "Pause &Request Queue"))
+        self.actionPauseQueue.setToolTip(_translate("MainWindow", "Pause Request Queue"))
+        self.actionPauseQueue.setStatusTip(_translate("MainWindow", "Temporarily prevent from sending data to the server"))
+        self.actionPauseQueue.setShortcut(_translate("MainWindow", "F3"))
+        self.actionParseFile.setText(_translate("MainWindow", "&Parse File"))
+        self.actionParseFile.setToolTip(_translate("MainWindow", "Parse File"))
+        self.actionParseFile.setStatusTip(_translate("MainWindow", "Open a file for parsing"))
+        self.actionParseFile.setShortcut(_translate("MainWindow", "Ctrl+O"))
+        self.actionReadSerialPort.setText(_translate("MainWindow", "Read &Serial Port"))
+        self.actionReadSerialPort.setToolTip(_translate("MainWindow", "Read Serial Port"))
+        self.actionReadSerialPort.setStatusTip(_translate("MainWindow", "Parse the data read directly from a serial port"))
+        self.actionReadSerialPort.setShortcut(_translate("MainWindow", "Ctrl+Shift+O"))
+        self.actionSuspendProcessing.setText(_translate("MainWindow", "&Suspend Processing"))
+        self.actionSuspendProcessing.setStatusTip(_translate("MainWindow", "Withhold received data from being further processed, e.g. to calculate planetary info"))
+        self.actionSuspendProcessing.setShortcut(_translate("MainWindow", "F4"))
+        self.actionAboutQt.setText(_translate("MainWindow", "About &Qt"))
+        self.actionSetProbeStartTime.setText(_translate("MainWindow", "Set &Probe Start Time"))
+        self.actionSetProbeStartTime.setStatusTip(_translate("MainWindow", "Set probe start time for proper timestamp calculations"))
+        self.actionSetProbeStartTime.setShortcut(_translate("MainWindow", "F7"))
+        self.actionSetVideoID.setText(_translate("MainWindow", "Set &Video ID"))
+        self.actionSetVideoID.setIconText(_translate("MainWindow", "Set Video ID"))
+        self.actionSetVideoID.setToolTip(_translate("MainWindow", "Set Video ID"))
+        self.actionSetVideoID.setStatusTip(_translate("MainWindow", "Set YouTube video stream ID"))
+        self.actionPauseAnalyzer.setText(_translate("MainWindow", "Pause &Analyzer"))
+        self.actionPauseAnalyzer.setStatusTip(_translate("MainWindow", "Temporarily pause analyzing data"))
+        self.actionPauseAnalyzer.setShortcut(_translate("MainWindow", "Shift+F4"))
+from PyQt5 import QtWebEngineWidgets
+from . import res_rc
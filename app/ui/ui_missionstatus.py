@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/missionstatus.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MissionStatusDock(object):
+    def setupUi(self, MissionStatusDock):
+        MissionStatusDock.setObjectName("MissionStatusDock")
+        MissionStatusDock.resize(239, 181)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setContentsMargins(5, 5, 5, 5)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout_3 = QtWidgets.QFormLayout()
+        self.formLayout_3.setObjectName("formLayout_3")
+        self.label_6 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_6.setObjectName("label_6")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_6)
+        self.stateComboBox = QtWidgets.QComboBox(self.dockWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.stateComboBox.sizePolicy().hasHeightForWidth())
+        self.stateComboBox.setSizePolicy(sizePolicy)
+        self.stateComboBox.setObjectName("stateComboBox")
+        self.formLayout_3.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.stateComboBox)
+        self.label_9 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_9.setObjectName("label_9")
+        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_9)
+        self.lastChangeLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        self.lastChangeLabel.setObjectName("lastChangeLabel")
+        self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.lastChangeLabel)
+        self.label_7 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_7.setObjectName("label_7")
+        self.formLayout_3.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_7)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setSpacing(3)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.missionTimeCheckBox = QtWidgets.QCheckBox(self.dockWidgetContents)
+        self.missionTimeCheckBox.setObjectName("missionTimeCheckBox")
+        self.horizontalLayout_3.addWidget(self.missionTimeCheckBox)
+        self.missionTimeFrame = QtWidgets.QFrame(self.dockWidgetContents)
+        self.missionTimeFrame.setEnabled(False)
+        self.missionTimeFrame.setStyleSheet("QFrame {\n"
+"    background-color: #fff;\n"
+"    border: 1px solid #aaa;\n"
+"    border-radius: 3px;\n"
+"}\n"
+"\n"
+"QFrame:disabled {\n"
+"    background-color: #efebe7;\n"
+"}")
+        self.missionTimeFrame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.missionTimeFrame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.missionTimeFrame.setObjectName("missionTimeFrame")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.missionTimeFrame)
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        spacerItem = QtWidgets.QSpacerItem(3, 0, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem)
+        self.missionTimeSpinBox = QtWidgets.QDoubleSpinBox(self.missionTimeFrame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.missionTimeSpinBox.sizePolicy().hasHeightForWidth())
+        self.missionTimeSpinBox.setSizePolicy(sizePolicy)
+        self.missionTimeSpinBox.setFrame(False)
+        self.missionTimeSpinBox.setMinimum(-1000.0)
+        self.missionTimeSpinBox.setMaximum(9999.99)
+        self.missionTimeSpinBox.setProperty("value", -1000.0)
+        self.missionTimeSpinBox.setObjectName("missionTimeSpinBox")
+        self.horizontalLayout_4.addWidget(self.missionTimeSpinBox)
+        self.missionTimeNoneButton = QtWidgets.QToolButton(self.missionTimeFrame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.missionTimeNoneButton.sizePolicy().hasHeightForWidth())
+        self.missionTimeNoneButton.setSizePolicy(sizePolicy)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/res/remove.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon.addPixmap(QtGui.QPixmap(":/res/remove_disabled.svg"), QtGui.QIcon.Disabled, QtGui.QIcon.Off)
+        icon.addPixmap(QtGui.QPixmap(":/res/remove_disabled.svg"), QtGui.QIcon.Disabled, QtGui.QIcon.On)
+        self.missionTimeNoneButton.setIcon(icon)
+        self.missionTimeNoneButton.setIconSize(QtCore.QSize(14, 14))
+        self.missionTimeNoneButton.setAutoRaise(True)
+        self.missionTimeNoneButton.setObjectName("missionTimeNoneButton")
+        self.horizontalLayout_4.addWidget(self.missionTimeNoneButton)
+        self.horizontalLayout_3.addWidget(self.missionTimeFrame)
+        self.formLayout_3.setLayout(2, QtWidgets.QFormLayout.FieldRole, self.horizontalLayout_3)
+        self.canSatOnlineCheckBox = QtWidgets.QCheckBox(self.dockWidgetContents)
+        self.canSatOnlineCheckBox.setObjectName("canSatOnlineCheckBox")
+        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.canSatOnlineCheckBox)
+        self.label_8 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_8.setObjectName("label_8")
+        self.formLayout_3.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_8)
+        self.verticalLayout.addLayout(self.formLayout_3)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 12, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        self.verticalLayout.addItem(spacerItem1)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.refreshButton = QtWidgets.QToolButton(self.dockWidgetContents)
+        self.refreshButton.setStatusTip("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/res/refresh.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.refreshButton.setIcon(icon1)
+        self.refreshButton.setAutoRaise(True)
+        self.refreshButton.setObjectName("refreshButton")
+        self.horizontalLayout_2.addWidget(self.refreshButton)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem2)
+        self.submitButton = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.submitButton.setObjectName("submitButton")
+        self.horizontalLayout_2.addWidget(self.submitButton)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 1, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem3)
+        self.verticalLayout.setStretch(3, 1)
+        MissionStatusDock.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(MissionStatusDock)
+        self.refreshButton.clicked.connect(MissionStatusDock.refresh) # type: ignore
+        self.submitButton.clicked.connect(MissionStatusDock.submit) # type: ignore
+        self.missionTimeCheckBox.toggled['bool'].connect(self.missionTimeFrame.setEnabled) # type: ignore
+        self.missionTimeNoneButton.clicked.connect(MissionStatusDock.set_none_mission_time) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MissionStatusDock)
+
+    def retranslateUi(self, MissionStatusDock):
+        _translate = QtCore.QCoreApplication.translate
+        MissionStatusDock.setWindowTitle(_translate("MissionStatusDock", "&Mission status"))
+        self.label_6.setText(_translate("MissionStatusDock", "Phase:"))
+        self.label_9.setText(_translate("MissionStatusDock", "Last change:"))
+        self.lastChangeLabel.setText(_translate("MissionStatusDock", "None"))
+        self.label_7.setText(_translate("MissionStatusDock", "Mission time:"))
+        self.missionTimeCheckBox.setToolTip(_translate("MissionStatusDock", "Check to change current mission time"))
+        self.missionTimeSpinBox.setToolTip(_translate("MissionStatusDock", "Negative value means countdown to start"))
+        self.missionTimeSpinBox.setSpecialValueText(_translate("MissionStatusDock", "None"))
+        self.missionTimeSpinBox.setSuffix(_translate("MissionStatusDock", "sec"))
+        self.missionTimeNoneButton.setToolTip(_translate("MissionStatusDock", "Set to None"))
+        self.label_8.setText(_translate("MissionStatusDock", "CanSat online:"))
+        self.refreshButton.setToolTip(_translate("MissionStatusDock", "Refresh mission status"))
+        self.submitButton.setText(_translate("MissionStatusDock", "Submit"))
+from . import res_rc
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/probestart.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ProbeStartDialog(object):
+    def setupUi(self, ProbeStartDialog):
+        ProbeStartDialog.setObjectName("ProbeStartDialog")
+        ProbeStartDialog.resize(233, 95)
+        ProbeStartDialog.setModal(True)
+        self.verticalLayout = QtWidgets.QVBoxLayout(ProbeStartDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label = QtWidgets.QLabel(ProbeStartDialog)
+        self.label.setObjectName("label")
+        self.verticalLayout.addWidget(self.label)
+        self.probeStartTimeEdit = QtWidgets.QDateTimeEdit(ProbeStartDialog)
+        self.probeStartTimeEdit.setObjectName("probeStartTimeEdit")
+        self.verticalLayout.addWidget(self.probeStartTimeEdit)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.buttonBox = QtWidgets.QDialogButtonBox(ProbeStartDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.label.setBuddy(self.probeStartTimeEdit)
+
+        self.retranslateUi(ProbeStartDialog)
+        self.buttonBox.accepted.connect(ProbeStartDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(ProbeStartDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ProbeStartDialog)
+
+    def retranslateUi(self, ProbeStartDialog):
+        _translate = QtCore.QCoreApplication.translate
+        ProbeStartDialog.setWindowTitle(_translate("ProbeStartDialog", "Set Probe Start Time"))
+        self.label.setText(_translate("ProbeStartDialog", "&Probe start time:"))
+        self.probeStartTimeEdit.setDisplayFormat(_translate("ProbeStartDialog", "yyyy-MM-dd hh:mm:ss.zzz"))
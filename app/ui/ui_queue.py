@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/queue.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_QueueDock(object):
+    def setupUi(self, QueueDock):
+        QueueDock.setObjectName("QueueDock")
+        QueueDock.resize(285, 248)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.table = QtWidgets.QTableView(self.dockWidgetContents)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.table.setWordWrap(False)
+        self.table.setObjectName("table")
+        self.table.horizontalHeader().setHighlightSections(False)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.table)
+        QueueDock.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(QueueDock)
+        QtCore.QMetaObject.connectSlotsByName(QueueDock)
+
+    def retranslateUi(self, QueueDock):
+        _translate = QtCore.QCoreApplication.translate
+        QueueDock.setWindowTitle(_translate("QueueDock", "&Queue"))
+from . import res_rc
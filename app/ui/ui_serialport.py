@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/serialport.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SerialPortDialog(object):
+    def setupUi(self, SerialPortDialog):
+        SerialPortDialog.setObjectName("SerialPortDialog")
+        SerialPortDialog.resize(340, 140)
+        SerialPortDialog.setModal(True)
+        self.verticalLayout = QtWidgets.QVBoxLayout(SerialPortDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(SerialPortDialog)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.portComboBox = QtWidgets.QComboBox(SerialPortDialog)
+        self.portComboBox.setEditable(True)
+        self.portComboBox.setObjectName("portComboBox")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.portComboBox)
+        self.label_2 = QtWidgets.QLabel(SerialPortDialog)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.baudrateComboBox = QtWidgets.QComboBox(SerialPortDialog)
+        self.baudrateComboBox.setEditable(True)
+        self.baudrateComboBox.setObjectName("baudrateComboBox")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.baudrateComboBox)
+        self.label_3 = QtWidgets.QLabel(SerialPortDialog)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.archiveLineEdit = QtWidgets.QLineEdit(SerialPortDialog)
+        self.archiveLineEdit.setObjectName("archiveLineEdit")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.archiveLineEdit)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.buttonBox = QtWidgets.QDialogButtonBox(SerialPortDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.label.setBuddy(self.portComboBox)
+        self.label_2.setBuddy(self.baudrateComboBox)
+        self.label_3.setBuddy(self.archiveLineEdit)
+
+        self.retranslateUi(SerialPortDialog)
+        self.buttonBox.accepted.connect(SerialPortDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(SerialPortDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(SerialPortDialog)
+
+    def retranslateUi(self, SerialPortDialog):
+        _translate = QtCore.QCoreApplication.translate
+        SerialPortDialog.setWindowTitle(_translate("SerialPortDialog", "Read Serial Port"))
+        self.label.setText(_translate("SerialPortDialog", "&Port:"))
+        self.label_2.setText(_translate("SerialPortDialog", "&Baud rate:"))
+        self.label_3.setText(_translate("SerialPortDialog", "&Archive file:"))
+        self.archiveLineEdit.setPlaceholderText(_translate("SerialPortDialog", "Don\'t archive the data"))
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/statistics.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_StatisticsDock(object):
+    def setupUi(self, StatisticsDock):
+        StatisticsDock.setObjectName("StatisticsDock")
+        StatisticsDock.resize(200, 320)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.formLayout = QtWidgets.QFormLayout(self.dockWidgetContents)
+        self.formLayout.setContentsMargins(5, 5, 5, 5)
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.timeSinceStartLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.timeSinceStartLabel.setFont(font)
+        self.timeSinceStartLabel.setObjectName("timeSinceStartLabel")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.timeSinceStartLabel)
+        self.label_3 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.timeSinceLastReceiveLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.timeSinceLastReceiveLabel.setFont(font)
+        self.timeSinceLastReceiveLabel.setObjectName("timeSinceLastReceiveLabel")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.timeSinceLastReceiveLabel)
+        self.label_4 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.messagesParsedLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.messagesParsedLabel.setFont(font)
+        self.messagesParsedLabel.setObjectName("messagesParsedLabel")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.messagesParsedLabel)
+        self.label_6 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_6.setObjectName("label_6")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_6)
+        self.parseFailuresLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.parseFailuresLabel.setFont(font)
+        self.parseFailuresLabel.setObjectName("parseFailuresLabel")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.parseFailuresLabel)
+        self.label_2 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.requestsSentLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.requestsSentLabel.setFont(font)
+        self.requestsSentLabel.setObjectName("requestsSentLabel")
+        self.formLayout.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.requestsSentLabel)
+        self.label_7 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_7.setObjectName("label_7")
+        self.formLayout.setWidget(5, QtWidgets.QFormLayout.LabelRole, self.label_7)
+        self.totalDataReceivedLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.totalDataReceivedLabel.setFont(font)
+        self.totalDataReceivedLabel.setObjectName("totalDataReceivedLabel")
+        self.formLayout.setWidget(5, QtWidgets.QFormLayout.FieldRole, self.totalDataReceivedLabel)
+        self.label_8 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_8.setObjectName("label_8")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.label_8)
+        self.queueLengthLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.queueLengthLabel.setFont(font)
+        self.queueLengthLabel.setObjectName("queueLengthLabel")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.FieldRole, self.queueLengthLabel)
+        self.label_9 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_9.setObjectName("label_9")
+        self.formLayout.setWidget(7, QtWidgets.QFormLayout.LabelRole, self.label_9)
+        self.backpressureModeLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.backpressureModeLabel.setFont(font)
+        self.backpressureModeLabel.setObjectName("backpressureModeLabel")
+        self.formLayout.setWidget(7, QtWidgets.QFormLayout.FieldRole, self.backpressureModeLabel)
+        self.label_10 = QtWidgets.QLabel(self.dockWidgetContents)
+        self.label_10.setObjectName("label_10")
+        self.formLayout.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.label_10)
+        self.backpressureCountersLabel = QtWidgets.QLabel(self.dockWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.backpressureCountersLabel.setFont(font)
+        self.backpressureCountersLabel.setObjectName("backpressureCountersLabel")
+        self.formLayout.setWidget(8, QtWidgets.QFormLayout.FieldRole, self.backpressureCountersLabel)
+        self.endpointsTable = QtWidgets.QTableWidget(self.dockWidgetContents)
+        self.endpointsTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.endpointsTable.setAlternatingRowColors(True)
+        self.endpointsTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.endpointsTable.setWordWrap(False)
+        self.endpointsTable.setObjectName("endpointsTable")
+        self.endpointsTable.setColumnCount(7)
+        self.endpointsTable.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(5, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.endpointsTable.setHorizontalHeaderItem(6, item)
+        self.endpointsTable.horizontalHeader().setHighlightSections(False)
+        self.endpointsTable.horizontalHeader().setStretchLastSection(True)
+        self.endpointsTable.verticalHeader().setVisible(False)
+        self.formLayout.setWidget(9, QtWidgets.QFormLayout.SpanningRole, self.endpointsTable)
+        StatisticsDock.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(StatisticsDock)
+        QtCore.QMetaObject.connectSlotsByName(StatisticsDock)
+
+    def retranslateUi(self, StatisticsDock):
+        _translate = QtCore.QCoreApplication.translate
+        StatisticsDock.setWindowTitle(_translate("StatisticsDock", "&Statistics"))
+        self.label.setText(_translate("StatisticsDock", "Time since start:"))
+        self.timeSinceStartLabel.setText(_translate("StatisticsDock", "0s"))
+        self.label_3.setText(_translate("StatisticsDock", "Time since last receive:"))
+        self.timeSinceLastReceiveLabel.setText(_translate("StatisticsDock", "None"))
+        self.label_4.setText(_translate("StatisticsDock", "Messages parsed:"))
+        self.messagesParsedLabel.setText(_translate("StatisticsDock", "0"))
+        self.label_6.setText(_translate("StatisticsDock", "Parse failures:"))
+        self.parseFailuresLabel.setText(_translate("StatisticsDock", "0"))
+        self.label_2.setText(_translate("StatisticsDock", "Requests sent:"))
+        self.requestsSentLabel.setText(_translate("StatisticsDock", "0"))
+        self.label_7.setText(_translate("StatisticsDock", "Total data received:"))
+        self.totalDataReceivedLabel.setText(_translate("StatisticsDock", "0B"))
+        self.label_8.setText(_translate("StatisticsDock", "Queue length:"))
+        self.queueLengthLabel.setText(_translate("StatisticsDock", "0"))
+        self.label_9.setText(_translate("StatisticsDock", "Data sent:"))
+        self.backpressureModeLabel.setText(_translate("StatisticsDock", "All"))
+        self.label_10.setText(_translate("StatisticsDock", "Downsampled:"))
+        self.backpressureCountersLabel.setText(_translate("StatisticsDock", "0"))
+        item = self.endpointsTable.horizontalHeaderItem(0)
+        item.setText(_translate("StatisticsDock", "URL"))
+        item = self.endpointsTable.horizontalHeaderItem(1)
+        item.setText(_translate("StatisticsDock", "Requests/s"))
+        item = self.endpointsTable.horizontalHeaderItem(2)
+        item.setText(_translate("StatisticsDock", "Sent/s"))
+        item = self.endpointsTable.horizontalHeaderItem(3)
+        item.setText(_translate("StatisticsDock", "Retries"))
+        item = self.endpointsTable.horizontalHeaderItem(4)
+        item.setText(_translate("StatisticsDock", "Queue wait"))
+        item.setToolTip(_translate("StatisticsDock", "Time spent in the queue: p50 / p95 / p99 in ms"))
+        item = self.endpointsTable.horizontalHeaderItem(5)
+        item.setText(_translate("StatisticsDock", "Response"))
+        item.setToolTip(_translate("StatisticsDock", "Time waiting for the server: p50 / p95 / p99 in ms"))
+        item = self.endpointsTable.horizontalHeaderItem(6)
+        item.setText(_translate("StatisticsDock", "Total"))
+        item.setToolTip(_translate("StatisticsDock", "Time from adding to sending: p50 / p95 / p99 in ms"))
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app/ui/videoid.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_VideoIDDialog(object):
+    def setupUi(self, VideoIDDialog):
+        VideoIDDialog.setObjectName("VideoIDDialog")
+        VideoIDDialog.resize(316, 88)
+        self.verticalLayout = QtWidgets.QVBoxLayout(VideoIDDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout_2 = QtWidgets.QFormLayout()
+        self.formLayout_2.setObjectName("formLayout_2")
+        self.label = QtWidgets.QLabel(VideoIDDialog)
+        self.label.setObjectName("label")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.idLineEdit = QtWidgets.QLineEdit(VideoIDDialog)
+        self.idLineEdit.setInputMethodHints(QtCore.Qt.ImhPreferLowercase|QtCore.Qt.ImhUrlCharactersOnly)
+        self.idLineEdit.setObjectName("idLineEdit")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.idLineEdit)
+        self.verticalLayout.addLayout(self.formLayout_2)
+        self.buttonBox = QtWidgets.QDialogButtonBox(VideoIDDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+        self.label.setBuddy(self.idLineEdit)
+
+        self.retranslateUi(VideoIDDialog)
+        self.buttonBox.accepted.connect(VideoIDDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(VideoIDDialog.reject) # type: ignore
+        self.idLineEdit.editingFinished.connect(VideoIDDialog.check_id_contents) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(VideoIDDialog)
+
+    def retranslateUi(self, VideoIDDialog):
+        _translate = QtCore.QCoreApplication.translate
+        VideoIDDialog.setWindowTitle(_translate("VideoIDDialog", "Set Video ID"))
+        self.label.setText(_translate("VideoIDDialog", "&ID or URL:"))
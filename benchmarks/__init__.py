@@ -0,0 +1,54 @@
+"""
+Benchmarks of the receiver's hot paths.
+
+Each module is runnable on its own, e.g. ``python -m benchmarks.reader``.
+"""
+import itertools
+import time
+
+TELEMETRY_LINE = ('S,0,f,e,d,c,325e,68c2,6448,3295,3d1,7e,fdd3,d,e83d,e6bd,'
+                  'cdb6,58c,fcbe,995')
+GPGGA_LINE = ('$GPGGA,123519,4807.038,N,01130.000,W,1,03,0.9,545.4,M,46.9,M,,'
+              '*5F')
+GPRMC_LINE = ('$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,'
+              '003.1,W*6A')
+KUNDT_LINE = '7530,400'
+
+LINE_MIX = [TELEMETRY_LINE] * 5 + [GPGGA_LINE, GPRMC_LINE] + [KUNDT_LINE] * 3
+"""Proportions of the messages similar to the ones received during flight"""
+
+
+def generate_lines(count):
+    """Return ``count`` lines of output following the :py:data:`LINE_MIX`
+
+    :param int count: number of lines to generate
+    :rtype: list[str]
+    """
+    return list(itertools.islice(itertools.cycle(LINE_MIX), count))
+
+
+def measure(func, *args, repeat=3):
+    """Call given function ``repeat`` times and return the best time
+
+    :param function func: function to measure
+    :return: best wall time of a single call in seconds
+    :rtype: float
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name, seconds, count, unit='lines'):
+    """Print the result of a single benchmark
+
+    :param str name: name of the benchmark
+    :param float seconds: time the benchmark took
+    :param int count: number of items processed
+    :param str unit: name of the items processed
+    """
+    print('{:<40} {:>10.3f} ms {:>14,.0f} {}/s'
+          .format(name, seconds * 1000, count / seconds, unit))
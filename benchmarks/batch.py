@@ -0,0 +1,45 @@
+"""
+Throughput of parsing telemetry lines one by one and in NumPy batches.
+
+Compares ``TelemetrySerializer.parse_data`` called for each line with
+``TelemetrySerializer.parse_batch`` called for chunks of lines.
+"""
+import argparse
+from datetime import datetime
+
+from app.parser.telemetry import TelemetrySerializer
+from benchmarks import TELEMETRY_LINE, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+def parse_scalar(serializer, lines):
+    parse_data = serializer.parse_data
+    for line in lines:
+        parse_data(line, PROBE_START_TIME)
+
+
+def parse_batches(serializer, lines, batch_size):
+    for i in range(0, len(lines), batch_size):
+        serializer.parse_batch(lines[i:i + batch_size], PROBE_START_TIME)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=100000,
+                            help='number of lines to parse')
+    arg_parser.add_argument('--batch-size', type=int, default=10000,
+                            help='number of lines parsed at once')
+    args = arg_parser.parse_args()
+
+    lines = [TELEMETRY_LINE] * args.lines
+    serializer = TelemetrySerializer()
+    report('parse_data', measure(parse_scalar, serializer, lines),
+           args.lines)
+    report('parse_batch ({} lines)'.format(args.batch_size),
+           measure(parse_batches, serializer, lines, args.batch_size),
+           args.lines)
+
+
+if __name__ == '__main__':
+    main()
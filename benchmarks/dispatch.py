@@ -0,0 +1,53 @@
+"""
+Cost of finding the parser for a line of output.
+
+Compares asking every parser with ``can_parse`` in turn with the lookup in
+:py:class:`app.parser.Dispatcher`, using the real GPS/telemetry/Kundt line
+mix, both for the parsers used by the application and with additional
+parsers registered.
+"""
+import argparse
+
+from app.parser import Dispatcher, Parser
+from app.parser.outputparser import PARSERS
+from benchmarks import generate_lines, measure, report
+
+
+class DummyParser(Parser):
+    def __init__(self, msg_id):
+        self.id = msg_id
+
+
+def classify_linear(parsers, lines):
+    for line in lines:
+        for parser in parsers:
+            if parser.can_parse(line):
+                break
+
+
+def classify_dispatcher(dispatcher, lines):
+    classify = dispatcher.classify
+    for line in lines:
+        classify(line)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=200000,
+                            help='number of lines to classify')
+    args = arg_parser.parse_args()
+    lines = generate_lines(args.lines)
+
+    for extra in (0, 20):
+        parsers = ([DummyParser('$X{}'.format(i)) for i in range(extra)] +
+                   [cls() for cls in PARSERS])
+        suffix = ' (+{} parsers)'.format(extra) if extra else ''
+        report('Linear can_parse' + suffix,
+               measure(classify_linear, parsers, lines), len(lines))
+        report('Dispatcher' + suffix,
+               measure(classify_dispatcher, Dispatcher(parsers), lines),
+               len(lines))
+
+
+if __name__ == '__main__':
+    main()
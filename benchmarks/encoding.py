@@ -0,0 +1,147 @@
+"""
+Size and CPU cost of the request bodies in different encodings.
+
+Sends telemetry requests (single and bulk) to a local server running in
+a separate process with form-encoded, JSON and gzip-compressed JSON bodies
+and reports the bytes sent per request and the CPU time of the client per
+request. Also compares encoding the datetimes with the previous
+implementation.
+"""
+import argparse
+import multiprocessing
+import random
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+
+from app import api
+from app.parser.telemetry import TelemetrySerializer
+from app.sender import Sender
+from benchmarks import TELEMETRY_LINE, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.send_response(201)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port_queue):
+    server = HTTPServer(('127.0.0.1', 0), SinkHandler)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def generate_telemetry(count):
+    """Return the data of ``count`` telemetry records with varying values
+
+    :rtype: list[dict]
+    """
+    serializer = TelemetrySerializer()
+    rand = random.Random(0)
+    fields = TELEMETRY_LINE.split(',')
+    result = []
+    for i in range(count):
+        # Timestamp and the sensor readings
+        fields[6] = '{:x}'.format(i * 100)
+        for j in range(7, len(fields)):
+            fields[j] = '{:x}'.format(rand.randrange(0x10000))
+        data = serializer.parse_data(','.join(fields),
+                                     PROBE_START_TIME).as_dict()
+        result.append(data)
+    return result
+
+
+def encode_datetime_old(dt):
+    """:py:func:`app.api.encode_datetime` before optimization"""
+    s = dt.isoformat()
+    if s.endswith('+00:00'):
+        s = s[:-6] + 'Z'
+    if dt.tzinfo is None:
+        s += 'Z'
+    return s
+
+
+def encode_all(encode, datetimes):
+    for dt in datetimes:
+        encode(dt)
+
+
+def send(client, session, items, bulk_size):
+    """Send the items and return the bytes sent and the CPU time"""
+    sent = [0]
+
+    def count(response, *args, **kwargs):
+        sent[0] += len(response.request.body)
+
+    session.hooks['response'] = [count]
+    start = time.process_time()
+    if bulk_size == 1:
+        for data in items:
+            client.create('/telemetry/', data, requests_object=session)
+    else:
+        for i in range(0, len(items), bulk_size):
+            client.create_bulk('/telemetry/', items[i:i + bulk_size],
+                               requests_object=session)
+    return sent[0], time.process_time() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=500,
+                            help='number of telemetry records to send')
+    arg_parser.add_argument('--bulk-size', type=int, default=50,
+                            help='number of records in a bulk request')
+    args = arg_parser.parse_args()
+
+    items = generate_telemetry(args.lines)
+    datetimes = [data['timestamp'] for data in items] * 100
+    report('encode_datetime (old)',
+           measure(encode_all, encode_datetime_old, datetimes),
+           len(datetimes), 'datetimes')
+    report('encode_datetime', measure(encode_all, api.encode_datetime,
+                                      datetimes), len(datetimes), 'datetimes')
+
+    sender = Sender(api.API())
+    for data in items:
+        sender.prepare_request_data(data)
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(port_queue,),
+                                     daemon=True)
+    server.start()
+    try:
+        client = api.API()
+        client.set_server_url('http://127.0.0.1:{}'.format(port_queue.get()))
+        for bulk_size in [1, args.bulk_size]:
+            for encoding in api.ENCODINGS:
+                if bulk_size > 1 and encoding == api.ENCODING_FORM:
+                    continue
+                client.default_encoding = encoding
+                with requests.Session() as session:
+                    size, cpu_time = send(client, session, items, bulk_size)
+                requests_count = -(-len(items) // bulk_size)
+                print('{:<40} {:>10,.0f} B/request {:>8.0f} us CPU/request '
+                      '{:>8.1f} B/record'.format(
+                          '{} (bulk size {})'.format(encoding, bulk_size),
+                          size / requests_count,
+                          cpu_time / requests_count * 1e6,
+                          size / len(items)))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Contention between the parser adding requests and the sender sending them.
+
+The requests produced by parsing synthetic probe output are added to
+:py:class:`app.sender.Sender` as fast as possible by one thread, while
+:py:meth:`app.sender.Sender.process_indefinitely` sends them to an API that
+responds immediately, so that both sides are saturated and compete for the
+sender's lock all the time. ``on_request_added`` takes ``--hook-cost``
+microseconds, standing for emitting the Qt signal.
+
+The current handoff (the inbox filled without waiting for the lock) is
+compared with the one where everything :py:meth:`app.sender.Sender.add_request`
+does happens with the lock held, with the in-memory queue or the persistent
+one (whose commits make the lock holders hold it for much longer). For every
+configuration, reports the requests added per second, the median, 99th
+percentile and maximum time a single ``add_request`` call took and the
+requests sent per second.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from app.sender import RequestData, PRIORITY_NORMAL, Sender
+from app.sender.persistentqueue import PersistentRequestQueue
+from benchmarks.sender import generate_requests
+
+
+class NullAPI:
+    """API accepting every request after ``delay`` seconds of busy waiting"""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+
+    def _respond(self):
+        deadline = time.perf_counter() + self.delay
+        while time.perf_counter() < deadline:
+            pass
+
+    def create(self, url, data, files=None, requests_object=None):
+        self._respond()
+
+    def create_bulk(self, url, data, requests_object=None):
+        self._respond()
+
+
+class BenchmarkSender(Sender):
+    hook_cost = 0
+
+    def on_request_added(self, request_data):
+        deadline = time.perf_counter() + self.hook_cost
+        while time.perf_counter() < deadline:
+            pass
+
+
+class LockedSender(BenchmarkSender):
+    """Sender adding the requests with the lock held for the whole time"""
+
+    def add_request(self, module, url, data, files=None,
+                    append_timestamp=True, callback=None, priority=None,
+                    supersede_key=None):
+        if priority is None:
+            priority = self.module_priorities.get(module, PRIORITY_NORMAL)
+        self.prepare_request_data(data)
+        with self.lock:
+            request_data = RequestData(next(self._ids), module, url, data,
+                                       files, callback, time.monotonic(),
+                                       priority, supersede_key)
+            self.queue.append(request_data)
+            self.on_request_added(request_data)
+            self.not_empty.notify()
+
+
+def run(sender_class, requests, hook_cost, api_delay, persistent,
+        **sender_kwargs):
+    """Add and send given requests and return the statistics
+
+    :return: requests added per second, times of the ``add_request`` calls
+        (sorted) and requests sent per second
+    :rtype: tuple[float, list[float], float]
+    """
+    queue = None
+    if persistent:
+        directory = tempfile.mkdtemp()
+        queue = PersistentRequestQueue(os.path.join(directory, 'queue.db'))
+    sender = sender_class(NullAPI(api_delay), queue=queue, **sender_kwargs)
+    sender.hook_cost = hook_cost
+    thread = threading.Thread(target=sender.process_indefinitely)
+    thread.start()
+
+    times = []
+    start = time.perf_counter()
+    for module, url, data in requests:
+        call_start = time.perf_counter()
+        sender.add_request(module, url, dict(data), append_timestamp=False)
+        times.append(time.perf_counter() - call_start)
+    added = time.perf_counter()
+    while len(sender):
+        time.sleep(0.0005)
+    sent = time.perf_counter()
+
+    sender.set_terminated()
+    thread.join()
+    sender.session.close()
+    if persistent:
+        queue.close()
+        shutil.rmtree(directory)
+    return (len(requests) / (added - start), sorted(times),
+            len(requests) / (sent - start))
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=20000,
+                            help='number of lines of output to send the '
+                                 'data of')
+    arg_parser.add_argument('--batch-size', type=int, nargs='+',
+                            default=[1, 50], help='batch sizes to compare')
+    arg_parser.add_argument('--concurrency', type=int, nargs='+',
+                            default=[1, 4], help='concurrency to compare')
+    arg_parser.add_argument('--hook-cost', type=float, default=5,
+                            help='time on_request_added takes in '
+                                 'microseconds')
+    arg_parser.add_argument('--api-delay', type=float, default=0,
+                            help='time every request to the API takes in '
+                                 'microseconds')
+    arg_parser.add_argument('--queue', choices=['memory', 'persistent'],
+                            nargs='+', default=['memory', 'persistent'],
+                            help='queues to compare')
+    args = arg_parser.parse_args()
+
+    requests = generate_requests(args.lines)
+    print('{} requests, on_request_added {:.0f} us, API {:.0f} us'.format(
+        len(requests), args.hook_cost, args.api_delay))
+    for queue in args.queue:
+        for batch_size in args.batch_size:
+            for concurrency in args.concurrency:
+                for name, sender_class in (('locked', LockedSender),
+                                           ('inbox', BenchmarkSender)):
+                    added, times, sent = run(
+                        sender_class, requests, args.hook_cost / 1e6,
+                        args.api_delay / 1e6, queue == 'persistent',
+                        batch_size=batch_size, batch_age=0,
+                        concurrency=concurrency)
+                    print('{:<48} {:>9,.0f} added/s {:>7.1f} us p50 '
+                          '{:>7.1f} us p99 {:>6.1f} ms max {:>9,.0f} sent/s'
+                          .format('{}, {}, batch size {}, concurrency {}'
+                                  .format(name, queue, batch_size,
+                                          concurrency),
+                                  added, percentile(times, 0.5) * 1e6,
+                                  percentile(times, 0.99) * 1e6,
+                                  times[-1] * 1000, sent))
+
+
+if __name__ == '__main__':
+    main()
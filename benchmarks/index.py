@@ -0,0 +1,73 @@
+"""
+Seeking in archived output using :py:class:`app.parser.index.CaptureIndex`.
+
+Compares building the index (which is what every seek costs without one)
+with loading an existing index and reading the lines of a short time window.
+"""
+import argparse
+import os
+import tempfile
+
+from app.parser import index
+from benchmarks import LINE_MIX, TELEMETRY_LINE, measure, report
+
+
+def generate_timed_lines(count):
+    """Return ``count`` lines following the :py:data:`LINE_MIX` with the
+    telemetry timestamps increasing by 100 ms
+
+    :rtype: list[str]
+    """
+    lines = []
+    timestamp = 0
+    while len(lines) < count:
+        for line in LINE_MIX:
+            if line == TELEMETRY_LINE:
+                line = line.replace(',325e,', ',{:x},'.format(timestamp))
+                timestamp += 100
+            lines.append(line)
+    return lines[:count]
+
+
+def build(path):
+    os.remove(path + index.INDEX_SUFFIX)
+    index.CaptureIndex(path).close()
+
+
+def load(path):
+    index.CaptureIndex(path).close()
+
+
+def read_window(path, t0, t1):
+    with index.CaptureIndex(path) as capture_index:
+        for line in capture_index.open_range(t0, t1):
+            line.release()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=200000,
+                            help='number of lines in the output file')
+    args = arg_parser.parse_args()
+
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write('\n'.join(generate_timed_lines(args.lines)) + '\n')
+        load(path)
+        # Middle 1% of the file
+        duration = args.lines // len(LINE_MIX) * 5 * 100 / 1000
+        t0 = duration / 2
+        t1 = t0 + duration / 100
+        report('build index', measure(build, path), args.lines)
+        report('load index', measure(load, path), args.lines)
+        report('load index + read 1% window',
+               measure(read_window, path, t0, t1), args.lines)
+    finally:
+        os.remove(path)
+        if os.path.exists(path + index.INDEX_SUFFIX):
+            os.remove(path + index.INDEX_SUFFIX)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Lookup tables for the 16-bit sensor fields.
+
+Compares the compiled ``parse_fields`` of TelemetrySerializer with and
+without the lookup tables (see
+:py:func:`app.parser.serializer.compiler.get_lookup_table`), as well as the
+conversion of the single fields.
+"""
+import argparse
+from datetime import datetime
+
+from app.parser.serializer import fields
+from app.parser.serializer.compiler import (
+    compile_parse_fields, get_lookup_table
+)
+from app.parser.telemetry import TelemetrySerializer
+from benchmarks import TELEMETRY_LINE, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+def parse_many(parse_fields, data, count):
+    for _ in range(count):
+        parse_fields(data, PROBE_START_TIME)
+
+
+def convert_formula(field, values):
+    to_python = field.to_python
+    for value in values:
+        to_python(value)
+
+
+def convert_table(table, values):
+    for value in values:
+        v = int(value, 16)
+        if 0 <= v < 65536:
+            table[v]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=100000,
+                            help='number of lines to parse')
+    args = arg_parser.parse_args()
+
+    data = TelemetrySerializer().get_data(TELEMETRY_LINE)
+    without_tables = compile_parse_fields(
+        'TelemetrySerializer', TelemetrySerializer.fields,
+        TelemetrySerializer.optional_count, lookup_tables=False)
+    report('TelemetrySerializer (computed)',
+           measure(parse_many, without_tables, data, args.lines), args.lines)
+    report('TelemetrySerializer (lookup tables)',
+           measure(parse_many, TelemetrySerializer.parse_fields, data,
+                   args.lines), args.lines)
+
+    values = ['{:x}'.format(v * 7919 % 65536) for v in range(args.lines)]
+    for field in (fields.GyroField(), fields.TemperatureField()):
+        name = type(field).__name__
+        report('{} (to_python)'.format(name),
+               measure(convert_formula, field, values), args.lines, 'values')
+        report('{} (lookup table)'.format(name),
+               measure(convert_table, get_lookup_table(field), values),
+               args.lines, 'values')
+
+
+if __name__ == '__main__':
+    main()
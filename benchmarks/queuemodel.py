@@ -0,0 +1,99 @@
+"""
+Cost of displaying the sender's queue in the main window.
+
+Fills :py:class:`app.mainwindow.queuetablemodel.QueueTableModel` (behind
+the proxy model the queue dock uses) with given number of requests and
+reports how many requests per second it can mark as processed and remove,
+either in the order they were added or the requests of one URL first (e.g.
+having higher priority), applying the changes as often as the timer of the
+model would at given rate.
+"""
+import argparse
+import time
+
+from PyQt5.QtCore import (
+    QCoreApplication, QObject, QSortFilterProxyModel, pyqtSignal
+)
+
+from app.mainwindow.queuetablemodel import QueueTableModel
+from app.sender import RequestData, PRIORITY_NORMAL
+from benchmarks import report
+
+
+class StandInSender(QObject):
+    request_added = pyqtSignal(RequestData)
+    request_processing = pyqtSignal(RequestData)
+    request_processed = pyqtSignal(RequestData, bool)
+    request_retrying = pyqtSignal(RequestData, BaseException, int, float)
+    error_occurred = pyqtSignal(RequestData, BaseException, object)
+    requests_not_announced = pyqtSignal(int, int, int)
+
+
+def create_requests(count):
+    return [RequestData(i, 'TelemetryParser', '/telemetry/', {}, None, None,
+                        0.0, PRIORITY_NORMAL, None)
+            for i in range(1, count + 1)]
+
+
+def one_lane_first(requests, lanes):
+    """Return the requests in the order they are processed when every
+    ``lanes``-th of them is sent first"""
+    return [request_data for i in range(lanes)
+            for request_data in requests[i::lanes]]
+
+
+def run(requests, order, per_update):
+    """Add given requests and remove them in given order
+
+    :return: time spent on removing the requests
+    :rtype: float
+    """
+    sender = StandInSender()
+    model = QueueTableModel(sender)
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setFilterKeyColumn(1)
+    for request_data in requests:
+        sender.request_added.emit(request_data)
+    model.apply_pending()
+
+    start = time.perf_counter()
+    for i, request_data in enumerate(order, 1):
+        sender.request_processing.emit(request_data)
+        sender.request_processed.emit(request_data, False)
+        if i % per_update == 0:
+            model.apply_pending()
+    model.apply_pending()
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--queued', type=int, nargs='+',
+                            default=[1000, 50000],
+                            help='numbers of queued requests to compare')
+    arg_parser.add_argument('--processed', type=int, default=5000,
+                            help='number of requests to process')
+    arg_parser.add_argument('--rate', type=float, default=5000,
+                            help='requests processed per second')
+    arg_parser.add_argument('--interval', type=int, default=100,
+                            help='update interval of the model in ms')
+    arg_parser.add_argument('--lanes', type=int, default=4,
+                            help='number of URLs the requests are sent to')
+    args = arg_parser.parse_args()
+
+    app = QCoreApplication([])  # noqa: F841
+    per_update = max(1, int(args.rate * args.interval / 1000))
+    for queued in args.queued:
+        requests = create_requests(queued)
+        processed = min(args.processed, queued)
+        for name, order in (('in order', requests),
+                            ('one URL first',
+                             one_lane_first(requests, args.lanes))):
+            report('{} queued, {}'.format(queued, name),
+                   run(requests, order[:processed], per_update), processed,
+                   'requests')
+
+
+if __name__ == '__main__':
+    main()
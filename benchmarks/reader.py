@@ -0,0 +1,51 @@
+"""
+Throughput of the line readers used by the output parser.
+
+Compares reading an archived output file line by line with a text-mode file
+object (:py:class:`TextLineReader`) and in large blocks
+(:py:class:`BlockLineReader`).
+"""
+import argparse
+import os
+import tempfile
+
+from app.parser import reader
+from benchmarks import generate_lines, measure, report
+
+
+def read_all(reader_cls, path, *args):
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        line_reader = reader_cls(fd, *args)
+        count = 0
+        lines = line_reader.read_lines()
+        while lines is not None:
+            count += len(lines)
+            lines = line_reader.read_lines()
+        return count
+    finally:
+        os.close(fd)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=1000000,
+                            help='number of lines in the generated file')
+    args = arg_parser.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt') as f:
+        f.write('\n'.join(generate_lines(args.lines)) + '\n')
+        f.flush()
+        print('File size: {:.1f} MB'.format(os.path.getsize(f.name) / 1e6))
+
+        report('TextLineReader',
+               measure(read_all, reader.TextLineReader, f.name), args.lines)
+        for block_size in (1 << 12, 1 << 16, 1 << 20):
+            report('BlockLineReader (block_size={})'.format(block_size),
+                   measure(read_all, reader.BlockLineReader, f.name,
+                           block_size),
+                   args.lines)
+
+
+if __name__ == '__main__':
+    main()
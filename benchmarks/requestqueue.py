@@ -0,0 +1,117 @@
+"""
+Throughput and memory usage of the in-memory and persistent request queues.
+
+Compares adding (and then sending, i.e. removing and acknowledging) telemetry
+requests with :py:class:`app.sender.requestqueue.RequestQueue` and
+:py:class:`app.sender.persistentqueue.PersistentRequestQueue` with and
+without durability (waiting for the disk on every commit), as well as the peak
+(Python) memory usage of a large backlog.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+from app import api
+from app.parser.telemetry import TelemetrySerializer
+from app.sender import PRIORITY_NORMAL, RequestData
+from app.sender.persistentqueue import PersistentRequestQueue
+from app.sender.requestqueue import RequestQueue
+from benchmarks import TELEMETRY_LINE, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+def create_requests(count):
+    data = TelemetrySerializer().parse_data(
+        TELEMETRY_LINE, PROBE_START_TIME).as_dict()
+    for key, value in data.items():
+        if isinstance(value, datetime):
+            data[key] = api.encode_datetime(value)
+    return [RequestData(i, 'Telemetry', '/telemetry/', dict(data), None,
+                        None, 0.0, PRIORITY_NORMAL, None)
+            for i in range(1, count + 1)]
+
+
+def generate_requests(requests):
+    """Yield copies of given requests, so that only the queue keeps them"""
+    for request_data in requests:
+        yield request_data._replace(data=dict(request_data.data))
+
+
+def enqueue(create_queue, requests):
+    queue = create_queue()
+    for request_data in requests:
+        queue.append(request_data)
+    queue.flush()
+    return queue
+
+
+def enqueue_and_send(create_queue, requests):
+    queue = enqueue(create_queue, requests)
+    for _ in range(len(queue)):
+        queue.acknowledge(queue.popleft('/telemetry/'))
+    queue.flush()
+
+
+def get_peak_memory(create_queue, requests):
+    tracemalloc.start()
+    queue = enqueue(create_queue, generate_requests(requests))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del queue
+    return peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=20000,
+                            help='number of requests to add')
+    arg_parser.add_argument('--group-size', type=int, default=100,
+                            help='number of changes committed at once')
+    args = arg_parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    counter = [0]
+
+    def persistent(**kwargs):
+        def create_queue():
+            counter[0] += 1
+            path = os.path.join(directory, '{}.db'.format(counter[0]))
+            return PersistentRequestQueue(path, **kwargs)
+        return create_queue
+
+    # Committing every request separately is much slower, so fewer are used
+    single_count = max(1, args.lines // 20)
+    cases = [
+        ('memory', RequestQueue, args.lines),
+        ('durable=False', persistent(
+            durable=False, group_size=args.group_size), args.lines),
+        ('durable=True', persistent(
+            durable=True, group_size=args.group_size), args.lines),
+        ('durable=True, group_size=1', persistent(
+            durable=True, group_size=1), single_count),
+    ]
+    requests = create_requests(args.lines)
+    try:
+        for name, create_queue, count in cases:
+            report('enqueue ({})'.format(name),
+                   measure(enqueue, create_queue, requests[:count]), count,
+                   'requests')
+        for name, create_queue, count in cases:
+            report('enqueue + send ({})'.format(name),
+                   measure(enqueue_and_send, create_queue, requests[:count]),
+                   count, 'requests')
+        # Note that the memory allocated by SQLite itself is not traced
+        for name, create_queue, count in cases[:2]:
+            print('{:<40} {:>10.1f} MiB peak memory'.format(
+                'enqueue ({})'.format(name),
+                get_peak_memory(create_queue, requests) / 2 ** 20))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Throughput and latency of the sender against the local mock API server.
+
+Runs :py:class:`app.mockserver.MockAPIServer` in a separate process and adds
+the requests produced by parsing synthetic probe output (see
+:py:data:`benchmarks.LINE_MIX`) to :py:class:`app.sender.Sender` running
+:py:meth:`app.sender.Sender.process_indefinitely` in a thread, either all at
+once or at given rate. For every configuration of the sender, reports the
+requests sent per second, the median and 99th percentile of the time between
+adding a request and receiving 201 Created for it, the peak length of the
+queue and the peak (Python) memory allocated while sending, measured in
+a separate run since tracing the allocations slows everything down.
+"""
+import argparse
+import multiprocessing
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+from app.api import API
+from app.mockserver import MockAPIServer
+from app.parser.outputparser import OutputParser
+from app.sender import Sender
+from benchmarks import generate_lines
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+TOKEN = 'benchmark-token'
+
+
+class RequestCollector:
+    """Stand-in for the sender collecting the requests the parser adds"""
+
+    def __init__(self):
+        self.requests = []
+
+    def add_request(self, module, url, data, files=None,
+                    append_timestamp=True, **kwargs):
+        self.requests.append((module, url, data))
+
+
+class BenchmarkSender(Sender):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Called from the worker threads; appending to a list is atomic
+        self.latencies = []
+
+    def on_request_processed(self, request_data, skipped):
+        self.latencies.append(time.monotonic() - request_data.added_time)
+
+
+def serve(port_queue, kwargs):
+    server = MockAPIServer(token=TOKEN, **kwargs)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def generate_requests(count):
+    """Return the requests added by the parser for ``count`` lines of output
+
+    :rtype: list[tuple[str, str, dict]]
+    """
+    collector = RequestCollector()
+    parser = OutputParser(collector, None)
+    parser.set_probe_start_time(PROBE_START_TIME)
+    parser.parse_lines(generate_lines(count))
+    return collector.requests
+
+
+def run(server_url, requests, rate, trace_memory, **sender_kwargs):
+    """Send given requests and return the statistics
+
+    :return: requests/s, latencies (sorted), peak queue length and peak
+        memory in bytes (``None`` unless ``trace_memory`` is set)
+    :rtype: tuple[float, list[float], int, int|None]
+    """
+    client = API()
+    client.set_server_url(server_url)
+    client.set_token(TOKEN)
+    sender = BenchmarkSender(client, **sender_kwargs)
+    thread = threading.Thread(target=sender.process_indefinitely)
+    thread.start()
+
+    if trace_memory:
+        tracemalloc.start()
+    peak_queue = 0
+    start = time.perf_counter()
+    for i, (module, url, data) in enumerate(requests):
+        if rate is not None:
+            delay = start + i / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        sender.add_request(module, url, dict(data), append_timestamp=False)
+        if i % 64 == 0:
+            peak_queue = max(peak_queue, len(sender))
+    while len(sender):
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    peak_memory = None
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    sender.set_terminated()
+    thread.join()
+    sender.session.close()
+    return (len(requests) / elapsed, sorted(sender.latencies), peak_queue,
+            peak_memory)
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=2000,
+                            help='number of lines of output to send the '
+                                 'data of')
+    arg_parser.add_argument('--rate', type=float, default=None,
+                            help='requests added per second (default: all '
+                                 'at once)')
+    arg_parser.add_argument('--batch-size', type=int, nargs='+',
+                            default=[1, 50], help='batch sizes to compare')
+    arg_parser.add_argument('--concurrency', type=int, nargs='+',
+                            default=[1, 4], help='concurrency to compare')
+    arg_parser.add_argument('--latency', type=float, default=0.002,
+                            help='time every request to the server takes')
+    arg_parser.add_argument('--jitter', type=float, default=0,
+                            help='maximum random time added to the latency')
+    arg_parser.add_argument('--error-rate', type=float, default=0,
+                            help='probability of 503 responses')
+    arg_parser.add_argument('--rate-limit', type=float, default=None,
+                            help='maximum requests per second accepted by '
+                                 'the server')
+    arg_parser.add_argument('--no-memory', action='store_true',
+                            help='skip the runs measuring the memory')
+    args = arg_parser.parse_args()
+
+    requests = generate_requests(args.lines)
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(port_queue, {
+        'latency': args.latency, 'jitter': args.jitter,
+        'error_rate': args.error_rate, 'rate_limit': args.rate_limit,
+        'seed': 0}), daemon=True)
+    server.start()
+    try:
+        server_url = 'http://127.0.0.1:{}'.format(port_queue.get())
+        print('{} requests, server latency {:.1f} ms'.format(
+            len(requests), args.latency * 1000))
+        for batch_size in args.batch_size:
+            for concurrency in args.concurrency:
+                kwargs = {'batch_size': batch_size,
+                          'concurrency': concurrency}
+                rps, latencies, peak_queue, _ = run(
+                    server_url, requests, args.rate, False, **kwargs)
+                memory = ''
+                if not args.no_memory:
+                    peak_memory = run(server_url, requests, args.rate, True,
+                                      **kwargs)[3]
+                    memory = '{:>8.1f} MiB peak'.format(peak_memory / 2 ** 20)
+                print('{:<40} {:>8,.0f} requests/s {:>8.1f} ms p50 '
+                      '{:>8.1f} ms p99 {:>7} queued {}'.format(
+                          'batch size {}, concurrency {}'.format(
+                              batch_size, concurrency),
+                          rps, percentile(latencies, 0.5) * 1000,
+                          percentile(latencies, 0.99) * 1000, peak_queue,
+                          memory))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
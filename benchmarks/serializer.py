@@ -0,0 +1,45 @@
+"""
+Cost of converting the fields of a single line of output.
+
+Compares the generic ``BaseSerializer.parse_fields`` with the version
+compiled by ``SerializerMetaclass`` for TelemetrySerializer and
+GPGGASerializer.
+"""
+import argparse
+import types
+from datetime import datetime
+
+from app.parser.gps import GPGGASerializer
+from app.parser.serializer import BaseSerializer
+from app.parser.telemetry import TelemetrySerializer
+from benchmarks import GPGGA_LINE, TELEMETRY_LINE, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+def parse_many(serializer, line, count):
+    parse_data = serializer.parse_data
+    for _ in range(count):
+        parse_data(line, PROBE_START_TIME)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=100000,
+                            help='number of lines to parse')
+    args = arg_parser.parse_args()
+
+    for serializer_cls, line in ((TelemetrySerializer, TELEMETRY_LINE),
+                                 (GPGGASerializer, GPGGA_LINE.split('*')[0])):
+        generic = serializer_cls()
+        generic.parse_fields = types.MethodType(BaseSerializer.parse_fields,
+                                                generic)
+        report('{} (generic)'.format(serializer_cls.__name__),
+               measure(parse_many, generic, line, args.lines), args.lines)
+        report('{} (compiled)'.format(serializer_cls.__name__),
+               measure(parse_many, serializer_cls(), line, args.lines),
+               args.lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Cost of storing and accessing the data of a single parsed line.
+
+Compares the data classes generated by ``SerializerMetaclass`` with the
+previous dictionary-backed implementation (replicated below) for
+TelemetrySerializer and GPGGASerializer: construction, reading all the fields,
+``as_dict()`` and the memory used by a single instance.
+"""
+import argparse
+import tracemalloc
+from datetime import datetime
+
+from app.parser.gps import GPGGASerializer
+from app.parser.telemetry import TelemetrySerializer
+from benchmarks import GPGGA_LINE, TELEMETRY_LINE, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+class LegacySerializerData:
+    """Dictionary-backed SerializerData, as implemented before"""
+
+    _field_names = ()
+    _dict_included = ()
+
+    def __init__(self, values):
+        self.__dict__['_lookup_dict'] = dict(zip(self._field_names, values))
+
+    def __getattr__(self, item):
+        try:
+            return self._lookup_dict[item]
+        except KeyError:
+            raise AttributeError(item)
+
+    def as_dict(self, fields=None, include_none=False):
+        result = {}
+        if fields is None:
+            fields = self._dict_included
+        for field in self._field_names:
+            if field not in fields:
+                continue
+            try:
+                value = self._lookup_dict[field]
+                if value is not None or include_none:
+                    result[field] = value
+            except KeyError:
+                pass
+        return result
+
+
+def create_legacy_class(data_cls):
+    return type('Legacy' + data_cls.__name__, (LegacySerializerData,), {
+        '_field_names': data_cls._field_names,
+        '_dict_included': list(data_cls._dict_included),
+    })
+
+
+def construct_many(data_cls, values, count):
+    for _ in range(count):
+        data_cls(values)
+
+
+def read_many(data, field_names, count):
+    for _ in range(count):
+        for name in field_names:
+            getattr(data, name)
+
+
+def as_dict_many(data, count):
+    as_dict = data.as_dict
+    for _ in range(count):
+        as_dict()
+
+
+def instance_size(data_cls, values, count=1000):
+    """Return average number of bytes allocated for a single instance"""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        instances = [data_cls(values) for _ in range(count)]
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del instances
+    return size / count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=100000,
+                            help='number of data objects to process')
+    args = arg_parser.parse_args()
+
+    for serializer_cls, line in ((TelemetrySerializer, TELEMETRY_LINE),
+                                 (GPGGASerializer, GPGGA_LINE.split('*')[0])):
+        serializer = serializer_cls()
+        values = serializer.parse_fields(serializer.get_data(line),
+                                         PROBE_START_TIME)
+        data_cls = serializer.data_cls
+        name = serializer_cls.__name__
+        for kind, cls in (('legacy', create_legacy_class(data_cls)),
+                          ('slots', data_cls)):
+            data = cls(values)
+            report('{} init ({})'.format(name, kind),
+                   measure(construct_many, cls, values, args.lines),
+                   args.lines, 'objects')
+            report('{} getattr ({})'.format(name, kind),
+                   measure(read_many, data, cls._field_names, args.lines),
+                   args.lines, 'objects')
+            report('{} as_dict ({})'.format(name, kind),
+                   measure(as_dict_many, data, args.lines),
+                   args.lines, 'objects')
+            print('{:<40} {:>10.0f} B'.format(
+                '{} size ({})'.format(name, kind),
+                instance_size(cls, values)))
+
+
+if __name__ == '__main__':
+    main()
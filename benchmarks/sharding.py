@@ -0,0 +1,43 @@
+"""
+Scaling of parallel parsing of archived output with the number of processes.
+
+Parses a generated capture file with :py:func:`app.parser.sharding.parse_file`
+using 1, 2, 4, ... processes (up to the number of CPUs).
+"""
+import argparse
+import os
+import tempfile
+from datetime import datetime
+
+from app.parser import sharding
+from benchmarks import generate_lines, measure, report
+
+PROBE_START_TIME = datetime(2016, 6, 1, 12, 0, 0)
+
+
+def parse_all(path, jobs):
+    for _ in sharding.parse_file(path, PROBE_START_TIME, jobs):
+        pass
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--lines', type=int, default=200000,
+                            help='number of lines in the capture file')
+    args = arg_parser.parse_args()
+
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write('\n'.join(generate_lines(args.lines)) + '\n')
+        jobs = 1
+        while jobs <= (os.cpu_count() or 1):
+            report('{} process(es)'.format(jobs),
+                   measure(parse_all, path, jobs, repeat=1), args.lines)
+            jobs *= 2
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
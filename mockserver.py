@@ -0,0 +1,5 @@
+#!/usr/bin/env python3
+
+if __name__ == '__main__':
+    from app.mockserver import main
+    main()
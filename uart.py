@@ -1,25 +1,61 @@
+import time
+
 import serial
 
 import uart_config
+from app import capture
 
 
 class Usart:
-    def __init__(self, serial_port, baudrate):
-        self.uart = serial.Serial(serial_port, baudrate)
+    def __init__(self, serial_port, baudrate, timeout=None):
+        self.uart = serial.Serial(serial_port, baudrate, timeout=timeout)
 
     def readline(self):
         return self.uart.readline()
 
 if __name__ == '__main__':
-    usart = Usart(uart_config.device, uart_config.baudrate)
     file = open(uart_config.filename, "a")
-    while True:
-        try:
-            rawline = usart.readline()
-            line = rawline.decode('utf-8')
-        except UnicodeDecodeError:
-            print(rawline)
-            print("line cannot be decoded\n")
-            continue
-        file.write(line)
-        file.flush()
+    capture_filename = getattr(uart_config, 'capture_filename', None)
+    capture_writer = None
+    if capture_filename:
+        capture_writer = capture.CaptureWriter(
+            capture_filename,
+            getattr(uart_config, 'capture_fsync', capture.FSYNC_INTERVAL))
+    flush_interval = getattr(uart_config, 'flush_interval', 0)
+    # Wake up when the probe goes quiet, so the time-based flushes still run
+    timeouts = [flush_interval]
+    if capture_writer is not None:
+        timeouts.append(capture_writer.flush_interval)
+    timeouts = [timeout for timeout in timeouts if timeout > 0]
+    usart = Usart(uart_config.device, uart_config.baudrate,
+                  min(timeouts) if timeouts else None)
+    last_flush = time.monotonic()
+    partial = b''
+    try:
+        while True:
+            rawline = partial + usart.readline()
+            if not rawline.endswith(b'\n'):
+                # Timed out, possibly in the middle of a line
+                partial = rawline
+                if capture_writer is not None:
+                    capture_writer.flush()
+                file.flush()
+                last_flush = time.monotonic()
+                continue
+            partial = b''
+            if capture_writer is not None:
+                capture_writer.write_frame(rawline, capture.monotonic_ns())
+            try:
+                line = rawline.decode('utf-8')
+            except UnicodeDecodeError:
+                print(rawline)
+                print("line cannot be decoded\n")
+                continue
+            file.write(line)
+            if time.monotonic() - last_flush >= flush_interval:
+                file.flush()
+                last_flush = time.monotonic()
+    finally:
+        file.close()
+        if capture_writer is not None:
+            capture_writer.close()